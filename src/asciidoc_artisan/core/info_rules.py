@@ -23,7 +23,7 @@ from asciidoc_artisan.core.models import (
     SyntaxErrorModel,
     TextEdit,
 )
-from asciidoc_artisan.core.syntax_checker import ValidationContext
+from asciidoc_artisan.core.syntax_checker import RuleScope, ValidationContext
 
 
 class MissingDocumentTitleRule:
@@ -35,6 +35,9 @@ class MissingDocumentTitleRule:
     Matches: Documents without = Title
     """
 
+    scope = RuleScope.DOCUMENT
+    facts: tuple[str, ...] | None = None
+
     def validate(self, context: ValidationContext) -> list[SyntaxErrorModel]:
         """Validate document has title."""
         errors = []
@@ -80,6 +83,9 @@ class MissingAuthorVersionRule:
     Matches: Documents without :author: or :version:
     """
 
+    scope = RuleScope.DOCUMENT
+    facts = ("attributes",)
+
     def validate(self, context: ValidationContext) -> list[SyntaxErrorModel]:
         """Validate document has author/version."""
         errors = []
@@ -5,7 +5,11 @@ Provides streaming, chunking, and progress tracking for files > 1MB.
 Implements performance optimizations per specification requirements.
 """
 
+import codecs
+import io
 import logging
+import mmap
+import os
 from pathlib import Path
 
 from PySide6.QtCore import QObject, Signal
@@ -21,6 +25,9 @@ LARGE_FILE = 10 * 1024 * 1024  # 10 MB
 PREVIEW_CHUNK_SIZE = 100000  # Characters to render for large files
 PREVIEW_DISABLE_THRESHOLD = 50 * 1024 * 1024  # 50 MB - disable live preview
 
+# Bytes decoded per step when loading medium and large files
+READ_CHUNK_SIZE = 1024 * 1024  # 1 MB
+
 
 class LargeFileHandler(QObject):
     """
@@ -30,6 +37,9 @@ class LargeFileHandler(QObject):
     - Small files (< 1MB): Normal loading
     - Medium files (1-10MB): Chunked preview, progress indicators
     - Large files (> 10MB): Lazy loading, preview optimization
+
+    Medium and large files are read through a memory map and decoded
+    incrementally; no per-line strings are built.
     """
 
     progress_update = Signal(int, str)  # (percentage, message)
@@ -129,26 +139,7 @@ class LargeFileHandler(QObject):
         """Load medium file with progress indicators (1-10MB)."""
         try:
             self.progress_update.emit(0, f"Loading {file_path.name}...")
-
-            # Read in chunks for progress feedback
-            chunk_size = 1024 * 1024  # 1 MB chunks
-            chunks = []
-            bytes_read = 0
-
-            with open(file_path, encoding=encoding, errors="replace") as f:
-                while True:
-                    chunk = f.read(chunk_size)
-                    if not chunk:
-                        break
-
-                    chunks.append(chunk)
-                    bytes_read += len(chunk.encode(encoding))
-
-                    # Update progress
-                    progress = int((bytes_read / file_size) * 100)
-                    self.progress_update.emit(progress, f"Loading... {progress}%")
-
-            content = "".join(chunks)
+            content = self._read_mapped(file_path, encoding)
             self.progress_update.emit(100, "Load complete")
 
             return True, content, ""
@@ -158,30 +149,13 @@ class LargeFileHandler(QObject):
             return False, "", str(e)
 
     def _load_large_file(self, file_path: Path, encoding: str, file_size: int) -> tuple[bool, str, str]:
-        """Load large file with chunked reading (> 10MB)."""
+        """Load large file with memory-mapped, incrementally decoded reading (> 10MB)."""
         try:
             self.progress_update.emit(0, f"Loading large file: {file_path.name}...")
-
-            # For very large files, read line by line for better memory management
-            lines = []
-            bytes_read = 0
-            last_progress = 0
-
-            with open(file_path, encoding=encoding, errors="replace") as f:
-                for line in f:
-                    lines.append(line)
-                    bytes_read += len(line.encode(encoding))
-
-                    # Update progress every 5%
-                    progress = int((bytes_read / file_size) * 100)
-                    if progress - last_progress >= 5:
-                        self.progress_update.emit(progress, f"Loading... {progress}%")
-                        last_progress = progress
-
-            content = "".join(lines)
+            content = self._read_mapped(file_path, encoding)
             self.progress_update.emit(100, "Large file loaded")
 
-            logger.info(f"Loaded large file: {len(content)} characters, {len(lines)} lines")
+            logger.info(f"Loaded large file: {len(content)} characters")
 
             return True, content, ""
 
@@ -189,6 +163,40 @@ class LargeFileHandler(QObject):
             self.progress_update.emit(0, "Load failed")
             return False, "", str(e)
 
+    def _read_mapped(self, file_path: Path, encoding: str) -> str:
+        """
+        Read and decode a file through a read-only memory map.
+
+        Decodes READ_CHUNK_SIZE bytes at a time with an incremental decoder
+        (multi-byte characters and \\r\\n pairs may span chunks; newlines are
+        translated like text-mode open()). Progress comes from byte offsets,
+        emitted every 5%.
+
+        Returns:
+            Decoded text
+        """
+        decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(encoding)(errors="replace"),
+            translate=True,
+        )
+        parts: list[str] = []
+        last_progress = 0
+
+        with open(file_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    for offset in range(0, size, READ_CHUNK_SIZE):
+                        parts.append(decoder.decode(mapped[offset : offset + READ_CHUNK_SIZE]))
+
+                        progress = min(100, (offset + READ_CHUNK_SIZE) * 100 // size)
+                        if progress - last_progress >= 5:
+                            self.progress_update.emit(progress, f"Loading... {progress}%")
+                            last_progress = progress
+            parts.append(decoder.decode(b"", final=True))
+
+        return "".join(parts)
+
     @staticmethod
     def get_preview_content(content: str, max_chars: int = PREVIEW_CHUNK_SIZE) -> str:
         """
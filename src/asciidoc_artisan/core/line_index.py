@@ -0,0 +1,245 @@
+"""
+Line Index - Compact line start offsets of one document text.
+
+Search, virtual scroll and block splitting each turned offsets into
+lines by splitting the whole text into a list of line strings, which
+costs one object per line on top of the text itself.
+
+LineIndex keeps only the line start offsets, in an array('l') (8 bytes
+per line on 64-bit Linux/macOS), built the first time it is needed:
+- offset_to_line_col() and line_of() use bisect (O(log n))
+- line() slices one line out of the shared text on demand
+- edited() derives the index of the next text version from an edit
+  range: only the edited span is scanned for newlines, later offsets are
+  shifted. Work is deferred until the new index is read, and edits made
+  in between are merged, so typing costs nothing until a consumer asks
+
+Indexes are immutable once built and safe to hand to worker threads.
+The editor's shared index comes from DocumentSnapshot.line_index().
+
+Example:
+    index = LineIndex(text)  # Nothing computed yet
+    line, column = index.offset_to_line_col(offset)  # Builds the index once
+    start, end = index.line_span(line)
+    index = index.edited(new_text, position, removed, added)  # Next version
+"""
+
+import bisect
+import logging
+import re
+from array import array
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+NEWLINE_PATTERN = re.compile("\n")
+
+# Characters outside the BMP count as two positions in Qt (UTF-16) but one
+# in Python, so edit positions reported by the editor cannot be applied
+ASTRAL_PATTERN = re.compile("[\U00010000-\U0010ffff]")
+
+# Edit range in QTextDocument.contentsChange form: (position, removed, added)
+Edit = tuple[int, int, int]
+
+
+def merge_edits(first: Edit | None, position: int, removed: int, added: int) -> Edit:
+    """
+    Fold a later edit (offsets in the edited text) into an earlier edit range.
+
+    Args:
+        first: Earlier edit range, or None
+        position: Start offset of the later edit
+        removed: Characters removed by the later edit
+        added: Characters added by the later edit
+
+    Returns:
+        One edit range turning the original text into the latest text
+    """
+    if first is None:
+        return position, removed, added
+    first_position, first_removed, first_added = first
+    end = max(first_position + first_added, position + removed)
+    old_end = end - (first_added - first_removed)
+    start = min(first_position, position)
+    return start, old_end - start, end + added - removed - start
+
+
+class _PendingEdit(NamedTuple):
+    """Edit not yet applied to the offsets of a previous text version."""
+
+    starts: "array[int]"
+    length: int
+    has_astral: bool
+    edit: Edit
+
+
+class LineIndex:
+    """
+    Lazily built line start offsets of a text.
+
+    Lines are separated by "\\n" (text as loaded by the editor, with
+    newlines already translated).
+
+    Attributes:
+        text: Indexed text
+        version: Text version (incremented by edited())
+    """
+
+    def __init__(self, text: str, version: int = 0) -> None:
+        """
+        Initialize index (offsets are computed on first use).
+
+        Args:
+            text: Text to index
+            version: Text version (default: 0)
+        """
+        self.text = text
+        self.version = version
+        self._starts: array[int] | None = None
+        self._has_astral = False
+        self._pending: _PendingEdit | None = None
+
+    @property
+    def starts(self) -> "array[int]":
+        """Start offset of every line (index i = offset where line i starts)."""
+        if self._starts is None:
+            pending, self._pending = self._pending, None
+            if pending is None or not self._apply(pending):
+                self._build()
+        return self._starts  # type: ignore[return-value]
+
+    def edited(self, text: str, position: int, removed: int, added: int) -> "LineIndex":
+        """
+        Index of the next text version.
+
+        The offsets are updated from this index when the new index is
+        first read. Edits that do not fit (astral characters, lengths that
+        do not add up) make it rebuild from scratch instead.
+
+        Args:
+            text: Text after the edit
+            position: Start offset of the edit
+            removed: Characters removed from this index's text
+            added: Characters inserted in text
+
+        Returns:
+            New LineIndex (this index is unchanged)
+        """
+        index = LineIndex(text, self.version + 1)
+        if self._starts is not None:
+            index._pending = _PendingEdit(self._starts, len(self.text), self._has_astral, (position, removed, added))
+        elif self._pending is not None:
+            # Not read since the last edit: merge both into one range
+            merged = merge_edits(self._pending.edit, position, removed, added)
+            index._pending = self._pending._replace(edit=merged)
+        return index
+
+    def _build(self) -> None:
+        """Scan the whole text."""
+        starts = array("l", [0])
+        starts.extend(match.end() for match in NEWLINE_PATTERN.finditer(self.text))
+        self._has_astral = ASTRAL_PATTERN.search(self.text) is not None
+        self._starts = starts
+        logger.debug(f"Line index built: {len(starts)} lines")
+
+    def _apply(self, pending: _PendingEdit) -> bool:
+        """Derive offsets from a previous version; False if the edit does not fit."""
+        position, removed, added = pending.edit
+        text = self.text
+        if (
+            pending.has_astral
+            or position < 0
+            or removed < 0
+            or position + removed > pending.length
+            or len(text) != pending.length + added - removed
+            or ASTRAL_PATTERN.search(text, position, position + added)
+        ):
+            return False
+
+        old = pending.starts
+        first = bisect.bisect_right(old, position)
+        last = bisect.bisect_right(old, position + removed)
+        delta = added - removed
+
+        starts = old[:first]
+        starts.extend(match.end() for match in NEWLINE_PATTERN.finditer(text, position, position + added))
+        if delta:
+            starts.extend(start + delta for start in old[last:])
+        else:
+            starts.extend(old[last:])
+        self._starts = starts
+        return True
+
+    @property
+    def is_built(self) -> bool:
+        """True once the offsets have been computed."""
+        return self._starts is not None
+
+    def line_count(self) -> int:
+        """Number of lines ("a\\nb" and "a\\nb\\n" have 2 and 3 lines)."""
+        return len(self.starts)
+
+    def line_start(self, line: int) -> int:
+        """
+        Offset where a line starts.
+
+        Args:
+            line: Line number (0-indexed)
+
+        Returns:
+            Character offset
+        """
+        return self.starts[line]
+
+    def line_span(self, line: int) -> tuple[int, int]:
+        """
+        Offsets of a line, without its newline.
+
+        Args:
+            line: Line number (0-indexed)
+
+        Returns:
+            (start, end) character offsets
+        """
+        starts = self.starts
+        start = starts[line]
+        end = starts[line + 1] - 1 if line + 1 < len(starts) else len(self.text)
+        return start, end
+
+    def line(self, line: int) -> str:
+        """
+        Text of a line, without its newline.
+
+        Args:
+            line: Line number (0-indexed)
+
+        Returns:
+            Line text
+        """
+        start, end = self.line_span(line)
+        return self.text[start:end]
+
+    def line_of(self, offset: int) -> int:
+        """
+        Line containing an offset.
+
+        Args:
+            offset: Character offset (clamped to the text)
+
+        Returns:
+            Line number (0-indexed)
+        """
+        return bisect.bisect_right(self.starts, offset) - 1 if offset > 0 else 0
+
+    def offset_to_line_col(self, offset: int) -> tuple[int, int]:
+        """
+        Convert an offset to line and column.
+
+        Args:
+            offset: Character offset
+
+        Returns:
+            (line (0-indexed), column (0-indexed))
+        """
+        line = self.line_of(offset)
+        return line, offset - self.starts[line]
@@ -4,9 +4,29 @@ Metrics Collection System - Track operation performance and statistics.
 Provides lightweight metrics collection for:
 - Operation durations (preview render, file I/O, conversions)
 - Cache hit/miss rates
-- Performance percentiles (p50, p95, p99)
+- Performance percentiles (p50, p95, p99) from streaming quantile sketches
 - Trend analysis over time
 
+Percentiles come from a QuantileSketch per operation: logarithmic buckets
+with 1% relative error (DDSketch style). Recording is O(1), memory is
+bounded by the bucket count rather than the number of samples, reading
+several percentiles walks the buckets once, and sketches merge exactly,
+so metrics from workers or time windows can be combined
+(OperationMetrics.merge, MetricsCollector.merge).
+
+Recording is buffered per thread: record_operation() appends to a
+thread-local list without taking a lock, and the collector drains all
+thread buffers into the shared metrics when they are read, on
+aggregate(), or when a thread's buffer fills up. Render workers can
+instrument hot loops without contending with each other. A buffer is
+released (merged and unregistered) by release_thread_buffer() when a
+worker stops, or when its thread-local registration is destroyed.
+
+Set ASCIIDOC_ARTISAN_NO_METRICS=1 (e.g. for production builds) to
+compile instrumentation out: measure_time() returns functions unwrapped,
+instrumented call sites skip their timing code and the collector starts
+disabled.
+
 Usage:
     metrics = get_metrics_collector()
     metrics.record_operation("preview_render", duration_ms=250.5)
@@ -22,29 +42,175 @@ Usage:
 """
 
 import logging
+import math
+import os
+import threading
 import time
-from collections import defaultdict, deque
-from collections.abc import Callable
+import weakref
+from collections import defaultdict
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Default sketch accuracy: percentiles within 1% of the true value
+SKETCH_RELATIVE_ACCURACY = 0.01
+
+# Bucket limit (~1,000 buckets cover 1 µs to 1 hour at 1%)
+SKETCH_MAX_BUCKETS = 2048
+
+# Records a thread buffers before merging them itself
+THREAD_BUFFER_SIZE = 512
+
+# Instrumentation switch, fixed at import time
+INSTRUMENTATION_ENABLED = not os.environ.get("ASCIIDOC_ARTISAN_NO_METRICS")
+
+
+class QuantileSketch:
+    """
+    Streaming quantile sketch with relative-error buckets.
+
+    Bucket k counts values in (gamma^(k-1), gamma^k], with
+    gamma = (1 + accuracy) / (1 - accuracy), so every quantile is
+    returned within relative_accuracy of a recorded value. Zero and
+    negative values share one bucket. Past max_buckets, the lowest
+    buckets are folded together (low percentiles lose accuracy first).
+
+    Example:
+        sketch = QuantileSketch()
+        sketch.add(12.5)
+        p50, p99 = sketch.quantiles([0.5, 0.99])
+        total.merge(sketch)
+    """
+
+    def __init__(
+        self,
+        relative_accuracy: float = SKETCH_RELATIVE_ACCURACY,
+        max_buckets: int = SKETCH_MAX_BUCKETS,
+    ) -> None:
+        """
+        Initialize empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of quantiles (0-1)
+            max_buckets: Maximum number of buckets kept
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(f"relative_accuracy must be between 0 and 1, got {relative_accuracy}")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+
+    def add(self, value: float, count: int = 1) -> None:
+        """
+        Record a value (O(1)).
+
+        Args:
+            value: Value to record
+            count: Number of occurrences
+        """
+        if value > 0:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self._buckets[key] = self._buckets.get(key, 0) + count
+            if len(self._buckets) > self.max_buckets:
+                self._collapse_lowest()
+        else:
+            self._zero_count += count
+        self.count += count
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """
+        Add the values of another sketch (exact: same buckets are summed).
+
+        Args:
+            other: Sketch with the same relative accuracy
+
+        Raises:
+            ValueError: If the sketches use different accuracies
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for key, count in other._buckets.items():
+            self._buckets[key] = self._buckets.get(key, 0) + count
+        while len(self._buckets) > self.max_buckets:
+            self._collapse_lowest()
+        self._zero_count += other._zero_count
+        self.count += other.count
+
+    def quantile(self, quantile: float) -> float:
+        """
+        Get one quantile.
+
+        Args:
+            quantile: Quantile to read (0-1)
+
+        Returns:
+            Estimated value (0.0 if empty)
+        """
+        return self.quantiles([quantile])[0]
+
+    def quantiles(self, quantiles: Sequence[float]) -> list[float]:
+        """
+        Get several quantiles in one pass over the buckets.
+
+        Args:
+            quantiles: Quantiles to read (0-1)
+
+        Returns:
+            Estimated values, in the order requested (0.0 if empty)
+        """
+        results = [0.0] * len(quantiles)
+        if self.count == 0:
+            return results
+
+        # Rank of each quantile among the recorded values, lowest first
+        pending = sorted(
+            (max(0.0, min(1.0, quantile)) * (self.count - 1), index) for index, quantile in enumerate(quantiles)
+        )
+        position = 0
+        cumulative = self._zero_count
+        while position < len(pending) and pending[position][0] < cumulative:
+            position += 1  # Falls in the zero bucket: 0.0
+
+        for key in sorted(self._buckets):
+            if position == len(pending):
+                break
+            cumulative += self._buckets[key]
+            value = 2 * self._gamma**key / (self._gamma + 1)
+            while position < len(pending) and pending[position][0] < cumulative:
+                results[pending[position][1]] = value
+                position += 1
+        return results
+
+    def bucket_count(self) -> int:
+        """Number of buckets in use (memory is proportional to this)."""
+        return len(self._buckets) + (1 if self._zero_count else 0)
+
+    def _collapse_lowest(self) -> None:
+        """Fold the lowest bucket into the next one."""
+        lowest, second = sorted(self._buckets)[:2]
+        self._buckets[second] += self._buckets.pop(lowest)
+
 
 @dataclass
 class OperationMetrics:
     """Metrics for a specific operation type."""
 
     operation_name: str
-    durations: deque[float] = field(default_factory=lambda: deque(maxlen=1000))
+    sketch: QuantileSketch = field(default_factory=QuantileSketch)
     count: int = 0
     total_time_ms: float = 0.0
     min_time_ms: float = float("inf")
     max_time_ms: float = 0.0
 
     def record(self, duration_ms: float) -> None:
-        """Record an operation duration."""
-        self.durations.append(duration_ms)
+        """Record an operation duration (O(1), constant memory)."""
+        self.sketch.add(duration_ms)
         self.count += 1
         self.total_time_ms += duration_ms
         self.min_time_ms = min(self.min_time_ms, duration_ms)
@@ -56,7 +222,7 @@ class OperationMetrics:
             return 0.0
         return self.total_time_ms / self.count
 
-    def get_percentile(self, percentile: int) -> float:
+    def get_percentile(self, percentile: float) -> float:
         """
         Get duration percentile (e.g., 50, 95, 99).
 
@@ -64,14 +230,38 @@ class OperationMetrics:
             percentile: Percentile to calculate (0-100)
 
         Returns:
-            Duration in ms at the specified percentile
+            Duration in ms at the specified percentile (within 1%)
         """
-        if not self.durations:
-            return 0.0
-        sorted_durations = sorted(self.durations)
-        index = int(len(sorted_durations) * (percentile / 100.0))
-        index = min(index, len(sorted_durations) - 1)
-        return sorted_durations[index]
+        return self.get_percentiles([percentile])[0]
+
+    def get_percentiles(self, percentiles: Sequence[float]) -> list[float]:
+        """
+        Get several duration percentiles in one sketch read.
+
+        Args:
+            percentiles: Percentiles to calculate (0-100)
+
+        Returns:
+            Durations in ms, in the order requested
+        """
+        if self.count == 0:
+            return [0.0] * len(percentiles)
+        values = self.sketch.quantiles([percentile / 100.0 for percentile in percentiles])
+        # Bucket values can overshoot the observed range by up to 1%
+        return [min(max(value, self.min_time_ms), self.max_time_ms) for value in values]
+
+    def merge(self, other: "OperationMetrics") -> None:
+        """
+        Add another operation's metrics (e.g. from a worker or an earlier time window).
+
+        Args:
+            other: Metrics to add
+        """
+        self.sketch.merge(other.sketch)
+        self.count += other.count
+        self.total_time_ms += other.total_time_ms
+        self.min_time_ms = min(self.min_time_ms, other.min_time_ms)
+        self.max_time_ms = max(self.max_time_ms, other.max_time_ms)
 
     def get_stats(self) -> dict[str, float]:
         """Get comprehensive statistics."""
@@ -86,14 +276,15 @@ class OperationMetrics:
                 "p99_ms": 0.0,
             }
 
+        p50, p95, p99 = self.get_percentiles([50, 95, 99])
         return {
             "count": self.count,
             "avg_ms": self.get_average(),
             "min_ms": self.min_time_ms,
             "max_ms": self.max_time_ms,
-            "p50_ms": self.get_percentile(50),
-            "p95_ms": self.get_percentile(95),
-            "p99_ms": self.get_percentile(99),
+            "p50_ms": p50,
+            "p95_ms": p95,
+            "p99_ms": p99,
         }
 
 
@@ -130,25 +321,100 @@ class CacheMetrics:
         }
 
 
+class _ThreadBuffer:
+    """Records of one thread waiting to be aggregated."""
+
+    __slots__ = ("operations", "cache_events")
+
+    def __init__(self) -> None:
+        self.operations: list[tuple[str, float]] = []
+        self.cache_events: list[tuple[str, bool]] = []
+
+
+class _Registration:
+    """Thread-local handle of a registered buffer (releases it when called or destroyed)."""
+
+    __slots__ = ("buffer", "release", "__weakref__")
+
+    def __init__(self, buffer: _ThreadBuffer, release: Callable[[_ThreadBuffer], None]) -> None:
+        self.buffer = buffer
+        # QThreads never report finished, so the buffer is released from here
+        self.release = weakref.finalize(self, release, buffer)
+        self.release.atexit = False
+
+
+def _take(records: list[Any]) -> list[Any]:
+    """Remove and return buffered records (the owner thread may keep appending)."""
+    taken = records[:]
+    del records[: len(taken)]
+    return taken
+
+
 class MetricsCollector:
     """
     Centralized metrics collection.
 
-    Thread-safe singleton for collecting performance metrics.
+    Thread-safe singleton for collecting performance metrics. Each thread
+    records into its own buffer; buffers are merged under a lock when
+    metrics are read or aggregate() is called.
     """
 
     def __init__(self) -> None:
         """Initialize metrics collector."""
-        self.operations: defaultdict[str, OperationMetrics] = defaultdict(lambda: OperationMetrics(operation_name=""))
-        self.caches: defaultdict[str, CacheMetrics] = defaultdict(lambda: CacheMetrics(cache_name=""))
-        self.enabled = True
+        self._operations: defaultdict[str, OperationMetrics] = defaultdict(lambda: OperationMetrics(operation_name=""))
+        self._caches: defaultdict[str, CacheMetrics] = defaultdict(lambda: CacheMetrics(cache_name=""))
+        self._local = threading.local()
+        self._buffers: list[_ThreadBuffer] = []
+        self._lock = threading.Lock()
+        self.enabled = INSTRUMENTATION_ENABLED
         self.start_time = time.time()
 
         logger.info("MetricsCollector initialized")
 
+    @property
+    def operations(self) -> defaultdict[str, OperationMetrics]:
+        """Operation metrics by name (buffered records included)."""
+        self.aggregate()
+        return self._operations
+
+    @property
+    def caches(self) -> defaultdict[str, CacheMetrics]:
+        """Cache metrics by name (buffered records included)."""
+        self.aggregate()
+        return self._caches
+
+    def _thread_buffer(self) -> _ThreadBuffer:
+        """Get the calling thread's buffer (registered on first use)."""
+        try:
+            return self._local.registration.buffer  # type: ignore[no-any-return]
+        except AttributeError:
+            buffer = _ThreadBuffer()
+            with self._lock:
+                self._buffers.append(buffer)
+            self._local.registration = _Registration(buffer, self._release)
+            return buffer
+
+    def release_thread_buffer(self) -> None:
+        """
+        Merge the calling thread's buffer and unregister it.
+
+        Workers call this before their thread stops; a later record from
+        the same thread registers a new buffer.
+        """
+        registration = self._local.__dict__.pop("registration", None)
+        if registration is not None:
+            registration.release()
+
+    def _release(self, buffer: _ThreadBuffer) -> None:
+        """Merge a buffer's records and stop tracking it."""
+        with self._lock:
+            self._drain(buffer)
+            if buffer in self._buffers:
+                self._buffers.remove(buffer)
+
     def record_operation(self, operation_name: str, duration_ms: float) -> None:
         """
-        Record an operation duration.
+        Record an operation duration (lock-free, buffered per thread).
 
         Args:
             operation_name: Name of operation (e.g., "preview_render")
@@ -157,14 +423,14 @@ class MetricsCollector:
         if not self.enabled:
             return
 
-        if operation_name not in self.operations:
-            self.operations[operation_name] = OperationMetrics(operation_name=operation_name)
-
-        self.operations[operation_name].record(duration_ms)
+        records = self._thread_buffer().operations
+        records.append((operation_name, duration_ms))
+        if len(records) >= THREAD_BUFFER_SIZE:
+            self.aggregate()
 
     def record_cache_event(self, cache_name: str, hit: bool) -> None:
         """
-        Record a cache hit or miss.
+        Record a cache hit or miss (lock-free, buffered per thread).
 
         Args:
             cache_name: Name of cache (e.g., "preview_cache")
@@ -173,25 +439,66 @@ class MetricsCollector:
         if not self.enabled:
             return
 
-        if cache_name not in self.caches:
-            self.caches[cache_name] = CacheMetrics(cache_name=cache_name)
+        events = self._thread_buffer().cache_events
+        events.append((cache_name, hit))
+        if len(events) >= THREAD_BUFFER_SIZE:
+            self.aggregate()
+
+    def aggregate(self) -> None:
+        """Merge all thread buffers into the shared metrics."""
+        with self._lock:
+            for buffer in self._buffers:
+                self._drain(buffer)
+
+    def _drain(self, buffer: _ThreadBuffer) -> None:
+        """Merge one buffer's records (lock held)."""
+        for operation_name, duration_ms in _take(buffer.operations):
+            if operation_name not in self._operations:
+                self._operations[operation_name] = OperationMetrics(operation_name=operation_name)
+            self._operations[operation_name].record(duration_ms)
+
+        for cache_name, hit in _take(buffer.cache_events):
+            if cache_name not in self._caches:
+                self._caches[cache_name] = CacheMetrics(cache_name=cache_name)
+            if hit:
+                self._caches[cache_name].record_hit()
+            else:
+                self._caches[cache_name].record_miss()
+
+    def merge(self, other: "MetricsCollector") -> None:
+        """
+        Add another collector's operations and caches (e.g. from a worker or a previous session window).
 
-        if hit:
-            self.caches[cache_name].record_hit()
-        else:
-            self.caches[cache_name].record_miss()
+        Args:
+            other: Collector to add
+        """
+        other_operations = other.operations
+        other_caches = other.caches
+        with self._lock:
+            for op_name, op_metrics in other_operations.items():
+                if op_name not in self._operations:
+                    self._operations[op_name] = OperationMetrics(operation_name=op_name)
+                self._operations[op_name].merge(op_metrics)
+
+            for cache_name, cache_metrics in other_caches.items():
+                if cache_name not in self._caches:
+                    self._caches[cache_name] = CacheMetrics(cache_name=cache_name)
+                self._caches[cache_name].hits += cache_metrics.hits
+                self._caches[cache_name].misses += cache_metrics.misses
 
     def get_operation_stats(self, operation_name: str) -> dict[str, float] | None:
         """Get statistics for a specific operation."""
-        if operation_name not in self.operations:
+        operations = self.operations
+        if operation_name not in operations:
             return None
-        return self.operations[operation_name].get_stats()
+        return operations[operation_name].get_stats()
 
     def get_cache_stats(self, cache_name: str) -> dict[str, Any] | None:
         """Get statistics for a specific cache."""
-        if cache_name not in self.caches:
+        caches = self.caches
+        if cache_name not in caches:
             return None
-        return self.caches[cache_name].get_stats()
+        return caches[cache_name].get_stats()
 
     def get_statistics(self) -> dict[str, Any]:
         """
@@ -206,12 +513,13 @@ class MetricsCollector:
             "caches": {},
         }
 
+        self.aggregate()
         operations_dict: dict[str, Any] = stats["operations"]
-        for op_name, op_metrics in self.operations.items():
+        for op_name, op_metrics in self._operations.items():
             operations_dict[op_name] = op_metrics.get_stats()
 
         caches_dict: dict[str, Any] = stats["caches"]
-        for cache_name, cache_metrics in self.caches.items():
+        for cache_name, cache_metrics in self._caches.items():
             caches_dict[cache_name] = cache_metrics.get_stats()
 
         return stats
@@ -267,9 +575,13 @@ class MetricsCollector:
         return "\n".join(lines)
 
     def reset(self) -> None:
-        """Reset all metrics."""
-        self.operations.clear()
-        self.caches.clear()
+        """Reset all metrics (buffered records are discarded)."""
+        with self._lock:
+            for buffer in self._buffers:
+                _take(buffer.operations)
+                _take(buffer.cache_events)
+            self._operations.clear()
+            self._caches.clear()
         self.start_time = time.time()
         logger.info("Metrics reset")
 
@@ -319,6 +631,9 @@ def measure_time(
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if not INSTRUMENTATION_ENABLED:
+            return func
+
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             start_time = time.perf_counter()
             try:
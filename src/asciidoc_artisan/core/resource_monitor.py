@@ -132,25 +132,40 @@ class ResourceMonitor:
             Recommended debounce interval in milliseconds
         """
         doc_metrics = self.get_document_metrics(text)
+        return self.calculate_debounce_interval_for_size(doc_metrics.size_bytes, doc_metrics.line_count)
 
+    def calculate_debounce_interval_for_size(self, size_bytes: int, line_count: int) -> int:
+        """
+        Calculate adaptive debounce interval from known document size.
+
+        Same strategy as calculate_debounce_interval() without scanning the
+        text, for callers that already track size and line count.
+
+        Args:
+            size_bytes: Document size (character count is a close estimate)
+            line_count: Number of lines
+
+        Returns:
+            Recommended debounce interval in milliseconds
+        """
         # Tiny document - instant rendering (zero latency!)
-        if doc_metrics.size_bytes < 1000:  # < 1KB
+        if size_bytes < 1000:  # < 1KB
             return self.INSTANT_DEBOUNCE_MS
 
         # Small document - ultra-fast response
-        if doc_metrics.size_bytes < self.SMALL_DOC_BYTES and doc_metrics.line_count < self.SMALL_DOC_LINES:
+        if size_bytes < self.SMALL_DOC_BYTES and line_count < self.SMALL_DOC_LINES:
             return self.MIN_DEBOUNCE_MS
 
         # Medium document
-        if doc_metrics.size_bytes < self.MEDIUM_DOC_BYTES and doc_metrics.line_count < self.MEDIUM_DOC_LINES:
+        if size_bytes < self.MEDIUM_DOC_BYTES and line_count < self.MEDIUM_DOC_LINES:
             return self.NORMAL_DEBOUNCE_MS
 
         # Large document
-        if doc_metrics.size_bytes < self.LARGE_DOC_BYTES and doc_metrics.line_count < self.LARGE_DOC_LINES:
+        if size_bytes < self.LARGE_DOC_BYTES and line_count < self.LARGE_DOC_LINES:
             return self.MEDIUM_DEBOUNCE_MS
 
         # Very large document - use longest debounce
-        if doc_metrics.size_bytes >= self.LARGE_DOC_BYTES * 2 or doc_metrics.line_count >= self.LARGE_DOC_LINES * 2:
+        if size_bytes >= self.LARGE_DOC_BYTES * 2 or line_count >= self.LARGE_DOC_LINES * 2:
             return self.HUGE_DEBOUNCE_MS
 
         # Default for large documents
@@ -6,12 +6,13 @@ Performance: <50ms for 10K lines, memory-efficient iteration, incremental live-s
 Example: engine = SearchEngine("Hello world, hello Python!"); results = engine.find_all("hello", case_sensitive=False); len(results) == 2.
 """
 
-import bisect
 import logging
 import re
 from dataclasses import dataclass
 from re import Pattern
 
+from asciidoc_artisan.core.line_index import LineIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,43 +38,27 @@ class SearchMatch:
 class SearchEngine:
     """High-performance text search with case sensitivity, whole word matching, regex. Example: engine = SearchEngine("Line 1\\nLine 2\\nLine 3"); matches = engine.find_all("Line", case_sensitive=True); len(matches) == 3."""
 
-    def __init__(self, text: str) -> None:
-        """Initialize SearchEngine. Args: text (text to search within)."""
+    def __init__(self, text: str, line_index: LineIndex | None = None) -> None:
+        """Initialize SearchEngine. Args: text (text to search within), line_index (shared LineIndex of text, e.g. DocumentSnapshot.line_index(); built lazily if None)."""
         self._text = text
-        self._lines: list[str] | None = None  # Lazy-loaded line cache
-        self._line_offsets: list[int] | None = None  # Lazy-loaded offset index
+        self._line_index = line_index if line_index is not None and line_index.text is text else None
 
     @property
     def text(self) -> str:
         """Get the current text being searched."""
         return self._text
 
-    def set_text(self, text: str) -> None:
-        """Update text to search. Args: text (new text). Invalidates line cache and offset index."""
+    @property
+    def line_index(self) -> LineIndex:
+        """Line start offsets of the text (shared index if one was given, else built on first use)."""
+        if self._line_index is None:
+            self._line_index = LineIndex(self._text)
+        return self._line_index
+
+    def set_text(self, text: str, line_index: LineIndex | None = None) -> None:
+        """Update text to search. Args: text (new text), line_index (shared LineIndex of text; built lazily if None)."""
         self._text = text
-        self._lines = None  # Invalidate line cache
-        self._line_offsets = None  # Invalidate offset index
-
-    def _get_lines(self) -> list[str]:
-        """Get cached list of lines (lazy-loaded). Returns: List of lines in text."""
-        if self._lines is None:
-            self._lines = self._text.splitlines(keepends=True)
-        return self._lines
-
-    def _build_line_offsets(self) -> list[int]:
-        """Build line offset index for fast O(log n) line lookup. Returns: List of cumulative char offsets for each line start (index i = offset where line i starts). Example: "abc\\ndef\\n" → [0, 4]."""
-        if self._line_offsets is None:
-            lines = self._get_lines()
-            offsets = [0]  # First line always starts at offset 0
-            current_offset = 0
-
-            for line in lines:
-                current_offset += len(line)
-                offsets.append(current_offset)
-
-            self._line_offsets = offsets
-
-        return self._line_offsets
+        self._line_index = line_index if line_index is not None and line_index.text is text else None
 
     def _create_pattern(
         self,
@@ -100,20 +85,16 @@ class SearchEngine:
 
     def _offset_to_line_col(self, offset: int) -> tuple[int, int]:
         """Convert char offset to line/col using binary search (O(log n) perf). Args: offset (0-indexed). Returns: (line_number (1-indexed), column_number (0-indexed))."""
-        offsets = self._build_line_offsets()
-        lines = self._get_lines()
-
-        # Binary search to find line number (O(log n))
-        # bisect_right returns the index where offset would be inserted
-        # Subtract 1 to get the line that contains this offset
-        line_num = bisect.bisect_right(offsets, offset) - 1
+        index = self.line_index
 
-        # Edge case: offset at end of text (beyond all lines)
-        if line_num >= len(lines):
-            return (len(lines), 0)
+        # Edge case: offset at end of text (beyond all lines, a trailing newline ends the last line)
+        if offset >= len(self._text):
+            line_count = index.line_count()
+            if not self._text or self._text.endswith("\n"):
+                line_count -= 1
+            return (line_count, 0)
 
-        # Calculate column within the line
-        column = offset - offsets[line_num]
+        line_num, column = index.offset_to_line_col(offset)
 
         # Return 1-indexed line number
         return (line_num + 1, column)
@@ -0,0 +1,379 @@
+"""
+Search Session - Sorted, incrementally maintained matches of one query.
+
+MA principle: ~300 lines focused on keeping find/replace matches current.
+
+SearchEngine answers each request with a fresh scan: find next scanned
+from the cursor and then ran find_all again for the match index, find
+previous collected every match before the cursor, and live search
+re-scanned the whole text on every keystroke in the find bar. A session
+scans once and keeps the match offsets:
+- Starts and ends are kept in compact int arrays (no object per match);
+  SearchMatch objects are created on demand
+- Find next/previous and the current index use bisect (O(log n))
+- Edits are recorded as they happen and merged into one dirty range;
+  the next lookup re-scans only around it and shifts later matches
+- Extending a literal query (typing in the find bar) filters the
+  current matches instead of re-scanning the text
+
+Incremental updates need matches that cannot overlap: literal queries
+whose prefixes are never also suffixes ("abc", not "aba"). Other queries
+(regex, self-overlapping text) fall back to a full scan, which gives the
+same result.
+
+Example:
+    session = SearchSession(text, "hello", case_sensitive=False)
+    index = session.find_next(cursor_position)
+    match = session.match(index)  # SearchMatch with line/column
+    session.note_edit(position, removed, added)
+    session.sync(new_text)  # Re-scans around the edit only
+"""
+
+import bisect
+import logging
+from array import array
+from collections.abc import Iterator
+
+from asciidoc_artisan.core.line_index import ASTRAL_PATTERN, LineIndex
+from asciidoc_artisan.core.search_engine import SearchEngine, SearchMatch
+
+logger = logging.getLogger(__name__)
+
+
+def _has_border(text: str) -> bool:
+    """True if a proper prefix of text is also a suffix (occurrences may overlap)."""
+    return any(text[:size] == text[-size:] for size in range(1, len(text)))
+
+
+class SearchSession:
+    """
+    Matches of one query in one document, kept current across edits.
+
+    Attributes:
+        search_text: Text or pattern searched for
+        case_sensitive: Whether the search is case-sensitive
+        whole_word: Whether only whole words match
+        use_regex: Whether search_text is a regex pattern
+    """
+
+    def __init__(
+        self,
+        text: str,
+        search_text: str,
+        case_sensitive: bool = True,
+        whole_word: bool = False,
+        use_regex: bool = False,
+        line_index: LineIndex | None = None,
+    ) -> None:
+        """
+        Initialize session and scan text once.
+
+        Args:
+            text: Document text
+            search_text: Text or pattern to search for
+            case_sensitive: Whether search is case-sensitive (default: True)
+            whole_word: Whether to match whole words only (default: False)
+            use_regex: Whether search_text is a regex pattern (default: False)
+            line_index: Shared LineIndex of text for match lines (default: built on demand)
+
+        Raises:
+            ValueError: If search_text is empty
+            re.error: If the regex pattern is invalid
+        """
+        if not search_text:
+            raise ValueError("Search text cannot be empty")
+
+        self.search_text = search_text
+        self.case_sensitive = case_sensitive
+        self.whole_word = whole_word
+        self.use_regex = use_regex
+
+        self._engine = SearchEngine(text, line_index)
+        self._pattern = self._engine._create_pattern(search_text, case_sensitive, whole_word, use_regex)
+        self._starts = array("l")
+        self._ends = array("l")
+        # Pending edits merged into one range: [lo, hi) of the current text
+        # replaced [lo, hi - delta) of the last synced text
+        self._dirty: tuple[int, int, int] | None = None
+        self._has_astral = False
+
+        self._full_scans = 0
+        self._partial_scans = 0
+        self._scan()
+
+    @property
+    def text(self) -> str:
+        """Text of the last sync."""
+        return self._engine.text
+
+    def same_query(self, search_text: str, case_sensitive: bool, whole_word: bool, use_regex: bool) -> bool:
+        """True if the session searches for exactly this query."""
+        return (search_text, case_sensitive, whole_word, use_regex) == (
+            self.search_text,
+            self.case_sensitive,
+            self.whole_word,
+            self.use_regex,
+        )
+
+    def refine(self, search_text: str) -> bool:
+        """
+        Switch to a longer literal query by filtering the current matches.
+
+        Only applies when the text is synced, the query extends the
+        current one and current matches cannot overlap.
+
+        Args:
+            search_text: New query starting with the current one
+
+        Returns:
+            True if refined, False if a new session is needed
+        """
+        if (
+            self._dirty is not None
+            or self.use_regex
+            or self.whole_word
+            or len(search_text) <= len(self.search_text)
+            or not search_text.startswith(self.search_text)
+            or not self._incremental
+        ):
+            return False
+
+        pattern = self._engine._create_pattern(search_text, self.case_sensitive)
+        text = self.text
+        starts = array("l")
+        ends = array("l")
+        last_end = 0
+        for start in self._starts:
+            if start >= last_end and (match := pattern.match(text, start)):
+                starts.append(start)
+                ends.append(match.end())
+                last_end = match.end()
+
+        self.search_text = search_text
+        self._pattern = pattern
+        self._starts, self._ends = starts, ends
+        logger.debug(f"Search refined to '{search_text}': {len(starts)} matches")
+        return True
+
+    def note_edit(self, position: int, removed: int, added: int) -> None:
+        """
+        Record a document edit (applied by the next sync()).
+
+        Args:
+            position: Offset of the edit
+            removed: Characters removed at position
+            added: Characters inserted at position
+        """
+        if self._dirty is None:
+            self._dirty = (position, position + added, added - removed)
+            return
+
+        lo, hi, delta = self._dirty
+        end = max(hi, position + removed)
+        self._dirty = (min(lo, position), end + added - removed, delta + added - removed)
+
+    def sync(self, text: str, line_index: LineIndex | None = None) -> None:
+        """
+        Bring matches up to date with text after recorded edits.
+
+        Re-scans only around the merged edit range when possible; any
+        inconsistency (unrecorded edits, UTF-16 offsets) re-scans all.
+
+        Args:
+            text: Current document text
+            line_index: Shared LineIndex of text (default: built on demand)
+        """
+        dirty, self._dirty = self._dirty, None
+        if dirty is None:
+            if text is not self.text and text != self.text:
+                self._engine.set_text(text, line_index)
+                self._scan()
+            elif line_index is not None and line_index.text is self.text:
+                self._engine.set_text(self.text, line_index)
+            return
+
+        lo, hi, delta = dirty
+        old_length = len(self.text)
+        self._engine.set_text(text, line_index)
+        if (
+            not self._incremental
+            or self._has_astral
+            or len(text) != old_length + delta
+            or not 0 <= lo <= hi <= len(text)
+            or ASTRAL_PATTERN.search(text, lo, hi)
+        ):
+            self._scan()
+            return
+
+        self._rescan(lo, hi, delta)
+
+    @property
+    def starts(self) -> "array[int]":
+        """Sorted start offsets of the matches (replaced, not mutated, by sync)."""
+        return self._starts
+
+    @property
+    def line_index(self) -> LineIndex:
+        """LineIndex of the text of the last sync."""
+        return self._engine.line_index
+
+    def __len__(self) -> int:
+        """Number of matches."""
+        return len(self._starts)
+
+    def index_at(self, offset: int) -> int | None:
+        """
+        Index of the first match starting at or after offset (else the last match).
+
+        Args:
+            offset: Character offset (e.g. cursor position)
+
+        Returns:
+            Match index, or None if there are no matches
+        """
+        if not self._starts:
+            return None
+        return min(bisect.bisect_left(self._starts, offset), len(self._starts) - 1)
+
+    def find_next(self, offset: int, wrap_around: bool = True) -> int | None:
+        """
+        Index of the first match starting at or after offset.
+
+        Args:
+            offset: Character offset to search from
+            wrap_around: Return the first match if none follows (default: True)
+
+        Returns:
+            Match index, or None if not found
+        """
+        index = bisect.bisect_left(self._starts, offset)
+        if index < len(self._starts):
+            return index
+        return 0 if wrap_around and self._starts else None
+
+    def find_previous(self, offset: int, wrap_around: bool = True) -> int | None:
+        """
+        Index of the last match ending at or before offset.
+
+        Args:
+            offset: Character offset to search back from
+            wrap_around: Return the last match if none precedes (default: True)
+
+        Returns:
+            Match index, or None if not found
+        """
+        index = bisect.bisect_right(self._ends, offset) - 1
+        if index >= 0:
+            return index
+        return len(self._starts) - 1 if wrap_around and self._starts else None
+
+    def match(self, index: int) -> SearchMatch:
+        """
+        Create the SearchMatch of a match index.
+
+        Args:
+            index: Match index (0-based)
+
+        Returns:
+            SearchMatch with text, line and column
+        """
+        start, end = self._starts[index], self._ends[index]
+        line, column = self._engine._offset_to_line_col(start)
+        return SearchMatch(start=start, end=end, text=self.text[start:end], line=line, column=column)
+
+    def document_span(self, index: int) -> tuple[int, int]:
+        """
+        Editor (UTF-16) positions of a match.
+
+        Args:
+            index: Match index (0-based)
+
+        Returns:
+            (start, end) as QTextCursor positions
+        """
+        start, end = self._starts[index], self._ends[index]
+        if not self._has_astral:
+            return start, end
+        prefix = self.text[:start].encode("utf-16-le")
+        return len(prefix) // 2, (len(prefix) + len(self.text[start:end].encode("utf-16-le"))) // 2
+
+    def replacement(self, index: int, replace_text: str) -> str:
+        """
+        Replacement text of a match.
+
+        Args:
+            index: Match index (0-based)
+            replace_text: Replacement (backreferences expanded for regex queries)
+
+        Returns:
+            Text to insert in place of the match
+        """
+        if not self.use_regex:
+            return replace_text
+        match = self._pattern.match(self.text, self._starts[index])
+        return match.expand(replace_text) if match else replace_text
+
+    def iter_matches(self, start_index: int = 0) -> Iterator[SearchMatch]:
+        """
+        Yield SearchMatch objects in document order, created one at a time.
+
+        Args:
+            start_index: Index of the first match to yield (default: 0)
+        """
+        for index in range(start_index, len(self._starts)):
+            yield self.match(index)
+
+    @property
+    def _incremental(self) -> bool:
+        """True if matches cannot overlap, so edits and refinement stay local."""
+        if self.use_regex:
+            return False
+        if not self.case_sensitive and not self.search_text.isascii():
+            return False
+        text = self.search_text if self.case_sensitive else self.search_text.lower()
+        return not _has_border(text)
+
+    def _scan(self) -> None:
+        """Scan the whole text."""
+        text = self.text
+        self._starts = array("l")
+        self._ends = array("l")
+        for match in self._pattern.finditer(text):
+            self._starts.append(match.start())
+            self._ends.append(match.end())
+        self._has_astral = ASTRAL_PATTERN.search(text) is not None
+        self._full_scans += 1
+
+    def _rescan(self, lo: int, hi: int, delta: int) -> None:
+        """Re-scan around [lo, hi) of the new text; keep and shift matches outside it."""
+        margin = 1 if self.whole_word else 0
+        reach = len(self.search_text) + margin
+        text = self.text
+
+        # Matches clear of the edit (in old offsets) are still valid
+        first = bisect.bisect_right(self._ends, lo - margin)
+        last = bisect.bisect_left(self._starts, hi - delta + margin)
+
+        starts = array("l")
+        ends = array("l")
+        for match in self._pattern.finditer(text, max(0, lo - reach), min(len(text), hi + reach + 1)):
+            if match.end() + margin > lo and match.start() - margin < hi:
+                starts.append(match.start())
+                ends.append(match.end())
+
+        self._starts = self._starts[:first] + starts + array("l", (start + delta for start in self._starts[last:]))
+        self._ends = self._ends[:first] + ends + array("l", (end + delta for end in self._ends[last:]))
+        self._partial_scans += 1
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get session statistics.
+
+        Returns:
+            Dictionary with matches, full scans and partial (edit) scans
+        """
+        return {
+            "matches": len(self._starts),
+            "full_scans": self._full_scans,
+            "partial_scans": self._partial_scans,
+        }
@@ -0,0 +1,243 @@
+"""
+Spell Check Session - Incremental spell checking of one edited document.
+
+MA principle: ~200 lines focused on re-checking only changed paragraphs.
+
+SpellChecker.check_text() checks every word of the document on each pass
+and flags words in code. A session splits the text into paragraphs and
+remembers the misspellings of each paragraph text:
+- Unchanged paragraphs (even if moved) reuse their cached result
+- Changed paragraphs are checked with one batched dictionary lookup
+- Listing, literal, passthrough and comment blocks, fenced code,
+  attribute entries, block attribute lines and // comments are skipped
+- Suggestions are not computed here (SpellChecker.get_suggestions on demand)
+- Optionally, paragraphs on visible lines are checked and reported first
+
+Example:
+    session = SpellCheckSession(SpellChecker())
+    errors = session.check(text)  # First pass: every paragraph
+    errors = session.check(edited_text)  # Only the edited paragraph
+"""
+
+import logging
+import re
+import threading
+from collections.abc import Callable, Iterator
+from typing import NamedTuple
+
+from asciidoc_artisan.core.lru_cache import LRUCache
+from asciidoc_artisan.core.spell_checker import SpellChecker, SpellError
+
+logger = logging.getLogger(__name__)
+
+# Max paragraphs with a cached result
+PARAGRAPH_CACHE_SIZE = 5000
+
+# Delimiters of blocks whose content is not prose (listing, literal, passthrough, comment)
+SKIPPED_BLOCK_PATTERN = re.compile(r"^(-{4,}|\.{4,}|\+{4,}|/{4,})\s*$")
+FENCE_PATTERN = re.compile(r"^```")
+
+# Single lines that are not prose (attribute entry, block attribute/anchor, comment)
+SKIPPED_LINE_PATTERN = re.compile(r"^(:!?[\w-]+!?:|\[.*\]\s*$|//)")
+
+
+class Paragraph(NamedTuple):
+    """Prose paragraph: text starting at an absolute offset and line (0-indexed)."""
+
+    start: int
+    line: int
+    text: str
+
+
+# Cached misspelling within a paragraph: (start, end, word, line (1-indexed), column)
+CachedError = tuple[int, int, str, int, int]
+
+
+class SpellCheckCancelled(Exception):
+    """Raised by SpellCheckSession.check() when its cancel check returns True."""
+
+
+def iter_paragraphs(text: str) -> Iterator[Paragraph]:
+    """
+    Split text into prose paragraphs, leaving out non-prose lines and blocks.
+
+    Args:
+        text: Document text
+
+    Yields:
+        Paragraphs in document order
+    """
+    offset = 0
+    block_delimiter: str | None = None
+    start = first_line = 0
+    parts: list[str] = []
+
+    for line_num, line in enumerate(text.splitlines(keepends=True)):
+        content = line.rstrip("\r\n")
+        prose = False
+
+        if block_delimiter is not None:
+            if content.rstrip() == block_delimiter:
+                block_delimiter = None
+        elif match := SKIPPED_BLOCK_PATTERN.match(content):
+            block_delimiter = match.group(1)
+        elif FENCE_PATTERN.match(content):
+            block_delimiter = "```"
+        else:
+            prose = bool(content.strip()) and not SKIPPED_LINE_PATTERN.match(content)
+
+        if prose:
+            if not parts:
+                start, first_line = offset, line_num
+            parts.append(line)
+        elif parts:
+            yield Paragraph(start, first_line, "".join(parts))
+            parts = []
+
+        offset += len(line)
+
+    if parts:
+        yield Paragraph(start, first_line, "".join(parts))
+
+
+def _last_line(paragraph: Paragraph) -> int:
+    """Last line (0-indexed) of a paragraph."""
+    return paragraph.line + paragraph.text.rstrip("\r\n").count("\n")
+
+
+class SpellCheckSession:
+    """
+    Paragraph-level spell check cache for one document.
+
+    Thread-safe: check() calls are serialized.
+
+    Attributes:
+        checker: Spell checker used for dictionary lookups
+    """
+
+    def __init__(self, checker: SpellChecker) -> None:
+        """
+        Initialize session.
+
+        Args:
+            checker: Spell checker used for dictionary lookups
+        """
+        self.checker = checker
+        self._lock = threading.Lock()
+        self._paragraphs: LRUCache[str, tuple[CachedError, ...]] = LRUCache(
+            max_size=PARAGRAPH_CACHE_SIZE, name="SpellParagraphs"
+        )
+        self._last_checked = 0
+        self._last_reused = 0
+
+    def check(
+        self,
+        text: str,
+        cancelled: Callable[[], bool] | None = None,
+        visible: tuple[int, int] | None = None,
+        on_visible: Callable[[list[SpellError], int, int], None] | None = None,
+    ) -> list[SpellError]:
+        """
+        Spell check text, re-checking only paragraphs not seen before.
+
+        With visible and on_visible, paragraphs overlapping the visible
+        lines are checked first and reported through on_visible before the
+        rest of the document is checked (skipped if nothing else changed).
+
+        Args:
+            text: Document text
+            cancelled: Polled before each changed paragraph; raises SpellCheckCancelled if True
+            visible: First and last visible line (0-indexed) to check first
+            on_visible: Called with (errors, first_line, last_line) of the visible paragraphs
+
+        Returns:
+            Misspellings in document order (suggestions left empty)
+        """
+        with self._lock:
+            paragraphs = list(iter_paragraphs(text))
+            checked = reused = 0
+
+            if visible is not None and on_visible is not None:
+                first, last = visible
+                in_view = [p for p in paragraphs if p.line <= last and _last_line(p) >= first]
+                pending = [p for p in paragraphs if self._paragraphs.get(p.text) is None]
+                if in_view and len(pending) > sum(1 for p in in_view if self._paragraphs.get(p.text) is None):
+                    errors, checked, _ = self._check_paragraphs(in_view, cancelled)
+                    on_visible(errors, in_view[0].line, _last_line(in_view[-1]))
+
+            errors, checked_rest, reused = self._check_paragraphs(paragraphs, cancelled)
+            self._last_checked = checked + checked_rest
+            self._last_reused = reused - checked
+
+        logger.debug(f"Spell check: {self._last_checked} paragraphs checked, {self._last_reused} reused")
+        return errors
+
+    def _check_paragraphs(
+        self, paragraphs: list[Paragraph], cancelled: Callable[[], bool] | None
+    ) -> tuple[list[SpellError], int, int]:
+        """
+        Spell check paragraphs, using cached results where possible (lock held).
+
+        Returns:
+            (errors, paragraphs checked, paragraphs reused)
+        """
+        errors: list[SpellError] = []
+        checked = reused = 0
+        for paragraph in paragraphs:
+            cached = self._paragraphs.get(paragraph.text)
+            if cached is None:
+                if cancelled is not None and cancelled():
+                    raise SpellCheckCancelled
+                cached = tuple(
+                    (error.start, error.end, error.word, error.line, error.column)
+                    for error in self.checker.check_text(paragraph.text, with_suggestions=False)
+                )
+                self._paragraphs.put(paragraph.text, cached)
+                checked += 1
+            else:
+                reused += 1
+
+            for start, end, word, line, column in cached:
+                errors.append(
+                    SpellError(
+                        word=word,
+                        start=paragraph.start + start,
+                        end=paragraph.start + end,
+                        suggestions=[],
+                        line=paragraph.line + line,
+                        column=column,
+                    )
+                )
+        return errors, checked, reused
+
+    def forget_word(self, word: str) -> None:
+        """
+        Drop cached misspellings of a word (after adding or ignoring it).
+
+        Args:
+            word: Word now considered correct
+        """
+        word_lower = word.lower()
+        with self._lock:
+            for text, cached in list(self._paragraphs.items()):
+                if any(error[2].lower() == word_lower for error in cached):
+                    self._paragraphs.put(text, tuple(error for error in cached if error[2].lower() != word_lower))
+
+    def reset(self) -> None:
+        """Forget all cached results (e.g. after a language change)."""
+        with self._lock:
+            self._paragraphs.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get session statistics.
+
+        Returns:
+            Dictionary with cached paragraphs and paragraphs checked/reused by the last pass
+        """
+        with self._lock:
+            return {
+                "cached_paragraphs": len(self._paragraphs),
+                "last_checked": self._last_checked,
+                "last_reused": self._last_reused,
+            }
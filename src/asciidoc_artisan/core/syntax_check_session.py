@@ -0,0 +1,331 @@
+"""
+Syntax Check Session - Incremental re-checking of one edited document.
+
+MA principle: ~300 lines focused on re-validating only what an edit touched.
+
+SyntaxChecker.validate() applies every rule to every line, and
+validate_incremental() only filtered the output, so each keystroke paid
+for a full scan. A session remembers the previous run of one document:
+- Dirty lines: common prefix/suffix diff against the previous text
+- Line rules (RuleScope.LINE) re-check dirty lines only; cached errors
+  of other lines are kept (shifted when lines were inserted or removed)
+- Facts (anchors, attribute names, block delimiter lines) are cached per
+  line; a rule that reads a fact is re-run fully only when it changed
+- Document rules are reused while their facts are unchanged and no
+  lines moved
+
+Results equal SyntaxChecker.validate() on the same text.
+
+Example:
+    session = SyntaxCheckSession(SyntaxChecker())
+    errors = session.validate(text)  # First run: all rules, all lines
+    errors = session.validate(edited_text)  # Dirty lines only
+"""
+
+import logging
+import re
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from asciidoc_artisan.core.models import SyntaxErrorModel
+from asciidoc_artisan.core.syntax_checker import (
+    ANCHOR_PATTERN,
+    ATTRIBUTE_PATTERN,
+    RuleScope,
+    SyntaxChecker,
+    ValidationCancelled,
+    ValidationContext,
+    ValidationRule,
+    shift_error,
+)
+
+logger = logging.getLogger(__name__)
+
+# Block attribute or delimiter lines (superset of UnclosedBlockRule patterns)
+DELIMITER_PATTERN = re.compile(r"\[(?:source|example|sidebar|quote|listing)|^[-=*_]{4,}$")
+
+# Per-line fact extractors: line -> hashable value (falsy = no fact on line)
+FACT_EXTRACTORS: dict[str, Callable[[str], Hashable]] = {
+    "anchors": lambda line: (
+        tuple((m.group(1) or m.group(2), m.start(), m.end()) for m in ANCHOR_PATTERN.finditer(line))
+        if "[" in line
+        else ()
+    ),
+    "attributes": lambda line: (
+        match.group(1).strip() if line.startswith(":") and (match := ATTRIBUTE_PATTERN.match(line)) else None
+    ),
+    "delimiters": lambda line: line if DELIMITER_PATTERN.search(line) else None,
+}
+
+# Errors of one line rule, one list per document line
+LineErrors = list[list[SyntaxErrorModel]]
+
+
+class _SessionContext(ValidationContext):
+    """ValidationContext whose anchors and attributes come from the session cache."""
+
+    def __init__(
+        self,
+        document: str,
+        lines: list[str],
+        anchors: list[str],
+        attributes: dict[str, str],
+        changed_lines: list[int] | None = None,
+    ) -> None:
+        super().__init__(document, changed_lines, lines)
+        self._anchors = anchors
+        self._attributes = attributes
+
+    @property
+    def anchors(self) -> list[str]:  # type: ignore[override]
+        """Anchor IDs in document order (cached between runs)."""
+        return self._anchors
+
+    @property
+    def attributes(self) -> dict[str, str]:  # type: ignore[override]
+        """Document attributes (cached between runs)."""
+        return self._attributes
+
+
+class SyntaxCheckSession:
+    """
+    Incremental validation state for one document.
+
+    Thread-safe: validate() calls are serialized; a cancelled run leaves
+    the previous state untouched.
+
+    Attributes:
+        checker: Syntax checker providing the rules
+    """
+
+    def __init__(self, checker: SyntaxChecker) -> None:
+        """
+        Initialize session (the first validate() checks everything).
+
+        Args:
+            checker: Syntax checker providing the rules
+        """
+        self.checker = checker
+        self._lock = threading.Lock()
+        self._rules: list[ValidationRule] = []
+        self._lines: list[str] | None = None
+        self._facts: dict[str, list[Any]] = {}
+        self._anchors: list[str] = []
+        self._attributes: dict[str, str] = {}
+        self._line_errors: dict[int, LineErrors] = {}
+        self._document_errors: dict[int, list[SyntaxErrorModel]] = {}
+
+        self._runs = 0
+        self._rules_run = 0
+        self._rules_reused = 0
+        self._last_dirty_lines = 0
+
+    def reset(self) -> None:
+        """Forget the previous run (e.g. when another document is loaded)."""
+        with self._lock:
+            self._lines = None
+            self._facts = {}
+            self._anchors = []
+            self._attributes = {}
+            self._line_errors = {}
+            self._document_errors = {}
+
+    def validate(self, document: str, cancelled: Callable[[], bool] | None = None) -> list[SyntaxErrorModel]:
+        """
+        Validate document, re-checking only what changed since the last run.
+
+        Args:
+            document: Document text
+            cancelled: Polled before each rule; raises ValidationCancelled if True
+
+        Returns:
+            Errors sorted by line, then column
+        """
+        with self._lock:
+            lines = document.splitlines()
+            rules = list(self.checker.rules)
+            if rules != self._rules:
+                self._lines = None  # Rule set changed, nothing to reuse
+
+            start, old_end, new_end = self._dirty_range(lines)
+            delta = new_end - old_end
+            fresh = self._lines is None
+
+            facts, changed_facts, moved_facts = self._update_facts(lines, start, old_end, new_end)
+            dirty = list(range(start, new_end))
+
+            anchors = self._anchors
+            if "anchors" in changed_facts:
+                anchors = [anchor[0] for line_anchors in facts["anchors"] if line_anchors for anchor in line_anchors]
+            attributes = self._attributes
+            if "attributes" in moved_facts or any(facts["attributes"][start:new_end]):
+                attributes = self._collect_attributes(lines, facts["attributes"])
+
+            context = _SessionContext(document, lines, anchors, attributes)
+            dirty_context = _SessionContext(document, lines, anchors, attributes, dirty)
+
+            line_errors: dict[int, LineErrors] = {}
+            document_errors: dict[int, list[SyntaxErrorModel]] = {}
+            all_errors: list[SyntaxErrorModel] = []
+            rules_run = 0
+
+            for rule in rules:
+                key = id(rule)
+                scope = getattr(rule, "scope", RuleScope.DOCUMENT)
+                rule_facts = getattr(rule, "facts", None)
+
+                if scope == RuleScope.LINE and rule_facts is not None:
+                    cached = self._line_errors.get(key)
+                    if fresh or cached is None or any(name in changed_facts for name in rule_facts):
+                        self._check_cancelled(cancelled)
+                        per_line = self._bucket(self.checker.run_rule(rule, context), 0, len(lines))
+                        rules_run += 1
+                    else:
+                        if dirty:
+                            self._check_cancelled(cancelled)
+                            rules_run += 1
+                        errors = self.checker.run_rule(rule, dirty_context) if dirty else []
+                        suffix = cached[old_end:]
+                        if delta:
+                            suffix = [
+                                [shift_error(e, old_end, delta) for e in errs] if errs else errs for errs in suffix
+                            ]
+                        per_line = cached[:start] + self._bucket(errors, start, new_end) + suffix
+                    line_errors[key] = per_line
+                    all_errors.extend(error for errs in per_line for error in errs)
+                else:
+                    cached_errors = self._document_errors.get(key)
+                    reusable = (
+                        not fresh
+                        and cached_errors is not None
+                        and rule_facts is not None
+                        and delta == 0
+                        and not any(name in moved_facts for name in rule_facts)
+                    )
+                    if reusable and cached_errors is not None:
+                        errors = cached_errors
+                    else:
+                        self._check_cancelled(cancelled)
+                        errors = self.checker.run_rule(rule, context)
+                        rules_run += 1
+                    document_errors[key] = errors
+                    all_errors.extend(errors)
+
+            # Commit (only after every rule ran, so cancelling keeps the old state)
+            self._rules = rules
+            self._lines = lines
+            self._facts = facts
+            self._anchors = anchors
+            self._attributes = attributes
+            self._line_errors = line_errors
+            self._document_errors = document_errors
+
+            self._runs += 1
+            self._rules_run += rules_run
+            self._rules_reused += len(rules) - rules_run
+            self._last_dirty_lines = len(dirty)
+
+        all_errors.sort(key=lambda err: (err.line, err.column))
+        return all_errors
+
+    def _dirty_range(self, lines: list[str]) -> tuple[int, int, int]:
+        """
+        Diff lines against the previous run.
+
+        Returns:
+            (start, old_end, new_end): old lines [start, old_end) became
+            new lines [start, new_end); everything is dirty on a fresh run
+        """
+        old = self._lines
+        if old is None:
+            return 0, 0, len(lines)
+
+        limit = min(len(old), len(lines))
+        start = 0
+        while start < limit and old[start] == lines[start]:
+            start += 1
+
+        suffix = 0
+        limit -= start
+        while suffix < limit and old[-1 - suffix] == lines[-1 - suffix]:
+            suffix += 1
+
+        old_end = len(old) - suffix
+        new_end = len(lines) - suffix
+        if old_end == start and old_end < len(old):
+            # Pure insertion: include the following line so positions
+            # before the first shifted line stay put
+            old_end += 1
+            new_end += 1
+        return start, old_end, new_end
+
+    def _update_facts(
+        self, lines: list[str], start: int, old_end: int, new_end: int
+    ) -> tuple[dict[str, list[Any]], set[str], set[str]]:
+        """
+        Splice facts of the dirty lines into the cached facts.
+
+        Returns:
+            (facts, changed, moved): changed = facts whose document-order
+            values differ; moved = facts that differ at any dirty position
+        """
+        facts: dict[str, list[Any]] = {}
+        changed: set[str] = set()
+        moved: set[str] = set()
+        for name, extract in FACT_EXTRACTORS.items():
+            new_values = [extract(line) for line in lines[start:new_end]]
+            cached = self._facts.get(name)
+            if self._lines is None or cached is None:
+                facts[name] = new_values
+                changed.add(name)
+                moved.add(name)
+                continue
+
+            old_values = cached[start:old_end]
+            if old_values != new_values:
+                moved.add(name)
+                if [v for v in old_values if v] != [v for v in new_values if v]:
+                    changed.add(name)
+            facts[name] = cached[:start] + new_values + cached[old_end:]
+        return facts, changed, moved
+
+    @staticmethod
+    def _collect_attributes(lines: list[str], names: list[Any]) -> dict[str, str]:
+        """Build the attributes dict, re-matching only lines with an attribute fact."""
+        attributes = {}
+        for line_num, name in enumerate(names):
+            if name and (match := ATTRIBUTE_PATTERN.match(lines[line_num])):
+                attributes[name] = match.group(2).strip()
+        return attributes
+
+    @staticmethod
+    def _bucket(errors: list[SyntaxErrorModel], start: int, end: int) -> LineErrors:
+        """Group errors of lines [start, end) into one list per line."""
+        per_line: LineErrors = [[] for _ in range(end - start)]
+        if not per_line:
+            return per_line
+        for error in errors:
+            per_line[min(max(error.line - start, 0), len(per_line) - 1)].append(error)
+        return per_line
+
+    @staticmethod
+    def _check_cancelled(cancelled: Callable[[], bool] | None) -> None:
+        """Raise ValidationCancelled if the run is no longer wanted."""
+        if cancelled is not None and cancelled():
+            raise ValidationCancelled
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get session statistics.
+
+        Returns:
+            Dictionary with runs, rules run/reused and dirty lines of the last run
+        """
+        with self._lock:
+            return {
+                "runs": self._runs,
+                "rules_run": self._rules_run,
+                "rules_reused": self._rules_reused,
+                "last_dirty_lines": self._last_dirty_lines,
+            }
@@ -26,7 +26,7 @@ from asciidoc_artisan.core.models import (
     SyntaxErrorModel,
     TextEdit,
 )
-from asciidoc_artisan.core.syntax_checker import ValidationContext
+from asciidoc_artisan.core.syntax_checker import RuleScope, ValidationContext
 
 
 class UnclosedBlockRule:
@@ -38,6 +38,9 @@ class UnclosedBlockRule:
     Matches: [source], [example], [sidebar], [quote] without closing delimiter
     """
 
+    scope = RuleScope.DOCUMENT
+    facts = ("delimiters",)
+
     BLOCK_PATTERNS = {
         "source": (r"\[source[^\]]*\]", r"^-{4,}$"),
         "example": (r"\[example\]", r"^={4,}$"),
@@ -52,18 +55,16 @@ class UnclosedBlockRule:
         lines = context.lines
 
         for block_type, (start_pattern, end_pattern) in self.BLOCK_PATTERNS.items():
-            for i, line in enumerate(lines):
-                if not context.should_validate_line(i):
-                    continue
-
-                if re.search(start_pattern, line):
-                    found_close = False
-                    for j in range(i + 1, len(lines)):
-                        if re.match(end_pattern, lines[j]):
-                            found_close = True
-                            break
-
-                    if not found_close:
+            start_regex = re.compile(start_pattern)
+            end_regex = re.compile(end_pattern)
+            # A block is closed if any later line matches: compare with the last match
+            last_close = next((j for j in range(len(lines) - 1, -1, -1) if end_regex.match(lines[j])), -1)
+
+            for i in context.lines_to_validate():
+                line = lines[i]
+
+                if start_regex.search(line):
+                    if last_close <= i:
                         delimiter = self._get_delimiter(block_type)
                         errors.append(
                             SyntaxErrorModel(
@@ -113,14 +114,16 @@ class InvalidAttributeRule:
     Matches: Attribute definitions missing closing colon
     """
 
+    scope = RuleScope.LINE
+    facts = ()
+
     def validate(self, context: ValidationContext) -> list[SyntaxErrorModel]:
         """Validate attribute syntax."""
         errors = []
         lines = context.lines
 
-        for i, line in enumerate(lines):
-            if not context.should_validate_line(i):
-                continue
+        for i in context.lines_to_validate():
+            line = lines[i]
 
             if line.strip().startswith(":") and not line.strip().endswith(":"):
                 if " " in line or len(line.strip()) > 1:
@@ -161,14 +164,16 @@ class MalformedXRefRule:
     Matches: <<target without closing >>
     """
 
+    scope = RuleScope.LINE
+    facts = ()
+
     def validate(self, context: ValidationContext) -> list[SyntaxErrorModel]:
         """Validate cross-reference syntax."""
         errors = []
         lines = context.lines
 
-        for i, line in enumerate(lines):
-            if not context.should_validate_line(i):
-                continue
+        for i in context.lines_to_validate():
+            line = lines[i]
 
             matches = re.finditer(r"<<([^>]*?)(?:>>|$)", line)
             for match in matches:
@@ -3,21 +3,28 @@ Telemetry Collector - Privacy-First Usage Analytics (opt-in, local-only, NO clou
 
 Privacy: Opt-in only (disabled default), anonymous UUIDs, NO personal data/content/paths, easy opt-out.
 Collects: Feature usage (menu/dialogs), error patterns (types only), performance metrics, system info (OS/Python/GPU).
-Storage: ~/.config/AsciiDocArtisan/telemetry.toon, TOON format, 10MB max (auto-rotate), 30-day retention.
+Storage: ~/.config/AsciiDocArtisan/telemetry-NNNNNN.jsonl, append-only log (one JSON event per line) in 1MB segments,
+written by a background thread. 10MB max and 30-day retention drop whole old segments. telemetry-summary.json keeps
+per-segment event counts, so statistics never re-read the log. Legacy telemetry.toon/telemetry.json are migrated.
 Example: collector = TelemetryCollector(); collector.track_event("menu_click", {"menu": "File", "action": "Open"}); collector.track_performance("startup_time", 1.05).
 """
 
 import logging
 import platform
+import shutil
 import sys
+import threading
 import time
 import uuid
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from . import toon_utils
+from . import json_utils, toon_utils
+from .file_operations import atomic_save_json
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +36,15 @@ EVENT_PERFORMANCE = "performance"
 EVENT_STARTUP = "startup"
 EVENT_FEATURE_USE = "feature_use"
 
+# Log segments: telemetry-000001.jsonl, telemetry-000002.jsonl, ... (oldest first)
+SEGMENT_PREFIX = "telemetry-"
+SEGMENT_SUFFIX = ".jsonl"
+SEGMENT_MAX_BYTES = 1024 * 1024  # Start a new segment past 1MB
+SUMMARY_FILE_NAME = "telemetry-summary.json"
+
+# Segments whose newest event is older than this are dropped (30 days)
+RETENTION_SECONDS = 30 * 24 * 60 * 60
+
 
 @dataclass
 class TelemetryEvent:
@@ -44,8 +60,18 @@ class TelemetryEvent:
         return asdict(self)
 
 
+@dataclass
+class _SegmentSummary:
+    """Running totals of one log segment. Attributes: events, size (bytes), last_time (epoch of last append), event_counts (by type)."""
+
+    events: int = 0
+    size: int = 0
+    last_time: float = 0.0
+    event_counts: dict[str, int] = field(default_factory=dict)
+
+
 class TelemetryCollector:
-    """Privacy-first telemetry with local-only storage. Features: Opt-in only, local JSON, anonymous IDs, NO personal data, auto-rotation (10MB max), 30-day retention. Example: collector = TelemetryCollector(enabled=True); collector.track_event("menu_click", {"menu": "File"}); collector.track_performance("render_time", 0.05)."""
+    """Privacy-first telemetry with local-only storage. Features: Opt-in only, append-only local log, anonymous IDs, NO personal data, segment rotation (10MB max), 30-day retention. Example: collector = TelemetryCollector(enabled=True); collector.track_event("menu_click", {"menu": "File"}); collector.track_performance("render_time", 0.05)."""
 
     def __init__(
         self,
@@ -75,45 +101,70 @@ class TelemetryCollector:
         # Create data directory if it doesn't exist
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
-        # Telemetry file path (TOON format v2.1.0+)
-        self.telemetry_file = self.data_dir / "telemetry.toon"
-        self._legacy_json_file = self.data_dir / "telemetry.json"
-
-        # Migrate legacy JSON if exists
-        self._migrate_legacy_json()
-
-        # Maximum file size (10MB)
+        # Maximum total log size (10MB) and size of one segment
         self.max_file_size = 10 * 1024 * 1024
+        self.segment_max_size = SEGMENT_MAX_BYTES
 
         # Event buffer (in-memory before flush)
         self.event_buffer: list[TelemetryEvent] = []
         self.buffer_size = 100  # Flush after 100 events
+        self._buffer_lock = threading.Lock()  # Guards event_buffer and _segments
+
+        # Background writer (created on first flush). Segment summaries are
+        # changed by the writer and read from the GUI thread under _buffer_lock.
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending_write: Future[None] | None = None
+        self._segments = self._load_summary()
+
+        # Migrate single-file telemetry (TOON v2.1.0+, legacy JSON) into the log
+        self._migrate_legacy_file(self.data_dir / "telemetry.toon")
+        self._migrate_legacy_file(self.data_dir / "telemetry.json")
 
         logger.info(f"TelemetryCollector initialized (enabled={enabled}, session_id={self.session_id[:8]}...)")
 
-    def _migrate_legacy_json(self) -> None:
-        """Migrate legacy JSON telemetry to TOON format."""
-        if not self._legacy_json_file.exists():
+    @property
+    def telemetry_file(self) -> Path:
+        """Current log segment (events are appended to it; it may not exist yet)."""
+        with self._buffer_lock:
+            number = max(self._segments, default=1)
+        return self._segment_path(number)
+
+    def _segment_path(self, number: int) -> Path:
+        """Path of log segment number."""
+        return self.data_dir / f"{SEGMENT_PREFIX}{number:06d}{SEGMENT_SUFFIX}"
+
+    def _migrate_legacy_file(self, legacy_file: Path) -> None:
+        """Append events of a legacy single-file log (TOON or JSON) within retention, then keep it as .bak."""
+        if not legacy_file.exists():
             return
 
         try:
-            import json
+            with open(legacy_file, encoding="utf-8") as f:
+                data = toon_utils.load(f) if legacy_file.suffix == ".toon" else json_utils.load(f)
 
-            with open(self._legacy_json_file, encoding="utf-8") as f:
-                events = json.load(f)
+            # Handle both old format (list) and new format (dict with events key)
+            events = data.get("events", []) if isinstance(data, dict) else data
+            cutoff_time = time.time() - RETENTION_SECONDS
+            recent_events = [event for event in events if self._event_time(event) > cutoff_time]
+            if recent_events:
+                self._append_records(recent_events)
 
-            # Save as TOON
-            with open(self.telemetry_file, "w", encoding="utf-8") as f:
-                toon_utils.dump({"events": events}, f)
-
-            # Backup and remove legacy file
-            backup_path = self._legacy_json_file.with_suffix(".json.bak")
-            self._legacy_json_file.rename(backup_path)
-            logger.info(f"Migrated telemetry: {self._legacy_json_file} → {self.telemetry_file}")
+            # Backup legacy file
+            backup_path = legacy_file.with_suffix(legacy_file.suffix + ".bak")
+            legacy_file.replace(backup_path)
+            logger.info(f"Migrated telemetry: {legacy_file} → {self.telemetry_file} ({len(recent_events)} events)")
 
         except Exception as e:
             logger.warning(f"Failed to migrate legacy telemetry: {e}")
 
+    @staticmethod
+    def _event_time(event: Any) -> float:
+        """Epoch time of an event dict (0.0 if malformed)."""
+        try:
+            return datetime.fromisoformat(event["timestamp"].replace("Z", "+00:00")).timestamp()
+        except (KeyError, TypeError, AttributeError, ValueError):
+            return 0.0
+
     def track_event(self, event_type: str, data: dict[str, Any] | None = None) -> None:
         """Track telemetry event. Args: event_type (menu_click/dialog_open/etc.), data (NO personal info). Example: collector.track_event("menu_click", {"menu": "File", "action": "Open"})."""
         if not self.enabled:
@@ -131,10 +182,12 @@ class TelemetryCollector:
         )
 
         # Add to buffer
-        self.event_buffer.append(event)
+        with self._buffer_lock:
+            self.event_buffer.append(event)
+            buffer_full = len(self.event_buffer) >= self.buffer_size
 
         # Flush if buffer is full
-        if len(self.event_buffer) >= self.buffer_size:
+        if buffer_full:
             self.flush()
 
         logger.debug(f"Tracked event: {event_type} - {sanitized_data}")
@@ -181,78 +234,197 @@ class TelemetryCollector:
 
         self.track_event(EVENT_STARTUP, data)
 
-    def flush(self) -> None:
-        """Flush event buffer to disk."""
+    def flush(self, wait: bool = False) -> None:
+        """Hand buffered events to the background writer (appended to the log, O(events flushed)). Args: wait (block until written)."""
         if not self.enabled or not self.event_buffer:
             return
 
+        events = self._take_buffer()
         try:
-            # Load existing events
-            existing_events = self._load_events()
-
-            # Add new events
-            new_events = [event.to_dict() for event in self.event_buffer]
-            all_events = existing_events + new_events
-
-            # Rotate if file is too large
-            if self._get_file_size() > self.max_file_size:
-                all_events = self._rotate_events(all_events)
-
-            # Save to file (TOON format)
-            with open(self.telemetry_file, "w", encoding="utf-8") as f:
-                toon_utils.dump({"events": all_events}, f)
-
-            # Clear buffer
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="telemetry-writer")
+            self._pending_write = self._executor.submit(self._write_events, events)
+        except RuntimeError:
+            # Interpreter shutting down (flush from __del__): write on this thread
+            self._write_events(events)
+
+        if wait:
+            self.wait_for_writes()
+
+    def _take_buffer(self) -> list[TelemetryEvent]:
+        """Remove and return buffered events."""
+        with self._buffer_lock:
+            events = list(self.event_buffer)
             self.event_buffer.clear()
+        return events
 
-            logger.debug(f"Flushed {len(new_events)} events to {self.telemetry_file}")
+    def wait_for_writes(self) -> None:
+        """Block until flushed events are on disk."""
+        pending = self._pending_write
+        if pending is not None:
+            pending.result()
 
+    def _write_events(self, events: list[TelemetryEvent]) -> None:
+        """Append events to the log (writer thread); events whose append failed go back to the buffer."""
+        try:
+            self._append_records([event.to_dict() for event in events])
+            logger.debug(f"Flushed {len(events)} events to {self.telemetry_file}")
         except Exception as e:
             logger.error(f"Failed to flush telemetry events: {e}")
+            with self._buffer_lock:
+                self.event_buffer[:0] = events  # Retried on next flush
+
+    def _append_records(self, records: list[dict[str, Any]]) -> None:
+        """Append event dicts to the current segment (new segment past segment_max_size), then apply retention. Raises only if the append failed."""
+        data = "".join(json_utils.dumps(record) + "\n" for record in records).encode("utf-8")
+
+        with self._buffer_lock:
+            number = max(self._segments, default=1)
+            current = self._segments.get(number)
+            if current is not None and current.size and current.size + len(data) > self.segment_max_size:
+                number += 1
+
+        with open(self._segment_path(number), "ab") as f:
+            f.write(data)
+
+        counts = Counter(record.get("event_type", "unknown") for record in records)
+        with self._buffer_lock:
+            segment = self._segments.setdefault(number, _SegmentSummary())
+            segment.events += len(records)
+            segment.size += len(data)
+            segment.last_time = time.time()
+            for event_type, count in counts.items():
+                segment.event_counts[event_type] = segment.event_counts.get(event_type, 0) + count
 
-    def _load_events(self) -> list[dict[str, Any]]:
-        """Load existing events from TOON file."""
-        if not self.telemetry_file.exists():
-            return []
+        try:
+            self._drop_old_segments()
+            self._save_summary()
+        except Exception as e:
+            # Segment sizes no longer match the saved summary: rescanned on next load
+            logger.warning(f"Failed to update telemetry summary: {e}")
+
+    def _drop_old_segments(self) -> None:
+        """Delete oldest segments past 30-day retention or the 10MB total (the current segment is kept)."""
+        cutoff_time = time.time() - RETENTION_SECONDS
+        with self._buffer_lock:
+            current = max(self._segments)
+            total_size = sum(segment.size for segment in self._segments.values())
+            dropped = []
+            for number in sorted(self._segments):
+                segment = self._segments[number]
+                if number == current or (segment.last_time > cutoff_time and total_size <= self.max_file_size):
+                    break
+                del self._segments[number]
+                total_size -= segment.size
+                dropped.append((number, segment.events))
+
+        for number, events in dropped:
+            self._segment_path(number).unlink(missing_ok=True)
+            logger.info(f"Dropped telemetry segment {number} ({events} events)")
+
+    def _segment_numbers(self, data_dir: Path) -> set[int]:
+        """Numbers of the log segments in data_dir."""
+        numbers = set()
+        for path in data_dir.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}"):
+            try:
+                numbers.add(int(path.name[len(SEGMENT_PREFIX) : -len(SEGMENT_SUFFIX)]))
+            except ValueError:
+                continue
+        return numbers
 
+    def _load_summary(self) -> dict[int, _SegmentSummary]:
+        """Load segment summaries; segments missing from it or whose size differs are rescanned."""
+        summary_file = self.data_dir / SUMMARY_FILE_NAME
+        saved: dict[int, _SegmentSummary] = {}
         try:
-            with open(self.telemetry_file, encoding="utf-8") as f:
-                data = toon_utils.load(f)
-                # Handle both old format (list) and new format (dict with events key)
-                if isinstance(data, list):
-                    return data
-                elif isinstance(data, dict) and "events" in data:
-                    events: list[dict[str, Any]] = data["events"]
-                    return events
-                return []
+            with open(summary_file, encoding="utf-8") as f:
+                data = json_utils.load(f)
+            saved = {int(number): _SegmentSummary(**values) for number, values in data["segments"].items()}
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            logger.error(f"Failed to load telemetry events: {e}")
-            return []
+            logger.warning(f"Failed to load telemetry summary: {e}")
+
+        # Appends change a segment's size: a matching size means its counts are current
+        segments = {}
+        rescanned = 0
+        for number in sorted(self._segment_numbers(self.data_dir)):
+            segment = saved.get(number)
+            if segment is None or segment.size != self._segment_path(number).stat().st_size:
+                segment = self._scan_segment(number)
+                rescanned += 1
+            segments[number] = segment
+        if rescanned:
+            logger.info(f"Rescanned {rescanned} of {len(segments)} telemetry segments")
+        return segments
+
+    def _scan_segment(self, number: int) -> _SegmentSummary:
+        """Summarize one segment by reading it (summary rebuild only)."""
+        path = self._segment_path(number)
+        segment = _SegmentSummary(size=path.stat().st_size, last_time=path.stat().st_mtime)
+        for record in self._read_segment(path):
+            event_type = record.get("event_type", "unknown")
+            segment.event_counts[event_type] = segment.event_counts.get(event_type, 0) + 1
+            segment.events += 1
+        return segment
+
+    @staticmethod
+    def _read_segment(path: Path) -> list[dict[str, Any]]:
+        """Events of one segment (malformed lines, e.g. from an interrupted write, are skipped)."""
+        records = []
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                try:
+                    record = json_utils.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(record, dict):
+                    records.append(record)
+        return records
+
+    def _save_summary(self) -> None:
+        """Persist segment summaries (small: one entry per segment)."""
+        with self._buffer_lock:
+            data = {"segments": {str(number): asdict(segment) for number, segment in self._segments.items()}}
+        atomic_save_json(self.data_dir / SUMMARY_FILE_NAME, data)
 
-    def _get_file_size(self) -> int:
-        """Get current telemetry file size in bytes."""
-        if not self.telemetry_file.exists():
-            return 0
-        return self.telemetry_file.stat().st_size
-
-    def _rotate_events(self, events: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        """Rotate events by keeping only recent events (30-day retention). Args: events (all events). Returns: List of events within retention period."""
-        # Calculate cutoff date (30 days ago)
-        cutoff_time = time.time() - (30 * 24 * 60 * 60)
-
-        # Filter events
-        recent_events = []
-        for event in events:
+    def _load_events(self) -> list[dict[str, Any]]:
+        """Load all logged events, oldest first (reads every segment; statistics use the summary instead)."""
+        self.wait_for_writes()
+        with self._buffer_lock:
+            numbers = sorted(self._segments)
+        events: list[dict[str, Any]] = []
+        for number in numbers:
             try:
-                event_time = datetime.fromisoformat(event["timestamp"].replace("Z", "+00:00"))
-                if event_time.timestamp() > cutoff_time:
-                    recent_events.append(event)
-            except (KeyError, ValueError):
-                # Skip malformed events
-                continue
+                events.extend(self._read_segment(self._segment_path(number)))
+            except Exception as e:
+                logger.error(f"Failed to load telemetry segment {number}: {e}")
+        return events
 
-        logger.info(f"Rotated events: {len(events)} → {len(recent_events)} (30-day retention)")
-        return recent_events
+    def _get_file_size(self) -> int:
+        """Get total telemetry log size in bytes."""
+        with self._buffer_lock:
+            return sum(segment.size for segment in self._segments.values())
+
+    def set_data_dir(self, data_dir: Path, copy_data: bool = True) -> None:
+        """Move telemetry storage to data_dir. Args: data_dir (created if missing), copy_data (copy existing segments after the ones already there). Raises: OSError if the directory or copies cannot be created."""
+        self.wait_for_writes()
+        data_dir.mkdir(parents=True, exist_ok=True)
+
+        if copy_data and data_dir.resolve() != self.data_dir.resolve():
+            with self._buffer_lock:
+                numbers = sorted(self._segments)
+            # Renumber after existing segments so none are overwritten
+            first = max(self._segment_numbers(data_dir), default=0) + 1
+            for target, number in enumerate(numbers, first):
+                shutil.copy2(self._segment_path(number), data_dir / self._segment_path(target).name)
+
+        self.data_dir = data_dir
+        segments = self._load_summary()
+        with self._buffer_lock:
+            self._segments = segments
+        self._save_summary()
+        logger.info(f"Telemetry directory changed: {data_dir}")
 
     def _sanitize_data(self, data: dict[str, Any]) -> dict[str, Any]:
         """Sanitize data to remove personal information (file paths, emails, IPs, user names). Args: data (raw dict). Returns: Sanitized dict."""
@@ -284,41 +456,57 @@ class TelemetryCollector:
         return sanitized[:500]  # Limit message length
 
     def get_statistics(self) -> dict[str, Any]:
-        """Get telemetry statistics. Returns: Dict with total_events, session_id, enabled, event_counts, file_size, file_path."""
-        events = self._load_events()
+        """Get telemetry statistics from the segment summaries (no log reads). Returns: Dict with total_events, session_id, enabled, event_counts, file_size, file_path, segments."""
+        self.wait_for_writes()
 
-        # Count events by type
+        # Merge event counts of all segments
         event_counts: dict[str, int] = {}
-        for event in events:
-            event_type = event.get("event_type", "unknown")
-            event_counts[event_type] = event_counts.get(event_type, 0) + 1
+        with self._buffer_lock:
+            for segment in self._segments.values():
+                for event_type, count in segment.event_counts.items():
+                    event_counts[event_type] = event_counts.get(event_type, 0) + count
+            total_events = sum(segment.events for segment in self._segments.values())
+            file_size = sum(segment.size for segment in self._segments.values())
+            segment_count = len(self._segments)
 
         return {
-            "total_events": len(events),
+            "total_events": total_events,
             "session_id": self.session_id,
             "enabled": self.enabled,
             "event_counts": event_counts,
-            "file_size": self._get_file_size(),
+            "file_size": file_size,
             "file_path": str(self.telemetry_file),
+            "segments": segment_count,
         }
 
     def clear_all_data(self) -> None:
         """Clear all telemetry data (for opt-out or testing)."""
-        try:
-            if self.telemetry_file.exists():
-                self.telemetry_file.unlink()
-                logger.info("Cleared all telemetry data")
-
-            # Clear buffer
+        # Clear buffer
+        with self._buffer_lock:
             self.event_buffer.clear()
 
+        try:
+            self.wait_for_writes()
+            with self._buffer_lock:
+                numbers = sorted(self._segments)
+            for number in numbers:
+                self._segment_path(number).unlink(missing_ok=True)
+                with self._buffer_lock:
+                    del self._segments[number]
+            (self.data_dir / SUMMARY_FILE_NAME).unlink(missing_ok=True)
+            logger.info("Cleared all telemetry data")
+
         except Exception as e:
             logger.error(f"Failed to clear telemetry data: {e}")
 
     def __del__(self) -> None:
-        """Flush events on destruction."""
+        """Write remaining events on destruction (on this thread: it may be the writer thread)."""
         try:
-            self.flush()
+            # No write can be pending: queued writes hold a reference to the collector
+            if self.enabled and self.event_buffer:
+                self._write_events(self._take_buffer())
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
         except Exception:
             # Ignore errors during cleanup
             pass
@@ -30,7 +30,7 @@ from asciidoc_artisan.core.models import (
     SyntaxErrorModel,
     TextEdit,
 )
-from asciidoc_artisan.core.syntax_checker import ValidationContext
+from asciidoc_artisan.core.syntax_checker import RuleScope, ValidationContext
 
 
 class BrokenXRefRule:
@@ -42,15 +42,17 @@ class BrokenXRefRule:
     Matches: <<target>> where target anchor doesn't exist
     """
 
+    scope = RuleScope.LINE
+    facts = ("anchors",)
+
     def validate(self, context: ValidationContext) -> list[SyntaxErrorModel]:
         """Validate cross-reference targets."""
         errors = []
         lines = context.lines
         anchors = set(context.anchors)
 
-        for i, line in enumerate(lines):
-            if not context.should_validate_line(i):
-                continue
+        for i in context.lines_to_validate():
+            line = lines[i]
 
             xref_pattern = r"<<([^>,]+)"
             for match in re.finditer(xref_pattern, line):
@@ -100,14 +102,16 @@ class MissingIncludeRule:
     Matches: include::file[] where file doesn't exist
     """
 
+    scope = RuleScope.LINE
+    facts = ()
+
     def validate(self, context: ValidationContext) -> list[SyntaxErrorModel]:
         """Validate include file paths."""
         errors = []
         lines = context.lines
 
-        for i, line in enumerate(lines):
-            if not context.should_validate_line(i):
-                continue
+        for i in context.lines_to_validate():
+            line = lines[i]
 
             include_pattern = r"include::([^\[]+)\["
             for match in re.finditer(include_pattern, line):
@@ -138,15 +142,17 @@ class UndefinedAttributeRefRule:
     Matches: {attribute} where :attribute: is not defined
     """
 
+    scope = RuleScope.LINE
+    facts = ("attributes",)
+
     def validate(self, context: ValidationContext) -> list[SyntaxErrorModel]:
         """Validate attribute references."""
         errors = []
         lines = context.lines
         defined_attrs = set(context.attributes.keys())
 
-        for i, line in enumerate(lines):
-            if not context.should_validate_line(i):
-                continue
+        for i in context.lines_to_validate():
+            line = lines[i]
 
             attr_ref_pattern = r"\{([^}]+)\}"
             for match in re.finditer(attr_ref_pattern, line):
@@ -193,15 +199,17 @@ class DuplicateAnchorRule:
     Matches: Multiple anchors with same ID
     """
 
+    scope = RuleScope.DOCUMENT
+    facts = ("anchors",)
+
     def validate(self, context: ValidationContext) -> list[SyntaxErrorModel]:
         """Validate anchor uniqueness."""
         errors = []
         lines = context.lines
         seen_anchors: dict[str, int] = {}
 
-        for i, line in enumerate(lines):
-            if not context.should_validate_line(i):
-                continue
+        for i in context.lines_to_validate():
+            line = lines[i]
 
             anchor_pattern = r"\[\[([^\]]+)\]\]|\[#([^\]]+)\]"
             for match in re.finditer(anchor_pattern, line):
@@ -248,14 +256,16 @@ class EmptyHeadingRule:
     Matches: == with no text
     """
 
+    scope = RuleScope.LINE
+    facts = ()
+
     def validate(self, context: ValidationContext) -> list[SyntaxErrorModel]:
         """Validate heading content."""
         errors = []
         lines = context.lines
 
-        for i, line in enumerate(lines):
-            if not context.should_validate_line(i):
-                continue
+        for i in context.lines_to_validate():
+            line = lines[i]
 
             heading_match = re.match(r"^(={1,5})\s*$", line)
             if heading_match:
@@ -283,14 +293,16 @@ class TrailingWhitespaceRule:
     Matches: Lines ending with spaces or tabs
     """
 
+    scope = RuleScope.LINE
+    facts = ()
+
     def validate(self, context: ValidationContext) -> list[SyntaxErrorModel]:
         """Validate for trailing whitespace."""
         errors = []
         lines = context.lines
 
-        for i, line in enumerate(lines):
-            if not context.should_validate_line(i):
-                continue
+        for i in context.lines_to_validate():
+            line = lines[i]
 
             if line and line != line.rstrip():
                 trailing_len = len(line) - len(line.rstrip())
@@ -0,0 +1,291 @@
+"""
+Windowed Document - Memory-mapped file plus a piece table of line edits.
+
+Files above WINDOWED_MODE_THRESHOLD are not loaded into the editor as a
+whole. The editor holds a window of lines and this document holds the
+rest:
+- The original file stays on disk, memory-mapped read-only; only the
+  byte offset of each line start is kept in memory (array('l'))
+- Edits are pieces: runs of original lines, or runs of lines in an
+  append-only buffer of edited lines
+- lines()/text() decode only the requested range
+- save() streams original byte runs and edited lines to a temp file,
+  then renames it over the target (same pattern as atomic_save_text)
+
+Line endings of unedited lines are written back byte for byte; edited
+lines use the file's first line ending.
+
+Example:
+    document = WindowedDocument(Path("huge.adoc"))
+    window = document.text(1000, 6000)  # Lines 1000-5999 for the editor
+    document.replace_lines(1000, 6000, edited_window.split("\\n"))
+    document.save(Path("huge.adoc"))
+"""
+
+import bisect
+import logging
+import mmap
+import re
+from array import array
+from pathlib import Path
+from typing import BinaryIO, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+# Files larger than this are edited in windowed mode (50 MB)
+WINDOWED_MODE_THRESHOLD = 50 * 1024 * 1024
+
+# Bytes written per call when streaming unedited runs on save
+SAVE_CHUNK_SIZE = 1024 * 1024
+
+NEWLINE_BYTES_PATTERN = re.compile(b"\n")
+
+# Piece sources
+ORIGINAL = 0
+ADDED = 1
+
+
+class _Piece(NamedTuple):
+    """Run of lines: `lines` lines from line `start` of the original file or the added buffer."""
+
+    source: int
+    start: int
+    lines: int
+
+
+class WindowedDocument:
+    """
+    Line-addressed view of a large file with in-memory edits.
+
+    Attributes:
+        file_path: File backing the unedited lines
+        encoding: Text encoding of the file
+        modified: True if lines were replaced since the last open or save
+    """
+
+    def __init__(self, file_path: Path, encoding: str = "utf-8") -> None:
+        """
+        Map a file and index its line starts.
+
+        Args:
+            file_path: File to open
+            encoding: Text encoding (decoding errors are replaced)
+
+        Raises:
+            OSError: If the file cannot be opened or mapped
+        """
+        self.encoding = encoding
+        self._file: BinaryIO | None = None
+        self._data: mmap.mmap | bytes = b""
+        self._open(file_path)
+
+    def _open(self, file_path: Path) -> None:
+        """Map file_path and reset the piece table to its lines."""
+        self.close()
+        self.file_path = file_path
+        self._file = open(file_path, "rb")
+        try:
+            if file_path.stat().st_size:
+                self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._data = b""
+        except Exception:
+            self.close()
+            raise
+
+        starts = array("l", [0])
+        starts.extend(match.end() for match in NEWLINE_BYTES_PATTERN.finditer(self._data))
+        self._line_starts = starts
+
+        first_end = self._data.find(b"\n")
+        self.newline = b"\r\n" if first_end > 0 and self._data[first_end - 1 : first_end] == b"\r" else b"\n"
+
+        self._added: list[str] = []
+        self._pieces = [_Piece(ORIGINAL, 0, len(starts))]
+        self._piece_ends = [len(starts)]
+        self.modified = False
+        logger.info(f"Windowed document opened: {file_path.name} ({len(starts)} lines)")
+
+    def close(self) -> None:
+        """Unmap and close the backing file."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._data = b""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def line_count(self) -> int:
+        """Number of lines (a trailing newline starts a last, empty line)."""
+        return self._piece_ends[-1] if self._piece_ends else 0
+
+    def lines(self, start: int, end: int) -> list[str]:
+        """
+        Decode lines [start, end).
+
+        Args:
+            start: First line (0-indexed)
+            end: Line after the last one (clamped to line_count())
+
+        Returns:
+            Line texts without line endings
+        """
+        result: list[str] = []
+        for piece, first, last in self._overlapping(start, min(end, self.line_count())):
+            if piece.source == ADDED:
+                result.extend(self._added[first:last])
+            else:
+                raw = bytes(self._data[self._line_starts[first] : self._line_end(last - 1)])
+                text = raw.decode(self.encoding, errors="replace")
+                result.extend(text.replace("\r\n", "\n").split("\n"))
+        return result
+
+    def text(self, start: int, end: int) -> str:
+        """
+        Text of lines [start, end) joined with "\\n" (for the editor).
+
+        Args:
+            start: First line (0-indexed)
+            end: Line after the last one
+
+        Returns:
+            Window text
+        """
+        return "\n".join(self.lines(start, end))
+
+    def replace_lines(self, start: int, end: int, lines: list[str]) -> None:
+        """
+        Replace lines [start, end) with new lines.
+
+        Args:
+            start: First replaced line (0-indexed)
+            end: Line after the last replaced one
+            lines: New line texts without line endings
+        """
+        end = min(end, self.line_count())
+        kept_before: list[_Piece] = []
+        kept_after: list[_Piece] = []
+        piece_start = 0
+        for piece in self._pieces:
+            piece_end = piece_start + piece.lines
+            if piece_start < start:
+                kept_before.append(piece._replace(lines=min(piece_end, start) - piece_start))
+            if piece_end > end:
+                skip = max(0, end - piece_start)
+                kept_after.append(_Piece(piece.source, piece.start + skip, piece.lines - skip))
+            piece_start = piece_end
+
+        inserted = []
+        if lines:
+            inserted.append(_Piece(ADDED, len(self._added), len(lines)))
+            self._added.extend(lines)
+
+        self._pieces = kept_before + inserted + kept_after
+        self._piece_ends = []
+        total = 0
+        for piece in self._pieces:
+            total += piece.lines
+            self._piece_ends.append(total)
+        self.modified = True
+
+    def write_to(self, stream: BinaryIO) -> None:
+        """
+        Stream the document to a binary file object.
+
+        Args:
+            stream: Writable binary stream
+        """
+        view = memoryview(self._data)
+        try:
+            for index, piece in enumerate(self._pieces):
+                if index:
+                    stream.write(self.newline)
+                if piece.source == ADDED:
+                    lines = self._added[piece.start : piece.start + piece.lines]
+                    stream.write(self.newline.join(line.encode(self.encoding) for line in lines))
+                    continue
+
+                position = self._line_starts[piece.start]
+                end = self._line_end(piece.start + piece.lines - 1)
+                while position < end:
+                    chunk_end = min(end, position + SAVE_CHUNK_SIZE)
+                    stream.write(view[position:chunk_end])
+                    position = chunk_end
+        finally:
+            view.release()
+
+    def save(self, file_path: Path) -> bool:
+        """
+        Save atomically by streaming to a temp file, then remap the saved file.
+
+        Args:
+            file_path: Target file path
+
+        Returns:
+            True if successful, False otherwise
+        """
+        temp_path = file_path.with_suffix(file_path.suffix + ".tmp")
+        try:
+            with open(temp_path, "wb") as stream:
+                self.write_to(stream)
+            # The target may be the mapped file (Windows cannot replace it while mapped)
+            self.close()
+            temp_path.replace(file_path)
+        except Exception as e:
+            logger.error(f"Windowed save failed for {file_path}: {e}")
+            try:
+                if temp_path.exists():
+                    temp_path.unlink()
+            except Exception as cleanup_error:
+                logger.error(f"Failed to cleanup temp file {temp_path}: {cleanup_error}")
+            if self._file is None:
+                # Closed for the rename; the original file is unchanged
+                self._reopen_after_failure()
+            return False
+
+        self._open(file_path)
+        logger.info(f"Windowed save successful: {file_path}")
+        return True
+
+    def _reopen_after_failure(self) -> None:
+        """Map the original file again, keeping the pieces (edits are not lost)."""
+        pieces, piece_ends, added = self._pieces, self._piece_ends, self._added
+        self._open(self.file_path)
+        self._pieces, self._piece_ends, self._added = pieces, piece_ends, added
+        self.modified = True
+
+    def _line_end(self, line: int) -> int:
+        """Byte offset where an original line ends (before its line ending)."""
+        if line + 1 >= len(self._line_starts):
+            return len(self._data)
+        end = self._line_starts[line + 1] - 1
+        if end > self._line_starts[line] and self._data[end - 1 : end] == b"\r":
+            end -= 1
+        return end
+
+    def _overlapping(self, start: int, end: int) -> list[tuple[_Piece, int, int]]:
+        """Pieces covering lines [start, end), with source line ranges [first, last)."""
+        result = []
+        index = bisect.bisect_right(self._piece_ends, start)
+        while start < end and index < len(self._pieces):
+            piece = self._pieces[index]
+            piece_start = self._piece_ends[index] - piece.lines
+            first = piece.start + start - piece_start
+            last = piece.start + min(end, self._piece_ends[index]) - piece_start
+            result.append((piece, first, last))
+            start = self._piece_ends[index]
+            index += 1
+        return result
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get document statistics.
+
+        Returns:
+            Dictionary with lines, pieces and edited (buffered) lines
+        """
+        return {
+            "lines": self.line_count(),
+            "pieces": len(self._pieces),
+            "edited_lines": len(self._added),
+        }
@@ -18,6 +18,7 @@ Architecture:
     AsciiDocLanguageServer (server.py) - Core LSP server with pygls
     ├── CompletionProvider - Auto-complete logic
     ├── DiagnosticsProvider - Syntax validation
+    ├── DiagnosticsScheduler - Debounced, cancellable diagnostics runs
     ├── HoverProvider - Hover documentation
     ├── SymbolsProvider - Document outline + go-to-definition
     ├── CodeActionProvider - Quick fixes
@@ -10,14 +10,16 @@ Provides intelligent auto-completion for AsciiDoc documents:
 - Include directives (include::path[])
 - Block delimiters (----, ====, etc.)
 
-Uses the existing autocomplete_engine where possible.
+Uses the existing autocomplete_engine where possible. Anchors come from
+the shared DocumentIndex.
 """
 
 import logging
-import re
 
 from lsprotocol import types as lsp
 
+from asciidoc_artisan.lsp.document_index import DocumentIndex, as_index
+
 logger = logging.getLogger(__name__)
 
 
@@ -112,23 +114,19 @@ class AsciiDocCompletionProvider:
     Performance: <50ms for typical completion requests.
     """
 
-    def __init__(self) -> None:
-        """Initialize completion provider."""
-        self._anchor_pattern = re.compile(r"\[\[([^\]]+)\]\]|\[#([^\]]+)\]")
-        self._attribute_pattern = re.compile(r"^:([^:]+):", re.MULTILINE)
-
-    def get_completions(self, text: str, position: lsp.Position) -> list[lsp.CompletionItem]:
+    def get_completions(self, text: str | DocumentIndex, position: lsp.Position) -> list[lsp.CompletionItem]:
         """
         Get completion items for given position.
 
         Args:
-            text: Document text
+            text: Document text or its DocumentIndex
             position: Cursor position
 
         Returns:
             List of completion items
         """
-        lines = text.splitlines()
+        index = as_index(text)
+        lines = index.lines
         if position.line >= len(lines):
             return []
 
@@ -139,7 +137,7 @@ class AsciiDocCompletionProvider:
         if self._is_attribute_context(prefix):
             return self._get_attribute_completions(prefix)
         elif self._is_xref_context(prefix):
-            return self._get_xref_completions(text, prefix)
+            return self._get_xref_completions(index, prefix)
         elif self._is_include_context(prefix):
             return self._get_include_completions(prefix)
         else:
@@ -195,7 +193,7 @@ class AsciiDocCompletionProvider:
 
         return items
 
-    def _get_xref_completions(self, text: str, prefix: str) -> list[lsp.CompletionItem]:
+    def _get_xref_completions(self, text: str | DocumentIndex, prefix: str) -> list[lsp.CompletionItem]:
         """Get cross-reference completions (anchors in document)."""
         items = []
 
@@ -247,8 +245,6 @@ class AsciiDocCompletionProvider:
         ]
         return items
 
-    def _extract_anchors(self, text: str) -> list[str]:
+    def _extract_anchors(self, text: str | DocumentIndex) -> list[str]:
         """Extract all anchor IDs from document."""
-        matches = self._anchor_pattern.findall(text)
-        # Flatten tuples (each match has 2 groups)
-        return [m[0] or m[1] for m in matches]
+        return as_index(text).anchor_ids
@@ -0,0 +1,229 @@
+"""
+Diagnostics Scheduler for AsciiDoc LSP.
+
+MA principle: ~250 lines focused on scheduling diagnostics runs.
+
+Validating on every didChange notification queues full SyntaxChecker
+runs that are stale by the time they finish. The scheduler keeps at most
+one run per document:
+- Debounce: changes within the delay coalesce into one run
+- Cancellation: a newer change cancels the in-flight run (checked
+  between validation rules)
+- Off-thread: runs execute on a worker thread, not the protocol thread
+  (publish is called on that thread; the server hands the result to its
+  event loop before touching protocol state)
+- Version check: results are published only if they were computed for
+  the latest document version
+
+Example:
+    scheduler = DiagnosticsScheduler(validate, publish, document_state.get_version)
+    scheduler.schedule(uri, version)  # on didChange
+    scheduler.get_stats()  # queue depth, latency
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from lsprotocol import types as lsp
+
+logger = logging.getLogger(__name__)
+
+# Validation callback: (uri, cancelled) -> (validated version, diagnostics),
+# or None if cancelled or the document is gone
+ValidateFn = Callable[[str, Callable[[], bool]], tuple[int, list[lsp.Diagnostic]] | None]
+
+# Publish callback: (uri, version, diagnostics)
+PublishFn = Callable[[str, int, list[lsp.Diagnostic]], None]
+
+# Default debounce delay (seconds)
+DEFAULT_DELAY = 0.25
+
+
+@dataclass(slots=True)
+class _Run:
+    """Scheduled or running diagnostics run for one document."""
+
+    version: int
+    requested_at: float  # First change not yet covered by a published result
+    cancel: threading.Event = field(default_factory=threading.Event)
+    timer: threading.Timer | None = None
+
+
+class DiagnosticsScheduler:
+    """
+    Per-URI debounced, cancellable diagnostics runs.
+
+    Thread-safe: schedule() and cancel() may be called from any thread.
+    Runs execute one at a time on a single worker thread.
+
+    Attributes:
+        _validate: Validation callback
+        _publish: Publish callback
+        _current_version: Returns the latest version of a document
+        _delay: Debounce delay in seconds
+    """
+
+    def __init__(
+        self,
+        validate: ValidateFn,
+        publish: PublishFn,
+        current_version: Callable[[str], int | None],
+        delay: float = DEFAULT_DELAY,
+    ) -> None:
+        """
+        Initialize scheduler.
+
+        Args:
+            validate: Runs validation for a URI, polling cancelled()
+            publish: Publishes diagnostics for a URI and version (called on
+                the worker thread, right after validate)
+            current_version: Latest document version (None if closed)
+            delay: Debounce delay in seconds
+        """
+        self._validate = validate
+        self._publish = publish
+        self._current_version = current_version
+        self._delay = delay
+
+        self._lock = threading.Lock()
+        self._pending: dict[str, _Run] = {}
+        self._running: dict[str, _Run] = {}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lsp-diagnostics")
+
+        self._scheduled = 0
+        self._coalesced = 0
+        self._cancelled = 0
+        self._stale = 0
+        self._published = 0
+        self._total_latency_ms = 0.0
+        self._max_latency_ms = 0.0
+        self._last_latency_ms = 0.0
+
+    def schedule(self, uri: str, version: int, delay: float | None = None) -> None:
+        """
+        Schedule a diagnostics run, replacing any pending or running one.
+
+        Args:
+            uri: Document URI
+            version: Document version the change produced
+            delay: Debounce delay in seconds (None = default, 0 = now)
+        """
+        now = time.perf_counter()
+        with self._lock:
+            self._scheduled += 1
+            requested_at = now
+
+            pending = self._pending.pop(uri, None)
+            if pending is not None:
+                if pending.timer is not None:
+                    pending.timer.cancel()
+                self._coalesced += 1
+                requested_at = min(requested_at, pending.requested_at)
+
+            running = self._running.get(uri)
+            if running is not None and not running.cancel.is_set():
+                running.cancel.set()
+                self._cancelled += 1
+                requested_at = min(requested_at, running.requested_at)
+
+            run = _Run(version=version, requested_at=requested_at)
+            self._pending[uri] = run
+            run.timer = threading.Timer(self._delay if delay is None else delay, self._dispatch, (uri, run))
+            run.timer.daemon = True
+            run.timer.start()
+
+    def cancel(self, uri: str) -> None:
+        """
+        Drop pending and running runs for a document (e.g. on close).
+
+        Args:
+            uri: Document URI
+        """
+        with self._lock:
+            pending = self._pending.pop(uri, None)
+            if pending is not None and pending.timer is not None:
+                pending.timer.cancel()
+            running = self._running.get(uri)
+            if running is not None:
+                running.cancel.set()
+
+    def shutdown(self) -> None:
+        """Cancel all runs and stop the worker thread."""
+        with self._lock:
+            for run in self._pending.values():
+                if run.timer is not None:
+                    run.timer.cancel()
+            self._pending.clear()
+            for run in self._running.values():
+                run.cancel.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _dispatch(self, uri: str, run: _Run) -> None:
+        """Debounce timer expired - queue the run on the worker thread."""
+        with self._lock:
+            if self._pending.get(uri) is not run:
+                return  # Replaced by a newer change
+            del self._pending[uri]
+            previous = self._running.get(uri)
+            if previous is not None:
+                previous.cancel.set()
+            self._running[uri] = run
+        try:
+            self._executor.submit(self._execute, uri, run)
+        except RuntimeError:
+            logger.debug(f"Diagnostics scheduler stopped, dropping run for {uri}")
+
+    def _execute(self, uri: str, run: _Run) -> None:
+        """Run validation and publish the result if still current."""
+        result = None
+        if not run.cancel.is_set():
+            try:
+                result = self._validate(uri, run.cancel.is_set)
+            except Exception as e:
+                logger.error(f"Diagnostics run failed for {uri}: {e}", exc_info=True)
+
+        with self._lock:
+            if self._running.get(uri) is run:
+                del self._running[uri]
+            if result is None or run.cancel.is_set():
+                return
+            version, diagnostics = result
+            if version != self._current_version(uri):
+                self._stale += 1
+                logger.debug(f"Dropping stale diagnostics for {uri} (v{version})")
+                return
+
+        self._publish(uri, version, diagnostics)
+
+        latency_ms = (time.perf_counter() - run.requested_at) * 1000
+        with self._lock:
+            self._published += 1
+            self._last_latency_ms = latency_ms
+            self._total_latency_ms += latency_ms
+            self._max_latency_ms = max(self._max_latency_ms, latency_ms)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get scheduler statistics.
+
+        Returns:
+            Dictionary with run counters, queue depth (documents with a
+            pending or running run) and change-to-publish latency in ms
+        """
+        with self._lock:
+            return {
+                "scheduled": self._scheduled,
+                "coalesced": self._coalesced,
+                "cancelled": self._cancelled,
+                "stale": self._stale,
+                "published": self._published,
+                "queue_depth": len(self._pending.keys() | self._running.keys()),
+                "last_latency_ms": self._last_latency_ms,
+                "avg_latency_ms": self._total_latency_ms / self._published if self._published else 0.0,
+                "max_latency_ms": self._max_latency_ms,
+            }
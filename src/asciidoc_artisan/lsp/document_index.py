@@ -0,0 +1,323 @@
+"""
+Document Index for AsciiDoc LSP.
+
+MA principle: ~250 lines focused on one shared structural scan per document version.
+
+Symbols, folding, semantic tokens, completion, hover and diagnostics each
+used to split and regex-scan the raw text on every request. One editor
+refresh tokenized the same document 5-6 times. DocumentIndex scans a
+document version once and every provider looks up the parts it needs:
+- lines: Text split into lines
+- headings, delimited_blocks, comment_lines: Structure
+- anchors, xrefs, attribute_entries, includes: Definitions and references
+- line_kinds, inline_spans: Per-line classification and inline markup
+
+Each part is computed on first access (like ValidationContext), so a
+folding request never pays for inline spans. DocumentState caches one
+index per document version.
+
+Example:
+    index = document_state.get_index(uri)
+    for heading in index.headings:
+        print(heading.line, heading.title)
+"""
+
+import re
+from dataclasses import dataclass
+from functools import cached_property
+
+# LSP line terminators (unlike str.splitlines: no form feed or Unicode separators)
+LINE_BREAK_PATTERN = re.compile(r"\r\n|\r|\n")
+
+
+def split_lines(text: str) -> list[str]:
+    """
+    Split text into lines, keeping line endings.
+
+    Always returns line-break count + 1 items; the last item has no line
+    ending (empty if the text ends with a line break).
+
+    Args:
+        text: Text to split
+
+    Returns:
+        Lines with their line endings
+    """
+    lines = []
+    start = 0
+    for match in LINE_BREAK_PATTERN.finditer(text):
+        lines.append(text[start : match.end()])
+        start = match.end()
+    lines.append(text[start:])
+    return lines
+
+
+# Structure patterns
+HEADING_PATTERN = re.compile(r"^(=+)\s+(.+)$")
+ATTRIBUTE_ENTRY_PATTERN = re.compile(r"^(:[\w-]+:)\s*(.*)$")
+BLOCK_ATTRIBUTE_PATTERN = re.compile(r"^\[([^\]]+)\]$")
+COMMENT_BLOCK_PATTERN = re.compile(r"^(/{4,})$")
+COMMENT_LINE_PATTERN = re.compile(r"^//(?!/)")
+INCLUDE_PATTERN = re.compile(r"^include::([^\[]+)\[")
+
+# Definition and reference patterns
+ANCHOR_PATTERN = re.compile(r"\[\[([^\]]+)\]\]|\[#([^\]]+)\]")
+XREF_PATTERN = re.compile(r"<<([^,>]+)(,[^>]*)?>?>")
+
+# Inline span patterns, in tokenization order
+INLINE_PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = (
+    ("macro", re.compile(r"(image|include|link|xref|mailto|kbd|btn|menu)::?")),
+    ("xref", XREF_PATTERN),
+    ("anchor", ANCHOR_PATTERN),
+    ("attr_ref", re.compile(r"\{([\w-]+)\}")),
+    ("bold", re.compile(r"\*([^*]+)\*")),
+    ("italic", re.compile(r"_([^_]+)_")),
+    ("mono", re.compile(r"`([^`]+)`")),
+)
+
+# Delimiter characters of delimited blocks (4+ repeated on their own line)
+BLOCK_DELIMITER_CHARS = frozenset("-=*_/+")
+
+# Line kinds (see DocumentIndex.line_kinds)
+LINE_TEXT = "text"
+LINE_HEADING = "heading"
+LINE_COMMENT = "comment"
+LINE_ATTRIBUTE = "attribute"
+LINE_BLOCK_ATTRIBUTE = "block_attribute"
+
+
+@dataclass(frozen=True, slots=True)
+class Heading:
+    """Section heading (level = number of '=')."""
+
+    line: int
+    level: int
+    title: str
+
+
+@dataclass(frozen=True, slots=True)
+class DelimitedBlock:
+    """Delimited block from opening to closing delimiter line."""
+
+    start_line: int
+    end_line: int
+    delimiter: str  # Delimiter character
+
+
+@dataclass(frozen=True, slots=True)
+class Anchor:
+    """Anchor definition ([[id]] or [#id])."""
+
+    id: str
+    line: int
+    start: int
+    end: int
+
+
+@dataclass(frozen=True, slots=True)
+class Xref:
+    """Cross-reference (<<id>> or <<id,text>>)."""
+
+    id: str
+    line: int
+    start: int
+    end: int
+
+
+@dataclass(frozen=True, slots=True)
+class AttributeEntry:
+    """Attribute entry line (:name: value); name includes the colons."""
+
+    name: str
+    value: str
+    line: int
+
+
+@dataclass(frozen=True, slots=True)
+class Include:
+    """Include directive (include::target[])."""
+
+    target: str
+    line: int
+
+
+@dataclass(frozen=True, slots=True)
+class InlineSpan:
+    """Inline markup span within a line (kind from INLINE_PATTERNS)."""
+
+    kind: str
+    start: int
+    end: int
+
+
+class DocumentIndex:
+    """
+    Structural index of one document version.
+
+    Immutable once built; safe to share across provider threads.
+
+    Attributes:
+        text: Indexed document text
+        version: Document version (None if built from plain text)
+    """
+
+    def __init__(self, text: str, version: int | None = None) -> None:
+        """
+        Initialize index (parts are scanned on first access).
+
+        Args:
+            text: Document text
+            version: Document version
+        """
+        self.text = text
+        self.version = version
+
+    @cached_property
+    def lines(self) -> list[str]:
+        """Document lines (without line endings; split at LSP line breaks, none after a final break)."""
+        lines = [line.rstrip("\r\n") for line in split_lines(self.text)]
+        if not lines[-1]:
+            lines.pop()
+        return lines
+
+    @cached_property
+    def headings(self) -> list[Heading]:
+        """All heading lines in document order."""
+        headings = []
+        for line_num, line in enumerate(self.lines):
+            if line.startswith("=") and (match := HEADING_PATTERN.match(line)):
+                headings.append(Heading(line_num, len(match.group(1)), match.group(2).strip()))
+        return headings
+
+    @cached_property
+    def delimited_blocks(self) -> list[DelimitedBlock]:
+        """Closed delimited blocks, ordered by closing line (unclosed blocks omitted)."""
+        blocks = []
+        stack: list[tuple[int, str]] = []
+        for line_num, line in enumerate(self.lines):
+            stripped = line.strip()
+            if len(stripped) < 4:
+                continue
+            char = stripped[0]
+            if char in BLOCK_DELIMITER_CHARS and stripped == char * len(stripped):
+                if stack and stack[-1][1] == char:
+                    start_line, _ = stack.pop()
+                    blocks.append(DelimitedBlock(start_line, line_num, char))
+                else:
+                    stack.append((line_num, char))
+        return blocks
+
+    @cached_property
+    def comment_lines(self) -> list[int]:
+        """Line numbers of single-line comments (// but not ///)."""
+        return [line_num for line_num, line in enumerate(self.lines) if COMMENT_LINE_PATTERN.match(line)]
+
+    @cached_property
+    def anchors(self) -> list[Anchor]:
+        """Anchor definitions in document order."""
+        anchors = []
+        for line_num, line in enumerate(self.lines):
+            if "[" not in line:
+                continue
+            for match in ANCHOR_PATTERN.finditer(line):
+                anchors.append(Anchor(match.group(1) or match.group(2), line_num, match.start(), match.end()))
+        return anchors
+
+    @cached_property
+    def anchor_ids(self) -> list[str]:
+        """Anchor IDs in document order."""
+        return [anchor.id for anchor in self.anchors]
+
+    @cached_property
+    def xrefs(self) -> list[Xref]:
+        """Cross-references in document order."""
+        xrefs = []
+        for line_num, line in enumerate(self.lines):
+            if "<<" not in line:
+                continue
+            for match in XREF_PATTERN.finditer(line):
+                xrefs.append(Xref(match.group(1), line_num, match.start(), match.end()))
+        return xrefs
+
+    @cached_property
+    def attribute_entries(self) -> dict[int, AttributeEntry]:
+        """Attribute entries by line number."""
+        entries = {}
+        for line_num, line in enumerate(self.lines):
+            if line.startswith(":") and (match := ATTRIBUTE_ENTRY_PATTERN.match(line)):
+                entries[line_num] = AttributeEntry(match.group(1), match.group(2), line_num)
+        return entries
+
+    @cached_property
+    def includes(self) -> list[Include]:
+        """Include directives in document order."""
+        includes = []
+        for line_num, line in enumerate(self.lines):
+            if line.startswith("include::") and (match := INCLUDE_PATTERN.match(line)):
+                includes.append(Include(match.group(1), line_num))
+        return includes
+
+    @cached_property
+    def line_kinds(self) -> list[str]:
+        """
+        Kind of each line (LINE_* constants).
+
+        Lines inside //// comment blocks (and the delimiters) are comments;
+        otherwise the first match of heading, // comment, attribute entry,
+        block attribute list wins.
+        """
+        kinds = []
+        attribute_entries = self.attribute_entries
+        in_comment_block = False
+        for line_num, line in enumerate(self.lines):
+            if COMMENT_BLOCK_PATTERN.match(line):
+                in_comment_block = not in_comment_block
+                kinds.append(LINE_COMMENT)
+            elif in_comment_block or line.startswith("//"):
+                kinds.append(LINE_COMMENT)
+            elif line.startswith("=") and HEADING_PATTERN.match(line):
+                kinds.append(LINE_HEADING)
+            elif line_num in attribute_entries:
+                kinds.append(LINE_ATTRIBUTE)
+            elif BLOCK_ATTRIBUTE_PATTERN.match(line):
+                kinds.append(LINE_BLOCK_ATTRIBUTE)
+            else:
+                kinds.append(LINE_TEXT)
+        return kinds
+
+    @cached_property
+    def inline_spans(self) -> list[list[InlineSpan]]:
+        """Inline markup spans of each text line (empty for other line kinds)."""
+        return [self.line_spans(line_num) for line_num in range(len(self.lines))]
+
+    def line_spans(self, line_num: int) -> list[InlineSpan]:
+        """
+        Scan inline markup of one line (not cached; see inline_spans).
+
+        Args:
+            line_num: Line number
+
+        Returns:
+            Spans in INLINE_PATTERNS order (empty unless a text line)
+        """
+        if self.line_kinds[line_num] != LINE_TEXT:
+            return []
+        line = self.lines[line_num]
+        return [
+            InlineSpan(name, match.start(), match.end())
+            for name, pattern in INLINE_PATTERNS
+            for match in pattern.finditer(line)
+        ]
+
+
+def as_index(source: str | DocumentIndex) -> DocumentIndex:
+    """
+    Get an index for provider input (text is indexed on the fly).
+
+    Args:
+        source: Document text or an existing index
+
+    Returns:
+        DocumentIndex for the source
+    """
+    return source if isinstance(source, DocumentIndex) else DocumentIndex(source)
@@ -1,26 +1,203 @@
 """
 Document State Manager for LSP server.
 
-MA principle: ~80 lines focused on document content management.
+MA principle: ~300 lines focused on document content management.
 
 Manages open documents and their content for the LSP server.
 Provides efficient access to document text for feature providers.
+
+Documents are stored as line-indexed buffers so ranged edits from
+incremental sync (TextDocumentSyncKind.Incremental) only touch the
+edited lines:
+- LineBuffer: list of lines (with line endings), joined lazily
+- apply_edit(): replace a (line, character) range in O(edited lines)
+- ChangedLines: edited line span since the last diagnostics run, in
+  both old and new line numbers (for reusing unchanged diagnostics)
+- get_index(): one DocumentIndex per document version, shared by all
+  feature providers
+- Desync: an edit that does not fit the buffer means the client's text
+  differs from ours. The document stays desynced (no content served,
+  further ranged edits dropped) until its full text arrives again.
+
+Positions use UTF-16 code units (LSP default position encoding).
 """
 
 import logging
 import threading
 from dataclasses import dataclass
 
+from asciidoc_artisan.lsp.document_index import DocumentIndex, split_lines
+
 logger = logging.getLogger(__name__)
 
 
+def utf16_to_index(line: str, character: int) -> int:
+    """
+    Convert a UTF-16 character offset to a Python string index.
+
+    Offsets past the end of the line content clamp to the line ending,
+    as required by LSP.
+
+    Args:
+        line: Line text (may include its line ending)
+        character: UTF-16 code unit offset
+
+    Returns:
+        Index into line
+    """
+    content_length = len(line.rstrip("\r\n"))
+    if line.isascii():
+        return min(character, content_length)
+
+    units = 0
+    for index, char in enumerate(line[:content_length]):
+        if units >= character:
+            return index
+        units += 2 if ord(char) > 0xFFFF else 1
+    return content_length
+
+
+@dataclass(slots=True)
+class ChangedLines:
+    """
+    Line span edited since the last consumer (e.g. diagnostics) ran.
+
+    Lines before the span keep their numbers; lines after it shift by
+    line_delta. Old numbers refer to the text the consumer last saw.
+
+    Attributes:
+        old_start: First changed line (old numbering)
+        old_end: End of changed lines, exclusive (old numbering)
+        new_start: First changed line (new numbering)
+        new_end: End of changed lines, exclusive (new numbering)
+    """
+
+    old_start: int
+    old_end: int
+    new_start: int
+    new_end: int
+
+    @property
+    def line_delta(self) -> int:
+        """Line number shift for lines after the span."""
+        return (self.new_end - self.new_start) - (self.old_end - self.old_start)
+
+    def merge(self, start: int, end: int, new_count: int) -> None:
+        """
+        Merge another edit (current lines [start, end) became new_count lines).
+
+        Args:
+            start: First replaced line (current numbering)
+            end: End of replaced lines, exclusive (current numbering)
+            new_count: Number of lines that replaced them
+        """
+        union_start = min(self.new_start, start)
+        union_end = max(self.new_end, end)
+        self.old_start -= self.new_start - union_start
+        self.old_end += union_end - self.new_end
+        self.new_start = union_start
+        self.new_end = union_end + new_count - (end - start)
+
+
+class LineBuffer:
+    """
+    Line-indexed text buffer for ranged edits.
+
+    Edits re-split only the touched lines. The full text is joined on
+    demand and cached until the next edit.
+    """
+
+    def __init__(self, text: str) -> None:
+        """
+        Initialize buffer.
+
+        Args:
+            text: Initial content
+        """
+        self._lines = split_lines(text)
+        self._text: str | None = text
+
+    @property
+    def text(self) -> str:
+        """Full buffer content (joined once per edit)."""
+        if self._text is None:
+            self._text = "".join(self._lines)
+        return self._text
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines."""
+        return len(self._lines)
+
+    def get_line(self, line: int) -> str | None:
+        """Get line content without line ending, or None if out of range."""
+        if 0 <= line < len(self._lines):
+            return self._lines[line].rstrip("\r\n")
+        return None
+
+    def apply_edit(
+        self, start_line: int, start_char: int, end_line: int, end_char: int, new_text: str
+    ) -> tuple[int, int, int]:
+        """
+        Replace a range with new text.
+
+        Args:
+            start_line: Range start line
+            start_char: Range start character (UTF-16)
+            end_line: Range end line
+            end_char: Range end character (UTF-16)
+            new_text: Replacement text
+
+        Returns:
+            Tuple of (first line, end of replaced lines, number of new lines)
+
+        Raises:
+            ValueError: If the range is outside the buffer
+        """
+        lines = self._lines
+        if not (0 <= start_line <= end_line < len(lines)):
+            raise ValueError(f"Edit range lines {start_line}-{end_line} outside buffer ({len(lines)} lines)")
+
+        start_index = utf16_to_index(lines[start_line], start_char)
+        end_index = utf16_to_index(lines[end_line], end_char)
+        if start_line == end_line and end_index < start_index:
+            raise ValueError("Edit range end before start")
+
+        # Re-split touched lines. The segment always ends with the end line's
+        # own line ending, so only a lone \r before it can join the new text.
+        first = start_line
+        rest = new_text + lines[end_line][end_index:]
+        if start_index == 0 and first > 0 and lines[first - 1].endswith("\r") and rest.startswith("\n"):
+            first -= 1
+            segment = lines[first] + rest
+        else:
+            segment = lines[start_line][:start_index] + rest
+
+        new_lines = split_lines(segment)
+        if end_line + 1 < len(lines):
+            new_lines.pop()  # Segment ends with a line break; the next line follows
+
+        lines[first : end_line + 1] = new_lines
+        self._text = None
+        return first, end_line + 1, len(new_lines)
+
+
 @dataclass
 class Document:
     """Represents an open document."""
 
     uri: str
-    text: str
+    buffer: LineBuffer
     version: int
+    changed_lines: ChangedLines | None = None
+    full_change: bool = True
+    index: DocumentIndex | None = None
+    desynced: bool = False
+
+    @property
+    def text(self) -> str:
+        """Document content."""
+        return self.buffer.text
 
 
 class DocumentState:
@@ -50,7 +227,7 @@ class DocumentState:
             version: Document version
         """
         with self._lock:
-            self._documents[uri] = Document(uri=uri, text=text, version=version)
+            self._documents[uri] = Document(uri=uri, buffer=LineBuffer(text), version=version)
             logger.debug(f"Opened document: {uri} (v{version})")
 
     def update_document(self, uri: str, text: str, version: int) -> None:
@@ -64,13 +241,170 @@ class DocumentState:
         """
         with self._lock:
             if uri in self._documents:
-                self._documents[uri] = Document(uri=uri, text=text, version=version)
+                self._documents[uri] = Document(uri=uri, buffer=LineBuffer(text), version=version)
                 logger.debug(f"Updated document: {uri} (v{version})")
             else:
                 # Auto-open if not tracked
-                self._documents[uri] = Document(uri=uri, text=text, version=version)
+                self._documents[uri] = Document(uri=uri, buffer=LineBuffer(text), version=version)
                 logger.debug(f"Auto-opened document: {uri} (v{version})")
 
+    def apply_edit(
+        self,
+        uri: str,
+        start_line: int,
+        start_char: int,
+        end_line: int,
+        end_char: int,
+        text: str,
+        version: int,
+    ) -> tuple[int, int, int] | None:
+        """
+        Apply a ranged edit (incremental sync).
+
+        Args:
+            uri: Document URI
+            start_line: Range start line
+            start_char: Range start character (UTF-16)
+            end_line: Range end line
+            end_char: Range end character (UTF-16)
+            text: Replacement text
+            version: New version
+
+        Returns:
+            Edited lines as (first line, end of replaced lines, number of new
+            lines), or None if document unknown, desynced or range invalid
+            (the document is then desynced until update_document)
+        """
+        with self._lock:
+            doc = self._documents.get(uri)
+            if doc is None:
+                logger.warning(f"Edit for unknown document: {uri}")
+                return None
+            if doc.desynced:
+                return None
+            try:
+                first, end, new_count = doc.buffer.apply_edit(start_line, start_char, end_line, end_char, text)
+            except ValueError as exc:
+                logger.warning(f"Rejected edit for {uri}: {exc}; waiting for full text")
+                doc.desynced = True
+                doc.index = None
+                doc.changed_lines = None
+                doc.full_change = True
+                return None
+
+            doc.version = version
+            doc.index = None
+            if doc.changed_lines is None:
+                doc.changed_lines = ChangedLines(first, end, first, first + new_count)
+            else:
+                doc.changed_lines.merge(first, end, new_count)
+            return first, end, new_count
+
+    def take_changed_lines(self, uri: str) -> ChangedLines | None:
+        """
+        Get and reset the line span edited since the previous call.
+
+        Args:
+            uri: Document URI
+
+        Returns:
+            Changed span, or None if unknown (document opened or fully
+            replaced since the previous call) - consumers then rescan all
+        """
+        with self._lock:
+            doc = self._get_synced(uri)
+            return self._take_changed(doc) if doc else None
+
+    def take_snapshot(self, uri: str) -> tuple[DocumentIndex, int, ChangedLines | None] | None:
+        """
+        Get index, version and changed lines atomically (resets changed lines).
+
+        Args:
+            uri: Document URI
+
+        Returns:
+            Tuple of (index of the current version, version, changed span
+            as in take_changed_lines), or None if not found
+        """
+        with self._lock:
+            doc = self._get_synced(uri)
+            if doc is None:
+                return None
+            return self._get_index(doc), doc.version, self._take_changed(doc)
+
+    def get_index(self, uri: str) -> DocumentIndex | None:
+        """
+        Get the shared structural index of the current document version.
+
+        Built on first request per version; all providers share it.
+
+        Args:
+            uri: Document URI
+
+        Returns:
+            DocumentIndex or None if not found or desynced
+        """
+        with self._lock:
+            doc = self._get_synced(uri)
+            return self._get_index(doc) if doc else None
+
+    def is_desynced(self, uri: str) -> bool:
+        """
+        Check if a document's content no longer matches the client.
+
+        Args:
+            uri: Document URI
+
+        Returns:
+            True if an edit was rejected since the last full text
+        """
+        with self._lock:
+            doc = self._documents.get(uri)
+            return doc is not None and doc.desynced
+
+    def _get_synced(self, uri: str) -> Document | None:
+        """Get a document whose content can be served (caller holds the lock)."""
+        doc = self._documents.get(uri)
+        return doc if doc is not None and not doc.desynced else None
+
+    @staticmethod
+    def _get_index(doc: Document) -> DocumentIndex:
+        """Get or create a document's index (parts are scanned lazily)."""
+        if doc.index is None:
+            doc.index = DocumentIndex(doc.text, doc.version)
+        return doc.index
+
+    @staticmethod
+    def _take_changed(doc: Document) -> ChangedLines | None:
+        """Reset and return a document's changed span (None = full change)."""
+        changed = None if doc.full_change else doc.changed_lines
+        doc.changed_lines = None
+        doc.full_change = False
+        return changed
+
+    def restore_changed_lines(self, uri: str, changed: ChangedLines | None) -> None:
+        """
+        Give back a taken span whose consumer was cancelled.
+
+        Edits made since the span was taken are merged into it, so the next
+        consumer sees all lines changed since the last completed run.
+
+        Args:
+            uri: Document URI
+            changed: Span returned by take_snapshot/take_changed_lines
+        """
+        with self._lock:
+            doc = self._documents.get(uri)
+            if doc is None or doc.full_change:
+                return
+            if changed is None:
+                doc.full_change = True
+                return
+            newer = doc.changed_lines
+            if newer is not None:
+                changed.merge(newer.old_start, newer.old_end, newer.new_end - newer.new_start)
+            doc.changed_lines = changed
+
     def close_document(self, uri: str) -> None:
         """
         Remove a closed document.
@@ -91,12 +425,27 @@ class DocumentState:
             uri: Document URI
 
         Returns:
-            Document text or None if not found
+            Document text or None if not found or desynced
         """
         with self._lock:
-            doc = self._documents.get(uri)
+            doc = self._get_synced(uri)
             return doc.text if doc else None
 
+    def get_line(self, uri: str, line: int) -> str | None:
+        """
+        Get a single line without joining the document.
+
+        Args:
+            uri: Document URI
+            line: Line number (0-indexed)
+
+        Returns:
+            Line content without line ending, or None if not found or desynced
+        """
+        with self._lock:
+            doc = self._get_synced(uri)
+            return doc.buffer.get_line(line) if doc else None
+
     def get_version(self, uri: str) -> int | None:
         """
         Get document version.
@@ -15,6 +15,8 @@ import re
 
 from lsprotocol import types as lsp
 
+from asciidoc_artisan.lsp.document_index import DocumentIndex, as_index
+
 logger = logging.getLogger(__name__)
 
 
@@ -256,18 +258,18 @@ class AsciiDocHoverProvider:
         # Compile patterns for faster matching
         self._patterns = [(re.compile(pattern), docs) for pattern, docs in SYNTAX_DOCS.items()]
 
-    def get_hover(self, text: str, position: lsp.Position) -> lsp.Hover | None:
+    def get_hover(self, text: str | DocumentIndex, position: lsp.Position) -> lsp.Hover | None:
         """
         Get hover information for position.
 
         Args:
-            text: Document text
+            text: Document text or its DocumentIndex
             position: Cursor position
 
         Returns:
             Hover information or None
         """
-        lines = text.splitlines()
+        lines = as_index(text).lines
         if position.line >= len(lines):
             return None
 
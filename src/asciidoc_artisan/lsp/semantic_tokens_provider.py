@@ -6,13 +6,39 @@ MA principle: ~200 lines focused on semantic tokenization.
 Provides syntax highlighting data for:
 - Headings, Attributes, Blocks, Comments
 - Macros, Cross-references, Formatting
+
+Line kinds and inline spans come from the shared DocumentIndex.
+
+Requests:
+- full: whole token array, with a result id per document
+- full/delta: edits against the previous result (payload ~ edit size)
+- range: tokens for a line range only (viewport)
+
+Each open document keeps its tokens per line. Edited line ranges from
+didChange (note_edit) mark the lines to rescan, so a request after an
+edit tokenizes and encodes only those lines and the delta covers just
+their part of the token array.
 """
 
+import itertools
 import logging
-import re
+import threading
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
 
 from lsprotocol import types as lsp
 
+from asciidoc_artisan.lsp.document_index import (
+    COMMENT_BLOCK_PATTERN,
+    LINE_ATTRIBUTE,
+    LINE_BLOCK_ATTRIBUTE,
+    LINE_COMMENT,
+    LINE_HEADING,
+    DocumentIndex,
+    as_index,
+)
+from asciidoc_artisan.lsp.document_state import ChangedLines
+
 logger = logging.getLogger(__name__)
 
 # Token types for AsciiDoc
@@ -30,6 +56,56 @@ TOKEN_TYPES = [
 
 TOKEN_MODIFIERS = ["declaration", "definition"]
 
+# Whole-line token (type, modifiers) per DocumentIndex line kind
+LINE_TOKENS: dict[str, tuple[int, int]] = {
+    LINE_HEADING: (0, 0),
+    LINE_COMMENT: (4, 0),
+    LINE_BLOCK_ATTRIBUTE: (3, 0),
+}
+
+# Token (type, modifiers) per DocumentIndex inline span kind
+INLINE_TOKENS: dict[str, tuple[int, int]] = {
+    "macro": (5, 0),
+    "xref": (7, 0),
+    "anchor": (7, 1),
+    "attr_ref": (2, 0),
+    "bold": (6, 0),
+    "italic": (6, 0),
+    "mono": (6, 0),
+}
+
+# Token within a line: (start character, length, token type, modifiers)
+LineToken = tuple[int, int, int, int]
+
+# Integers per encoded token
+TOKEN_FIELDS = 5
+
+
+@dataclass(slots=True)
+class DocumentTokens:
+    """
+    Tokens of one open document, kept in step with its edits.
+
+    Attributes:
+        result_id: Id of the last result sent for data
+        version: Document version the tokens belong to (None for plain text)
+        line_tokens: Tokens of each line
+        toggles: True for lines opening or closing a //// comment block
+        data: Encoded tokens of all lines
+        changed: Lines edited since version (None if none or unknown)
+        edited_version: Version produced by the last noted edit
+        full_change: Text was replaced since version (lines must be rescanned)
+    """
+
+    result_id: str
+    version: int | None
+    line_tokens: list[tuple[LineToken, ...]]
+    toggles: list[bool]
+    data: list[int]
+    changed: ChangedLines | None = None
+    edited_version: int | None = None
+    full_change: bool = False
+
 
 class AsciiDocSemanticTokensProvider:
     """
@@ -38,25 +114,17 @@ class AsciiDocSemanticTokensProvider:
     Tokenizes AsciiDoc elements for rich editor highlighting.
     Returns data in LSP semantic tokens format (delta-encoded).
 
-    Performance: <100ms for typical documents.
+    Attributes:
+        _documents: Token state per URI (from the last full or delta result)
+
+    Performance: <100ms for typical documents; edits rescan changed lines only.
     """
 
     def __init__(self) -> None:
         """Initialize semantic tokens provider."""
-        self._patterns = {
-            "heading": re.compile(r"^(=+)\s+(.+)$"),
-            "attr_def": re.compile(r"^(:[\w-]+:)\s*(.*)$"),
-            "attr_ref": re.compile(r"\{([\w-]+)\}"),
-            "block_type": re.compile(r"^\[([^\]]+)\]$"),
-            "comment_line": re.compile(r"^//(.*)$"),
-            "comment_block": re.compile(r"^(/{4,})$"),
-            "macro": re.compile(r"(image|include|link|xref|mailto|kbd|btn|menu)::?"),
-            "xref": re.compile(r"<<([^,>]+)(,[^>]*)?>?>"),
-            "anchor": re.compile(r"\[\[([^\]]+)\]\]|\[#([^\]]+)\]"),
-            "bold": re.compile(r"\*([^*]+)\*"),
-            "italic": re.compile(r"_([^_]+)_"),
-            "mono": re.compile(r"`([^`]+)`"),
-        }
+        self._documents: dict[str, DocumentTokens] = {}
+        self._result_ids = itertools.count(1)
+        self._lock = threading.Lock()
 
     def get_legend(self) -> lsp.SemanticTokensLegend:
         """Get token types and modifiers legend."""
@@ -65,116 +133,305 @@ class AsciiDocSemanticTokensProvider:
             token_modifiers=TOKEN_MODIFIERS,
         )
 
-    def get_tokens(self, text: str) -> lsp.SemanticTokens:
+    def get_tokens(self, text: str | DocumentIndex) -> lsp.SemanticTokens:
         """
         Get semantic tokens for document.
 
         Args:
-            text: Document text
+            text: Document text or its DocumentIndex
 
         Returns:
             SemanticTokens with delta-encoded data
         """
-        lines = text.splitlines()
-        tokens: list[tuple[int, int, int, int, int]] = []
-        in_comment_block = False
-
-        for line_num, line in enumerate(lines):
-            # Comment block toggle
-            if self._patterns["comment_block"].match(line):
-                in_comment_block = not in_comment_block
-                tokens.append((line_num, 0, len(line), 4, 0))
-                continue
-
-            if in_comment_block:
-                tokens.append((line_num, 0, len(line), 4, 0))
-                continue
-
-            tokens.extend(self._tokenize_line(line_num, line))
-
-        return self._encode_tokens(tokens)
-
-    def _tokenize_line(
-        self,
-        line_num: int,
-        line: str,
-    ) -> list[tuple[int, int, int, int, int]]:
-        """Tokenize a single line."""
-        tokens: list[tuple[int, int, int, int, int]] = []
-
-        # Heading
-        if match := self._patterns["heading"].match(line):
-            tokens.append((line_num, 0, len(line), 0, 0))
-            return tokens
-
-        # Comment line
-        if self._patterns["comment_line"].match(line):
-            tokens.append((line_num, 0, len(line), 4, 0))
-            return tokens
-
-        # Attribute definition
-        if match := self._patterns["attr_def"].match(line):
-            tokens.append((line_num, 0, len(match.group(1)), 1, 1))
-            return tokens
-
-        # Block type annotation
-        if self._patterns["block_type"].match(line):
-            tokens.append((line_num, 0, len(line), 3, 0))
-            return tokens
-
-        # Inline patterns
-        tokens.extend(self._tokenize_inline(line_num, line))
-        return tokens
-
-    def _tokenize_inline(
-        self,
-        line_num: int,
-        line: str,
-    ) -> list[tuple[int, int, int, int, int]]:
-        """Tokenize inline elements."""
-        tokens: list[tuple[int, int, int, int, int]] = []
-
-        # Macros
-        for match in self._patterns["macro"].finditer(line):
-            tokens.append((line_num, match.start(), len(match.group(0)), 5, 0))
-
-        # Cross-references
-        for match in self._patterns["xref"].finditer(line):
-            tokens.append((line_num, match.start(), match.end() - match.start(), 7, 0))
-
-        # Anchors
-        for match in self._patterns["anchor"].finditer(line):
-            tokens.append((line_num, match.start(), match.end() - match.start(), 7, 1))
-
-        # Attribute references
-        for match in self._patterns["attr_ref"].finditer(line):
-            tokens.append((line_num, match.start(), match.end() - match.start(), 2, 0))
-
-        # Formatting (bold, italic, mono)
-        for pattern_name in ("bold", "italic", "mono"):
-            for match in self._patterns[pattern_name].finditer(line):
-                tokens.append((line_num, match.start(), match.end() - match.start(), 6, 0))
-
-        return tokens
-
-    def _encode_tokens(
-        self,
-        tokens: list[tuple[int, int, int, int, int]],
-    ) -> lsp.SemanticTokens:
-        """Encode tokens in LSP delta format."""
-        tokens.sort(key=lambda t: (t[0], t[1]))
+        index = as_index(text)
+        return lsp.SemanticTokens(data=self._encode_lines(index, 0, len(index.lines)))
+
+    def get_tokens_full(self, uri: str, text: str | DocumentIndex) -> lsp.SemanticTokens:
+        """
+        Get semantic tokens for document, remembering them for delta requests.
+
+        Args:
+            uri: Document URI
+            text: Document text or its DocumentIndex
+
+        Returns:
+            SemanticTokens with result id
+        """
+        index = as_index(text)
+        with self._lock:
+            state = self._documents.get(uri)
+            if state is None or self._advance(state, index) is None:
+                state = self._build(uri, index)
+            else:
+                state.result_id = self._next_result_id()
+            return lsp.SemanticTokens(data=list(state.data), result_id=state.result_id)
+
+    def get_tokens_delta(
+        self, uri: str, text: str | DocumentIndex, previous_result_id: str
+    ) -> lsp.SemanticTokens | lsp.SemanticTokensDelta:
+        """
+        Get edits turning the previous result into the current tokens.
+
+        Falls back to a full result if the previous result is unknown. With
+        edits noted for the requested version only the edited lines are
+        rescanned; otherwise all lines are and the arrays are compared.
+
+        Args:
+            uri: Document URI
+            text: Document text or its DocumentIndex
+            previous_result_id: Result id the client holds
+
+        Returns:
+            SemanticTokensDelta (one edit, or none if unchanged), or full SemanticTokens
+        """
+        index = as_index(text)
+        with self._lock:
+            state = self._documents.get(uri)
+            if state is None or state.result_id != previous_result_id:
+                state = self._build(uri, index)
+                return lsp.SemanticTokens(data=list(state.data), result_id=state.result_id)
+
+            edits = self._advance(state, index)
+            if edits is None:
+                previous = state.data
+                state = self._build(uri, index)
+                edit = self._diff(previous, state.data)
+                edits = [edit] if edit else []
+            else:
+                state.result_id = self._next_result_id()
+            return lsp.SemanticTokensDelta(edits=edits, result_id=state.result_id)
+
+    def get_tokens_range(self, text: str | DocumentIndex, range_: lsp.Range) -> lsp.SemanticTokens:
+        """
+        Get semantic tokens for the lines of a range (e.g. the viewport).
+
+        Args:
+            text: Document text or its DocumentIndex
+            range_: Requested range (whole lines are tokenized)
+
+        Returns:
+            SemanticTokens for tokens in the range lines
+        """
+        index = as_index(text)
+        end_line = min(range_.end.line + 1, len(index.lines))
+        return lsp.SemanticTokens(data=self._encode_lines(index, range_.start.line, end_line))
 
+    def note_edit(self, uri: str, version: int, span: tuple[int, int, int] | None = None) -> None:
+        """
+        Record a didChange edit so the next request rescans only its lines.
+
+        Args:
+            uri: Document URI
+            version: Document version after the edit
+            span: (first line, end of replaced lines, number of new lines)
+                as returned by DocumentState.apply_edit; None if the whole
+                text was replaced
+        """
+        with self._lock:
+            state = self._documents.get(uri)
+            if state is None:
+                return
+            state.edited_version = version
+            if span is None or state.full_change:
+                state.full_change = True
+                state.changed = None
+                return
+            start, end, new_count = span
+            if state.changed is None:
+                state.changed = ChangedLines(start, end, start, start + new_count)
+            else:
+                state.changed.merge(start, end, new_count)
+
+    def forget(self, uri: str) -> None:
+        """
+        Drop the remembered tokens for a document (e.g. on close).
+
+        Args:
+            uri: Document URI
+        """
+        with self._lock:
+            self._documents.pop(uri, None)
+
+    def _next_result_id(self) -> str:
+        """Get a new result id."""
+        return str(next(self._result_ids))
+
+    def _build(self, uri: str, index: DocumentIndex) -> DocumentTokens:
+        """Tokenize all lines and store them as the document's state (caller holds the lock)."""
+        line_count = len(index.lines)
+        line_tokens = [self._tokenize_line(index, line_num) for line_num in range(line_count)]
+        state = DocumentTokens(
+            result_id=self._next_result_id(),
+            version=index.version,
+            line_tokens=line_tokens,
+            toggles=self._toggles(index, 0, line_count),
+            data=self._encode(enumerate(line_tokens)),
+        )
+        self._documents[uri] = state
+        return state
+
+    def _advance(self, state: DocumentTokens, index: DocumentIndex) -> list[lsp.SemanticTokensEdit] | None:
+        """
+        Bring state up to index by rescanning the noted edit window.
+
+        Lines outside the window keep their text; their kinds only change
+        when the window gains or loses a //// delimiter, and then the
+        window is extended to the end of the document.
+
+        Returns:
+            Edits applied to state.data (empty if unchanged), or None if
+            the noted edits do not lead to index (state must be rebuilt)
+        """
+        if index.version is None:
+            return None
+        if state.version == index.version:
+            return []
+        changed = state.changed
+        if changed is None or state.full_change or state.edited_version != index.version:
+            return None
+
+        old_tokens = state.line_tokens
+        old_count = len(old_tokens)
+        new_count = len(index.lines)
+        old_end = changed.old_end
+        new_end = changed.new_end
+        if old_end >= old_count or new_end >= new_count:
+            # Edit reaches the last line (a final line break may come or go)
+            old_end, new_end = old_count, new_count
+        if old_count - old_end != new_count - new_end:
+            return None
+        start = min(changed.new_start, old_end, new_end)
+
+        toggles = self._toggles(index, start, new_end)
+        if sum(toggles) % 2 != sum(state.toggles[start:old_end]) % 2:
+            old_end, new_end = old_count, new_count
+            toggles = self._toggles(index, start, new_end)
+        tokens = [self._tokenize_line(index, line_num) for line_num in range(start, new_end)]
+
+        # Position of the window in data, counted from the nearer end
+        if start <= old_count - old_end:
+            data_start = TOKEN_FIELDS * sum(map(len, itertools.islice(old_tokens, start)))
+        else:
+            data_start = len(state.data) - TOKEN_FIELDS * sum(map(len, itertools.islice(old_tokens, start, None)))
+        data_end = data_start + TOKEN_FIELDS * sum(map(len, itertools.islice(old_tokens, start, old_end)))
+
+        # Window tokens are encoded relative to the last token before it
+        prev_line = start - 1
+        while prev_line >= 0 and not old_tokens[prev_line]:
+            prev_line -= 1
+        prev_char = old_tokens[prev_line][-1][0] if prev_line >= 0 else 0
+        data = self._encode(enumerate(tokens, start), max(prev_line, 0), prev_char)
+
+        # The first token after the window is relative to the window's last token
+        next_line = old_end
+        while next_line < old_count and not old_tokens[next_line]:
+            next_line += 1
+        if next_line < old_count:
+            for line_num, line_tokens in reversed(list(enumerate(tokens, start))):
+                if line_tokens:
+                    prev_line, prev_char = line_num, line_tokens[-1][0]
+                    break
+            following = (next_line - old_end + new_end, old_tokens[next_line][:1])
+            data += self._encode([following], max(prev_line, 0), prev_char)
+            data_end += TOKEN_FIELDS
+
+        edit = self._diff(state.data[data_start:data_end], data)
+        state.data[data_start:data_end] = data
+        old_tokens[start:old_end] = tokens
+        state.toggles[start:old_end] = toggles
+        state.version = index.version
+        state.changed = None
+        if edit is None:
+            return []
+        edit.start += data_start
+        return [edit]
+
+    @staticmethod
+    def _toggles(index: DocumentIndex, start: int, end: int) -> list[bool]:
+        """Flag lines [start, end) that open or close a //// comment block."""
+        lines = index.lines
+        return [
+            lines[line_num].startswith("////") and COMMENT_BLOCK_PATTERN.match(lines[line_num]) is not None
+            for line_num in range(start, end)
+        ]
+
+    def _tokenize_line(self, index: DocumentIndex, line_num: int) -> tuple[LineToken, ...]:
+        """Get tokens of one line sorted by start."""
+        kind = index.line_kinds[line_num]
+        line = index.lines[line_num]
+
+        tokens: list[LineToken]
+        if kind in LINE_TOKENS:
+            token_type, modifiers = LINE_TOKENS[kind]
+            tokens = [(0, len(line), token_type, modifiers)]
+        elif kind == LINE_ATTRIBUTE:
+            tokens = [(0, len(index.attribute_entries[line_num].name), 1, 1)]
+        else:
+            tokens = [
+                (span.start, span.end - span.start, *INLINE_TOKENS[span.kind]) for span in index.line_spans(line_num)
+            ]
+            tokens.sort(key=lambda token: token[0])
+
+        return tuple(tokens)
+
+    def _encode_lines(self, index: DocumentIndex, start_line: int, end_line: int) -> list[int]:
+        """Encode tokens of lines [start_line, end_line) in LSP delta format."""
+        lines = range(max(start_line, 0), end_line)
+        return self._encode((line_num, self._tokenize_line(index, line_num)) for line_num in lines)
+
+    @staticmethod
+    def _encode(lines: Iterable[tuple[int, Sequence[LineToken]]], prev_line: int = 0, prev_char: int = 0) -> list[int]:
+        """
+        Encode tokens of lines in LSP delta format.
+
+        Args:
+            lines: (line number, tokens) in line order
+            prev_line: Line of the token before the first one
+            prev_char: Start character of that token
+
+        Returns:
+            Encoded token data
+        """
         data: list[int] = []
-        prev_line = 0
-        prev_char = 0
+        for line_num, tokens in lines:
+            for char, length, token_type, modifiers in tokens:
+                delta_line = line_num - prev_line
+                delta_char = char if delta_line > 0 else char - prev_char
 
-        for line, char, length, token_type, modifiers in tokens:
-            delta_line = line - prev_line
-            delta_char = char if delta_line > 0 else char - prev_char
+                data.extend([delta_line, delta_char, length, token_type, modifiers])
 
-            data.extend([delta_line, delta_char, length, token_type, modifiers])
+                prev_line = line_num
+                prev_char = char
 
-            prev_line = line
-            prev_char = char
+        return data
 
-        return lsp.SemanticTokens(data=data)
+    @staticmethod
+    def _diff(previous: list[int], current: list[int]) -> lsp.SemanticTokensEdit | None:
+        """
+        Compute one edit replacing the differing middle of two token arrays.
+
+        Args:
+            previous: Data the client holds
+            current: New data
+
+        Returns:
+            SemanticTokensEdit, or None if the arrays are equal
+        """
+        if previous == current:
+            return None
+
+        limit = min(len(previous), len(current))
+        prefix = 0
+        while prefix < limit and previous[prefix] == current[prefix]:
+            prefix += 1
+
+        suffix = 0
+        limit -= prefix
+        while suffix < limit and previous[-1 - suffix] == current[-1 - suffix]:
+            suffix += 1
+
+        return lsp.SemanticTokensEdit(
+            start=prefix,
+            delete_count=len(previous) - prefix - suffix,
+            data=current[prefix : len(current) - suffix],
+        )
@@ -15,7 +15,7 @@ Features:
 - textDocument/codeAction: Quick fixes
 - textDocument/foldingRange: Collapsible regions
 - textDocument/formatting: Document formatting
-- textDocument/semanticTokens: Syntax highlighting
+- textDocument/semanticTokens: Syntax highlighting (full, delta, range)
 
 Example:
     # Standalone server
@@ -26,14 +26,20 @@ Example:
     server.start_tcp("localhost", 2087)
 """
 
+import asyncio
 import logging
+from collections.abc import Callable
 
 from lsprotocol import types as lsp
 from pygls.lsp.server import LanguageServer
+from pygls.uris import to_fs_path
 
+from asciidoc_artisan.core.syntax_checker import ValidationCancelled
+from asciidoc_artisan.core.syntax_models import SyntaxErrorModel
 from asciidoc_artisan.lsp.code_action_provider import AsciiDocCodeActionProvider
 from asciidoc_artisan.lsp.completion_provider import AsciiDocCompletionProvider
 from asciidoc_artisan.lsp.diagnostics_provider import AsciiDocDiagnosticsProvider
+from asciidoc_artisan.lsp.diagnostics_scheduler import DiagnosticsScheduler
 from asciidoc_artisan.lsp.document_state import DocumentState
 from asciidoc_artisan.lsp.folding_provider import AsciiDocFoldingProvider
 from asciidoc_artisan.lsp.formatting_provider import AsciiDocFormattingProvider
@@ -61,7 +67,9 @@ class AsciiDocLanguageServer(LanguageServer):
 
     Thread Safety:
         Uses pygls's built-in threading model - all feature handlers
-        run on a separate thread pool.
+        run on a separate thread pool. Diagnostics are computed on the
+        DiagnosticsScheduler worker thread (debounced per document) and
+        published from the server's event loop.
     """
 
     SERVER_NAME = "asciidoc-artisan-lsp"
@@ -69,7 +77,11 @@ class AsciiDocLanguageServer(LanguageServer):
 
     def __init__(self) -> None:
         """Initialize AsciiDoc Language Server."""
-        super().__init__(name=self.SERVER_NAME, version=self.SERVER_VERSION)
+        super().__init__(
+            name=self.SERVER_NAME,
+            version=self.SERVER_VERSION,
+            text_document_sync_kind=lsp.TextDocumentSyncKind.Incremental,
+        )
 
         # Document state management
         self.document_state = DocumentState()
@@ -84,6 +96,17 @@ class AsciiDocLanguageServer(LanguageServer):
         self.formatting_provider = AsciiDocFormattingProvider()
         self.semantic_tokens_provider = AsciiDocSemanticTokensProvider()
 
+        # Event loop running the protocol (set by handlers that schedule
+        # diagnostics): pygls server and transport state is only touched from it
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        # Debounced, cancellable diagnostics off the protocol thread
+        self.diagnostics_scheduler = DiagnosticsScheduler(
+            self._validate_document,
+            self._publish_diagnostics,
+            self.document_state.get_version,
+        )
+
         # Register handlers
         self._register_handlers()
 
@@ -106,6 +129,8 @@ class AsciiDocLanguageServer(LanguageServer):
         self.feature(lsp.TEXT_DOCUMENT_FOLDING_RANGE)(self._on_folding_range)
         self.feature(lsp.TEXT_DOCUMENT_FORMATTING)(self._on_formatting)
         self.feature(lsp.TEXT_DOCUMENT_SEMANTIC_TOKENS_FULL)(self._on_semantic_tokens)
+        self.feature(lsp.TEXT_DOCUMENT_SEMANTIC_TOKENS_FULL_DELTA)(self._on_semantic_tokens_delta)
+        self.feature(lsp.TEXT_DOCUMENT_SEMANTIC_TOKENS_RANGE)(self._on_semantic_tokens_range)
 
     def _on_did_open(self, params: lsp.DidOpenTextDocumentParams) -> None:
         """Handle document open - store content and run initial diagnostics."""
@@ -113,110 +138,212 @@ class AsciiDocLanguageServer(LanguageServer):
         text = params.text_document.text
         version = params.text_document.version
 
+        self._remember_loop()
         self.document_state.open_document(uri, text, version)
         logger.debug(f"Document opened: {uri}")
 
-        # Run initial diagnostics
-        self._publish_diagnostics(uri, text)
+        # Run initial diagnostics (no debounce)
+        self.diagnostics_scheduler.schedule(uri, version, delay=0)
 
     def _on_did_change(self, params: lsp.DidChangeTextDocumentParams) -> None:
-        """Handle document change - update content and refresh diagnostics."""
+        """Handle document change - apply edits and refresh diagnostics."""
         uri = params.text_document.uri
         version = params.text_document.version
 
-        # Apply changes (full sync mode - get full text)
-        text: str | None = None
+        self._remember_loop()
+        was_desynced = self.document_state.is_desynced(uri)
+
+        # Apply changes in order (ranged edits touch only the edited lines;
+        # they are dropped while desynced)
         for change in params.content_changes:
-            if isinstance(change, lsp.TextDocumentContentChangeWholeDocument):
-                # Full document sync
-                self.document_state.update_document(uri, change.text, version)
-                text = change.text
+            if isinstance(change, lsp.TextDocumentContentChangePartial):
+                start = change.range.start
+                end = change.range.end
+                span = self.document_state.apply_edit(
+                    uri, start.line, start.character, end.line, end.character, change.text, version
+                )
+                if span is not None:
+                    self.semantic_tokens_provider.note_edit(uri, version, span)
             else:
-                # Incremental sync not fully supported yet
-                text = self.document_state.get_document(uri)
+                # Full document sync (also ends a desync)
+                self.document_state.update_document(uri, change.text, version)
+                self.semantic_tokens_provider.note_edit(uri, version)
 
         logger.debug(f"Document changed: {uri}")
 
-        # Refresh diagnostics
-        if text is not None:
-            self._publish_diagnostics(uri, text)
+        if self.document_state.is_desynced(uri):
+            if not was_desynced:
+                self._on_desync(uri)
+            return
+
+        # Refresh diagnostics once typing pauses (coalesces rapid changes)
+        self.diagnostics_scheduler.schedule(uri, version)
 
     def _on_did_close(self, params: lsp.DidCloseTextDocumentParams) -> None:
         """Handle document close - clean up state."""
         uri = params.text_document.uri
+        self.diagnostics_scheduler.cancel(uri)
         self.document_state.close_document(uri)
+        self.diagnostics_provider.forget(uri)
+        self.semantic_tokens_provider.forget(uri)
         logger.debug(f"Document closed: {uri}")
 
         # Clear diagnostics
         self.text_document_publish_diagnostics(lsp.PublishDiagnosticsParams(uri=uri, diagnostics=[]))
 
     def _on_did_save(self, params: lsp.DidSaveTextDocumentParams) -> None:
-        """Handle document save - refresh diagnostics if text included."""
+        """Handle document save - full diagnostics refresh."""
         uri = params.text_document.uri
 
-        if params.text:
-            self._publish_diagnostics(uri, params.text)
+        self._remember_loop()
+        if self.document_state.is_desynced(uri):
+            self._resync(uri, params.text)
+
+        version = self.document_state.get_version(uri)
+        if version is not None:
+            # Forget reused errors so line-local rules also re-check every line
+            self.diagnostics_provider.forget(uri)
+            self.diagnostics_scheduler.schedule(uri, version, delay=0)
 
         logger.debug(f"Document saved: {uri}")
 
+    def _on_desync(self, uri: str) -> None:
+        """Stop serving a document whose edits no longer apply (until its full text arrives)."""
+        logger.warning(f"Document out of sync: {uri}; features paused until save or full sync")
+        self.diagnostics_scheduler.cancel(uri)
+        self.diagnostics_provider.forget(uri)
+        self.semantic_tokens_provider.forget(uri)
+        self.text_document_publish_diagnostics(lsp.PublishDiagnosticsParams(uri=uri, diagnostics=[]))
+
+    def _resync(self, uri: str, text: str | None) -> None:
+        """
+        Replace a desynced document with its saved content.
+
+        After a save the client buffer equals the saved text: taken from the
+        notification (include_text) or, failing that, read from disk.
+        """
+        if text is None:
+            path = to_fs_path(uri)
+            if path is None:
+                logger.warning(f"Cannot resync {uri}: not a file URI")
+                return
+            try:
+                with open(path, encoding="utf-8", newline="") as file:
+                    text = file.read()
+            except (OSError, UnicodeDecodeError) as exc:
+                logger.warning(f"Cannot resync {uri}: {exc}")
+                return
+
+        version = self.document_state.get_version(uri)
+        if version is not None:
+            self.document_state.update_document(uri, text, version)
+            logger.info(f"Document resynced from save: {uri}")
+
     def _on_completion(self, params: lsp.CompletionParams) -> lsp.CompletionList | None:
         """Handle completion request."""
         uri = params.text_document.uri
         position = params.position
-        text = self.document_state.get_document(uri)
+        index = self.document_state.get_index(uri)
 
-        if not text:
+        if index is None or not index.text:
             return None
 
-        items = self.completion_provider.get_completions(text, position)
+        items = self.completion_provider.get_completions(index, position)
         return lsp.CompletionList(is_incomplete=False, items=items)
 
     def _on_hover(self, params: lsp.HoverParams) -> lsp.Hover | None:
         """Handle hover request."""
         uri = params.text_document.uri
         position = params.position
-        text = self.document_state.get_document(uri)
+        index = self.document_state.get_index(uri)
 
-        if not text:
+        if index is None or not index.text:
             return None
 
-        return self.hover_provider.get_hover(text, position)
+        return self.hover_provider.get_hover(index, position)
 
     def _on_definition(self, params: lsp.DefinitionParams) -> lsp.Location | list[lsp.Location] | None:
         """Handle go-to-definition request."""
         uri = params.text_document.uri
         position = params.position
-        text = self.document_state.get_document(uri)
+        index = self.document_state.get_index(uri)
 
-        if not text:
+        if index is None or not index.text:
             return None
 
         # Find definition in same document
-        location = self.symbols_provider.find_definition(text, position, uri)
+        location = self.symbols_provider.find_definition(index, position, uri)
         return location
 
     def _on_document_symbol(self, params: lsp.DocumentSymbolParams) -> list[lsp.DocumentSymbol] | None:
         """Handle document symbol request (outline)."""
         uri = params.text_document.uri
-        text = self.document_state.get_document(uri)
+        index = self.document_state.get_index(uri)
 
-        if not text:
+        if index is None or not index.text:
             return None
 
-        return self.symbols_provider.get_symbols(text)
+        return self.symbols_provider.get_symbols(index)
 
-    def _publish_diagnostics(self, uri: str, text: str) -> None:
-        """Run diagnostics and publish results, storing fixes for code actions."""
-        diagnostics = self.diagnostics_provider.get_diagnostics(text)
+    def _validate_document(self, uri: str, cancelled: Callable[[], bool]) -> tuple[int, list[lsp.Diagnostic]] | None:
+        """Run diagnostics for the current document content (scheduler worker thread)."""
+        snapshot = self.document_state.take_snapshot(uri)
+        if snapshot is None:
+            return None
+        index, version, changed = snapshot
 
-        # Store fixes from cached errors in code_action_provider
+        try:
+            # Only the edited lines when the span is known
+            if changed is None:
+                diagnostics = self.diagnostics_provider.get_diagnostics(index, uri, cancelled)
+            else:
+                diagnostics = self.diagnostics_provider.get_diagnostics_for_edit(uri, index, changed, cancelled)
+        except ValidationCancelled:
+            # Newer change pending - its run must also cover these lines
+            self.document_state.restore_changed_lines(uri, changed)
+            return None
+
+        return version, diagnostics
+
+    def _remember_loop(self) -> None:
+        """Remember the event loop running this handler (publishes are posted to it)."""
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            pass  # Called outside the server loop (tests): publish directly
+
+    def _publish_diagnostics(self, uri: str, version: int, diagnostics: list[lsp.Diagnostic]) -> None:
+        """Hand diagnostics from the scheduler worker thread to the server loop."""
+        # Errors of the run that produced diagnostics (later runs replace
+        # the list, they never modify it)
+        errors = self.diagnostics_provider.get_last_errors()
+        loop = self._loop
+        if loop is None:
+            self._apply_diagnostics(uri, version, diagnostics, errors)
+            return
+        try:
+            loop.call_soon_threadsafe(self._apply_diagnostics, uri, version, diagnostics, errors)
+        except RuntimeError:
+            logger.debug(f"Server loop closed, dropping diagnostics for {uri}")
+
+    def _apply_diagnostics(
+        self, uri: str, version: int, diagnostics: list[lsp.Diagnostic], errors: list[SyntaxErrorModel]
+    ) -> None:
+        """Publish diagnostics, storing fixes for code actions (server loop)."""
+        if self.document_state.get_version(uri) != version:
+            logger.debug(f"Dropping diagnostics for {uri} (v{version}): changed while queued")
+            return
+
+        # Store fixes from the run's errors in code_action_provider
         self.code_action_provider.clear_cache()
-        for error in self.diagnostics_provider._errors_cache:
+        for error in errors:
             if error.fixes:
                 key = f"{error.line}:{error.column}:{error.code}"
                 self.code_action_provider.store_fixes(key, error.fixes)
 
-        self.text_document_publish_diagnostics(lsp.PublishDiagnosticsParams(uri=uri, diagnostics=diagnostics))
+        self.text_document_publish_diagnostics(
+            lsp.PublishDiagnosticsParams(uri=uri, version=version, diagnostics=diagnostics)
+        )
 
     def _on_code_action(self, params: lsp.CodeActionParams) -> list[lsp.CodeAction] | None:
         """Handle code action request (quick fixes)."""
@@ -226,10 +353,10 @@ class AsciiDocLanguageServer(LanguageServer):
     def _on_folding_range(self, params: lsp.FoldingRangeParams) -> list[lsp.FoldingRange] | None:
         """Handle folding range request."""
         uri = params.text_document.uri
-        text = self.document_state.get_document(uri)
-        if not text:
+        index = self.document_state.get_index(uri)
+        if index is None or not index.text:
             return None
-        return self.folding_provider.get_folding_ranges(text)
+        return self.folding_provider.get_folding_ranges(index)
 
     def _on_formatting(self, params: lsp.DocumentFormattingParams) -> list[lsp.TextEdit] | None:
         """Handle document formatting request."""
@@ -242,17 +369,35 @@ class AsciiDocLanguageServer(LanguageServer):
     def _on_semantic_tokens(self, params: lsp.SemanticTokensParams) -> lsp.SemanticTokens | None:
         """Handle semantic tokens request."""
         uri = params.text_document.uri
-        text = self.document_state.get_document(uri)
-        if not text:
+        index = self.document_state.get_index(uri)
+        if index is None or not index.text:
+            return None
+        return self.semantic_tokens_provider.get_tokens_full(uri, index)
+
+    def _on_semantic_tokens_delta(
+        self, params: lsp.SemanticTokensDeltaParams
+    ) -> lsp.SemanticTokens | lsp.SemanticTokensDelta | None:
+        """Handle semantic tokens delta request (edits since previous result)."""
+        uri = params.text_document.uri
+        index = self.document_state.get_index(uri)
+        if index is None:
+            return None
+        return self.semantic_tokens_provider.get_tokens_delta(uri, index, params.previous_result_id)
+
+    def _on_semantic_tokens_range(self, params: lsp.SemanticTokensRangeParams) -> lsp.SemanticTokens | None:
+        """Handle semantic tokens range request (viewport)."""
+        uri = params.text_document.uri
+        index = self.document_state.get_index(uri)
+        if index is None or not index.text:
             return None
-        return self.semantic_tokens_provider.get_tokens(text)
+        return self.semantic_tokens_provider.get_tokens_range(index, params.range)
 
     def get_capabilities(self) -> lsp.ServerCapabilities:
         """Return server capabilities for initialization."""
         return lsp.ServerCapabilities(
             text_document_sync=lsp.TextDocumentSyncOptions(
                 open_close=True,
-                change=lsp.TextDocumentSyncKind.Full,
+                change=lsp.TextDocumentSyncKind.Incremental,
                 save=lsp.SaveOptions(include_text=True),
             ),
             completion_provider=lsp.CompletionOptions(
@@ -269,7 +414,8 @@ class AsciiDocLanguageServer(LanguageServer):
             document_formatting_provider=lsp.DocumentFormattingOptions(),
             semantic_tokens_provider=lsp.SemanticTokensOptions(
                 legend=self.semantic_tokens_provider.get_legend(),
-                full=True,
+                full=lsp.SemanticTokensFullDelta(delta=True),
+                range=True,
             ),
         )
 
@@ -306,12 +452,15 @@ def main() -> None:
 
     server = AsciiDocLanguageServer()
 
-    if args.tcp:
-        logger.info(f"Starting TCP server on {args.host}:{args.port}")
-        server.start_tcp(args.host, args.port)
-    else:
-        logger.info("Starting stdio server")
-        server.start_io()
+    try:
+        if args.tcp:
+            logger.info(f"Starting TCP server on {args.host}:{args.port}")
+            server.start_tcp(args.host, args.port)
+        else:
+            logger.info("Starting stdio server")
+            server.start_io()
+    finally:
+        server.diagnostics_scheduler.shutdown()
 
 
 if __name__ == "__main__":
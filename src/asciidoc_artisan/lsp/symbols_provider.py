@@ -7,6 +7,8 @@ Provides:
 - Document outline (headings hierarchy)
 - Go-to-definition for anchors
 - Symbol search within document
+
+Structure comes from the shared DocumentIndex (no rescans per request).
 """
 
 import logging
@@ -15,6 +17,8 @@ from typing import cast
 
 from lsprotocol import types as lsp
 
+from asciidoc_artisan.lsp.document_index import DocumentIndex, Heading, as_index
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,69 +34,54 @@ class AsciiDocSymbolsProvider:
     Performance: <50ms for typical documents.
     """
 
-    def __init__(self) -> None:
-        """Initialize symbols provider."""
-        # Patterns for symbol extraction
-        self._heading_pattern = re.compile(r"^(=+)\s+(.+)$", re.MULTILINE)
-        self._anchor_pattern = re.compile(r"\[\[([^\]]+)\]\]|\[#([^\]]+)\]")
-        self._include_pattern = re.compile(r"^include::([^\[]+)\[", re.MULTILINE)
-
-    def get_symbols(self, text: str) -> list[lsp.DocumentSymbol]:
+    def get_symbols(self, text: str | DocumentIndex) -> list[lsp.DocumentSymbol]:
         """
         Extract document symbols (outline).
 
         Args:
-            text: Document text
+            text: Document text or its DocumentIndex
 
         Returns:
             Hierarchical list of document symbols
         """
-        lines = text.splitlines()
+        index = as_index(text)
         symbols: list[lsp.DocumentSymbol] = []
         heading_stack: list[tuple[int, lsp.DocumentSymbol]] = []
 
-        for line_num, line in enumerate(lines):
-            # Check for heading
-            heading_match = self._heading_pattern.match(line)
-            if heading_match:
-                level = len(heading_match.group(1))
-                name = heading_match.group(2).strip()
+        # Merge headings and anchors in document order (heading first on a line)
+        entries = sorted(
+            [(heading.line, 0, heading) for heading in index.headings]
+            + [(anchor.line, 1, anchor) for anchor in index.anchors],
+            key=lambda entry: (entry[0], entry[1]),
+        )
 
-                # Create symbol
+        for line_num, _, entry in entries:
+            line_range = self._line_range(index, line_num)
+
+            if isinstance(entry, Heading):
+                level = entry.level
                 symbol = lsp.DocumentSymbol(
-                    name=name,
+                    name=entry.title,
                     kind=lsp.SymbolKind.String if level == 1 else lsp.SymbolKind.Function,
-                    range=lsp.Range(
-                        start=lsp.Position(line=line_num, character=0),
-                        end=lsp.Position(line=line_num, character=len(line)),
-                    ),
+                    range=line_range,
                     selection_range=lsp.Range(
                         start=lsp.Position(line=line_num, character=level + 1),
-                        end=lsp.Position(line=line_num, character=len(line)),
+                        end=line_range.end,
                     ),
                     children=[],
                 )
 
                 # Build hierarchy
                 self._add_to_hierarchy(symbols, heading_stack, level, symbol)
-
-            # Check for anchor
-            anchor_matches = self._anchor_pattern.findall(line)
-            for match in anchor_matches:
-                anchor_id = match[0] or match[1]
-                symbol = lsp.DocumentSymbol(
-                    name=f"#{anchor_id}",
-                    kind=lsp.SymbolKind.Key,
-                    range=lsp.Range(
-                        start=lsp.Position(line=line_num, character=0),
-                        end=lsp.Position(line=line_num, character=len(line)),
-                    ),
-                    selection_range=lsp.Range(
-                        start=lsp.Position(line=line_num, character=0),
-                        end=lsp.Position(line=line_num, character=len(line)),
-                    ),
+            else:
+                symbols.append(
+                    lsp.DocumentSymbol(
+                        name=f"#{entry.id}",
+                        kind=lsp.SymbolKind.Key,
+                        range=line_range,
+                        selection_range=line_range,
+                    )
                 )
-                symbols.append(symbol)
 
         return symbols
 
@@ -122,7 +111,7 @@ class AsciiDocSymbolsProvider:
         # Push to stack
         stack.append((level, symbol))
 
-    def find_definition(self, text: str, position: lsp.Position, uri: str) -> lsp.Location | None:
+    def find_definition(self, text: str | DocumentIndex, position: lsp.Position, uri: str) -> lsp.Location | None:
         """
         Find definition of symbol at position.
 
@@ -131,14 +120,15 @@ class AsciiDocSymbolsProvider:
         - Includes: include::file[] -> file (not implemented yet)
 
         Args:
-            text: Document text
+            text: Document text or its DocumentIndex
             position: Cursor position
             uri: Document URI
 
         Returns:
             Location of definition or None
         """
-        lines = text.splitlines()
+        index = as_index(text)
+        lines = index.lines
         if position.line >= len(lines):
             return None
 
@@ -148,63 +138,50 @@ class AsciiDocSymbolsProvider:
         xref_match = re.search(r"<<([^,>]+)", line)
         if xref_match:
             anchor_id = xref_match.group(1)
-            return self._find_anchor_definition(text, anchor_id, uri)
+            return self._find_anchor_definition(index, anchor_id, uri)
 
         return None
 
-    def _find_anchor_definition(self, text: str, anchor_id: str, uri: str) -> lsp.Location | None:
+    def _find_anchor_definition(self, text: str | DocumentIndex, anchor_id: str, uri: str) -> lsp.Location | None:
         """
         Find where an anchor is defined.
 
         Args:
-            text: Document text
+            text: Document text or its DocumentIndex
             anchor_id: Anchor ID to find
             uri: Document URI
 
         Returns:
             Location of anchor definition or None
         """
-        lines = text.splitlines()
-
-        for line_num, line in enumerate(lines):
-            # Check for [[anchor]] or [#anchor]
-            if f"[[{anchor_id}]]" in line or f"[#{anchor_id}]" in line:
-                return lsp.Location(
-                    uri=uri,
-                    range=lsp.Range(
-                        start=lsp.Position(line=line_num, character=0),
-                        end=lsp.Position(line=line_num, character=len(line)),
-                    ),
-                )
+        index = as_index(text)
+
+        for anchor in index.anchors:
+            if anchor.id == anchor_id:
+                return lsp.Location(uri=uri, range=self._line_range(index, anchor.line))
 
         return None
 
-    def find_references(self, text: str, anchor_id: str, uri: str) -> list[lsp.Location]:
+    def find_references(self, text: str | DocumentIndex, anchor_id: str, uri: str) -> list[lsp.Location]:
         """
         Find all references to an anchor.
 
         Args:
-            text: Document text
+            text: Document text or its DocumentIndex
             anchor_id: Anchor ID
             uri: Document URI
 
         Returns:
-            List of locations where anchor is referenced
+            List of locations (one per line) where anchor is referenced
         """
-        locations = []
-        lines = text.splitlines()
-
-        for line_num, line in enumerate(lines):
-            # Check for <<anchor>> references
-            if f"<<{anchor_id}" in line:
-                locations.append(
-                    lsp.Location(
-                        uri=uri,
-                        range=lsp.Range(
-                            start=lsp.Position(line=line_num, character=0),
-                            end=lsp.Position(line=line_num, character=len(line)),
-                        ),
-                    )
-                )
-
-        return locations
+        index = as_index(text)
+        lines_with_refs = dict.fromkeys(xref.line for xref in index.xrefs if xref.id == anchor_id)
+        return [lsp.Location(uri=uri, range=self._line_range(index, line_num)) for line_num in lines_with_refs]
+
+    @staticmethod
+    def _line_range(index: DocumentIndex, line_num: int) -> lsp.Range:
+        """Range covering a whole line."""
+        return lsp.Range(
+            start=lsp.Position(line=line_num, character=0),
+            end=lsp.Position(line=line_num, character=len(index.lines[line_num])),
+        )
@@ -57,7 +57,8 @@ class ChatWorkerRouter:
 
         if backend == "ollama":
             # Route to Ollama worker
-            self.editor.ollama_chat_worker.send_message(message, model, context_mode, history, document_content)
+            worker = self.editor.worker_manager.start_worker("ollama_chat")
+            worker.send_message(message, model, context_mode, history, document_content)
         elif backend == "claude":
             # Route to Claude worker with context-appropriate system prompt
             self._route_to_claude(message, model, context_mode, history, document_content)
@@ -90,7 +91,7 @@ class ChatWorkerRouter:
             full_message = f"Document content:\n```\n{document_content}\n```\n\nUser question: {message}"
 
         # Send to Claude worker
-        self.editor.claude_worker.send_message(
+        self.editor.worker_manager.start_worker("claude").send_message(
             message=full_message,
             system=system_prompt,
             conversation_history=claude_history,
@@ -103,10 +103,11 @@ class DialogManager:
             # Refresh status bar to show new model.
             self.editor._update_ai_status_bar()
 
-            # Tell worker thread about new config.
-            self.editor.pandoc_worker.set_ollama_config(
-                self.editor._settings.ollama_enabled, self.editor._settings.ollama_model
-            )
+            # Tell worker thread about new config (a worker started later reads settings).
+            if self.editor.pandoc_worker:
+                self.editor.pandoc_worker.set_ollama_config(
+                    self.editor._settings.ollama_enabled, self.editor._settings.ollama_model
+                )
 
             # Keep chat manager in sync with new settings.
             self.editor.chat_manager.update_settings(self.editor._settings)
@@ -306,6 +307,7 @@ class DialogManager:
 
             # QPlainTextEdit handles large documents efficiently with internal lazy loading
             # It only renders visible blocks, so setPlainText is still fast
+            self.editor.windowed_editor.close()
             self.editor.editor.setPlainText(content)
             self.editor._current_file_path = file_path
             self.editor._unsaved_changes = False
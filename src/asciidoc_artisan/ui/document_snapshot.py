@@ -0,0 +1,137 @@
+"""
+Document Snapshot - One shared copy of the editor text per edit.
+
+QPlainTextEdit.toPlainText() builds a new string on every call. One
+keystroke used to copy the whole document several times (preview size
+check, prediction, search index, debounce sizing, then spell, syntax and
+metrics timers). On multi-MB documents each copy is a large allocation.
+
+DocumentSnapshot copies the text at most once per edit generation and
+hands the same immutable string to every consumer:
+- Generation counter bumped by QTextDocument.contentsChange
+- text() copies lazily, only when the generation moved
+- length() and line_count() read document counters (no copy)
+- line_index() hands out one versioned LineIndex of the text, derived
+  from the previous one with the edits made since (no re-split)
+
+Example:
+    snapshot = get_document_snapshot(editor)
+    if snapshot.length() > 300:
+        render(snapshot.text())  # Shared with all other consumers
+    line, column = snapshot.line_index().offset_to_line_col(offset)
+"""
+
+import logging
+
+from PySide6.QtGui import QTextDocument
+from PySide6.QtWidgets import QPlainTextEdit
+
+from asciidoc_artisan.core.line_index import Edit, LineIndex, merge_edits
+
+logger = logging.getLogger(__name__)
+
+
+class DocumentSnapshot:
+    """
+    Versioned, lazily copied snapshot of a QTextDocument's plain text.
+
+    Attributes:
+        document: Tracked document
+    """
+
+    def __init__(self, document: QTextDocument) -> None:
+        """
+        Initialize snapshot for a document (no copy until text() is called).
+
+        Args:
+            document: Document to track
+        """
+        self.document = document
+        self._generation = 0
+        self._text = ""
+        self._text_generation = -1
+        self._copies = 0
+        self._line_index: LineIndex | None = None
+        # Edits since the text of _line_index, merged into one range
+        self._index_edit: Edit | None = None
+        document.contentsChange.connect(self._on_contents_change)
+
+    def _on_contents_change(self, position: int, removed: int, added: int) -> None:
+        """Invalidate cached text (called for every document change)."""
+        self._generation += 1
+        if self._line_index is not None:
+            self._index_edit = merge_edits(self._index_edit, position, removed, added)
+
+    @property
+    def generation(self) -> int:
+        """Edit generation (changes whenever the document text may have changed)."""
+        return self._generation
+
+    def text(self) -> str:
+        """
+        Get document text, copying it only once per generation.
+
+        Returns:
+            Plain text of the document (immutable, safe to share across threads)
+        """
+        if self._text_generation != self._generation:
+            self._text = self.document.toPlainText()
+            self._text_generation = self._generation
+            self._copies += 1
+        return self._text
+
+    def line_index(self) -> LineIndex:
+        """
+        Get the line index of text(), updated from the previous version.
+
+        Returns:
+            LineIndex of the current text (immutable, safe to share across threads)
+        """
+        text = self.text()
+        index = self._line_index
+        if index is None:
+            index = LineIndex(text)
+        elif index.text is not text:
+            edit, self._index_edit = self._index_edit, None
+            index = index.edited(text, *edit) if edit is not None else LineIndex(text, index.version + 1)
+        self._line_index = index
+        return index
+
+    def length(self) -> int:
+        """Character count of the document text (no copy)."""
+        return max(0, self.document.characterCount() - 1)
+
+    def line_count(self) -> int:
+        """Number of lines in the document (no copy)."""
+        return self.document.blockCount()
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get snapshot statistics.
+
+        Returns:
+            Dictionary with generation and copies (text copies made)
+        """
+        return {"generation": self._generation, "copies": self._copies}
+
+
+def get_document_snapshot(editor: QPlainTextEdit) -> DocumentSnapshot:
+    """
+    Get the shared snapshot for an editor's current document.
+
+    Every consumer of the same editor gets the same DocumentSnapshot, so the
+    text is copied once per edit no matter how many consumers read it.
+
+    Args:
+        editor: Editor widget
+
+    Returns:
+        DocumentSnapshot tracking editor.document()
+    """
+    document = editor.document()
+    snapshot = getattr(editor, "_document_snapshot", None)
+    if not isinstance(snapshot, DocumentSnapshot) or snapshot.document is not document:
+        snapshot = DocumentSnapshot(document)
+        editor._document_snapshot = snapshot  # type: ignore[attr-defined]
+        logger.debug("Document snapshot attached to editor")
+    return snapshot
@@ -252,6 +252,11 @@ class EditorState:
 
     def _shutdown_threads(self) -> None:
         """Safely shut down worker threads via WorkerManager."""
+        if getattr(self.window, "syntax_checker_manager", None):
+            self.window.syntax_checker_manager.shutdown()
+        if getattr(self.window, "spell_check_manager", None):
+            self.window.spell_check_manager.shutdown()
+
         if hasattr(self.window, "worker_manager") and self.window.worker_manager:
             self.window.worker_manager.shutdown()
         else:
@@ -87,10 +87,8 @@ class ExportManager(QObject):
         self.status_manager = main_window.status_manager
         self.settings_manager = main_window._settings_manager
         self._settings = main_window._settings
-        self._asciidoc_api = main_window._asciidoc_api
 
-        # Export helpers
-        self.html_converter = HTMLConverter(self._asciidoc_api)
+        # Export helpers (html_converter is built on first use)
         self.pdf_helper = PDFHelper()
         self.clipboard_helper = ClipboardHelper()
 
@@ -108,6 +106,13 @@ class ExportManager(QObject):
         except Exception as e:
             logger.warning(f"Failed to cleanup temp directory: {e}")
 
+    @property
+    def html_converter(self) -> HTMLConverter:
+        """Lazy-initialized HTML converter (builds the main-thread AsciiDoc API on first export)."""
+        if not hasattr(self, "_html_converter_instance"):
+            self._html_converter_instance = HTMLConverter(self.window._asciidoc_api)
+        return self._html_converter_instance
+
     @property
     def _pandoc_exporter(self) -> PandocExporter:
         """Lazy-initialized Pandoc exporter (MA principle: delegates to PandocExporter)."""
@@ -162,7 +167,13 @@ class ExportManager(QObject):
 
     def _save_asciidoc_directly(self, file_path: Path, content: str) -> bool:
         """Save as AsciiDoc file, no conversion (MA: extracted 14 lines)."""
-        if atomic_save_text(file_path, content, encoding="utf-8"):
+        # The editor holds only a window of very large files: stream the whole document
+        windowed = getattr(self.window, "windowed_editor", None)
+        if windowed is not None and windowed.active:
+            saved = windowed.save(file_path)
+        else:
+            saved = atomic_save_text(file_path, content, encoding="utf-8")
+        if saved:
             self.status_bar.showMessage(MSG_SAVED_ASCIIDOC.format(file_path))
             self.export_completed.emit(file_path)
             return True
@@ -183,6 +194,16 @@ class ExportManager(QObject):
             return False
         file_filter, suggested_ext = result
 
+        # Converting needs the whole text in memory, which windowed mode avoids
+        windowed = getattr(self.window, "windowed_editor", None)
+        if format_type != "adoc" and windowed is not None and windowed.active:
+            self.status_manager.show_message(
+                "warning",
+                "Export Unavailable",
+                "Files opened in windowed mode can only be saved as AsciiDoc.",
+            )
+            return False
+
         # Get suggested file path
         suggested_path = self._get_suggested_export_path(suggested_ext)
 
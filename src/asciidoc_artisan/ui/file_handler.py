@@ -19,9 +19,9 @@ from asciidoc_artisan.core import (
 
 # Import metrics
 try:
-    from asciidoc_artisan.core.metrics import get_metrics_collector
+    from asciidoc_artisan.core.metrics import INSTRUMENTATION_ENABLED, get_metrics_collector
 
-    METRICS_AVAILABLE = True
+    METRICS_AVAILABLE = INSTRUMENTATION_ENABLED
 except ImportError:
     get_metrics_collector = None
     METRICS_AVAILABLE = False
@@ -88,6 +88,9 @@ class FileHandler(QObject):
             if not self.prompt_save_before_action("creating a new file"):
                 return
 
+        windowed = getattr(self.window, "windowed_editor", None)
+        if windowed is not None:
+            windowed.close()
         self.editor.clear()
         self.current_file_path = None
         self.unsaved_changes = False
@@ -171,6 +174,9 @@ class FileHandler(QObject):
 
     def _update_editor_and_state(self, file_path: Path, content: str) -> None:
         """Load content into editor and update state (MA: extracted 8 lines)."""
+        windowed = getattr(self.window, "windowed_editor", None)
+        if windowed is not None:
+            windowed.close()
         self.editor.setPlainText(content)
         self.current_file_path = file_path
         self.unsaved_changes = False
@@ -247,6 +253,11 @@ class FileHandler(QObject):
     @Slot()
     def save_file(self, save_as: bool = False) -> bool:
         """Save file (v1.7.0: async operation, success via file_saved signal)."""
+        # The editor holds only a window of very large files: save the whole document
+        windowed = getattr(self.window, "windowed_editor", None)
+        if windowed is not None and windowed.active:
+            return self.window.save_file(save_as)  # type: ignore[no-any-return]
+
         # Determine save path
         if save_as or not self.current_file_path:
             settings = self.settings_manager.load_settings()
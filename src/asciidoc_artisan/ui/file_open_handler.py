@@ -14,6 +14,7 @@ from PySide6.QtWidgets import QFileDialog, QWidget
 
 from asciidoc_artisan.core import SUPPORTED_OPEN_FILTER
 from asciidoc_artisan.core.large_file_handler import LargeFileHandler
+from asciidoc_artisan.core.windowed_document import WINDOWED_MODE_THRESHOLD
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +40,7 @@ class FileOpenHandler:
     - PDF text extraction (PyMuPDF)
     - Pandoc conversion for DOCX/MD/HTML/etc
     - Native AsciiDoc loading with large file optimization
+    - Windowed editing of files over WINDOWED_MODE_THRESHOLD
     """
 
     def __init__(self, file_ops_mgr: FileOpsContext) -> None:
@@ -175,6 +177,9 @@ class FileOpenHandler:
         self.mgr._pending_file_path = file_path
         self.mgr.editor._update_ui_state()
 
+        windowed = getattr(self.mgr.editor, "windowed_editor", None)
+        if windowed is not None:
+            windowed.close()
         self.mgr.editor.editor.setPlainText(f"// Converting {file_path.name} to AsciiDoc...\n// Please wait...")
         self.mgr.editor.preview.setHtml(
             "<h3>Converting document...</h3><p>The preview will update when conversion is complete.</p>"
@@ -211,6 +216,12 @@ class FileOpenHandler:
 
         MA principle: Extracted from FileOperationsManager (19 lines).
         """
+        # Very large files: edit a window of lines, never load the whole text
+        if file_path.stat().st_size > WINDOWED_MODE_THRESHOLD:
+            logger.info("Opening very large file in windowed mode")
+            self.mgr.editor.windowed_editor.open(file_path)
+            return
+
         # Use optimized loading for large files
         category = LargeFileHandler.get_file_size_category(file_path)
 
@@ -136,15 +136,23 @@ class FileSaveHandler:
 
         MA principle: Extracted from save_file (17 lines).
         """
-        content = self.editor.editor.toPlainText()
+        windowed = self.editor.windowed_editor
+        if windowed.active:
+            # Only a window of the file is in the editor: stream the whole document
+            saved = windowed.save(file_path)
+        else:
+            saved = atomic_save_text(file_path, self.editor.editor.toPlainText(), encoding="utf-8")
 
-        if atomic_save_text(file_path, content, encoding="utf-8"):
+        if saved:
             self.editor._current_file_path = file_path
             self.editor._settings.last_directory = str(file_path.parent)
             self.editor._unsaved_changes = False
             self.editor.status_manager.update_window_title()
             self.editor.status_bar.showMessage(MSG_SAVED_ASCIIDOC.format(file_path))
             logger.info(f"Saved file: {file_path}")
+            if hasattr(self.editor, "file_handler"):
+                # Same signal as FileHandler saves: refreshes git status once
+                self.editor.file_handler.file_saved.emit(file_path)
             return True
         else:
             self.editor.status_manager.show_message(
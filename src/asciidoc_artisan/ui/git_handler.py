@@ -3,6 +3,13 @@ Git Handler - Manage Git version control operations.
 
 Handles: Select repository, trigger commands (commit, pull, push), handle results from worker, validate repository state.
 Extracted from main_window.py to improve maintainability and testability.
+
+Status refresh is event-driven: saves, external file changes, finished Git commands and
+returning to the app request a refresh (bursts coalesced into one). Between events a
+backoff timer polls at STATUS_REFRESH_MIN_MS, doubling up to STATUS_REFRESH_MAX_MS while
+nothing changes. Polls skip the git subprocesses while .git/index and .git/HEAD are
+unchanged (the slowest poll always runs, to catch edits made outside the app). The branch
+name is cached from status results instead of being queried on the GUI thread.
 """
 
 import logging
@@ -10,14 +17,24 @@ import subprocess
 from pathlib import Path
 from typing import Any
 
-from PySide6.QtCore import QTimer, Signal
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtWidgets import QFileDialog, QInputDialog
 
-from asciidoc_artisan.core import GitResult
+from asciidoc_artisan.core import GitResult, GitStatus
 from asciidoc_artisan.ui.base_vcs_handler import BaseVCSHandler
 
 logger = logging.getLogger(__name__)
 
+# Status poll interval after a change, and the longest interval when idle
+STATUS_REFRESH_MIN_MS = 5000
+STATUS_REFRESH_MAX_MS = 60000
+
+# Delay that coalesces bursts of change events into one status refresh
+STATUS_EVENT_DELAY_MS = 500
+
+# Files whose mtime/size change with staging, commits, checkouts and merges
+REPOSITORY_STATE_FILES = ("index", "HEAD")
+
 
 class GitHandler(BaseVCSHandler):
     """Handle Git version control operations."""
@@ -33,11 +50,22 @@ class GitHandler(BaseVCSHandler):
         # Git-specific state
         self.pending_commit_message: str | None = None
 
-        # Git status refresh timer (v1.9.0+)
+        # Git status refresh timer (v1.9.0+): single-shot, rescheduled with backoff
         self.status_timer: QTimer = QTimer()
-        self.status_timer.timeout.connect(self._refresh_git_status)
-        self.status_timer.setInterval(5000)  # 5 seconds
+        self.status_timer.setSingleShot(True)
+        self.status_timer.timeout.connect(self._on_status_timer)
+        self.status_timer.setInterval(STATUS_REFRESH_MIN_MS)
         self.status_refresh_enabled: bool = False
+        self._status_interval = STATUS_REFRESH_MIN_MS
+
+        # Change detection: repository state at the last status run, and whether an
+        # event (save, external change, Git command) happened since
+        self._repo_signature: tuple[tuple[int, int] | None, ...] | None = None
+        self._changes_pending = True
+        self._last_status: GitStatus | None = None
+        self._cached_branch: str | None = None
+        self._status_requests = 0
+        self._skipped_refreshes = 0
 
     def initialize(self) -> None:
         """Initialize from settings (loads/validates repo path, UI updated later)."""
@@ -89,6 +117,12 @@ class GitHandler(BaseVCSHandler):
         settings.git_repo_path = dir_path
         self.settings_manager.save_settings(settings, self.window)
 
+        # Status and branch of the previous repository no longer apply
+        self._repo_signature = None
+        self._last_status = None
+        self._cached_branch = None
+        self.notify_repository_changed()
+
         # Update UI
         if hasattr(self.window, "status_bar"):
             self.window.status_bar.showMessage(f"Git repository: {dir_path}")
@@ -259,6 +293,9 @@ class GitHandler(BaseVCSHandler):
         self.last_operation = ""
         self.pending_commit_message = None
 
+        # Commits, pulls and pushes change branch and file state
+        self.notify_repository_changed()
+
     def _check_repository_ready(self) -> bool:
         """Check if Git repository is configured and ready."""
         settings = self.settings_manager.load_settings()
@@ -288,7 +325,7 @@ class GitHandler(BaseVCSHandler):
         return self.is_processing
 
     def get_current_branch(self) -> str:
-        """Get branch name synchronously (MA: 80→30 lines, 2 helpers, 63%). <50ms, shell=False, 2s timeout."""
+        """Get branch name (MA: 80→30 lines, 2 helpers). Cached from status; synchronous query (2s timeout) on a miss."""
         if not self.is_repository_set():
             return ""
 
@@ -296,17 +333,21 @@ class GitHandler(BaseVCSHandler):
         if not repo_path:  # pragma: no cover
             return ""
 
+        if self._cached_branch is not None:
+            return self._cached_branch
+
         # Get branch name (or empty for detached HEAD)
         result = self._execute_git_command(["git", "branch", "--show-current"], repo_path)
         if result is None:
             return ""
 
         branch = result.stdout.strip()
-        if branch:
-            return branch
+        if not branch:
+            # Handle detached HEAD (empty output from --show-current)
+            branch = self._get_detached_head_label(repo_path)
 
-        # Handle detached HEAD (empty output from --show-current)
-        return self._get_detached_head_label(repo_path)
+        self._cached_branch = branch
+        return branch
 
     def _execute_git_command(self, command: list[str], repo_path: str) -> subprocess.CompletedProcess[str] | None:
         """Execute git command (MA: extracted 22 lines). shell=False, 2s timeout."""
@@ -346,26 +387,109 @@ class GitHandler(BaseVCSHandler):
         return "HEAD (detached)"
 
     def start_status_refresh(self) -> None:
-        """Start periodic Git status refresh (v1.9.0+): 5s interval, status bar updates."""
+        """Start Git status refresh (v1.9.0+): immediate fetch, then event-driven with backoff polling."""
         if not self.status_refresh_enabled and self.is_repository_set():
             self.status_refresh_enabled = True
-            self.status_timer.start()
+            self._status_interval = STATUS_REFRESH_MIN_MS
+            self._changes_pending = True
+            self.status_timer.start(self._status_interval)
             self._refresh_git_status()  # Initial immediate fetch
-            logger.info("Git status refresh started (5 second interval)")
+            logger.info(
+                f"Git status refresh started ({STATUS_REFRESH_MIN_MS // 1000}-{STATUS_REFRESH_MAX_MS // 1000}s backoff)"
+            )
 
     def stop_status_refresh(self) -> None:
-        """Stop periodic Git status refresh (v1.9.0+)."""
+        """Stop Git status refresh (v1.9.0+)."""
         if self.status_refresh_enabled:
             self.status_refresh_enabled = False
             self.status_timer.stop()
             logger.info("Git status refresh stopped")
 
+    def notify_repository_changed(self) -> None:
+        """Request a status refresh after a change event (save, external edit, Git command); bursts are coalesced."""
+        self._changes_pending = True
+        self._status_interval = STATUS_REFRESH_MIN_MS
+        if self.status_refresh_enabled:
+            self.status_timer.start(STATUS_EVENT_DELAY_MS)
+
+    def handle_application_state(self, state: Qt.ApplicationState) -> None:
+        """Refresh status when the app becomes active (files may have changed meanwhile)."""
+        if state == Qt.ApplicationState.ApplicationActive:
+            self.notify_repository_changed()
+
+    def handle_status_result(self, status: GitStatus) -> None:
+        """Record a status result: cache the branch and back off while the status stays the same."""
+        if status.branch:
+            self._cached_branch = status.branch
+        if status == self._last_status:
+            self._status_interval = min(self._status_interval * 2, STATUS_REFRESH_MAX_MS)
+        else:
+            self._status_interval = STATUS_REFRESH_MIN_MS
+        self._last_status = status
+
+    def _on_status_timer(self) -> None:
+        """Poll status, then schedule the next poll with the current backoff interval."""
+        self._refresh_git_status()
+        if self.status_refresh_enabled:
+            self.status_timer.start(self._status_interval)
+
     def _refresh_git_status(self) -> None:
-        """Request Git status update (v1.9.0+): non-blocking, emits request_git_status signal."""
+        """Request Git status update (v1.9.0+): non-blocking, skipped while the repository is unchanged."""
         if not self.is_repository_set() or self.is_processing:
             return
 
         repo_path = self.get_repository_path()
-        if repo_path and hasattr(self.window, "request_git_status"):
+        if not repo_path:  # pragma: no cover
+            return
+
+        signature = self._repository_signature(repo_path)
+        if (
+            not self._changes_pending
+            and signature == self._repo_signature
+            and self._status_interval < STATUS_REFRESH_MAX_MS
+        ):
+            self._skipped_refreshes += 1
+            self._status_interval = min(self._status_interval * 2, STATUS_REFRESH_MAX_MS)
+            logger.debug("Git status refresh skipped (repository unchanged)")
+            return
+
+        if signature != self._repo_signature:
+            self._cached_branch = None  # HEAD or index moved: branch may have changed
+        self._repo_signature = signature
+        self._changes_pending = False
+        self._status_requests += 1
+
+        # The status dialog needs file lists: one detailed request refreshes both
+        dialog = getattr(self.window, "_git_status_dialog", None)
+        if dialog is not None and dialog.isVisible() and hasattr(self.window, "request_detailed_git_status"):
+            self.window.request_detailed_git_status.emit(repo_path)
+            logger.debug("Detailed Git status refresh requested")
+        elif hasattr(self.window, "request_git_status"):
             self.window.request_git_status.emit(repo_path)
             logger.debug("Git status refresh requested")
+
+    @staticmethod
+    def _repository_signature(repo_path: str) -> tuple[tuple[int, int] | None, ...]:
+        """(mtime_ns, size) of .git/index and .git/HEAD (None for missing files)."""
+        git_dir = Path(repo_path) / ".git"
+        signature: list[tuple[int, int] | None] = []
+        for name in REPOSITORY_STATE_FILES:
+            try:
+                stat = (git_dir / name).stat()
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get status refresh statistics.
+
+        Returns:
+            Dictionary with status requests sent, refreshes skipped and current interval (ms)
+        """
+        return {
+            "status_requests": self._status_requests,
+            "skipped_refreshes": self._skipped_refreshes,
+            "interval_ms": self._status_interval,
+        }
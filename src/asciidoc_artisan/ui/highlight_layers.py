@@ -0,0 +1,360 @@
+"""
+Highlight Layers - Viewport-first extra selections for the editor.
+
+Spell check, syntax check and search each used to build an ExtraSelection
+for every issue in the document and re-apply the combined list, so the
+cost grew with the issue count instead of with what is on screen, and
+every layer was rebuilt whenever one of them changed.
+
+HighlightLayers keeps one layer per source:
+- Items are plain data sorted by line; ExtraSelections are built only for
+  the visible lines plus one screen of margin
+- Items may also be given as sorted start offsets (set_offset_layer): the
+  visible lines are mapped to offsets with the document's LineIndex, so
+  no line is computed per item
+- The rest of each layer is filled in by an idle timer in growing chunks
+- Scrolling past the built range builds the newly visible items first
+- Edits made before an item is built are recorded on its layer and
+  applied to the item's span when it is built; items whose text was
+  edited are skipped until their owner sets the layer again
+- Changing one layer rebuilds that layer only; the others are reused
+- Layers are painted in LAYER_ORDER (later layers draw over earlier ones)
+
+Example:
+    layers = get_highlight_layers(editor)
+    layers.set_layer("spell", errors, line_of, span_of, format_of)
+    layers.clear_layer("search")
+"""
+
+import bisect
+import logging
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from PySide6.QtCore import QObject, QPoint, QTimer
+from PySide6.QtGui import QTextCharFormat, QTextCursor
+from PySide6.QtWidgets import QPlainTextEdit, QTextEdit
+
+from asciidoc_artisan.core.line_index import LineIndex
+
+logger = logging.getLogger(__name__)
+
+# Paint order of known layers; unknown layers are painted last
+LAYER_ORDER = ("syntax", "spell", "search")
+
+# Items built per layer by the first idle tick (doubles on each tick)
+IDLE_CHUNK = 200
+
+
+def _same_line(line: int) -> int:
+    """Sort key of a block number in line-keyed layers."""
+    return line
+
+
+def _shift_span(span: tuple[int, int], edits: list[tuple[int, int, int]]) -> tuple[int, int] | None:
+    """Map a span through contentsChange edits (None if an edit touched it)."""
+    start, end = span
+    for position, removed, added in edits:
+        if end <= position:
+            continue
+        if start < position + removed:
+            return None
+        start += added - removed
+        end += added - removed
+    return start, end
+
+
+class _Layer:
+    """Items of one layer and the ExtraSelections built so far (items [lo, hi)).
+
+    keys are sorted item keys (lines or offsets); key_of_line maps a block
+    number to the first key on that line. edits are the document edits
+    made since the items were computed, applied to spans of unbuilt items
+    (keys are not shifted: the window may be off by the lines an edit
+    added or removed until the idle fill reaches the rest).
+    """
+
+    __slots__ = ("items", "keys", "key_of_line", "span_of", "format_of", "lo", "hi", "selections", "edits")
+
+    def __init__(
+        self,
+        items: Sequence[Any],
+        keys: Sequence[int],
+        key_of_line: Callable[[int], int],
+        span_of: Callable[[Any], tuple[int, int] | None],
+        format_of: Callable[[Any], QTextCharFormat],
+    ) -> None:
+        self.items = items
+        self.keys = keys
+        self.key_of_line = key_of_line
+        self.span_of = span_of
+        self.format_of = format_of
+        self.lo = 0
+        self.hi = 0
+        self.selections: list[QTextEdit.ExtraSelection] = []
+        self.edits: list[tuple[int, int, int]] = []
+
+    @property
+    def complete(self) -> bool:
+        """True when every item has a selection."""
+        return self.lo == 0 and self.hi == len(self.items)
+
+
+class HighlightLayers(QObject):
+    """
+    Layered, viewport-first extra selections of one editor.
+
+    Attributes:
+        editor: Editor whose extra selections are managed
+    """
+
+    def __init__(self, editor: QPlainTextEdit) -> None:
+        """
+        Initialize layers (use get_highlight_layers() to share one per editor).
+
+        Args:
+            editor: Editor whose extra selections are managed
+        """
+        super().__init__()
+        self.editor = editor
+        self._layers: dict[str, _Layer] = {}
+        self._idle_chunk = IDLE_CHUNK
+
+        self._idle_timer = QTimer()
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(0)
+        self._idle_timer.timeout.connect(self._fill_idle)
+
+        editor.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+        # Unbuilt items hold positions of the text they were computed for
+        # (built selections follow edits through their QTextCursor)
+        editor.document().contentsChange.connect(self._on_contents_change)
+
+    def set_layer(
+        self,
+        name: str,
+        items: Sequence[Any],
+        line_of: Callable[[Any], int],
+        span_of: Callable[[Any], tuple[int, int] | None],
+        format_of: Callable[[Any], QTextCharFormat],
+    ) -> None:
+        """
+        Replace a layer's items and rebuild it around the viewport.
+
+        Args:
+            name: Layer name (see LAYER_ORDER)
+            items: Highlighted items (any type)
+            line_of: Item -> block number (0-indexed)
+            span_of: Item -> (start, end) document positions, or None to skip
+            format_of: Item -> character format of its selection
+        """
+        if not items:
+            self.clear_layer(name)
+            return
+
+        ordered = sorted(items, key=line_of)
+        self._set(name, _Layer(ordered, [line_of(item) for item in ordered], _same_line, span_of, format_of))
+
+    def set_offset_layer(
+        self,
+        name: str,
+        starts: Sequence[int],
+        line_index: LineIndex,
+        span_of: Callable[[int], tuple[int, int] | None],
+        format_of: Callable[[int], QTextCharFormat],
+    ) -> None:
+        """
+        Replace a layer whose items are sorted start offsets.
+
+        Items are the indices into starts; lines are never computed per
+        item, only the viewport lines are mapped to offsets.
+
+        Args:
+            name: Layer name (see LAYER_ORDER)
+            starts: Sorted start offsets of the items (e.g. SearchSession offsets)
+            line_index: LineIndex of the text the offsets belong to
+            span_of: Item index -> (start, end) document positions, or None to skip
+            format_of: Item index -> character format of its selection
+        """
+        if not starts:
+            self.clear_layer(name)
+            return
+
+        def key_of_line(line: int) -> int:
+            line_starts = line_index.starts
+            return line_starts[line] if line < len(line_starts) else len(line_index.text) + 1
+
+        self._set(name, _Layer(range(len(starts)), starts, key_of_line, span_of, format_of))
+
+    def clear_layer(self, name: str) -> None:
+        """
+        Remove a layer's highlights.
+
+        Args:
+            name: Layer name
+        """
+        if self._layers.pop(name, None) is not None or not self._layers:
+            self._apply()
+
+    def refresh(self) -> None:
+        """Re-apply the built selections of every layer to the editor."""
+        self._set_selections()
+
+    def layer_names(self) -> list[str]:
+        """Names of non-empty layers in paint order."""
+        return sorted(self._layers, key=self._paint_rank)
+
+    def window(self) -> tuple[int, int]:
+        """First and last block numbers to build first: visible lines plus one screen each way."""
+        first = self.editor.cursorForPosition(QPoint(0, 0)).blockNumber()
+        last = self.editor.cursorForPosition(QPoint(0, self.editor.viewport().height())).blockNumber()
+        last = max(first, last)
+        span = last - first + 1
+        return max(0, first - span), last + span
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get layer statistics.
+
+        Returns:
+            Dictionary with layers, items and built (ExtraSelections created)
+        """
+        return {
+            "layers": len(self._layers),
+            "items": sum(len(layer.items) for layer in self._layers.values()),
+            "built": sum(layer.hi - layer.lo for layer in self._layers.values()),
+        }
+
+    def _set(self, name: str, layer: _Layer) -> None:
+        """Install a layer and build it around the viewport."""
+        self._layers[name] = layer
+        self._build_window(layer, *self.window())
+        self._apply()
+
+    @staticmethod
+    def _item_range(layer: _Layer, first: int, last: int) -> tuple[int, int]:
+        """Items [lo, hi) of a layer on lines [first, last]."""
+        lo = bisect.bisect_left(layer.keys, layer.key_of_line(first))
+        hi = bisect.bisect_left(layer.keys, layer.key_of_line(last + 1))
+        return lo, hi
+
+    def _build_window(self, layer: _Layer, first: int, last: int) -> None:
+        """Build selections of items on lines [first, last], keeping the built range contiguous."""
+        lo, hi = self._item_range(layer, first, last)
+
+        if layer.hi == layer.lo or hi < layer.lo or lo > layer.hi:
+            # Nothing built yet or disjoint from what is built: start over here
+            layer.lo = layer.hi = lo
+            layer.selections = []
+        self._extend(layer, min(lo, layer.lo), max(hi, layer.hi))
+
+    def _extend(self, layer: _Layer, lo: int, hi: int) -> None:
+        """Grow the built range of a layer to items [lo, hi)."""
+        before = self._selections(layer, lo, layer.lo) if lo < layer.lo else []
+        after = self._selections(layer, layer.hi, hi) if hi > layer.hi else []
+        if before or after:
+            layer.selections = before + layer.selections + after
+        layer.lo = min(lo, layer.lo)
+        layer.hi = max(hi, layer.hi)
+
+    def _selections(self, layer: _Layer, lo: int, hi: int) -> list[QTextEdit.ExtraSelection]:
+        """Create ExtraSelections for items [lo, hi) of a layer."""
+        document = self.editor.document()
+        max_position = max(0, document.characterCount() - 1)
+        selections = []
+        for item in layer.items[lo:hi]:
+            span = layer.span_of(item)
+            if span is not None and layer.edits:
+                span = _shift_span(span, layer.edits)
+            if span is None:
+                continue
+            start = min(max(span[0], 0), max_position)
+            end = min(max(span[1], start), max_position)
+
+            cursor = QTextCursor(document)
+            cursor.setPosition(start)
+            cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
+
+            selection = QTextEdit.ExtraSelection()
+            selection.cursor = cursor
+            selection.format = layer.format_of(item)
+            selections.append(selection)
+        return selections
+
+    def _apply(self) -> None:
+        """Show the built selections and (re)start the idle fill if layers are incomplete."""
+        self._set_selections()
+
+        self._idle_chunk = IDLE_CHUNK
+        if any(not layer.complete for layer in self._layers.values()):
+            self._idle_timer.start()
+        else:
+            self._idle_timer.stop()
+
+    def _fill_idle(self) -> None:
+        """Build the next chunk of every incomplete layer (idle timer)."""
+        chunk = self._idle_chunk
+        pending = False
+        for layer in self._layers.values():
+            if layer.complete:
+                continue
+            self._extend(layer, max(0, layer.lo - chunk), min(len(layer.items), layer.hi + chunk))
+            pending = pending or not layer.complete
+
+        self._set_selections()
+        if pending:
+            self._idle_chunk = chunk * 2
+            self._idle_timer.start()
+
+    def _set_selections(self) -> None:
+        """Set the editor's extra selections from the built part of every layer."""
+        combined: list[QTextEdit.ExtraSelection] = []
+        for name in self.layer_names():
+            combined.extend(self._layers[name].selections)
+        self.editor.setExtraSelections(combined)
+
+    def _on_scrolled(self, _value: int) -> None:
+        """Build items that scrolled into view before the idle fill reached them."""
+        first, last = self.window()
+        changed = False
+        for layer in self._layers.values():
+            if layer.complete:
+                continue
+            lo, hi = self._item_range(layer, first, last)
+            if lo < layer.lo or hi > layer.hi:
+                self._build_window(layer, first, last)
+                changed = True
+        if changed:
+            self._apply()
+
+    def _on_contents_change(self, position: int, removed: int, added: int) -> None:
+        """Record an edit on every layer with unbuilt items (their spans are shifted when built)."""
+        for layer in self._layers.values():
+            if not layer.complete:
+                layer.edits.append((position, removed, added))
+
+    @staticmethod
+    def _paint_rank(name: str) -> tuple[int, str]:
+        """Sort key placing known layers in LAYER_ORDER, then others by name."""
+        return (LAYER_ORDER.index(name) if name in LAYER_ORDER else len(LAYER_ORDER), name)
+
+
+def get_highlight_layers(editor: QPlainTextEdit) -> HighlightLayers:
+    """
+    Get the shared highlight layers of an editor.
+
+    Spell check, syntax check and search all draw through the same
+    HighlightLayers, so none of them overwrites the others' highlights.
+
+    Args:
+        editor: Editor widget
+
+    Returns:
+        HighlightLayers managing editor.setExtraSelections()
+    """
+    layers = getattr(editor, "_highlight_layers", None)
+    if not isinstance(layers, HighlightLayers):
+        layers = HighlightLayers(editor)
+        editor._highlight_layers = layers  # type: ignore[attr-defined]
+        logger.debug("Highlight layers attached to editor")
+    return layers
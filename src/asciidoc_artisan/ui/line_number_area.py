@@ -59,6 +59,8 @@ class LineNumberMixin:
     def setup_line_numbers(self) -> None:
         """Set up line number area and connect signals."""
         self.line_number_area = LineNumberArea(cast(QPlainTextEdit, self))
+        # Number of the first block minus one (set by windowed editing)
+        self.line_number_offset = 0
 
         # Connect signals for auto-update
         self.blockCountChanged.connect(self.update_line_number_area_width)
@@ -75,7 +77,7 @@ class LineNumberMixin:
             Width in pixels for line number area
         """
         digits = 1
-        max_num = max(1, self.blockCount())
+        max_num = max(1, self.blockCount() + self.line_number_offset)
         while max_num >= 10:
             max_num //= 10
             digits += 1
@@ -151,7 +153,7 @@ class LineNumberMixin:
 
         while block.isValid() and top <= event.rect().bottom():
             if block.isVisible() and bottom >= event.rect().top():
-                number = str(block_number + 1)
+                number = str(block_number + 1 + self.line_number_offset)
                 painter.setPen(text_color)
                 painter.drawText(
                     0,
@@ -13,8 +13,10 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
 from PySide6.QtCore import QRect, Qt, QTimer
+from PySide6.QtGui import QGuiApplication
 
 from asciidoc_artisan.core import AUTO_SAVE_INTERVAL_MS, PREVIEW_UPDATE_INTERVAL_MS
+from asciidoc_artisan.ui.document_snapshot import get_document_snapshot
 
 if TYPE_CHECKING:
     from asciidoc_artisan.core.settings import Settings
@@ -22,16 +24,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-# Check for AsciiDoc3 availability
-try:
-    from asciidoc3 import asciidoc3
-    from asciidoc3.asciidoc3api import AsciiDoc3API
-
-    ASCIIDOC3_AVAILABLE = True
-except ImportError:
-    asciidoc3 = None
-    AsciiDoc3API = None
-    ASCIIDOC3_AVAILABLE = False
+# Marks the main-thread AsciiDoc API as not built yet (None means unavailable)
+_API_NOT_BUILT = object()
 
 
 class MainWindowInitMixin:
@@ -52,9 +46,25 @@ class MainWindowInitMixin:
     _sync_scrolling: bool
     _is_syncing_scroll: bool
     _temp_dir: tempfile.TemporaryDirectory[str]
-    _asciidoc_api: Any
     _preview_timer: QTimer
 
+    @property
+    def _asciidoc_api(self: AsciiDocEditor) -> Any:
+        """
+        Main-thread AsciiDoc3 API (exports, save as HTML), built on first use.
+
+        The preview renders with its own API in the preview worker thread,
+        so startup does not import asciidoc3 on the main thread.
+        """
+        api = getattr(self, "_asciidoc_api_instance", _API_NOT_BUILT)
+        if api is _API_NOT_BUILT:
+            api = self._asciidoc_api_instance = self._initialize_asciidoc()
+        return api
+
+    @_asciidoc_api.setter
+    def _asciidoc_api(self: AsciiDocEditor, api: Any) -> None:
+        self._asciidoc_api_instance = api
+
     def _init_settings(self: AsciiDocEditor) -> None:
         """Initialize settings manager and load configuration."""
         from asciidoc_artisan.ui.settings_manager import SettingsManager
@@ -128,8 +138,7 @@ class MainWindowInitMixin:
         self.worker_manager = WorkerManager(self)
 
     def _init_asciidoc_and_preview(self: AsciiDocEditor) -> None:
-        """Initialize AsciiDoc API and preview timer."""
-        self._asciidoc_api = self._initialize_asciidoc()
+        """Initialize preview timer (the AsciiDoc API is built on first use)."""
         self._preview_timer = self._setup_preview_timer()
 
     def _configure_window(self: AsciiDocEditor) -> None:
@@ -158,11 +167,13 @@ class MainWindowInitMixin:
         self.ui_setup.setup_ui()
 
     def _setup_file_operations(self: AsciiDocEditor) -> None:
-        """Setup file operations and auto-save."""
+        """Setup file operations, auto-save and windowed editing of very large files."""
         from asciidoc_artisan.ui.file_handler import FileHandler
+        from asciidoc_artisan.ui.windowed_editor import WindowedEditor
 
         self.file_handler = FileHandler(self.editor, self, self._settings_manager, self.status_manager)
         self.file_handler.start_auto_save(AUTO_SAVE_INTERVAL_MS)
+        self.windowed_editor = WindowedEditor(self)
 
     def _setup_preview_system(self: AsciiDocEditor) -> None:
         """Setup preview handler and start updates."""
@@ -178,6 +189,13 @@ class MainWindowInitMixin:
 
         self.git_handler = GitHandler(self, self._settings_manager, self.status_manager)
         self.git_handler.initialize()
+
+        # Event-driven status refresh: saves, external changes and returning to the app
+        self.file_handler.file_saved.connect(lambda _path: self.git_handler.notify_repository_changed())
+        self.file_handler.file_changed_externally.connect(lambda _path: self.git_handler.notify_repository_changed())
+        app = QGuiApplication.instance()
+        if isinstance(app, QGuiApplication):
+            app.applicationStateChanged.connect(self.git_handler.handle_application_state)
         self.github_handler = GitHubHandler(self, self._settings_manager, self.status_manager, self.git_handler)
 
     def _setup_editor_features(self: AsciiDocEditor) -> None:
@@ -232,6 +250,9 @@ class MainWindowInitMixin:
         self._settings_manager.restore_ui_settings(self, self.splitter, self._settings)
         self.theme_manager.apply_theme()
         self._setup_workers_and_threads()
+        # First preview request once the event loop runs: starts the preview
+        # thread, which warms up the AsciiDoc engine while the window paints
+        QTimer.singleShot(0, self.update_preview)
         self._update_ui_state()
         self._update_ai_backend_checkmarks()
 
@@ -240,22 +261,28 @@ class MainWindowInitMixin:
         logger.info("S-tier UX features initialized")
 
     def _initialize_asciidoc(self: AsciiDocEditor) -> Any:
-        """Initialize AsciiDoc3 API."""
-        if ASCIIDOC3_AVAILABLE and AsciiDoc3API and asciidoc3:
-            try:
-                instance = AsciiDoc3API(asciidoc3.__file__)
-                instance.options("--no-header-footer")
-                instance.attributes["icons"] = "font"
-                instance.attributes["source-highlighter"] = "highlight.js"
-                instance.attributes["toc"] = "left"
-                instance.attributes["sectanchors"] = ""
-                instance.attributes["sectnums"] = ""
-                instance.attributes["imagesdir"] = "."
-                logger.info("AsciiDoc3API initialized with enhanced attributes")
-                return instance
-            except Exception as exc:
-                logger.error(f"AsciiDoc3API initialization failed: {exc}")
-        return None
+        """Initialize AsciiDoc3 API (None if asciidoc3 is not installed)."""
+        try:
+            from asciidoc3 import asciidoc3
+            from asciidoc3.asciidoc3api import AsciiDoc3API
+        except ImportError:
+            logger.warning("AsciiDoc3 not available, exports fall back to plain text")
+            return None
+
+        try:
+            instance = AsciiDoc3API(asciidoc3.__file__)
+            instance.options("--no-header-footer")
+            instance.attributes["icons"] = "font"
+            instance.attributes["source-highlighter"] = "highlight.js"
+            instance.attributes["toc"] = "left"
+            instance.attributes["sectanchors"] = ""
+            instance.attributes["sectnums"] = ""
+            instance.attributes["imagesdir"] = "."
+            logger.info("AsciiDoc3API initialized with enhanced attributes")
+            return instance
+        except Exception as exc:
+            logger.error(f"AsciiDoc3API initialization failed: {exc}")
+            return None
 
     def _setup_preview_timer(self: AsciiDocEditor) -> QTimer:
         """Setup preview update timer."""
@@ -270,7 +297,8 @@ class MainWindowInitMixin:
         from asciidoc_artisan.core.search_engine import SearchEngine
         from asciidoc_artisan.ui.search_handler import SearchContext, SearchHandler
 
-        self.search_engine = SearchEngine(self.editor.toPlainText())
+        snapshot = get_document_snapshot(self.editor)
+        self.search_engine = SearchEngine(snapshot.text(), snapshot.line_index())
         self.search_handler = SearchHandler(cast(SearchContext, self))
 
         self.find_bar.search_requested.connect(self.search_handler.handle_search_requested)
@@ -279,7 +307,8 @@ class MainWindowInitMixin:
         self.find_bar.closed.connect(self.search_handler.handle_find_closed)
         self.find_bar.replace_requested.connect(self.search_handler.handle_replace)
         self.find_bar.replace_all_requested.connect(self.search_handler.handle_replace_all)
-        self.editor.textChanged.connect(lambda: self.search_engine.set_text(self.editor.toPlainText()))
+        self.editor.textChanged.connect(lambda: self.search_engine.set_text(snapshot.text(), snapshot.line_index()))
+        self.editor.document().contentsChange.connect(self.search_handler.handle_contents_change)
 
         logger.info("Find & Replace system initialized")
 
@@ -339,16 +368,6 @@ class MainWindowInitMixin:
         self.chat_manager.status_message.connect(self.status_manager.show_status)
         self.chat_manager.settings_changed.connect(lambda: self._settings_manager.save_settings(self._settings, self))
 
-        self.ollama_chat_worker.chat_response_ready.connect(self.chat_manager.handle_response_ready)
-        self.ollama_chat_worker.chat_response_chunk.connect(self.chat_manager.handle_response_chunk)
-        self.ollama_chat_worker.chat_error.connect(self.chat_manager.handle_error)
-        self.ollama_chat_worker.operation_cancelled.connect(self.chat_manager.handle_operation_cancelled)
-
-        self.claude_worker.response_ready.connect(self.chat_worker_router.adapt_claude_response)
-        self.claude_worker.error_occurred.connect(self.chat_manager.handle_error)
-
-        self.chat_bar.cancel_requested.connect(self.ollama_chat_worker.cancel_operation)
-
-        self.chat_manager.set_document_content_provider(lambda: self.editor.toPlainText())
+        self.chat_manager.set_document_content_provider(lambda: get_document_snapshot(self.editor).text())
         self.chat_manager.initialize()
         self.github_handler.initialize()
@@ -23,7 +23,9 @@ class MainWindowSignalsMixin:
     request_pandoc_conversion = Signal(object, str, str, str, object, bool)
 
     # Preview rendering
-    request_preview_render = Signal(str)
+    request_preview_render = Signal(str, object)  # (source, LineIndex)
+    request_preview_render_edit = Signal(str, object, object)  # (source, EditRange, LineIndex)
+    request_preview_prediction = Signal(str, int, object)  # (source, cursor line, LineIndex)
 
     # File loading
     request_load_file_content = Signal(str, object, str)
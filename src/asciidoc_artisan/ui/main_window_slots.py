@@ -21,6 +21,7 @@ from asciidoc_artisan.core import (
     GitResult,
     atomic_save_text,
 )
+from asciidoc_artisan.ui.document_snapshot import get_document_snapshot
 
 if TYPE_CHECKING:
     from asciidoc_artisan.ui.main_window import AsciiDocEditor
@@ -56,6 +57,11 @@ class MainWindowSlotsMixin:
         """Handle successful preview rendering (delegates to PreviewHandler)."""
         self.preview_handler.handle_preview_complete(html_body)
 
+    @Slot(str, object)
+    def _handle_preview_patch(self: AsciiDocEditor, html_body: str, patches: Any) -> None:
+        """Handle per-block preview patches (delegates to PreviewHandler)."""
+        self.preview_handler.handle_preview_patch(html_body, patches)
+
     @Slot(str)
     def _handle_preview_error(self: AsciiDocEditor, error_html: str) -> None:
         """Handle preview rendering error (delegates to PreviewHandler)."""
@@ -73,6 +79,7 @@ class MainWindowSlotsMixin:
 
         if isinstance(status, GitStatus):
             self.status_manager.update_git_status(status)
+            self.git_handler.handle_status_result(status)
 
     @Slot(dict)
     def _handle_detailed_git_status(self: AsciiDocEditor, status_data: dict[str, Any]) -> None:
@@ -118,12 +125,14 @@ class MainWindowSlotsMixin:
         self.status_manager.update_window_title()
         self.status_manager.update_document_metrics()
 
-        text = self.editor.toPlainText()
-        debounce_ms = self.resource_monitor.calculate_debounce_interval(text)
+        # Size from document counters - no text copy per keystroke
+        snapshot = get_document_snapshot(self.editor)
+        text_size = snapshot.length()
+        debounce_ms = self.resource_monitor.calculate_debounce_interval_for_size(text_size, snapshot.line_count())
 
         if self._preview_timer.interval() != debounce_ms:
             self._preview_timer.setInterval(debounce_ms)
-            logger.debug(f"Adaptive debounce: {debounce_ms}ms for {len(text)} chars")
+            logger.debug(f"Adaptive debounce: {debounce_ms}ms for {text_size} chars")
 
         self._preview_timer.start()
 
@@ -143,8 +152,12 @@ class MainWindowSlotsMixin:
     def _auto_save(self: AsciiDocEditor) -> None:
         """Auto-save current file if there are unsaved changes."""
         if self._current_file_path and self._unsaved_changes:
-            content = self.editor.toPlainText()
-            if atomic_save_text(self._current_file_path, content, encoding="utf-8"):
+            # The editor holds only a window of very large files: save the whole document
+            if self.windowed_editor.active:
+                saved = self.windowed_editor.save(self._current_file_path)
+            else:
+                saved = atomic_save_text(self._current_file_path, self.editor.toPlainText(), encoding="utf-8")
+            if saved:
                 self.status_bar.showMessage("Auto-saved", 2000)
                 logger.info(f"Auto-saved: {self._current_file_path}")
             else:
@@ -179,7 +192,7 @@ class MainWindowSlotsMixin:
         self._update_ai_status_bar()
         self._update_ai_backend_checkmarks()
 
-        if hasattr(self, "pandoc_worker"):
+        if getattr(self, "pandoc_worker", None):
             self.pandoc_worker.set_ollama_config(settings.ollama_enabled, settings.ollama_model)
 
         if hasattr(self, "chat_manager"):
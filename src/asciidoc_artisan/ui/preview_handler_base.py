@@ -36,6 +36,7 @@ from PySide6.QtCore import QObject, QTimer, Signal, Slot
 from PySide6.QtWidgets import QPlainTextEdit, QWidget
 
 # === LOCAL IMPORTS ===
+from asciidoc_artisan.ui.document_snapshot import get_document_snapshot
 from asciidoc_artisan.ui.preview_constants import (
     PREVIEW_FAST_INTERVAL_MS,
     PREVIEW_INSTANT_MS,
@@ -43,6 +44,8 @@ from asciidoc_artisan.ui.preview_constants import (
     PREVIEW_SLOW_INTERVAL_MS,
 )
 from asciidoc_artisan.ui.preview_css_manager import PreviewCSSManager
+from asciidoc_artisan.workers.block_splitter import EditRange
+from asciidoc_artisan.workers.preview_patch import BlockPatch
 
 # === OPTIONAL IMPORTS (Adaptive Debouncer) ===
 try:
@@ -78,6 +81,9 @@ class PreviewHandlerBase(QObject):
     - _scroll_preview_to_percentage() - Scroll preview to match editor
     - _get_preview_scroll_percentage() - Get preview scroll position
 
+    WHAT SUBCLASSES MAY IMPLEMENT:
+    - _apply_preview_patches() - Update changed blocks in place (no reload)
+
     SIGNALS:
     - preview_updated: Fired when preview HTML changes
     - preview_error: Fired when rendering fails
@@ -104,6 +110,7 @@ class PreviewHandlerBase(QObject):
         # Preview state
         self.sync_scrolling_enabled = True
         self.is_syncing_scroll = False
+        self.preview_updates_enabled = True
 
         # CSS manager (extracted per MA principle)
         self._css_manager = PreviewCSSManager(parent_window)  # type: ignore[arg-type]
@@ -126,9 +133,30 @@ class PreviewHandlerBase(QObject):
         self._current_cursor_line = 0
         self.editor.cursorPositionChanged.connect(self._on_cursor_position_changed)
 
+        # Shared text snapshot (one copy per edit for all consumers)
+        self._snapshot = get_document_snapshot(editor)
+
         # Connect editor text changes to preview updates
         self.editor.textChanged.connect(self._on_text_changed)
 
+        # Edit range since last render request (lets renderer re-split only edited blocks)
+        self._pending_edit: EditRange | None = None
+        # Set when edits went untracked; the next render re-splits the whole text
+        self._needs_full_render = False
+        self.editor.document().contentsChange.connect(self._on_contents_change)
+
+        # CSS of the page loaded from anchored (patchable) HTML, None if not patchable
+        self._patchable_css: str | None = None
+
+    def _on_contents_change(self, position: int, removed: int, added: int) -> None:
+        """Accumulate editor change range until the next preview update."""
+        if not self.preview_updates_enabled or self._needs_full_render:
+            return
+        if self._pending_edit is None:
+            self._pending_edit = EditRange(position, removed, added)
+        else:
+            self._pending_edit.merge(position, removed, added)
+
     def _on_cursor_position_changed(self) -> None:
         """Handle cursor position changes (v1.6.0 for predictive rendering)."""
         cursor = self.editor.textCursor()
@@ -142,11 +170,18 @@ class PreviewHandlerBase(QObject):
 
     def start_preview_updates(self) -> None:
         """Start automatic preview updates on text changes."""
+        if not self.preview_updates_enabled:
+            # Edits made while stopped were not tracked: don't diff against the old layout
+            self._needs_full_render = True
+            self._pending_edit = None
+        self.preview_updates_enabled = True
         logger.info("Preview updates enabled")
 
     def stop_preview_updates(self) -> None:
         """Stop automatic preview updates."""
+        self.preview_updates_enabled = False
         self.preview_timer.stop()
+        self._pending_edit = None
         logger.info("Preview updates disabled")
 
     def _on_text_changed(self) -> None:
@@ -157,9 +192,11 @@ class PreviewHandlerBase(QObject):
         """
         # Cancel any pending update
         self.preview_timer.stop()
+        if not self.preview_updates_enabled:
+            return
 
-        # Get document size
-        text_size = len(self.editor.toPlainText())
+        # Get document size (no copy)
+        text_size = self._snapshot.length()
 
         # Use adaptive debouncing if available
         if self._use_adaptive_debouncing and self._adaptive_debouncer:
@@ -169,12 +206,12 @@ class PreviewHandlerBase(QObject):
             # Fall back to simple size-based delay
             delay = self._calculate_simple_delay(text_size)
 
-        # Request predictive pre-rendering during debounce (v1.6.0)
-        if hasattr(self.window, "preview_worker"):
-            worker = self.window.preview_worker
-            if hasattr(worker, "request_prediction"):
-                source_text = self.editor.toPlainText()
-                worker.request_prediction(source_text, self._current_cursor_line)
+        # Request predictive pre-rendering during debounce (v1.6.0), on the
+        # preview thread: it renders with the worker's AsciiDoc API
+        if hasattr(self.window, "request_preview_prediction"):
+            self.window.request_preview_prediction.emit(
+                self._snapshot.text(), self._current_cursor_line, self._snapshot.line_index()
+            )
 
         # Start timer with calculated delay
         self.preview_timer.start(delay)
@@ -200,14 +237,23 @@ class PreviewHandlerBase(QObject):
     @Slot()
     def update_preview(self) -> None:
         """Update preview with current editor content."""
-        source_text = self.editor.toPlainText()
+        source_text = self._snapshot.text()
 
         # Track render start time
         self._last_render_start = time.time()
 
+        # Hand the accumulated edit range over with the text it produced
+        edit = self._pending_edit
+        self._pending_edit = None
+        self._needs_full_render = False
+
         # Emit signal to worker for rendering
-        if hasattr(self.window, "request_preview_render"):
-            self.window.request_preview_render.emit(source_text)
+        # The worker splits with the editor's line index instead of rescanning newlines
+        line_index = self._snapshot.line_index()
+        if edit is not None and hasattr(self.window, "request_preview_render_edit"):
+            self.window.request_preview_render_edit.emit(source_text, edit, line_index)
+        elif hasattr(self.window, "request_preview_render"):
+            self.window.request_preview_render.emit(source_text, line_index)
 
         logger.debug(f"Preview update requested ({len(source_text)} chars)")
 
@@ -218,27 +264,66 @@ class PreviewHandlerBase(QObject):
         Args:
             html: Rendered HTML content
         """
-        # Calculate render time
-        if self._last_render_start is not None:
-            render_time = time.time() - self._last_render_start
-
-            # Update adaptive debouncer
-            if self._adaptive_debouncer:
-                self._adaptive_debouncer.on_render_complete(render_time)
-
-            logger.debug(f"Render completed in {render_time:.3f}s")
+        self._record_render_time()
 
         # Add CSS styling (delegated to CSS manager)
         styled_html = self._css_manager.wrap_with_css(html)
 
         # Update widget (delegate to subclass)
         self._set_preview_html(styled_html)
+        self._patchable_css = None
 
         # Emit signal
         self.preview_updated.emit(html)
 
         logger.debug(f"Preview updated successfully ({self.__class__.__name__})")
 
+    def handle_preview_patch(self, html: str, patches: list[BlockPatch] | None) -> None:
+        """
+        Handle per-block patches from worker (reloads page only when needed).
+
+        Patches are applied in place when the page was loaded from anchored
+        HTML with the current CSS. Otherwise the full anchored HTML is loaded,
+        which later patches can then update.
+
+        Args:
+            html: Rendered HTML with block anchors (used for full reloads)
+            patches: (anchor id, block HTML) tuples, or None if structure changed
+        """
+        css = self._css_manager.get_preview_css()
+        if patches is not None and css == self._patchable_css and self._apply_preview_patches(patches, html):
+            self._record_render_time()
+            self.preview_updated.emit(html)
+            logger.debug(f"Preview patched ({len(patches)} blocks)")
+            return
+
+        self.handle_preview_complete(html)
+        self._patchable_css = css
+
+    def _record_render_time(self) -> None:
+        """Feed time since last render request to the adaptive debouncer."""
+        if self._last_render_start is not None:
+            render_time = time.time() - self._last_render_start
+
+            # Update adaptive debouncer
+            if self._adaptive_debouncer:
+                self._adaptive_debouncer.on_render_complete(render_time)
+
+            logger.debug(f"Render completed in {render_time:.3f}s")
+
+    def _apply_preview_patches(self, patches: list[BlockPatch], html: str) -> bool:
+        """
+        Apply block patches to the loaded page (widget-specific, optional).
+
+        Args:
+            patches: (anchor id, block HTML) tuples
+            html: Full anchored HTML (fallback if patching fails later)
+
+        Returns:
+            True if patches were applied, False to reload the full page
+        """
+        return False
+
     @abstractmethod
     def _set_preview_html(self, html: str) -> None:
         """
@@ -259,6 +344,7 @@ class PreviewHandlerBase(QObject):
         error_html = self._css_manager.build_error_html(error)
         # Use subclass method for thread-safe setHtml
         self._set_preview_html(error_html)
+        self._patchable_css = None
         self.preview_error.emit(error)
 
     # === CSS DELEGATION METHODS (backward compatibility) ===
@@ -351,6 +437,7 @@ class PreviewHandlerBase(QObject):
         clear_html = self._css_manager.build_clear_html()
         # Use subclass method for thread-safe setHtml
         self._set_preview_html(clear_html)
+        self._patchable_css = None
         logger.debug("Preview cleared")
 
     def get_preview_html(self) -> str:
@@ -15,6 +15,7 @@ Detects GPU capabilities automatically and chooses the optimal widget:
 Factory function create_preview_handler() simplifies usage in main_window.py.
 """
 
+import json
 import logging
 import os
 from typing import Any
@@ -24,6 +25,7 @@ from PySide6.QtWidgets import QPlainTextEdit, QTextBrowser, QWidget
 
 from asciidoc_artisan.core.gpu_detection import get_gpu_info
 from asciidoc_artisan.ui.preview_handler_base import PreviewHandlerBase
+from asciidoc_artisan.workers.preview_patch import BlockPatch
 
 # Try to import QWebEngineView (may not be available)
 try:
@@ -38,6 +40,22 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Replaces innerHTML of block anchors; returns false (nothing changed) if any anchor is missing
+PATCH_SCRIPT_TEMPLATE = """
+    (function(patches) {
+        var nodes = [];
+        for (var i = 0; i < patches.length; i++) {
+            var node = document.getElementById(patches[i][0]);
+            if (!node) return false;
+            nodes.push(node);
+        }
+        for (var j = 0; j < nodes.length; j++) {
+            nodes[j].innerHTML = patches[j][1];
+        }
+        return true;
+    })(%s)
+"""
+
 
 class WebEngineHandler(PreviewHandlerBase):
     """
@@ -47,6 +65,7 @@ class WebEngineHandler(PreviewHandlerBase):
     - GPU-accelerated 2D canvas (up to 10-50x faster)
     - WebGL support for rich content
     - JavaScript-based scroll synchronization
+    - Per-block DOM patching (no page reload while typing)
     - Significantly reduced CPU usage (70-90% less)
 
     Attributes:
@@ -93,6 +112,32 @@ class WebEngineHandler(PreviewHandlerBase):
         # QWebEngineView requires base URL for local resource access
         self.preview.setHtml(html, QUrl("file://"))
 
+    def _apply_preview_patches(self, patches: list[BlockPatch], html: str) -> bool:
+        """
+        Replace changed blocks in the loaded page via JavaScript.
+
+        Keeps scroll position and page state. If an anchor is missing
+        (page replaced meanwhile), the full HTML is loaded instead.
+
+        Args:
+            patches: (anchor id, block HTML) tuples
+            html: Full anchored HTML for the reload fallback
+
+        Returns:
+            True (patches are applied asynchronously)
+        """
+        if not patches:
+            return True
+
+        def on_patched(applied: bool | None) -> None:
+            if not applied:
+                logger.debug("Preview patch target missing, reloading page")
+                self._set_preview_html(self._css_manager.wrap_with_css(html))
+
+        js_code = PATCH_SCRIPT_TEMPLATE % json.dumps(patches)
+        self.preview.page().runJavaScript(js_code, on_patched)
+        return True
+
     def _scroll_preview_to_percentage(self, percentage: float) -> None:
         """
         Scroll QWebEngineView to percentage via JavaScript.
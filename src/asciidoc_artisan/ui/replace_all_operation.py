@@ -0,0 +1,149 @@
+"""
+Replace All Operation - Chunked, cancellable replace-all in the editor.
+
+Replace all used to run one pattern.subn() over the whole document and
+swap the editor text with setPlainText(), allocating several copies of
+the document and blocking the UI with no progress or way out.
+
+ReplaceAllOperation edits the document in place instead:
+- Matches come from a SearchSession (offset arrays, no new text built)
+- Replacements go through one QTextCursor, last match first, so earlier
+  offsets stay valid and no positions need to be shifted
+- Work runs in chunks between event loop turns, reporting progress
+- Chunks after the first join the first edit block: undo reverts the
+  whole replace-all in one step
+- Cancelling undoes the chunks already applied
+
+Example:
+    operation = ReplaceAllOperation(editor, session, "new")
+    operation.progress.connect(on_progress)
+    operation.finished.connect(on_finished)
+    operation.start()
+"""
+
+import logging
+
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtGui import QTextCursor
+from PySide6.QtWidgets import QPlainTextEdit
+
+from asciidoc_artisan.core.search_session import SearchSession
+
+logger = logging.getLogger(__name__)
+
+# Replacements applied per event loop turn
+REPLACE_CHUNK_SIZE = 500
+
+
+class ReplaceAllOperation(QObject):
+    """
+    Replace every match of a search session in an editor, in chunks.
+
+    The editor is read-only while the operation runs so that no user
+    edit lands inside the replace-all undo step.
+
+    Signals:
+        progress: (replaced, total) after each chunk
+        finished: Replacement count when all matches were replaced
+        cancelled: Emitted after cancel() restored the document
+    """
+
+    progress = Signal(int, int)
+    finished = Signal(int)
+    cancelled = Signal()
+
+    def __init__(
+        self,
+        editor: QPlainTextEdit,
+        session: SearchSession,
+        replace_text: str,
+        chunk_size: int = REPLACE_CHUNK_SIZE,
+    ) -> None:
+        """
+        Initialize operation (nothing is replaced until start()).
+
+        Args:
+            editor: Editor whose document is edited
+            session: Matches to replace, synced with the editor text
+            replace_text: Replacement text (backreferences for regex sessions)
+            chunk_size: Replacements per event loop turn
+        """
+        super().__init__()
+        self.editor = editor
+        self.session = session
+        self.replace_text = replace_text
+        self.chunk_size = max(1, chunk_size)
+
+        self._cursor = QTextCursor(editor.document())
+        self._next_index = len(session) - 1
+        self._replaced = 0
+        self._running = False
+        self._was_read_only = False
+
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._replace_chunk)
+
+    @property
+    def total(self) -> int:
+        """Number of matches to replace."""
+        return len(self.session)
+
+    @property
+    def is_running(self) -> bool:
+        """True between start() and finished/cancelled."""
+        return self._running
+
+    def start(self) -> None:
+        """Apply the first chunk now and schedule the rest."""
+        if self._running:
+            return
+        self._running = True
+        self._was_read_only = self.editor.isReadOnly()
+        self.editor.setReadOnly(True)
+        self._replace_chunk()
+
+    def cancel(self) -> None:
+        """Stop and undo the replacements applied so far."""
+        if not self._running:
+            return
+        self._timer.stop()
+        if self._replaced:
+            self.editor.document().undo()
+        self._stop()
+        logger.info(f"Replace all cancelled after {self._replaced} of {self.total} replacements (undone)")
+        self.cancelled.emit()
+
+    def _replace_chunk(self) -> None:
+        """Replace the next chunk of matches, last match first."""
+        if not self._running:
+            return
+
+        stop = max(-1, self._next_index - self.chunk_size)
+        cursor = self._cursor
+        if self._replaced:
+            cursor.joinPreviousEditBlock()
+        else:
+            cursor.beginEditBlock()
+        for index in range(self._next_index, stop, -1):
+            start, end = self.session.document_span(index)
+            cursor.setPosition(start)
+            cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
+            cursor.insertText(self.session.replacement(index, self.replace_text))
+            self._replaced += 1
+        cursor.endEditBlock()
+        self._next_index = stop
+
+        self.progress.emit(self._replaced, self.total)
+        if self._next_index >= 0:
+            self._timer.start()
+            return
+
+        self._stop()
+        self.finished.emit(self._replaced)
+
+    def _stop(self) -> None:
+        """Leave the running state and restore the editor."""
+        self._running = False
+        self.editor.setReadOnly(self._was_read_only)
@@ -6,17 +6,25 @@ Handles search highlighting, match navigation, and replace operations.
 """
 
 import logging
+from array import array
 from typing import TYPE_CHECKING, Any, Protocol
 
-from PySide6.QtCore import Slot
-from PySide6.QtGui import QColor, QTextCursor
-from PySide6.QtWidgets import QMessageBox, QTextEdit
+from PySide6.QtCore import Qt, QTimer, Slot
+from PySide6.QtGui import QColor, QTextCharFormat, QTextCursor
+from PySide6.QtWidgets import QMessageBox, QProgressDialog
+
+from asciidoc_artisan.core.search_session import SearchSession
+from asciidoc_artisan.ui.highlight_layers import get_highlight_layers
+from asciidoc_artisan.ui.replace_all_operation import ReplaceAllOperation
 
 if TYPE_CHECKING:
     from asciidoc_artisan.core.search_engine import SearchMatch
 
 logger = logging.getLogger(__name__)
 
+# Delay before highlights are refreshed for edits made while they are shown
+HIGHLIGHT_REFRESH_DELAY_MS = 300
+
 
 class SearchContext(Protocol):
     """Protocol for search context (avoid circular imports)."""
@@ -42,8 +50,12 @@ class SearchHandler:
     - Live search with highlighting
     - Find next/previous navigation
     - Single replace operation
-    - Replace all with confirmation
+    - Replace all with confirmation (chunked, cancellable, one undo step)
     - Search highlighting management
+
+    Matches of the current query live in a SearchSession that is kept
+    current across edits (see handle_contents_change). Shown highlights
+    are refreshed shortly after an edit, or at the next find next/previous.
     """
 
     def __init__(self, ctx: SearchContext) -> None:
@@ -54,6 +66,16 @@ class SearchHandler:
             ctx: Search context providing editor, find_bar, search_engine
         """
         self.ctx = ctx
+        self._session: SearchSession | None = None
+        self._replace_operation: ReplaceAllOperation | None = None
+        self._replace_dialog: QProgressDialog | None = None
+        # Session offsets shown in the search layer (None when not highlighting)
+        self._highlighted: array[int] | None = None
+
+        self._refresh_timer = QTimer()
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(HIGHLIGHT_REFRESH_DELAY_MS)
+        self._refresh_timer.timeout.connect(self._refresh_highlights)
 
     @Slot(str, bool)
     def handle_search_requested(self, search_text: str, case_sensitive: bool) -> None:
@@ -64,31 +86,22 @@ class SearchHandler:
             case_sensitive: Whether search is case-sensitive
         """
         if not search_text:
+            self._session = None
             self.clear_search_highlighting()
             self.ctx.find_bar.update_match_count(0, 0)
             return
 
         try:
-            matches = self.ctx.search_engine.find_all(search_text, case_sensitive=case_sensitive)
+            session = self._get_session(search_text, case_sensitive)
+            cursor = self.ctx.editor.textCursor()
 
-            if matches:
-                cursor = self.ctx.editor.textCursor()
-                current_pos = cursor.position()
-
-                # Find first match at or after cursor position
-                current_match_index = 0
-                for i, match in enumerate(matches):
-                    if match.start >= current_pos:
-                        current_match_index = i
-                        break
-                else:
-                    current_match_index = len(matches) - 1
-
-                self.ctx.find_bar.update_match_count(current_match_index + 1, len(matches))
-                self.highlight_search_matches(matches)
-
-                if matches:
-                    self.select_match(matches[current_match_index])
+            # First match at or after cursor position (else the last one)
+            current_match_index = session.index_at(cursor.position())
+
+            if current_match_index is not None:
+                self.ctx.find_bar.update_match_count(current_match_index + 1, len(session))
+                self.highlight_search_matches(session)
+                self.select_match(session.match(current_match_index))
             else:
                 self.ctx.find_bar.update_match_count(0, 0)
                 self.ctx.find_bar.set_not_found_style()
@@ -100,62 +113,97 @@ class SearchHandler:
 
     @Slot()
     def handle_find_next(self) -> None:
-        """Navigate to next search match."""
+        """Navigate to next search match (O(log n) via the search session)."""
         search_text = self.ctx.find_bar.get_search_text()
         if not search_text:
             return
 
         try:
             cursor = self.ctx.editor.textCursor()
-            current_pos = cursor.position()
-
-            match = self.ctx.search_engine.find_next(
-                search_text,
-                start_offset=current_pos,
-                case_sensitive=self.ctx.find_bar.is_case_sensitive(),
-                wrap_around=True,
-            )
-
-            if match:
-                self.select_match(match)
-                matches = self.ctx.search_engine.find_all(
-                    search_text, case_sensitive=self.ctx.find_bar.is_case_sensitive()
-                )
-                match_index = matches.index(match) if match in matches else 0
-                self.ctx.find_bar.update_match_count(match_index + 1, len(matches))
+            session = self._get_session(search_text, self.ctx.find_bar.is_case_sensitive())
+            index = session.find_next(cursor.position(), wrap_around=True)
+            self._update_highlights(session)
+
+            if index is not None:
+                self.select_match(session.match(index))
+                self.ctx.find_bar.update_match_count(index + 1, len(session))
 
         except Exception as e:
             logger.error(f"Find next error: {e}")
 
     @Slot()
     def handle_find_previous(self) -> None:
-        """Navigate to previous search match."""
+        """Navigate to previous search match (O(log n) via the search session)."""
         search_text = self.ctx.find_bar.get_search_text()
         if not search_text:
             return
 
         try:
             cursor = self.ctx.editor.textCursor()
-            current_pos = cursor.selectionStart()
-
-            match = self.ctx.search_engine.find_previous(
-                search_text,
-                start_offset=current_pos,
-                case_sensitive=self.ctx.find_bar.is_case_sensitive(),
-                wrap_around=True,
-            )
-
-            if match:
-                self.select_match(match)
-                matches = self.ctx.search_engine.find_all(
-                    search_text, case_sensitive=self.ctx.find_bar.is_case_sensitive()
-                )
-                match_index = matches.index(match) if match in matches else 0
-                self.ctx.find_bar.update_match_count(match_index + 1, len(matches))
+            session = self._get_session(search_text, self.ctx.find_bar.is_case_sensitive())
+            index = session.find_previous(cursor.selectionStart(), wrap_around=True)
+            self._update_highlights(session)
+
+            if index is not None:
+                self.select_match(session.match(index))
+                self.ctx.find_bar.update_match_count(index + 1, len(session))
 
         except Exception as e:
             logger.error(f"Find previous error: {e}")
 
+    def handle_contents_change(self, position: int, removed: int, added: int) -> None:
+        """Record a document edit for the search session (connected to contentsChange).
+
+        Args:
+            position: Offset of the edit
+            removed: Characters removed
+            added: Characters inserted
+        """
+        if self._session is not None:
+            self._session.note_edit(position, removed, added)
+            if self._highlighted is not None:
+                self._refresh_timer.start()
+
+    def _refresh_highlights(self) -> None:
+        """Sync the session with the edited text and refresh its highlights (refresh timer)."""
+        session = self._session
+        if session is None or self._highlighted is None:
+            return
+        engine = self.ctx.search_engine
+        session.sync(engine.text, engine.line_index)
+        self._update_highlights(session)
+
+    def _update_highlights(self, session: SearchSession) -> None:
+        """Re-highlight a synced session if its matches changed since they were shown."""
+        if self._highlighted is not None and session.starts is not self._highlighted:
+            self.highlight_search_matches(session)
+
+    def _get_session(self, search_text: str, case_sensitive: bool) -> SearchSession:
+        """Get the search session for a query, synced with the current text.
+
+        Reuses the current session for the same query, refines it when the
+        query was extended, and scans the text again otherwise.
+
+        Args:
+            search_text: Text to search for
+            case_sensitive: Whether search is case-sensitive
+
+        Returns:
+            SearchSession of the query
+        """
+        engine = self.ctx.search_engine
+        text = engine.text
+        session = self._session
+        if session is not None:
+            session.sync(text, engine.line_index)
+            if session.same_query(search_text, case_sensitive, False, False):
+                return session
+            if session.case_sensitive == case_sensitive and session.refine(search_text):
+                return session
+
+        self._session = SearchSession(text, search_text, case_sensitive=case_sensitive, line_index=engine.line_index)
+        return self._session
+
     @Slot()
     def handle_find_closed(self) -> None:
         """Handle find bar being closed."""
@@ -213,7 +261,7 @@ class SearchHandler:
             replace_text: Text to replace with
         """
         search_text = self.ctx.find_bar.get_search_text()
-        if not search_text:
+        if not search_text or self._replace_operation is not None:
             return
 
         try:
@@ -240,8 +288,7 @@ class SearchHandler:
         Returns:
             Match count if matches found, None if no matches
         """
-        matches = self.ctx.search_engine.find_all(search_text, case_sensitive=self.ctx.find_bar.is_case_sensitive())
-        match_count = len(matches)
+        match_count = len(self._get_session(search_text, self.ctx.find_bar.is_case_sensitive()))
 
         if match_count == 0:
             self.ctx.status_manager.show_status("No matches to replace", 2000)
@@ -272,32 +319,56 @@ class SearchHandler:
 
     def _execute_replace_all(self, search_text: str, replace_text: str) -> None:
         """
-        Execute replace all and update editor state.
+        Start a chunked replace all (one undo step, cancellable from a progress dialog).
 
         Args:
             search_text: Text to search for
             replace_text: Text to replace with
         """
-        new_text, count = self.ctx.search_engine.replace_all(
-            search_text,
-            replace_text,
-            case_sensitive=self.ctx.find_bar.is_case_sensitive(),
-        )
-
-        cursor = self.ctx.editor.textCursor()
-        cursor_pos = cursor.position()
-
-        self.ctx.editor.setPlainText(new_text)
-
-        cursor.setPosition(min(cursor_pos, len(new_text)))
-        self.ctx.editor.setTextCursor(cursor)
-
+        session = self._get_session(search_text, self.ctx.find_bar.is_case_sensitive())
+        # The operation owns the session; edits it makes are not recorded into it
+        self._session = None
+
+        operation = ReplaceAllOperation(self.ctx.editor, session, replace_text)
+        dialog = QProgressDialog("Replacing...", "Cancel", 0, operation.total, self.ctx.editor)
+        dialog.setWindowTitle("Replace All")
+        dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        dialog.setMinimumDuration(500)  # Show only for long replacements
+        dialog.setAutoClose(False)
+        dialog.setAutoReset(False)
+
+        dialog.canceled.connect(operation.cancel)
+        operation.progress.connect(lambda replaced, _total: dialog.setValue(replaced))
+        operation.finished.connect(lambda count: self._on_replace_all_finished(search_text, replace_text, count))
+        operation.cancelled.connect(self._on_replace_all_cancelled)
+
+        self._replace_operation = operation
+        self._replace_dialog = dialog
+        operation.start()
+
+    def _on_replace_all_finished(self, search_text: str, replace_text: str, count: int) -> None:
+        """Update editor state after replace all completed."""
+        self._close_replace_dialog()
         self.clear_search_highlighting()
         self.ctx.find_bar.update_match_count(0, 0)
         self.ctx.status_manager.show_status(f"Replaced {count} occurrence(s)", 3000)
 
         logger.info(f"Replaced all: {count} occurrences of '{search_text}' with '{replace_text}'")
 
+    def _on_replace_all_cancelled(self) -> None:
+        """Report a cancelled replace all (the document was restored)."""
+        self._close_replace_dialog()
+        self.ctx.status_manager.show_status("Replace all cancelled", 3000)
+
+    def _close_replace_dialog(self) -> None:
+        """Close the replace all progress dialog and drop the finished operation."""
+        if self._replace_dialog is not None:
+            self._replace_dialog.canceled.disconnect()
+            self._replace_dialog.close()
+            self._replace_dialog.deleteLater()
+        self._replace_dialog = None
+        self._replace_operation = None
+
     def select_match(self, match: "SearchMatch") -> None:
         """Select a search match in the editor.
 
@@ -310,35 +381,34 @@ class SearchHandler:
         self.ctx.editor.setTextCursor(cursor)
         self.ctx.editor.ensureCursorVisible()
 
-    def highlight_search_matches(self, matches: list["SearchMatch"]) -> None:
-        """Highlight all search matches in the editor.
+    def highlight_search_matches(self, session: SearchSession) -> None:
+        """Highlight all matches of a session in the editor (visible matches first).
+
+        The layer works on the session's match offsets; no SearchMatch is
+        created and lines are looked up only for the viewport.
 
         Args:
-            matches: List of SearchMatch objects
+            session: SearchSession synced with the editor text
         """
-        search_selections = []
-        for match in matches:
-            selection = QTextEdit.ExtraSelection()
-            cursor = self.ctx.editor.textCursor()
-            cursor.setPosition(match.start)
-            cursor.setPosition(match.end, QTextCursor.MoveMode.KeepAnchor)
-
-            selection.format.setBackground(QColor(255, 255, 0, 80))  # Light yellow
-            selection.cursor = cursor
-            search_selections.append(selection)
-
-        self.ctx.editor.search_selections = search_selections
-        self.apply_combined_selections()
+        fmt = QTextCharFormat()
+        fmt.setBackground(QColor(255, 255, 0, 80))  # Light yellow
+
+        self._highlighted = session.starts
+        get_highlight_layers(self.ctx.editor).set_offset_layer(
+            "search",
+            session.starts,
+            session.line_index,
+            span_of=session.document_span,
+            format_of=lambda _index: fmt,
+        )
 
     def clear_search_highlighting(self) -> None:
         """Clear all search highlighting from the editor."""
-        self.ctx.editor.search_selections = []
-        self.apply_combined_selections()
+        self._highlighted = None
+        self._refresh_timer.stop()
+        get_highlight_layers(self.ctx.editor).clear_layer("search")
         self.ctx.find_bar.clear_not_found_style()
 
     def apply_combined_selections(self) -> None:
-        """Combine search and spell check selections and apply to editor."""
-        combined = list(getattr(self.ctx.editor, "search_selections", []))
-        spell_sels = getattr(self.ctx.editor, "spell_check_selections", [])
-        combined.extend(spell_sels)
-        self.ctx.editor.setExtraSelections(combined)
+        """Re-apply search, spell check and syntax highlights to the editor."""
+        get_highlight_layers(self.ctx.editor).refresh()
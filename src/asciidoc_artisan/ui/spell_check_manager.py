@@ -3,19 +3,24 @@ Spell Check Manager - UI integration for spell checking.
 
 Manages spell checking integration with the editor:
 - Red squiggly underlines for misspelled words
-- Right-click context menu with suggestions
+- Right-click context menu with suggestions (computed when the menu opens)
 - Toggle spell checking on/off (F7)
 - Custom dictionary management
+- Background checking: typing triggers a debounced pass on a worker
+  thread that re-checks changed paragraphs only (SpellCheckSession)
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
 from PySide6.QtGui import QColor, QContextMenuEvent, QTextCharFormat, QTextCursor
-from PySide6.QtWidgets import QTextEdit
 
 from asciidoc_artisan.core import SpellChecker, SpellError
+from asciidoc_artisan.core.spell_check_session import SpellCheckCancelled, SpellCheckSession
+from asciidoc_artisan.ui.document_snapshot import get_document_snapshot
+from asciidoc_artisan.ui.highlight_layers import get_highlight_layers
 
 if TYPE_CHECKING:
     from .main_window import AsciiDocEditor
@@ -23,11 +28,15 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-class SpellCheckManager:
+class SpellCheckManager(QObject):
     """Manages spell checking UI integration."""
 
+    _check_finished = Signal(int, object)  # (generation, errors) from worker thread
+    _visible_checked = Signal(int, object, int, int)  # (generation, errors, first_line, last_line)
+
     def __init__(self, main_window: "AsciiDocEditor") -> None:
         """Initialize SpellCheckManager."""
+        super().__init__()
         self.main_window = main_window
         self.editor = main_window.editor
 
@@ -44,6 +53,18 @@ class SpellCheckManager:
         self.enabled = main_window._settings.spell_check_enabled
         self.errors: list[SpellError] = []
 
+        self._underline_format = QTextCharFormat()
+        self._underline_format.setUnderlineColor(QColor(Qt.GlobalColor.red))
+        self._underline_format.setUnderlineStyle(QTextCharFormat.UnderlineStyle.SpellCheckUnderline)
+
+        # Paragraph cache and worker thread; _generation bumps on every
+        # edit so a running pass for older text cancels itself
+        self._session = SpellCheckSession(self.spell_checker)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="spell-check")
+        self._generation = 0
+        self._check_finished.connect(self._on_check_finished)
+        self._visible_checked.connect(self._on_visible_checked)
+
         # Context menu handler (MA extraction)
         from .spell_context_menu import SpellContextMenu
 
@@ -52,14 +73,14 @@ class SpellCheckManager:
         # Debounce timer for spell checking
         self.check_timer = QTimer()
         self.check_timer.setSingleShot(True)
-        self.check_timer.timeout.connect(self._perform_spell_check)
+        self.check_timer.timeout.connect(self._start_background_check)
 
         # Connect signals
         self.editor.textChanged.connect(self._on_text_changed)
 
-        # Perform initial spell check if enabled
+        # Initial spell check off the GUI thread if enabled
         if self.enabled:
-            self._perform_spell_check()
+            self._start_background_check()
 
         logger.info(f"SpellCheckManager initialized (enabled={self.enabled}, language={language})")
 
@@ -70,7 +91,7 @@ class SpellCheckManager:
         self._update_menu_text()
 
         if self.enabled:
-            self._perform_spell_check()
+            self._start_background_check()
             self.main_window.status_manager.show_message("info", "Spell Check", "Spell check enabled")
             logger.info("Spell check enabled")
         else:
@@ -91,6 +112,7 @@ class SpellCheckManager:
     def set_language(self, language: str) -> None:
         """Change spell check language."""
         self.spell_checker.set_language(language)
+        self._session.reset()
         self.main_window._settings.spell_check_language = language
         logger.info(f"Spell check language changed to: {language}")
 
@@ -100,6 +122,7 @@ class SpellCheckManager:
     def add_to_dictionary(self, word: str) -> None:
         """Add word to custom dictionary."""
         self.spell_checker.add_to_dictionary(word)
+        self._session.forget_word(word)
         custom_words = self.spell_checker.get_custom_words()
         self.main_window._settings.spell_check_custom_words = custom_words
 
@@ -111,6 +134,7 @@ class SpellCheckManager:
     def ignore_word(self, word: str) -> None:
         """Ignore word for this session only."""
         self.spell_checker.ignore_word(word)
+        self._session.forget_word(word)
 
         if self.enabled:
             self._perform_spell_check()
@@ -121,59 +145,105 @@ class SpellCheckManager:
         """Show context menu with spell check suggestions."""
         self._context_menu.show(event)
 
+    def get_suggestions(self, error: SpellError) -> list[str]:
+        """Get suggestions for a misspelling, computing them on first request (context menu)."""
+        if not error.suggestions:
+            error.suggestions = self.spell_checker.get_suggestions(error.word)
+        return error.suggestions
+
+    def shutdown(self) -> None:
+        """Cancel the running pass and stop the worker thread (call on exit)."""
+        self.check_timer.stop()
+        self._generation += 1
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
     def _on_text_changed(self) -> None:
         """Handle text changed event - debounced spell check."""
+        # Any running pass is now stale
+        self._generation += 1
         if not self.enabled:
             return
         self.check_timer.stop()
         self.check_timer.start(500)
 
-    def _perform_spell_check(self) -> None:
-        """Perform spell check on current document."""
+    def _start_background_check(self) -> None:
+        """Queue a spell check pass of the current text on the worker thread."""
         if not self.enabled:
             return
 
-        text = self.editor.toPlainText()
-        self.errors = self.spell_checker.check_text(text)
-        self._update_highlights()
+        text = get_document_snapshot(self.editor).text()
+        visible = get_highlight_layers(self.editor).window()
+        try:
+            self._executor.submit(self._run_check, text, self._generation, visible)
+        except RuntimeError:
+            logger.debug("Spell check worker stopped, skipping pass")
+
+    def _run_check(self, text: str, generation: int, visible: tuple[int, int] | None = None) -> None:
+        """Spell check text on the worker thread, visible paragraphs first (cancelled by newer edits)."""
+
+        def on_visible(errors: list[SpellError], first_line: int, last_line: int) -> None:
+            self._visible_checked.emit(generation, errors, first_line, last_line)
+
+        try:
+            errors = self._session.check(
+                text,
+                cancelled=lambda: generation != self._generation,
+                visible=visible,
+                on_visible=on_visible,
+            )
+        except SpellCheckCancelled:
+            return
+        except Exception as e:
+            logger.error(f"Spell check failed: {e}", exc_info=True)
+            return
 
-        logger.info(f"Spell check complete: {len(self.errors)} errors found")
+        try:
+            self._check_finished.emit(generation, errors)
+        except RuntimeError:  # pragma: no cover - manager deleted during shutdown
+            pass
 
-    def _update_highlights(self) -> None:
-        """Update red squiggly underlines for all spelling errors."""
-        if not self.errors:
-            self._clear_highlights()
+    def _on_check_finished(self, generation: int, errors: list[SpellError]) -> None:
+        """Apply worker results on the GUI thread (dropped if the text changed since)."""
+        if generation != self._generation or not self.enabled:
             return
+        self.errors = errors
+        self._update_highlights()
+        logger.debug(f"Spell check complete: {len(self.errors)} errors found")
 
-        spell_check_selections = []
-        for error in self.errors:
-            cursor = QTextCursor(self.editor.document())
-            cursor.setPosition(error.start)
-            cursor.setPosition(error.end, QTextCursor.MoveMode.KeepAnchor)
+    def _on_visible_checked(self, generation: int, errors: list[SpellError], first_line: int, last_line: int) -> None:
+        """Show results for the visible paragraphs while the rest of the document is checked."""
+        if generation != self._generation or not self.enabled:
+            return
+        kept = [error for error in self.errors if not first_line <= error.line - 1 <= last_line]
+        self.errors = sorted(kept + errors, key=lambda error: error.start)
+        self._update_highlights()
 
-            fmt = QTextCharFormat()
-            fmt.setUnderlineColor(QColor(Qt.GlobalColor.red))
-            fmt.setUnderlineStyle(QTextCharFormat.UnderlineStyle.SpellCheckUnderline)
+    def _perform_spell_check(self) -> None:
+        """Perform spell check on current document now (changed paragraphs only)."""
+        if not self.enabled:
+            return
+
+        # Supersede any background pass
+        self._generation += 1
+        text = get_document_snapshot(self.editor).text()
+        self.errors = self._session.check(text)
+        self._update_highlights()
 
-            selection = QTextEdit.ExtraSelection()
-            selection.cursor = cursor
-            selection.format = fmt
-            spell_check_selections.append(selection)
+        logger.info(f"Spell check complete: {len(self.errors)} errors found")
 
-        self.editor.spell_check_selections = spell_check_selections
-        self._apply_combined_selections()
+    def _update_highlights(self) -> None:
+        """Update red squiggly underlines (the "spell" highlight layer, visible lines first)."""
+        get_highlight_layers(self.editor).set_layer(
+            "spell",
+            self.errors,
+            line_of=lambda error: error.line - 1,
+            span_of=lambda error: (error.start, error.end),
+            format_of=lambda _error: self._underline_format,
+        )
 
     def _clear_highlights(self) -> None:
         """Clear all spelling error highlights."""
-        self.editor.spell_check_selections = []
-        self._apply_combined_selections()
-
-    def _apply_combined_selections(self) -> None:
-        """Combine spell check selections with other selections."""
-        combined = list(getattr(self.editor, "spell_check_selections", []))
-        search_sels = getattr(self.editor, "search_selections", [])
-        combined.extend(search_sels)
-        self.editor.setExtraSelections(combined)
+        get_highlight_layers(self.editor).clear_layer("spell")
 
     def _find_error_at_position(self, position: int) -> SpellError | None:
         """Find spelling error at given text position."""
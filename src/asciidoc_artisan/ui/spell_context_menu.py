@@ -107,7 +107,7 @@ class SpellContextMenu:
         word, cursor, error = result
 
         menu = QMenu(self.editor)
-        self.add_suggestion_actions(menu, error.suggestions[:5], cursor)
+        self.add_suggestion_actions(menu, self.manager.get_suggestions(error)[:5], cursor)
         self.add_dictionary_actions(menu, word)
         self.add_standard_actions(menu)
         menu.exec(event.globalPos())
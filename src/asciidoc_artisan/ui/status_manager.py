@@ -21,6 +21,7 @@ from PySide6.QtWidgets import QLabel, QPushButton
 
 from asciidoc_artisan.core import APP_NAME, DEFAULT_FILENAME, GitStatus
 from asciidoc_artisan.ui.document_metrics_calculator import DocumentMetricsCalculator
+from asciidoc_artisan.ui.document_snapshot import get_document_snapshot
 from asciidoc_artisan.ui.git_status_formatter import GitStatusFormatter
 from asciidoc_artisan.ui.status_bar_label_updater import StatusBarLabelUpdater
 from asciidoc_artisan.ui.status_bar_widget_factory import StatusBarWidgetFactory
@@ -211,7 +212,7 @@ class StatusManager:
         if not self.version_label:
             return
 
-        text = self.editor.editor.toPlainText()
+        text = get_document_snapshot(self.editor.editor).text()
         word_count = self.count_words(text)
 
         # Update all metric labels
@@ -7,15 +7,17 @@ provides jump-to-error navigation.
 
 Key features:
 - Real-time error detection (500ms debounce)
-- Color-coded underlines (red=error, orange=warning, blue=info)
+- Color-coded underlines (red=error, orange=warning, blue=info), drawn
+  as the "syntax" highlight layer (visible lines first, rest when idle)
 - Jump to next/previous error (F8, Shift+F8)
 - Quick fix suggestions (lightbulb icon, Ctrl+.)
-- Incremental validation (only changed lines)
+- Background validation (worker thread, cancelled by the next edit)
+- Incremental validation (SyntaxCheckSession re-checks dirty lines only)
 - <100ms validation for 1000-line documents
 
 Architecture:
-    Editor textChanged → Debounce timer (500ms)
-    → Validate document → Update underlines
+    Editor textChanged → Cancel in-flight run → Debounce timer (500ms)
+    → Validate on worker thread → Update underlines (GUI thread, if current)
     → User clicks error → Show quick fixes
 
 Example:
@@ -37,12 +39,27 @@ Example:
     ```
 """
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
 from PySide6.QtCore import QObject, QTimer, Signal
-from PySide6.QtGui import QColor, QTextCharFormat, QTextCursor
-from PySide6.QtWidgets import QPlainTextEdit, QTextEdit
+from PySide6.QtGui import QColor, QTextCharFormat, QTextDocument
+from PySide6.QtWidgets import QPlainTextEdit
 
 from asciidoc_artisan.core.models import ErrorSeverity, SyntaxErrorModel
-from asciidoc_artisan.core.syntax_checker import SyntaxChecker
+from asciidoc_artisan.core.syntax_check_session import SyntaxCheckSession
+from asciidoc_artisan.core.syntax_checker import SyntaxChecker, ValidationCancelled
+from asciidoc_artisan.ui.document_snapshot import get_document_snapshot
+from asciidoc_artisan.ui.highlight_layers import get_highlight_layers
+
+logger = logging.getLogger(__name__)
+
+# Underline color per severity
+SEVERITY_COLORS = {
+    ErrorSeverity.ERROR: QColor(255, 0, 0),  # Red
+    ErrorSeverity.WARNING: QColor(255, 165, 0),  # Orange/Yellow
+    ErrorSeverity.INFO: QColor(0, 0, 255),  # Blue
+}
 
 
 class SyntaxCheckerManager(QObject):
@@ -70,8 +87,9 @@ class SyntaxCheckerManager(QObject):
 
     Performance:
         - Debounced to avoid excessive checking
-        - <100ms validation for 1000-line document
-        - Incremental validation for edited lines
+        - Validation runs on a worker thread; typing cancels the running check
+        - Incremental validation for edited lines (<10ms per keystroke at 10k lines)
+        - Underlines resolved via the document block index, viewport first
 
     Example:
         ```python
@@ -95,6 +113,7 @@ class SyntaxCheckerManager(QObject):
 
     # Signals
     errors_changed = Signal(int)  # Error count
+    _validation_finished = Signal(int, object)  # (generation, errors) from worker thread
 
     def __init__(self, editor: QPlainTextEdit, checker: SyntaxChecker) -> None:
         """
@@ -109,6 +128,13 @@ class SyntaxCheckerManager(QObject):
         self.checker = checker
         self.errors: list[SyntaxErrorModel] = []
 
+        # Incremental state and worker thread; _generation bumps on every
+        # edit so an in-flight run for older text cancels itself
+        self._session = SyntaxCheckSession(checker)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="syntax-check")
+        self._generation = 0
+        self._validation_finished.connect(self._on_validation_finished)
+
         # Debounce timer
         self.timer = QTimer()
         self.timer.setSingleShot(True)
@@ -152,6 +178,9 @@ class SyntaxCheckerManager(QObject):
         Restarts debounce timer for syntax checking. Only triggers
         if syntax checking is enabled.
         """
+        # Any running check is now stale
+        self._generation += 1
+
         if not self.enabled:  # pragma: no cover
             return
 
@@ -161,16 +190,47 @@ class SyntaxCheckerManager(QObject):
 
     def _validate_document(self) -> None:
         """
-        Validate document and update error display.
+        Start background validation of the current text.
+
+        Submits a SyntaxCheckSession run to the worker thread; results
+        are applied by _on_validation_finished if no edit happened since.
+        """
+        text = get_document_snapshot(self.editor).text()
+        generation = self._generation
+        try:
+            self._executor.submit(self._run_validation, text, generation)
+        except RuntimeError:
+            logger.debug("Syntax check worker stopped, skipping validation")
+
+    def _run_validation(self, text: str, generation: int) -> None:
+        """Validate text on the worker thread (cancelled when a newer edit arrives)."""
+        try:
+            errors = self._session.validate(text, cancelled=lambda: generation != self._generation)
+        except ValidationCancelled:
+            return
+        except Exception as e:
+            logger.error(f"Syntax check failed: {e}", exc_info=True)
+            return
+
+        try:
+            self._validation_finished.emit(generation, errors)
+        except RuntimeError:  # pragma: no cover - manager deleted during shutdown
+            pass
+
+    def _on_validation_finished(self, generation: int, errors: list[SyntaxErrorModel]) -> None:
+        """Apply worker results on the GUI thread (dropped if the text changed since)."""
+        if generation != self._generation:
+            return
+        self._apply_errors(errors)
 
-        Runs syntax checker on full document text, updates error list,
-        and refreshes underline display.
+    def _apply_errors(self, errors: list[SyntaxErrorModel]) -> None:
         """
-        # Get document text
-        document_text = self.editor.toPlainText()
+        Update error list and display.
 
-        # Validate
-        self.errors = self.checker.validate(document_text)
+        Args:
+            errors: Errors of the current document text
+        """
+        self.errors = errors
 
         # Update visual feedback
         if self.show_underlines:
@@ -183,52 +243,55 @@ class SyntaxCheckerManager(QObject):
         """
         Show error underlines in editor.
 
-        Creates extra selections with color-coded underlines:
+        Draws the "syntax" highlight layer with color-coded underlines:
         - Red squiggly: Errors (ErrorSeverity.ERROR)
         - Orange squiggly: Warnings (ErrorSeverity.WARNING)
         - Blue squiggly: Info/Style (ErrorSeverity.INFO)
+
+        The layer builds selections near the viewport first and the rest
+        when idle; spell check and search highlights are left untouched.
+        """
+        document = self.editor.document()
+        get_highlight_layers(self.editor).set_layer(
+            "syntax",
+            self.errors,
+            line_of=lambda error: error.line,
+            span_of=lambda error: self._error_span(document, error),
+            format_of=self._underline_format,
+        )
+
+    @staticmethod
+    def _underline_format(error: SyntaxErrorModel) -> QTextCharFormat:
+        """Wave underline in the error's severity color."""
+        fmt = QTextCharFormat()
+        fmt.setUnderlineColor(SEVERITY_COLORS.get(error.severity, SEVERITY_COLORS[ErrorSeverity.INFO]))
+        fmt.setUnderlineStyle(QTextCharFormat.UnderlineStyle.WaveUnderline)
+        return fmt
+
+    @staticmethod
+    def _error_span(document: QTextDocument, error: SyntaxErrorModel) -> tuple[int, int] | None:
         """
-        # Clear previous underlines
-        self.editor.setExtraSelections([])
+        Resolve an error to absolute document positions.
 
-        # Create selections for each error
-        selections = []
-        for error in self.errors:
-            selection = QTextEdit.ExtraSelection()
-
-            # Set underline color by severity
-            if error.severity == ErrorSeverity.ERROR:
-                color = QColor(255, 0, 0)  # Red
-            elif error.severity == ErrorSeverity.WARNING:
-                color = QColor(255, 165, 0)  # Orange/Yellow
-            else:
-                color = QColor(0, 0, 255)  # Blue
-
-            # Set format
-            selection.format.setUnderlineColor(color)
-            selection.format.setUnderlineStyle(QTextCharFormat.UnderlineStyle.WaveUnderline)
-
-            # Set cursor position
-            cursor = self.editor.textCursor()
-            cursor.movePosition(QTextCursor.MoveOperation.Start)
-            for _ in range(error.line):
-                cursor.movePosition(QTextCursor.MoveOperation.Down)
-            cursor.movePosition(
-                QTextCursor.MoveOperation.Right,
-                QTextCursor.MoveMode.MoveAnchor,
-                error.column,
-            )
-            cursor.movePosition(
-                QTextCursor.MoveOperation.Right,
-                QTextCursor.MoveMode.KeepAnchor,
-                error.length,
-            )
-
-            selection.cursor = cursor
-            selections.append(selection)
-
-        # Apply selections
-        self.editor.setExtraSelections(selections)
+        Uses the document's block index (findBlockByNumber) instead of
+        walking lines; columns are clamped to the line.
+
+        Returns:
+            (start, end) positions, or None if the line no longer exists
+        """
+        block = document.findBlockByNumber(error.line)
+        if not block.isValid():
+            return None
+
+        start = error.column
+        end = error.column + error.length
+        text = block.text()
+        if not text.isascii():
+            # Qt positions count UTF-16 code units
+            start = len(text[:start].encode("utf-16-le")) // 2
+            end = len(text[:end].encode("utf-16-le")) // 2
+        line_length = block.length() - 1
+        return block.position() + min(start, line_length), block.position() + min(end, line_length)
 
     def jump_to_next_error(self) -> None:
         """
@@ -304,15 +367,12 @@ class SyntaxCheckerManager(QObject):
         Args:
             error: Error to jump to
         """
+        span_range = self._error_span(self.editor.document(), error)
+        if span_range is None:
+            return
+
         cursor = self.editor.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.Start)
-        for _ in range(error.line):
-            cursor.movePosition(QTextCursor.MoveOperation.Down)
-        cursor.movePosition(
-            QTextCursor.MoveOperation.Right,
-            QTextCursor.MoveMode.MoveAnchor,
-            error.column,
-        )
+        cursor.setPosition(span_range[0])
         self.editor.setTextCursor(cursor)
         self.editor.ensureCursorVisible()
 
@@ -372,7 +432,7 @@ class SyntaxCheckerManager(QObject):
             ```
         """
         self.errors = []
-        self.editor.setExtraSelections([])
+        get_highlight_layers(self.editor).clear_layer("syntax")
         self.errors_changed.emit(0)
 
     def validate_now(self) -> None:
@@ -390,4 +450,18 @@ class SyntaxCheckerManager(QObject):
             ```
         """
         self.timer.stop()
-        self._validate_document()
+
+        # Supersede any background run, then validate on this thread
+        self._generation += 1
+        text = get_document_snapshot(self.editor).text()
+        self._apply_errors(self._session.validate(text))
+
+    def shutdown(self) -> None:
+        """
+        Stop background validation (call on application exit).
+
+        Cancels the running check and stops the worker thread.
+        """
+        self.timer.stop()
+        self._generation += 1
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -110,26 +110,18 @@ class TelemetryDialogHandler:
         MA principle: Extracted from _change_telemetry_directory (15 lines).
 
         Args:
-            telemetry_file: Current telemetry file path
+            telemetry_file: Current telemetry log segment
             new_dir_path: New directory path
 
         Raises:
-            Exception: If file move or directory creation fails
+            Exception: If directory creation or copying fails
         """
         # Create new directory if it doesn't exist
         new_dir_path.mkdir(parents=True, exist_ok=True)
 
-        # Move existing telemetry file if it exists
-        if telemetry_file and telemetry_file.exists():
-            new_file_path = new_dir_path / "telemetry.toon"
-            import shutil
-
-            shutil.copy2(telemetry_file, new_file_path)
-            logger.info(f"Copied telemetry file to: {new_file_path}")
-
-        # Update telemetry collector
-        self.editor.telemetry_collector.data_dir = new_dir_path
-        self.editor.telemetry_collector.telemetry_file = new_dir_path / "telemetry.toon"
+        # Copy existing log segments (if any) and switch the collector to the new directory
+        copy_data = telemetry_file is not None and telemetry_file.exists()
+        self.editor.telemetry_collector.set_data_dir(new_dir_path, copy_data=copy_data)
 
         logger.info("Telemetry directory changed successfully")
 
@@ -29,6 +29,7 @@ from asciidoc_artisan.core import (
     MIN_WINDOW_WIDTH,
 )
 from asciidoc_artisan.ui.find_bar_widget import FindBarWidget
+from asciidoc_artisan.ui.highlight_layers import get_highlight_layers
 from asciidoc_artisan.ui.line_number_area import LineNumberPlainTextEdit
 from asciidoc_artisan.ui.toolbar_factory import ToolbarFactory
 
@@ -172,9 +173,8 @@ class UISetupManager:
             "Main text editor for writing AsciiDoc documents. Use Ctrl+Space for auto-complete, F8 for syntax check."
         )
 
-        # Initialize extra selection lists for combining highlights
-        self.editor.editor.spell_check_selections = []
-        self.editor.editor.search_selections = []
+        # Highlight layers shared by spell check, syntax check and search
+        get_highlight_layers(self.editor.editor)
 
         font = QFont(EDITOR_FONT_FAMILY, EDITOR_FONT_SIZE)
         self.editor.editor.setFont(font)
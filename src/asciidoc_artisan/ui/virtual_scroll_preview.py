@@ -6,6 +6,8 @@ from typing import Any
 
 from PySide6.QtWidgets import QWidget
 
+from asciidoc_artisan.core.line_index import LineIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -165,13 +167,19 @@ class VirtualScrollPreview:
         line_count = source_text.count("\n") + 1
         return line_count >= self.config.min_lines_for_virtual
 
-    def render_viewport(self, source_text: str, viewport: Viewport) -> tuple[str, int]:
+    def render_viewport(
+        self, source_text: str, viewport: Viewport, line_index: LineIndex | None = None
+    ) -> tuple[str, int]:
         """
         Render only visible viewport.
 
+        The visible lines are sliced out of the source by offset; the
+        document is not split into lines.
+
         Args:
             source_text: Full document source
             viewport: Viewport information
+            line_index: Shared LineIndex of source_text (default: built here)
 
         Returns:
             Tuple of (rendered_html, offset_pixels)
@@ -182,21 +190,24 @@ class VirtualScrollPreview:
             html = self._render_full(source_text)
             return (html, 0)
 
-        lines = source_text.split("\n")
-        self._total_lines = len(lines)
+        if line_index is None or line_index.text is not source_text:
+            line_index = LineIndex(source_text)
+        self._total_lines = line_index.line_count()
 
         # Calculate visible range
         start_line, end_line = viewport.get_visible_line_range(self.config.buffer_lines)
 
         # Clamp to document bounds
         start_line = max(0, start_line)
-        end_line = min(len(lines), end_line)
+        end_line = min(self._total_lines, end_line)
 
         # Extract visible lines
-        visible_lines = lines[start_line:end_line]
-        visible_source = "\n".join(visible_lines)
-
-        self._rendered_lines = len(visible_lines)
+        if start_line < end_line:
+            visible_source = source_text[line_index.line_start(start_line) : line_index.line_span(end_line - 1)[1]]
+            self._rendered_lines = end_line - start_line
+        else:
+            visible_source = ""
+            self._rendered_lines = 0
 
         # Calculate vertical offset for positioning
         offset_pixels = start_line * viewport.line_height
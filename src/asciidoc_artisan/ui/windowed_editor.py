@@ -0,0 +1,261 @@
+"""
+Windowed Editor - Edit very large files through a window of lines.
+
+Loading a file over WINDOWED_MODE_THRESHOLD into QPlainTextEdit takes
+several GB of memory (the decoded text, the editor's block structure and
+the copies made by every text consumer). In windowed mode the editor
+holds WINDOW_LINES lines of a WindowedDocument at a time:
+- Moving the cursor (or scrolling) within EDGE_LINES of a window edge
+  writes the window's edits into the document and loads the window
+  around the new position
+- Line numbers show document lines (line_number_offset)
+- Saving streams the document to disk (WindowedDocument.save)
+
+Preview updates are stopped while such a file is open
+(LargeFileHandler.should_disable_preview): rendering would need the
+whole text in memory, and the window alone renders a fragment.
+
+Example:
+    windowed = WindowedEditor(main_window)
+    windowed.open(Path("huge.adoc"))
+    windowed.go_to_line(1_000_000)
+    windowed.save(Path("huge.adoc"))
+"""
+
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from PySide6.QtCore import QObject, QTimer
+from PySide6.QtGui import QTextCursor
+
+from asciidoc_artisan.core.large_file_handler import LargeFileHandler
+from asciidoc_artisan.core.windowed_document import WindowedDocument
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .main_window import AsciiDocEditor
+
+logger = logging.getLogger(__name__)
+
+# Lines held by the editor at a time
+WINDOW_LINES = 5000
+
+# Distance from a window edge (in lines) that moves the window
+EDGE_LINES = 500
+
+
+class WindowedEditor(QObject):
+    """
+    Keeps a window of a large file in the editor.
+
+    Attributes:
+        main_window: Main window owning the editor
+        editor: Editor widget holding the window
+        document: Open windowed document, or None when inactive
+    """
+
+    def __init__(self, main_window: "AsciiDocEditor") -> None:
+        """
+        Initialize windowed editing (inactive until open()).
+
+        Args:
+            main_window: Main window owning the editor
+        """
+        super().__init__()
+        self.main_window = main_window
+        self.editor = main_window.editor
+        self.document: WindowedDocument | None = None
+        self._first = 0
+        self._last = 0
+        self._moving = False
+        self._preview_stopped = False
+
+        self._recenter_timer = QTimer()
+        self._recenter_timer.setSingleShot(True)
+        self._recenter_timer.setInterval(0)
+        self._recenter_timer.timeout.connect(self._recenter_if_near_edge)
+
+        self.editor.cursorPositionChanged.connect(self._on_position_changed)
+        self.editor.verticalScrollBar().valueChanged.connect(self._on_position_changed)
+
+    @property
+    def active(self) -> bool:
+        """True while a windowed document is open."""
+        return self.document is not None
+
+    @property
+    def window(self) -> tuple[int, int]:
+        """Document lines [first, last) currently in the editor."""
+        return self._first, self._last
+
+    def open(self, file_path: Path) -> None:
+        """
+        Open a file in windowed mode and show its first window.
+
+        Args:
+            file_path: File to open
+
+        Raises:
+            OSError: If the file cannot be mapped
+        """
+        self.close()
+        self.document = WindowedDocument(file_path)
+        if LargeFileHandler.should_disable_preview(file_path.stat().st_size):
+            self._stop_preview()
+        self._load_window(0)
+
+        self.main_window._current_file_path = file_path
+        self.main_window._unsaved_changes = False
+        self.main_window.status_manager.update_window_title()
+        self.main_window.status_bar.showMessage(
+            f"Opened in windowed mode: {file_path} ({self.document.line_count():,} lines)"
+        )
+        logger.info(f"Windowed editing: {file_path}")
+
+    def close(self) -> None:
+        """Leave windowed mode (the editor content is left as is)."""
+        if self.document is None:
+            return
+        self._recenter_timer.stop()
+        self.document.close()
+        self.document = None
+        self._first = self._last = 0
+        self._set_line_number_offset(0)
+        if self._preview_stopped:
+            self._preview_stopped = False
+            self.main_window.preview_handler.start_preview_updates()
+
+    def go_to_line(self, line: int) -> None:
+        """
+        Move the cursor to a document line, loading its window if needed.
+
+        Args:
+            line: Document line (0-indexed)
+        """
+        if self.document is None:
+            return
+        line = max(0, min(line, self.document.line_count() - 1))
+        if not self._first <= line < self._last:
+            self.commit()
+            self._load_window(max(0, line - WINDOW_LINES // 2))
+        self._place_cursor(line - self._first, 0)
+
+    def commit(self) -> None:
+        """Write edits of the current window into the document."""
+        if self.document is None or not self.editor.document().isModified():
+            return
+        lines = self.editor.toPlainText().split("\n")
+        self.document.replace_lines(self._first, self._last, lines)
+        self._last = self._first + len(lines)
+        self.editor.document().setModified(False)
+
+    def save(self, file_path: Path) -> bool:
+        """
+        Save the document by streaming it to file_path.
+
+        Args:
+            file_path: Target file path
+
+        Returns:
+            True if saved successfully, False otherwise
+        """
+        if self.document is None:
+            return False
+        self.commit()
+        return self.document.save(file_path)
+
+    def _stop_preview(self) -> None:
+        """Stop preview updates and clear the preview until close()."""
+        self._preview_stopped = True
+        self.main_window.preview_handler.stop_preview_updates()
+        self.main_window.preview_handler.clear_preview()
+        logger.info("Preview disabled for windowed file")
+
+    def _load_window(self, first: int) -> None:
+        """Show document lines [first, first + WINDOW_LINES) in the editor."""
+        assert self.document is not None
+        total = self.document.line_count()
+        first = max(0, min(first, total - WINDOW_LINES))
+        last = min(total, first + WINDOW_LINES)
+
+        # Swapping windows is not an edit: keep the unsaved flag as it was
+        unsaved = self.main_window._unsaved_changes
+        self._moving = True
+        self.main_window._is_opening_file = True
+        try:
+            self.editor.setPlainText(self.document.text(first, last))
+            self.editor.document().setModified(False)
+        finally:
+            self.main_window._is_opening_file = False
+            self._moving = False
+            self.main_window._unsaved_changes = unsaved
+
+        self._first, self._last = first, last
+        self._set_line_number_offset(first)
+        logger.debug(f"Windowed editing: lines {first}-{last} of {total}")
+
+    def _on_position_changed(self, *_args: object) -> None:
+        """Check the window edges once the current event is handled."""
+        if self.document is not None and not self._moving:
+            self._recenter_timer.start()
+
+    def _recenter_if_near_edge(self) -> None:
+        """Move the window when the cursor or the viewport nears an edge with more lines behind it."""
+        if self.document is None:
+            return
+
+        cursor = self.editor.textCursor()
+        block = cursor.blockNumber()
+        window_size = self._last - self._first
+        visible_top = self.editor.firstVisibleBlock().blockNumber()
+        scrollbar = self.editor.verticalScrollBar()
+
+        near_top = self._first > 0 and (block < EDGE_LINES or scrollbar.value() == scrollbar.minimum())
+        near_bottom = self._last < self.document.line_count() and (
+            block >= window_size - EDGE_LINES or scrollbar.value() == scrollbar.maximum()
+        )
+        if not (near_top or near_bottom):
+            return
+
+        # Follow the cursor if it is on screen, else the viewport
+        anchor = block if abs(block - visible_top) < EDGE_LINES else visible_top
+        line = self._first + anchor
+        column = cursor.positionInBlock()
+        top_offset = visible_top - block
+
+        self.commit()
+        self._load_window(line - WINDOW_LINES // 2)
+        if anchor == block:
+            self._place_cursor(line - self._first, column)
+        else:
+            self._place_cursor(line - self._first, 0)
+        self._scroll_to_block(line - self._first + (top_offset if anchor == block else 0))
+
+    def _place_cursor(self, block_number: int, column: int) -> None:
+        """Put the cursor at a block and column of the window."""
+        block = self.editor.document().findBlockByNumber(block_number)
+        if not block.isValid():
+            return
+        cursor = QTextCursor(block)
+        cursor.setPosition(block.position() + min(column, block.length() - 1))
+        self._moving = True
+        try:
+            self.editor.setTextCursor(cursor)
+            self.editor.ensureCursorVisible()
+        finally:
+            self._moving = False
+
+    def _scroll_to_block(self, block_number: int) -> None:
+        """Scroll so a window block is at the top of the viewport."""
+        self._moving = True
+        try:
+            self.editor.verticalScrollBar().setValue(max(0, block_number))
+        finally:
+            self._moving = False
+
+    def _set_line_number_offset(self, offset: int) -> None:
+        """Number editor lines as document lines."""
+        if hasattr(self.editor, "line_number_offset"):
+            self.editor.line_number_offset = offset
+            self.editor.update_line_number_area_width(0)
+            self.editor.line_number_area.update()
@@ -14,36 +14,94 @@ main window complexity and improve modularity.
 
 v1.5.0: Added OptimizedWorkerPool support for better resource management
 and cancellable operations.
+
+Workers start on demand: setup_workers_and_threads() only routes the
+editor's request signals. The first request for a worker imports it,
+creates its thread and starts it (start_worker()). Requests go through a
+queued invoker on the worker's thread, so requests made while a worker
+warms up (e.g. AsciiDoc initialization on the preview thread) wait in
+its event queue. Workers with an idle timeout (GitHub, Pandoc) quit
+their thread after the timeout once their queued work is done, and start
+again on the next request.
 """
 
 import logging
 import os
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
-from PySide6.QtCore import Qt, QThread
+from PySide6.QtCore import QObject, Qt, QThread, QTimer, Signal, Slot
 
-from asciidoc_artisan.workers import (
-    GitHubCLIWorker,
-    GitWorker,
-    OllamaChatWorker,
-    OptimizedWorkerPool,
-    PandocWorker,
-    PreviewWorker,
-)
+from asciidoc_artisan.core.metrics import get_metrics_collector
+from asciidoc_artisan.workers.optimized_worker_pool import OptimizedWorkerPool
 
 if TYPE_CHECKING:
+    from asciidoc_artisan.workers import (
+        GitHubCLIWorker,
+        GitWorker,
+        OllamaChatWorker,
+        PandocWorker,
+        PreviewWorker,
+    )
+
     from .main_window import AsciiDocEditor
 
 logger = logging.getLogger(__name__)
 
-# Check for AsciiDoc3 availability
-try:
-    from asciidoc3 import asciidoc3
+# Idle time before an on-demand worker thread is stopped (5 minutes)
+WORKER_IDLE_TIMEOUT_MS = 300_000
+
+# Worker name -> idle timeout in ms (0 = keep running once started).
+# Git is polled for status and the preview keeps render caches; the chat
+# workers are called directly, not through the invoker queue.
+WORKER_IDLE_TIMEOUTS = {
+    "git": 0,
+    "github": WORKER_IDLE_TIMEOUT_MS,
+    "pandoc": WORKER_IDLE_TIMEOUT_MS,
+    "preview": 0,
+    "ollama_chat": 0,
+    "claude": 0,
+}
+
+# Editor request signal -> (worker name, worker slot)
+REQUEST_ROUTES = (
+    ("request_git_command", "git", "run_git_command"),
+    ("request_git_status", "git", "get_repository_status"),
+    ("request_detailed_git_status", "git", "get_detailed_repository_status"),
+    ("request_github_command", "github", "dispatch_github_operation"),
+    ("request_pandoc_conversion", "pandoc", "run_pandoc_conversion"),
+    ("request_preview_render", "preview", "render_preview"),
+    ("request_preview_render_edit", "preview", "render_preview_edit"),
+    ("request_preview_prediction", "preview", "request_prediction"),
+)
+
+
+class WorkerInvoker(QObject):
+    """
+    Calls worker slots on the worker's thread.
+
+    Lives on the worker's thread; call is emitted from the main thread
+    and delivered through the thread's event queue. An empty slot name
+    quits the thread once the calls queued before it have run (after
+    releasing the thread's metrics buffer).
+    """
+
+    call = Signal(str, object)
 
-    ASCIIDOC3_AVAILABLE = True
-except ImportError:
-    asciidoc3 = None
-    ASCIIDOC3_AVAILABLE = False
+    def __init__(self, worker: QObject) -> None:
+        """Initialize invoker for a worker (move it to the worker's thread)."""
+        super().__init__()
+        self._worker = worker
+        self.call.connect(self._invoke, Qt.ConnectionType.QueuedConnection)
+
+    @Slot(str, object)
+    def _invoke(self, slot_name: str, args: tuple[Any, ...]) -> None:
+        """Run one queued call."""
+        if not slot_name:
+            get_metrics_collector().release_thread_buffer()
+            QThread.currentThread().quit()
+            return
+        getattr(self._worker, slot_name)(*args)
 
 
 class WorkerManager:
@@ -82,6 +140,13 @@ class WorkerManager:
         self.claude_thread: QThread | None = None
         self.claude_worker: Any = None  # ClaudeWorker, lazy-loaded
 
+        # On-demand startup state (worker name -> invoker / idle timer)
+        self._invokers: dict[str, WorkerInvoker] = {}
+        self._idle_timers: dict[str, QTimer] = {}
+        self._stopping_threads: list[QThread] = []
+        self._worker_starts = 0
+        self._idle_stops = 0
+
         # Worker pool (v1.5.0)
         self.use_worker_pool = use_worker_pool
         self.worker_pool: OptimizedWorkerPool | None = None
@@ -101,12 +166,11 @@ class WorkerManager:
 
         MA principle: Extracted from setup_workers_and_threads (12 lines).
         """
+        from asciidoc_artisan.workers import GitWorker
+
         self.git_thread = QThread(self.editor)
         self.git_worker = GitWorker()
         self.git_worker.moveToThread(self.git_thread)
-        self.editor.request_git_command.connect(self.git_worker.run_git_command)
-        self.editor.request_git_status.connect(self.git_worker.get_repository_status)
-        self.editor.request_detailed_git_status.connect(self.git_worker.get_detailed_repository_status)
         self.git_worker.command_complete.connect(self.editor._handle_git_result)
         self.git_worker.status_ready.connect(self.editor._handle_git_status)
         self.git_worker.detailed_status_ready.connect(self.editor._handle_detailed_git_status)
@@ -119,10 +183,11 @@ class WorkerManager:
 
         MA principle: Extracted from setup_workers_and_threads (8 lines).
         """
+        from asciidoc_artisan.workers import GitHubCLIWorker
+
         self.github_thread = QThread(self.editor)
         self.github_worker = GitHubCLIWorker()
         self.github_worker.moveToThread(self.github_thread)
-        self.editor.request_github_command.connect(self.github_worker.dispatch_github_operation)
         self.github_worker.github_result_ready.connect(self.editor._handle_github_result)
         self.github_thread.finished.connect(self.github_worker.deleteLater)
         self.github_thread.start()
@@ -133,6 +198,8 @@ class WorkerManager:
 
         MA principle: Extracted from setup_workers_and_threads (22 lines).
         """
+        from asciidoc_artisan.workers import PandocWorker
+
         self.pandoc_thread = QThread(self.editor)
         self.pandoc_worker = PandocWorker()
         self.pandoc_worker.moveToThread(self.pandoc_thread)
@@ -143,7 +210,6 @@ class WorkerManager:
             getattr(self.editor._settings, "ollama_model", None),
         )
 
-        self.editor.request_pandoc_conversion.connect(self.pandoc_worker.run_pandoc_conversion)
         self.pandoc_worker.conversion_complete.connect(
             self.editor.pandoc_result_handler.handle_pandoc_result,
             Qt.ConnectionType.QueuedConnection,
@@ -161,26 +227,25 @@ class WorkerManager:
 
         MA principle: Extracted from setup_workers_and_threads (17 lines).
         """
+        from asciidoc_artisan.workers import PreviewWorker
+
         self.preview_thread = QThread(self.editor)
         self.preview_worker = PreviewWorker()
         self.preview_worker.moveToThread(self.preview_thread)
 
         # Connect signals BEFORE starting thread
         # Use Qt.QueuedConnection for cross-thread signals to prevent race conditions
-        from PySide6.QtCore import Qt
-
-        self.editor.request_preview_render.connect(
-            self.preview_worker.render_preview, Qt.ConnectionType.QueuedConnection
-        )
         self.preview_worker.render_complete.connect(
             self.editor._handle_preview_complete, Qt.ConnectionType.QueuedConnection
         )
         self.preview_worker.render_error.connect(self.editor._handle_preview_error, Qt.ConnectionType.QueuedConnection)
+        self.preview_worker.render_patch.connect(self.editor._handle_preview_patch, Qt.ConnectionType.QueuedConnection)
+        self.preview_worker.set_patch_updates(True)
         self.preview_thread.finished.connect(self.preview_worker.deleteLater)
 
-        # Initialize AsciiDoc API on worker thread after thread starts
-        if ASCIIDOC3_AVAILABLE and asciidoc3:
-            self.preview_thread.started.connect(lambda: self.preview_worker.initialize_asciidoc(asciidoc3.__file__))
+        # Import asciidoc3, build the API and warm it up on the worker thread
+        # once it starts (requests queued meanwhile run after it)
+        self.preview_thread.started.connect(self.preview_worker.initialize_asciidoc)
 
         self.preview_thread.start()
 
@@ -189,11 +254,20 @@ class WorkerManager:
         Setup Ollama chat worker thread.
 
         MA principle: Extracted from setup_workers_and_threads (10 lines).
-        Note: Chat worker signals connected via ChatManager after initialization.
         """
+        from asciidoc_artisan.workers import OllamaChatWorker
+
         self.ollama_chat_thread = QThread(self.editor)
         self.ollama_chat_worker = OllamaChatWorker()
         self.ollama_chat_worker.moveToThread(self.ollama_chat_thread)
+
+        chat_manager = self.editor.chat_manager
+        self.ollama_chat_worker.chat_response_ready.connect(chat_manager.handle_response_ready)
+        self.ollama_chat_worker.chat_response_chunk.connect(chat_manager.handle_response_chunk)
+        self.ollama_chat_worker.chat_error.connect(chat_manager.handle_error)
+        self.ollama_chat_worker.operation_cancelled.connect(chat_manager.handle_operation_cancelled)
+        self.editor.chat_bar.cancel_requested.connect(self.ollama_chat_worker.cancel_operation)
+
         self.ollama_chat_thread.finished.connect(self.ollama_chat_worker.deleteLater)
         self.ollama_chat_thread.start()
 
@@ -202,13 +276,15 @@ class WorkerManager:
         Setup Claude AI worker thread.
 
         MA principle: Extracted from setup_workers_and_threads (10 lines).
-        Note: Claude worker signals connected via main_window adapter pattern.
+        Note: Responses go through the chat worker router's adapter.
         """
         self.claude_thread = QThread(self.editor)
         from asciidoc_artisan.claude import ClaudeWorker
 
         self.claude_worker = ClaudeWorker()
         self.claude_worker.moveToThread(self.claude_thread)
+        self.claude_worker.response_ready.connect(self.editor.chat_worker_router.adapt_claude_response)
+        self.claude_worker.error_occurred.connect(self.editor.chat_manager.handle_error)
         self.claude_thread.finished.connect(self.claude_worker.deleteLater)
         self.claude_thread.start()
 
@@ -233,24 +309,104 @@ class WorkerManager:
 
     def setup_workers_and_threads(self) -> None:
         """
-        Set up all worker threads with signal connections.
+        Route editor requests to workers started on first use.
+
+        No worker is imported or started here; see start_worker().
+        """
+        for signal_name, worker_name, slot_name in REQUEST_ROUTES:
+            getattr(self.editor, signal_name).connect(partial(self._forward_request, worker_name, slot_name))
+
+        # Store references on main window for backward compatibility (None until started)
+        self._store_worker_references()
+        logger.info("Worker requests routed (workers start on first use)")
 
-        MA principle: Reduced from 105→20 lines by extracting 7 helper methods.
+    def start_worker(self, name: str) -> Any:
         """
-        logger.info("Setting up worker threads...")
+        Get a worker, starting its thread on first use.
 
-        # Setup all workers using dedicated helper methods
-        self._setup_git_worker()
-        self._setup_github_worker()
-        self._setup_pandoc_worker()
-        self._setup_preview_worker()
-        self._setup_ollama_chat_worker()
-        self._setup_claude_worker()
+        Args:
+            name: Worker name ("git", "github", "pandoc", "preview", "ollama_chat" or "claude")
+
+        Returns:
+            Worker instance
+        """
+        worker = getattr(self, f"{name}_worker")
+        if worker is None:
+            getattr(self, f"_setup_{name}_worker")()
+            worker = getattr(self, f"{name}_worker")
+            thread: QThread = getattr(self, f"{name}_thread")
+
+            invoker = WorkerInvoker(worker)
+            invoker.moveToThread(thread)
+            thread.finished.connect(invoker.deleteLater)
+            self._invokers[name] = invoker
+
+            self._worker_starts += 1
+            self._store_worker_references()
+            logger.info(f"Started {name} worker on demand")
+
+        self._restart_idle_timer(name)
+        return worker
+
+    def _forward_request(self, name: str, slot_name: str, *args: Any) -> None:
+        """Run an editor request on its worker's thread (starts the worker if needed)."""
+        self.start_worker(name)
+        self._invokers[name].call.emit(slot_name, args)
+
+    def _restart_idle_timer(self, name: str) -> None:
+        """Postpone the idle shutdown of a worker (no-op for workers kept running)."""
+        timeout_ms = WORKER_IDLE_TIMEOUTS.get(name, 0)
+        if not timeout_ms:
+            return
+        timer = self._idle_timers.get(name)
+        if timer is None:
+            timer = QTimer()
+            timer.setSingleShot(True)
+            timer.timeout.connect(partial(self.stop_idle_worker, name))
+            self._idle_timers[name] = timer
+        timer.start(timeout_ms)
+
+    def stop_idle_worker(self, name: str) -> None:
+        """
+        Stop a worker's thread once its queued requests have run.
 
-        logger.info("All worker threads started (Git, GitHub, Pandoc, Preview, Ollama, Claude)")
+        The next request starts a new worker.
 
-        # Store references on main window for backward compatibility
+        Args:
+            name: Worker name
+        """
+        invoker = self._invokers.pop(name, None)
+        if invoker is None:
+            return
+        thread: QThread = getattr(self, f"{name}_thread")
+        self._stopping_threads.append(thread)
+        thread.finished.connect(partial(self._forget_stopped_thread, thread))
+        thread.finished.connect(thread.deleteLater)
+        invoker.call.emit("", ())
+
+        setattr(self, f"{name}_thread", None)
+        setattr(self, f"{name}_worker", None)
         self._store_worker_references()
+        self._idle_stops += 1
+        logger.info(f"Stopping idle {name} worker")
+
+    def _forget_stopped_thread(self, thread: QThread) -> None:
+        """Drop an idle-stopped thread once it has finished."""
+        if thread in self._stopping_threads:
+            self._stopping_threads.remove(thread)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get on-demand worker statistics.
+
+        Returns:
+            Dictionary with running workers, starts and idle stops
+        """
+        return {
+            "running_workers": sorted(self._invokers),
+            "worker_starts": self._worker_starts,
+            "idle_stops": self._idle_stops,
+        }
 
     def get_pool_statistics(self) -> dict[str, Any]:
         """
@@ -362,6 +518,14 @@ class WorkerManager:
         """
         logger.info("Shutting down workers...")
 
+        for timer in self._idle_timers.values():
+            timer.stop()
+
+        # Idle-stopped threads still finishing queued work
+        for thread in list(self._stopping_threads):
+            self._shutdown_thread(thread, "Idle")
+        self._stopping_threads.clear()
+
         # Cancel and wait for pool tasks if pool is enabled
         if self.worker_pool:
             cancelled = self.cancel_all_pool_tasks()
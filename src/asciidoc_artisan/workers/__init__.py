@@ -30,13 +30,43 @@ Usage Example:
     ```
 """
 
-from .git_worker import GitWorker
-from .github_cli_worker import GitHubCLIWorker
-from .ollama_chat_worker import OllamaChatWorker
-from .optimized_worker_pool import OptimizedWorkerPool, TaskPriority
-from .pandoc_worker import PandocWorker
-from .preview_worker import PreviewWorker
-from .worker_tasks import ConversionTask, GitTask, RenderTask
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .git_worker import GitWorker
+    from .github_cli_worker import GitHubCLIWorker
+    from .ollama_chat_worker import OllamaChatWorker
+    from .optimized_worker_pool import OptimizedWorkerPool, TaskPriority
+    from .pandoc_worker import PandocWorker
+    from .preview_worker import PreviewWorker
+    from .worker_tasks import ConversionTask, GitTask, RenderTask
+
+# Exports are imported on first access, so importing one worker module
+# (or asciidoc_artisan.workers.block_splitter) does not load every worker
+_LAZY_EXPORTS = {
+    "GitWorker": ".git_worker",
+    "GitHubCLIWorker": ".github_cli_worker",
+    "OllamaChatWorker": ".ollama_chat_worker",
+    "OptimizedWorkerPool": ".optimized_worker_pool",
+    "TaskPriority": ".optimized_worker_pool",
+    "PandocWorker": ".pandoc_worker",
+    "PreviewWorker": ".preview_worker",
+    "ConversionTask": ".worker_tasks",
+    "GitTask": ".worker_tasks",
+    "RenderTask": ".worker_tasks",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported worker class on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "GitWorker",
@@ -8,6 +8,10 @@ Features:
 - Document block detection at heading boundaries
 - Fast heading level detection using native Python
 - Block content hashing for change detection
+- Edit-range splitting: re-split only blocks touched by an editor change
+- Full splits slice block text out of the source between heading
+  offsets (no per-line strings); heading lines come from a shared
+  LineIndex when one is given
 
 Block Structure:
     Documents are split into blocks at section boundaries:
@@ -20,8 +24,11 @@ Block Structure:
 import hashlib
 import logging
 import re
+from bisect import bisect_right
 from dataclasses import dataclass
+from itertools import accumulate
 
+from asciidoc_artisan.core.line_index import ASTRAL_PATTERN, LineIndex
 from asciidoc_artisan.workers.render_cache import BLOCK_HASH_LENGTH
 
 # Fast hashing with xxHash (10x faster than MD5, hot path optimization)
@@ -50,6 +57,10 @@ class DocumentBlock:
         content: Raw AsciiDoc content
         rendered_html: Cached rendered HTML
         level: Heading level (0=title, 1=section, etc.)
+        prelude: Attribute entries from earlier blocks (see document_prelude)
+        prelude_hash: Short hash of prelude ("" when empty)
+        attribute_lines: Attribute entries in this block (None = not scanned)
+        section_number: Document-wide section number ("" when unnumbered)
     """
 
     id: str
@@ -58,6 +69,10 @@ class DocumentBlock:
     content: str
     rendered_html: str | None = None
     level: int = 0
+    prelude: str = ""
+    prelude_hash: str = ""
+    attribute_lines: list[str] | None = None
+    section_number: str = ""
 
     def compute_id(self) -> str:
         """
@@ -77,6 +92,50 @@ class DocumentBlock:
         result: str = content_hash[:BLOCK_HASH_LENGTH]
         return result
 
+    def cache_key(self) -> str:
+        """Cache key covering block content and its prelude."""
+        if self.prelude_hash:
+            return f"{self.id}-{self.prelude_hash}"
+        return self.id
+
+    def render_source(self) -> str:
+        """AsciiDoc source to render (prelude + content)."""
+        return self.prelude + self.content
+
+
+@dataclass(slots=True)
+class EditRange:
+    """
+    Accumulated editor change since the last render.
+
+    Mirrors QTextDocument.contentsChange: the original text
+    [position, position + removed) was replaced by `added` characters.
+
+    Attributes:
+        position: Start offset (same in old and new text)
+        removed: Characters removed from the old text
+        added: Characters inserted in the new text
+    """
+
+    position: int
+    removed: int
+    added: int
+
+    def merge(self, position: int, removed: int, added: int) -> None:
+        """
+        Fold a later change (offsets in current text) into this range.
+
+        Args:
+            position: Start offset of the new change
+            removed: Characters removed by the new change
+            added: Characters added by the new change
+        """
+        end = max(self.position + self.added, position + removed)
+        old_end = end - (self.added - self.removed)
+        self.position = min(self.position, position)
+        self.removed = old_end - self.position
+        self.added = end + added - removed - self.position
+
 
 def count_leading_equals(line: str) -> int:
     """
@@ -133,18 +192,22 @@ class DocumentBlockSplitter:
     SUBSECTION_PATTERN = re.compile(r"^===\s+\S+", re.MULTILINE)
     HEADING_PATTERN = re.compile(r"^(={1,6})\s+(.+)$", re.MULTILINE)
 
+    # Block boundaries: lines starting with '=' characters and a space or tab
+    # (same lines as count_leading_equals() > 0)
+    BOUNDARY_PATTERN = re.compile(r"^=+[ \t]", re.MULTILINE)
+
     @staticmethod
-    def split(source_text: str) -> list[DocumentBlock]:
+    def split(source_text: str, line_index: LineIndex | None = None) -> list[DocumentBlock]:
         """
         Split document into blocks (optimized).
 
-        Performance optimizations (v1.6):
-        - Fast-path empty check in heading detection
-        - Reduced string operations
-        - Direct line range extraction
+        Headings are found with one regex scan of the source; block content
+        is sliced out of it between heading offsets.
 
         Args:
             source_text: Full AsciiDoc source
+            line_index: Shared LineIndex of source_text for heading lines
+                (default: newlines between headings are counted)
 
         Returns:
             List of DocumentBlock objects
@@ -152,7 +215,47 @@ class DocumentBlockSplitter:
         if not source_text.strip():
             return []
 
-        lines = source_text.split("\n")
+        shared_index = line_index if line_index is not None and line_index.text is source_text else None
+
+        blocks: list[DocumentBlock] = []
+        block_offset = 0
+        block_line = 0
+        level = 0
+        for match in DocumentBlockSplitter.BOUNDARY_PATTERN.finditer(source_text):
+            heading_offset = match.start()
+            if heading_offset > block_offset:
+                if shared_index is not None:
+                    heading_line = shared_index.line_of(heading_offset)
+                else:
+                    heading_line = block_line + source_text.count("\n", block_offset, heading_offset)
+                blocks.append(
+                    DocumentBlockSplitter._create_block_from_text(
+                        source_text[block_offset : heading_offset - 1], block_line, heading_line - 1, level
+                    )
+                )
+                block_offset, block_line = heading_offset, heading_line
+            level = match.end() - heading_offset - 1
+
+        end_line = block_line + source_text.count("\n", block_offset)
+        blocks.append(
+            DocumentBlockSplitter._create_block_from_text(source_text[block_offset:], block_line, end_line, level)
+        )
+
+        logger.debug(f"Split document into {len(blocks)} blocks")
+        return blocks
+
+    @staticmethod
+    def _split_lines(lines: list[str], line_offset: int) -> list[DocumentBlock]:
+        """
+        Split lines into blocks at heading boundaries.
+
+        Args:
+            lines: Lines to split (first line starts a block)
+            line_offset: Document line number of lines[0]
+
+        Returns:
+            List of DocumentBlock objects with document line numbers
+        """
         blocks: list[DocumentBlock] = []
         current_block_start = 0
         current_level = 0
@@ -167,7 +270,7 @@ class DocumentBlockSplitter:
                     # Found a heading - save previous block
                     if line_num > current_block_start:
                         block = DocumentBlockSplitter._create_block_from_range(
-                            lines, current_block_start, line_num - 1, current_level
+                            lines, current_block_start, line_num - 1, current_level, line_offset
                         )
                         blocks.append(block)
 
@@ -178,13 +281,80 @@ class DocumentBlockSplitter:
         # Add final block
         if current_block_start < len(lines):
             block = DocumentBlockSplitter._create_block_from_range(
-                lines, current_block_start, len(lines) - 1, current_level
+                lines, current_block_start, len(lines) - 1, current_level, line_offset
             )
             blocks.append(block)
 
-        logger.debug(f"Split document into {len(blocks)} blocks")
         return blocks
 
+    @staticmethod
+    def split_edit(
+        previous: list[DocumentBlock], source_text: str, edit: EditRange
+    ) -> tuple[list[DocumentBlock], list[DocumentBlock], list[DocumentBlock]] | None:
+        """
+        Update a previous split using the editor's change range.
+
+        Only blocks overlapping the edit are re-split and re-hashed. Blocks
+        after the edit keep their content and ID; their line numbers are
+        shifted in place.
+
+        Args:
+            previous: Blocks of the text before the edit (full coverage)
+            source_text: Full AsciiDoc source after the edit
+            edit: Change range relative to the previous text (Qt positions,
+                in UTF-16 units)
+
+        Returns:
+            Tuple of (all_blocks, replaced_old_blocks, new_region_blocks),
+            or None if the edit does not match the previous blocks or
+            characters outside the BMP (two UTF-16 units, one Python
+            character) come before its end (caller should fall back to split())
+        """
+        if not previous or not source_text.strip():
+            return None
+        if ASTRAL_PATTERN.search(source_text, 0, edit.position + edit.added):
+            return None
+
+        # Character offset of each block (blocks are joined by "\n")
+        starts = list(accumulate((len(block.content) + 1 for block in previous[:-1]), initial=0))
+        old_length = starts[-1] + len(previous[-1].content)
+        delta = edit.added - edit.removed
+
+        if (
+            edit.position < 0
+            or edit.removed < 0
+            or edit.position + edit.removed > old_length
+            or len(source_text) != old_length + delta
+        ):
+            return None
+
+        first = bisect_right(starts, edit.position) - 1
+        last = bisect_right(starts, edit.position + edit.removed) - 1
+        old_region_end = starts[last] + len(previous[last].content)
+        region_end = old_region_end + delta
+
+        # Region must start at a heading; otherwise it joins the block before
+        region_text = source_text[starts[first] : region_end]
+        while first > 0 and count_leading_equals(region_text.split("\n", 1)[0]) == 0:
+            first -= 1
+            region_text = source_text[starts[first] : region_end]
+
+        old_region = previous[first : last + 1]
+        old_line_count = old_region[-1].end_line - old_region[0].start_line + 1
+        region_lines = region_text.split("\n")
+        new_region = DocumentBlockSplitter._split_lines(region_lines, old_region[0].start_line)
+
+        # Shift following blocks without rebuilding them
+        line_delta = len(region_lines) - old_line_count
+        following = previous[last + 1 :]
+        if line_delta:
+            for block in following:
+                block.start_line += line_delta
+                block.end_line += line_delta
+
+        logger.debug(f"Edit split: {len(old_region)} blocks replaced by {len(new_region)}")
+        return previous[:first] + new_region + following, old_region, new_region
+
     @staticmethod
     def _create_block(lines: list[str], start_line: int, end_line: int, level: int) -> DocumentBlock:
         """Create DocumentBlock from lines."""
@@ -200,14 +370,29 @@ class DocumentBlockSplitter:
         return block
 
     @staticmethod
-    def _create_block_from_range(lines: list[str], start_line: int, end_line: int, level: int) -> DocumentBlock:
+    def _create_block_from_text(content: str, start_line: int, end_line: int, level: int) -> DocumentBlock:
+        """Create DocumentBlock from content sliced out of the source (lines start_line to end_line)."""
+        block = DocumentBlock(
+            id="",
+            start_line=start_line,
+            end_line=end_line,
+            content=content,
+            level=level,
+        )
+        block.id = block.compute_id()
+        return block
+
+    @staticmethod
+    def _create_block_from_range(
+        lines: list[str], start_line: int, end_line: int, level: int, line_offset: int = 0
+    ) -> DocumentBlock:
         """Create DocumentBlock from line range (optimized)."""
         # Extract content directly from line range
         content = "\n".join(lines[start_line : end_line + 1])
         block = DocumentBlock(
             id="",
-            start_line=start_line,
-            end_line=end_line,
+            start_line=start_line + line_offset,
+            end_line=end_line + line_offset,
             content=content,
             level=level,
         )
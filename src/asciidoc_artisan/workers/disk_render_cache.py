@@ -0,0 +1,254 @@
+"""
+Disk Render Cache - Persistent second tier for BlockCache.
+
+MA principle: ~200 lines focused on on-disk block storage.
+
+Stores rendered block HTML across restarts so reopening a large document
+renders mostly from cache:
+- Keyed by block ID (xxHash of content) plus a render fingerprint
+- Fingerprint covers asciidoc3 version, API options and attributes
+- zlib-compressed entries, written atomically (temp file + rename)
+- Size-bounded LRU eviction (file mtime records recency across restarts)
+
+Example:
+    disk = DiskBlockCache(fingerprint=compute_render_fingerprint(api))
+    disk.put("a1b2c3d4e5f6", "<div>...</div>")
+    disk.get("a1b2c3d4e5f6")  # "<div>...</div>", also after restart
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from PySide6.QtCore import QStandardPaths
+
+logger = logging.getLogger(__name__)
+
+# Disk cache settings
+DISK_CACHE_DIR: Path | None = None  # Overrides the platform cache location (tests)
+DISK_CACHE_SUBDIR = "render_cache"
+DISK_CACHE_MAX_BYTES = 64 * 1024 * 1024  # 64 MB of compressed HTML
+DISK_CACHE_SUFFIX = ".html.z"
+FINGERPRINT_LENGTH = 12
+
+
+def default_cache_dir() -> Path:
+    """
+    Directory of the render cache in the platform cache location.
+
+    Resolved when a cache is created, after the application name is set
+    (QStandardPaths.CacheLocation includes it).
+
+    Returns:
+        DISK_CACHE_DIR if set, else <CacheLocation>/render_cache
+    """
+    if DISK_CACHE_DIR is not None:
+        return DISK_CACHE_DIR
+    location = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+    base = Path(location) if location else Path.home() / ".cache" / "AsciiDocArtisan"
+    return base / DISK_CACHE_SUBDIR
+
+
+def compute_render_fingerprint(asciidoc_api: Any) -> str:
+    """
+    Fingerprint everything besides block content that affects rendered HTML.
+
+    Args:
+        asciidoc_api: AsciiDoc3API instance
+
+    Returns:
+        Short hex digest of asciidoc3 version, options and attributes
+    """
+    module = getattr(asciidoc_api, "asciidoc3", None)
+    version = str(getattr(module, "VERSION", "unknown"))
+    options = getattr(getattr(asciidoc_api, "options", None), "values", [])
+    attributes = getattr(asciidoc_api, "attributes", {})
+    if not isinstance(attributes, dict):
+        attributes = {}
+
+    parts = [version, repr(list(options) if isinstance(options, list) else [])]
+    parts.extend(f"{key}={value}" for key, value in sorted(attributes.items()))
+    digest = hashlib.md5("\n".join(parts).encode("utf-8")).hexdigest()
+    return digest[:FINGERPRINT_LENGTH]
+
+
+class DiskBlockCache:
+    """
+    Persistent LRU store for rendered block HTML (thread-safe).
+
+    The directory is scanned lazily on first access. Read errors and
+    corrupt entries are treated as cache misses.
+    """
+
+    def __init__(
+        self,
+        fingerprint: str,
+        cache_dir: Path | None = None,
+        max_bytes: int = DISK_CACHE_MAX_BYTES,
+    ) -> None:
+        """
+        Initialize disk cache (no I/O until first use).
+
+        Args:
+            fingerprint: Render fingerprint from compute_render_fingerprint()
+            cache_dir: Cache directory (default: default_cache_dir())
+            max_bytes: Maximum total size of compressed entries
+        """
+        self.fingerprint = fingerprint
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_bytes = max_bytes
+        self._index: OrderedDict[str, int] | None = None  # file name -> size, oldest first
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _file_name(self, block_id: str) -> str:
+        """Build entry file name from fingerprint and block ID."""
+        return f"{self.fingerprint}-{block_id}{DISK_CACHE_SUFFIX}"
+
+    def _ensure_index(self) -> OrderedDict[str, int]:
+        """Load LRU index from directory (called with lock held)."""
+        if self._index is not None:
+            return self._index
+
+        entries: list[tuple[float, str, int]] = []
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.endswith(DISK_CACHE_SUFFIX):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, entry.name, stat.st_size))
+        except OSError as exc:
+            logger.warning(f"Render disk cache unavailable: {exc}")
+
+        entries.sort()
+        self._index = OrderedDict((name, size) for _, name, size in entries)
+        self._total_bytes = sum(size for _, _, size in entries)
+        logger.debug(f"Render disk cache: {len(entries)} entries, {self._total_bytes} bytes")
+        return self._index
+
+    def get(self, block_id: str) -> str | None:
+        """
+        Get rendered HTML from disk.
+
+        Args:
+            block_id: Block ID to retrieve
+
+        Returns:
+            Rendered HTML if cached, None otherwise
+        """
+        name = self._file_name(block_id)
+        with self._lock:
+            index = self._ensure_index()
+            if name not in index:
+                self._misses += 1
+                return None
+            index.move_to_end(name)
+
+        path = self.cache_dir / name
+        try:
+            html = zlib.decompress(path.read_bytes()).decode("utf-8")
+            os.utime(path)  # Record recency for the next session
+        except (OSError, zlib.error, UnicodeDecodeError) as exc:
+            logger.debug(f"Dropping unreadable cache entry {name}: {exc}")
+            self._remove(name)
+            with self._lock:
+                self._misses += 1
+            return None
+
+        with self._lock:
+            self._hits += 1
+        return html
+
+    def put(self, block_id: str, html: str) -> None:
+        """
+        Store rendered HTML on disk with LRU eviction.
+
+        The entry is written to a temp file without holding the lock; the
+        rename, index update and eviction (metadata only) are done under it.
+
+        Args:
+            block_id: Block ID
+            html: Rendered HTML
+        """
+        name = self._file_name(block_id)
+        data = zlib.compress(html.encode("utf-8"), 6)
+        path = self.cache_dir / name
+        temp_path = path.with_name(f".{name}.{threading.get_ident()}.tmp")
+
+        with self._lock:
+            self._ensure_index()  # Creates the directory on first use
+
+        try:
+            temp_path.write_bytes(data)
+        except OSError as exc:
+            logger.debug(f"Render disk cache write failed: {exc}")
+            return
+
+        with self._lock:
+            index = self._ensure_index()
+            try:
+                os.replace(temp_path, path)
+            except OSError as exc:
+                logger.debug(f"Render disk cache write failed: {exc}")
+                temp_path.unlink(missing_ok=True)
+                return
+
+            self._total_bytes += len(data) - index.pop(name, 0)
+            index[name] = len(data)
+
+            while self._total_bytes > self.max_bytes and len(index) > 1:
+                old_name, old_size = index.popitem(last=False)
+                self._total_bytes -= old_size
+                try:
+                    (self.cache_dir / old_name).unlink()
+                except OSError:
+                    pass
+
+    def _remove(self, name: str) -> None:
+        """Remove a single entry from index and disk."""
+        with self._lock:
+            index = self._ensure_index()
+            self._total_bytes -= index.pop(name, 0)
+        try:
+            (self.cache_dir / name).unlink()
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        """Delete all cached entries."""
+        with self._lock:
+            index = self._ensure_index()
+            for name in index:
+                try:
+                    (self.cache_dir / name).unlink()
+                except OSError:
+                    pass
+            index.clear()
+            self._total_bytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def get_stats(self) -> dict[str, int | float]:
+        """
+        Get disk cache statistics.
+
+        Returns:
+            Dictionary with entries, bytes, hits, misses, hit_rate
+        """
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "entries": len(self._index) if self._index is not None else 0,
+                "bytes": self._total_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / total * 100, 2) if total > 0 else 0.0,
+            }
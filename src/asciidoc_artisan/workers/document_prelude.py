@@ -0,0 +1,132 @@
+"""
+Document Prelude - Carry document context into standalone block renders.
+
+MA principle: ~150 lines focused on per-block rendering context.
+
+Each block is rendered as its own AsciiDoc document, so without help it
+loses everything defined before it. This module restores that context
+cheaply:
+- Attribute entries (:imagesdir:, :toc:, custom {attr} values) seen in
+  earlier blocks are prepended to each block as a "prelude"
+- The prelude hash becomes part of the block's cache key
+- Section numbers (:numbered:) are computed across blocks and patched
+  into the rendered heading, so numbering never invalidates the cache
+
+Footnotes need no prelude: the html5 backend emits them inline and
+numbers them client-side across the whole page.
+
+Example:
+    blocks = DocumentBlockSplitter.split(source)
+    assign_preludes(blocks, numbered=False)
+    source = blocks[3].render_source()   # prelude + block content
+    html = apply_section_number(blocks[3], rendered_html)
+"""
+
+import hashlib
+import re
+
+from asciidoc_artisan.workers.block_splitter import DocumentBlock
+
+# Attribute entry lines: ":name: value", ":name!:", ":!name:"
+ATTRIBUTE_ENTRY_PATTERN = re.compile(r"^:!?[A-Za-z0-9_][\w-]*!?:.*$", re.MULTILINE)
+
+# Attribute that turns on section numbering in asciidoc3
+NUMBERED_ATTRIBUTE = "numbered"
+
+# Hash length for prelude part of cache keys
+PRELUDE_HASH_LENGTH = 8
+
+# Deepest section level numbered by asciidoc3 (===== is level 4)
+MAX_SECTION_LEVEL = 4
+
+
+def extract_attribute_lines(content: str) -> list[str]:
+    """
+    Extract attribute entry lines from block content.
+
+    Args:
+        content: Raw block source
+
+    Returns:
+        Attribute entry lines in document order
+    """
+    if ":" not in content:
+        return []
+    return ATTRIBUTE_ENTRY_PATTERN.findall(content)
+
+
+def _numbered_after(lines: list[str], numbered: bool) -> bool:
+    """Apply :numbered: set/unset entries to the numbering state."""
+    for line in lines:
+        name = line[1 : line.index(":", 1)]
+        if name == NUMBERED_ATTRIBUTE:
+            numbered = True
+        elif name in (f"{NUMBERED_ATTRIBUTE}!", f"!{NUMBERED_ATTRIBUTE}"):
+            numbered = False
+    return numbered
+
+
+def _standalone_number(level: int) -> str:
+    """Section number asciidoc3 gives the only section of a document."""
+    return "0." * (level - 1) + "1."
+
+
+def assign_preludes(blocks: list[DocumentBlock], numbered: bool = False) -> None:
+    """
+    Assign prelude, prelude hash and section number to every block.
+
+    Blocks whose prelude changed since the last call get rendered_html
+    reset to None so callers re-render (or re-fetch from cache) them.
+    Attribute lines are extracted once per block and remembered.
+
+    Args:
+        blocks: Blocks in document order
+        numbered: Whether numbering is on before the first block
+            (e.g. "numbered" set on the AsciiDoc API)
+    """
+    entries: list[str] = []
+    prelude = ""
+    prelude_hash = ""
+    numbers = [0] * (MAX_SECTION_LEVEL + 1)
+
+    for block in blocks:
+        if block.prelude_hash != prelude_hash:
+            block.prelude = prelude
+            block.prelude_hash = prelude_hash
+            block.rendered_html = None
+
+        # asciidoc3 level: "==" is level 1 (block.level counts '=' characters)
+        level = block.level - 1
+        if numbered and 1 <= level <= MAX_SECTION_LEVEL:
+            numbers[level] += 1
+            numbers[level + 1 :] = [0] * (MAX_SECTION_LEVEL - level)
+            block.section_number = "".join(f"{n}." for n in numbers[1 : level + 1])
+        else:
+            block.section_number = ""
+
+        if block.attribute_lines is None:
+            block.attribute_lines = extract_attribute_lines(block.content)
+        if block.attribute_lines:
+            entries.extend(block.attribute_lines)
+            numbered = _numbered_after(block.attribute_lines, numbered)
+            prelude = "\n".join(entries) + "\n\n"
+            prelude_hash = hashlib.md5(prelude.encode("utf-8")).hexdigest()[:PRELUDE_HASH_LENGTH]
+
+
+def apply_section_number(block: DocumentBlock, html: str) -> str:
+    """
+    Replace the standalone section number with the document-wide one.
+
+    Args:
+        block: Block with section_number from assign_preludes()
+        html: HTML rendered from block.render_source()
+
+    Returns:
+        HTML with corrected heading number
+    """
+    if not block.section_number:
+        return html
+    standalone = _standalone_number(block.level - 1)
+    if standalone == block.section_number:
+        return html
+    return html.replace(f">{standalone} ", f">{block.section_number} ", 1)
@@ -229,6 +229,7 @@ class GitWorker(BaseWorker):
         """
         Get detailed status (branch, file lists with line counts) and emit detailed_status_ready.
 
+        Status and line counts run in one round-trip; status_ready is emitted as well.
         Emits Dict with branch/modified/staged/untracked. Non-blocking, 5s timeout, shell=False.
         """
         if self._check_cancellation():
@@ -242,6 +243,9 @@ class GitWorker(BaseWorker):
             if not status_result:
                 return
 
+            # Same porcelain output as get_repository_status: refresh the status bar too
+            self.status_ready.emit(self._parse_git_status_v2(status_result.stdout))
+
             # Parse and enrich file lists
             branch, modified_files, staged_files, untracked_files = self._parse_detailed_status_v2(status_result.stdout)
 
@@ -41,9 +41,9 @@ from asciidoc_artisan.workers.pandoc_executor import PandocExecutor
 
 # Import metrics
 try:
-    from asciidoc_artisan.core.metrics import get_metrics_collector
+    from asciidoc_artisan.core.metrics import INSTRUMENTATION_ENABLED, get_metrics_collector
 
-    METRICS_AVAILABLE = True
+    METRICS_AVAILABLE = INSTRUMENTATION_ENABLED
 except ImportError:
     get_metrics_collector = None  # type: ignore[assignment]
     METRICS_AVAILABLE = False
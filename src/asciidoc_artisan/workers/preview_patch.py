@@ -0,0 +1,71 @@
+"""
+Preview Patch - Per-block DOM patches for live preview updates.
+
+MA principle: ~90 lines focused on block anchoring and patch diffing.
+
+Reloading the whole preview page on every keystroke re-parses all HTML,
+resets JavaScript state and costs hundreds of milliseconds on large
+documents. Instead, each rendered block is wrapped in an anchor element
+and only blocks whose HTML changed are sent to the preview:
+- Anchors: <div class="adoc-block" id="adoc-block-N"> per block
+- Patches: (anchor id, new block HTML) tuples
+- None instead of patches when the block structure changed (full reload)
+
+Example:
+    patches = diff_block_html(previous_parts, current_parts)
+    if patches is None:
+        preview.setHtml(wrap_blocks(current_parts))
+    else:
+        apply(patches)  # replace innerHTML of each anchor
+"""
+
+# Patch protocol: (anchor element id, new inner HTML)
+BlockPatch = tuple[str, str]
+
+# Anchor element id prefix (suffix is the block position)
+BLOCK_ANCHOR_PREFIX = "adoc-block-"
+
+# CSS class of anchor elements
+BLOCK_ANCHOR_CLASS = "adoc-block"
+
+
+def block_anchor_id(index: int) -> str:
+    """Anchor element id for the block at a position."""
+    return f"{BLOCK_ANCHOR_PREFIX}{index}"
+
+
+def wrap_blocks(parts: list[str]) -> str:
+    """
+    Join block HTML with one anchor element per block.
+
+    Args:
+        parts: Rendered HTML of each block in document order
+
+    Returns:
+        Document HTML body
+    """
+    return "\n".join(
+        f'<div class="{BLOCK_ANCHOR_CLASS}" id="{block_anchor_id(index)}">{part}</div>'
+        for index, part in enumerate(parts)
+    )
+
+
+def diff_block_html(previous: list[str] | None, current: list[str]) -> list[BlockPatch] | None:
+    """
+    Compute patches turning the previous blocks into the current ones.
+
+    Args:
+        previous: Block HTML shown in the preview (None = unknown)
+        current: Newly rendered block HTML
+
+    Returns:
+        Patches for changed blocks (empty when nothing changed), or None
+        when the block structure changed and the page must be reloaded
+    """
+    if previous is None or len(previous) != len(current):
+        return None
+    return [
+        (block_anchor_id(index), part)
+        for index, (old_part, part) in enumerate(zip(previous, current, strict=True))
+        if part != old_part
+    ]
@@ -24,16 +24,16 @@ from typing import Any
 
 from PySide6.QtCore import QObject, Signal, Slot
 
-# Check for AsciiDoc3 availability
-try:
-    from asciidoc3 import asciidoc3
-    from asciidoc3.asciidoc3api import AsciiDoc3API
+# AsciiDoc3 is imported on the preview thread by initialize_asciidoc()
+# (see _load_asciidoc3), so creating the main window does not wait for it.
+# ASCIIDOC3_AVAILABLE stays None until the first import attempt.
+asciidoc3: Any = None
+AsciiDoc3API: Any = None
+ASCIIDOC3_AVAILABLE: bool | None = None
 
-    ASCIIDOC3_AVAILABLE = True
-except ImportError:
-    asciidoc3 = None
-    AsciiDoc3API = None
-    ASCIIDOC3_AVAILABLE = False
+# Tiny document rendered once after initialization, so asciidoc3 loads its
+# configuration and backend before the first real preview request
+WARM_UP_SOURCE = "= Warm-up\n\n== Section\n\nText with *bold* and `code`.\n"
 
 # Import incremental renderer
 try:
@@ -44,6 +44,19 @@ except ImportError:
     IncrementalPreviewRenderer = None  # type: ignore[assignment, misc]
     INCREMENTAL_RENDERER_AVAILABLE = False
 
+# Import persistent render cache
+try:
+    from asciidoc_artisan.workers.disk_render_cache import (
+        DiskBlockCache,
+        compute_render_fingerprint,
+    )
+
+    DISK_CACHE_AVAILABLE = True
+except ImportError:
+    DiskBlockCache = None  # type: ignore[assignment, misc]
+    compute_render_fingerprint = None  # type: ignore[assignment]
+    DISK_CACHE_AVAILABLE = False
+
 # Import predictive renderer (v1.6.0)
 try:
     from asciidoc_artisan.workers.predictive_renderer import (
@@ -59,9 +72,9 @@ except ImportError:
 
 # Import metrics
 try:
-    from asciidoc_artisan.core.metrics import get_metrics_collector
+    from asciidoc_artisan.core.metrics import INSTRUMENTATION_ENABLED, get_metrics_collector
 
-    METRICS_AVAILABLE = True
+    METRICS_AVAILABLE = INSTRUMENTATION_ENABLED
 except ImportError:
     get_metrics_collector = None  # type: ignore[assignment]
     METRICS_AVAILABLE = False
@@ -69,6 +82,27 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+def _load_asciidoc3() -> bool:
+    """
+    Import asciidoc3 on first call (runs on the preview thread).
+
+    Returns:
+        True if asciidoc3 is available
+    """
+    global asciidoc3, AsciiDoc3API, ASCIIDOC3_AVAILABLE
+    if ASCIIDOC3_AVAILABLE is None and AsciiDoc3API is None:
+        try:
+            from asciidoc3 import asciidoc3 as module
+            from asciidoc3.asciidoc3api import AsciiDoc3API as api_class
+
+            asciidoc3, AsciiDoc3API = module, api_class
+            ASCIIDOC3_AVAILABLE = True
+        except ImportError:
+            ASCIIDOC3_AVAILABLE = False
+            logger.warning("PreviewWorker: AsciiDoc3 not available")
+    return ASCIIDOC3_AVAILABLE is not False and AsciiDoc3API is not None
+
+
 class PreviewWorker(QObject):
     """
     Worker thread for rendering AsciiDoc preview without blocking UI.
@@ -82,6 +116,9 @@ class PreviewWorker(QObject):
     Signals:
         render_complete(str): Emitted with HTML content on successful render
         render_error(str): Emitted with error HTML on render failure
+        render_patch(str, object): Emitted instead of render_complete when
+            patch updates are enabled: anchored HTML plus per-block patches
+            (None when the preview must be reloaded)
 
     Example:
         ```python
@@ -90,7 +127,7 @@ class PreviewWorker(QObject):
         preview_worker.moveToThread(preview_thread)
         preview_thread.start()
 
-        preview_worker.initialize_asciidoc(asciidoc3.__file__)
+        preview_thread.started.connect(preview_worker.initialize_asciidoc)
         preview_worker.render_complete.connect(self._update_preview)
         preview_worker.render_preview("= My Document\\n\\nContent here")
         ```
@@ -98,6 +135,7 @@ class PreviewWorker(QObject):
 
     render_complete = Signal(str)
     render_error = Signal(str)
+    render_patch = Signal(str, object)
     ready = Signal()  # Emitted when worker is fully initialized and ready
 
     def __init__(self) -> None:
@@ -106,18 +144,23 @@ class PreviewWorker(QObject):
         self._asciidoc_api: Any | None = None
         self._incremental_renderer: Any | None = None
         self._use_incremental = True  # Enable incremental rendering by default
+        self._use_disk_cache = True  # Persist rendered blocks across restarts
+        self._use_patches = False  # Emit render_patch (preview applies DOM patches)
         self._predictive_renderer: Any | None = None  # v1.6.0: Predictive rendering
         self._use_predictive = True  # Enable predictive rendering by default
 
-    def initialize_asciidoc(self, asciidoc_module_file: str) -> None:
+    def initialize_asciidoc(self, asciidoc_module_file: str | None = None) -> None:
         """
-        Initialize AsciiDoc API in worker thread.
+        Import asciidoc3 and initialize AsciiDoc API in worker thread.
 
-        Must be called after worker is moved to thread, before any rendering.
-        Configures AsciiDoc attributes for optimal preview rendering.
+        Must be called after worker is moved to thread, before any rendering
+        (connect it to QThread.started: requests queued meanwhile run after it).
+        Configures AsciiDoc attributes for optimal preview rendering, then
+        renders WARM_UP_SOURCE so the first preview does not pay for
+        asciidoc3's own lazy loading.
 
         Args:
-            asciidoc_module_file: Path to asciidoc3 module (from asciidoc3.__file__)
+            asciidoc_module_file: Path to asciidoc3 module (default: asciidoc3.__file__)
 
         Configured Attributes:
             - icons: font (use Font Awesome icons)
@@ -131,9 +174,10 @@ class PreviewWorker(QObject):
             Uses --no-header-footer option to render body content only,
             allowing main window to provide HTML wrapper with styles.
         """
-        if ASCIIDOC3_AVAILABLE and AsciiDoc3API and asciidoc3:
+        if _load_asciidoc3():
             try:
-                self._asciidoc_api = AsciiDoc3API(asciidoc_module_file)
+                start_time = time.perf_counter()
+                self._asciidoc_api = AsciiDoc3API(asciidoc_module_file or asciidoc3.__file__)
 
                 # Render body only (main window provides HTML wrapper)
                 self._asciidoc_api.options("--no-header-footer")
@@ -148,7 +192,9 @@ class PreviewWorker(QObject):
 
                 # Initialize incremental renderer if available
                 if INCREMENTAL_RENDERER_AVAILABLE and IncrementalPreviewRenderer:  # type: ignore[truthy-function]
-                    self._incremental_renderer = IncrementalPreviewRenderer(self._asciidoc_api)
+                    self._incremental_renderer = IncrementalPreviewRenderer(
+                        self._asciidoc_api, disk_cache=self._create_disk_cache()
+                    )
                     logger.debug("PreviewWorker: Incremental renderer initialized")
 
                     # Initialize predictive renderer if available (v1.6.0)
@@ -156,7 +202,10 @@ class PreviewWorker(QObject):
                         self._predictive_renderer = PredictivePreviewRenderer(self._incremental_renderer)
                         logger.debug("PreviewWorker: Predictive renderer initialized")
 
-                logger.debug("PreviewWorker: AsciiDoc API initialized")
+                self._warm_up()
+                logger.info(
+                    f"PreviewWorker: AsciiDoc API initialized in {(time.perf_counter() - start_time) * 1000:.0f}ms"
+                )
 
                 # Emit ready signal to indicate worker is fully initialized
                 self.ready.emit()
@@ -165,8 +214,26 @@ class PreviewWorker(QObject):
                 # Emit ready signal even on error so app doesn't hang waiting
                 self.ready.emit()
 
-    @Slot(str)
-    def render_preview(self, source_text: str) -> None:
+    def _warm_up(self) -> None:
+        """Render WARM_UP_SOURCE once and discard it (failures only logged)."""
+        try:
+            api: Any = self._asciidoc_api
+            api.execute(io.StringIO(WARM_UP_SOURCE), io.StringIO(), backend="html5")
+        except Exception as exc:
+            logger.warning(f"PreviewWorker: Warm-up render failed: {exc}")
+
+    def _create_disk_cache(self) -> Any | None:
+        """Create persistent block cache for the configured API (None if disabled)."""
+        if not self._use_disk_cache or not DISK_CACHE_AVAILABLE or DiskBlockCache is None:
+            return None
+        try:
+            return DiskBlockCache(fingerprint=compute_render_fingerprint(self._asciidoc_api))
+        except Exception as exc:
+            logger.warning(f"PreviewWorker: Disk render cache unavailable: {exc}")
+            return None
+
+    @Slot(str, object)
+    def render_preview(self, source_text: str, line_index: Any | None = None) -> None:
         """
         Render AsciiDoc source to HTML in background thread.
 
@@ -177,6 +244,7 @@ class PreviewWorker(QObject):
 
         Args:
             source_text: AsciiDoc source content to render
+            line_index: Shared LineIndex of source_text (optional, saves a newline scan)
 
         Emits:
             render_complete(str): HTML content on successful render
@@ -194,8 +262,28 @@ class PreviewWorker(QObject):
             Main window handles debouncing (350ms delay, FR-004)
             Metrics tracked: preview_render_full, preview_render_incremental
         """
+        self._render(source_text, None, line_index)
+
+    @Slot(str, object, object)
+    def render_preview_edit(self, source_text: str, edit: Any, line_index: Any | None = None) -> None:
+        """
+        Render AsciiDoc source using the editor's change range.
+
+        Same as render_preview, but the incremental renderer only re-splits
+        the blocks touched by the edit instead of the whole document.
+
+        Args:
+            source_text: AsciiDoc source content to render
+            edit: EditRange relative to the previously rendered text
+            line_index: Shared LineIndex of source_text (optional)
+        """
+        self._render(source_text, edit, line_index)
+
+    def _render(self, source_text: str, edit: Any | None, line_index: Any | None = None) -> None:
+        """Render source (shared by render_preview and render_preview_edit)."""
         start_time = time.perf_counter()
         render_type = "full"
+        patches: list[Any] | None = None
 
         try:
             if self._asciidoc_api is None:
@@ -210,10 +298,17 @@ class PreviewWorker(QObject):
                 self._use_incremental and self._incremental_renderer is not None and len(source_text) > 300
             ):  # Aggressive threshold for maximum performance
                 render_type = "incremental"
-                html_body = self._incremental_renderer.render(source_text)
+                if self._use_patches:
+                    html_body, patches = self._incremental_renderer.render_with_patches(
+                        source_text, edit, line_index=line_index
+                    )
+                else:
+                    html_body = self._incremental_renderer.render(source_text, edit=edit, line_index=line_index)
                 logger.debug("PreviewWorker: Incremental rendering successful")
             else:
-                # Full render for small documents
+                # Full render for small documents (block layout goes stale)
+                if self._incremental_renderer is not None:
+                    self._incremental_renderer.forget_layout()
                 infile = io.StringIO(source_text)
                 outfile = io.StringIO()
                 self._asciidoc_api.execute(infile, outfile, backend="html5")
@@ -226,7 +321,10 @@ class PreviewWorker(QObject):
                 metrics = get_metrics_collector()
                 metrics.record_operation(f"preview_render_{render_type}", duration_ms)
 
-            self.render_complete.emit(html_body)
+            if self._use_patches and render_type == "incremental":
+                self.render_patch.emit(html_body, patches)
+            else:
+                self.render_complete.emit(html_body)
 
         except Exception as exc:
             # Render error as HTML for display in preview pane
@@ -246,6 +344,32 @@ class PreviewWorker(QObject):
             self._incremental_renderer.enable(enabled)
         logger.info(f"Incremental rendering {'enabled' if enabled else 'disabled'}")
 
+    def set_patch_updates(self, enabled: bool) -> None:
+        """
+        Enable or disable per-block patch updates (render_patch signal).
+
+        Only enable when render_patch is connected to the preview.
+
+        Args:
+            enabled: True to emit render_patch for incremental renders
+        """
+        self._use_patches = enabled
+        if self._incremental_renderer is not None:
+            self._incremental_renderer.forget_layout()
+        logger.info(f"Preview patch updates {'enabled' if enabled else 'disabled'}")
+
+    def set_disk_cache(self, enabled: bool) -> None:
+        """
+        Enable or disable the persistent on-disk render cache.
+
+        Args:
+            enabled: True to enable, False to disable
+        """
+        self._use_disk_cache = enabled
+        if self._incremental_renderer:
+            self._incremental_renderer.cache.disk_cache = self._create_disk_cache() if enabled else None
+        logger.info(f"Disk render cache {'enabled' if enabled else 'disabled'}")
+
     def set_predictive_rendering(self, enabled: bool) -> None:
         """
         Enable or disable predictive rendering (v1.6.0).
@@ -268,7 +392,7 @@ class PreviewWorker(QObject):
         if self._predictive_renderer:
             self._predictive_renderer.update_cursor_position(line_number)
 
-    def request_prediction(self, source_text: str, cursor_line: int) -> None:
+    def request_prediction(self, source_text: str, cursor_line: int, line_index: Any | None = None) -> None:
         """
         Request predictive pre-rendering during debounce period (v1.6.0).
 
@@ -278,20 +402,23 @@ class PreviewWorker(QObject):
         Args:
             source_text: Current document text
             cursor_line: Current cursor line number (0-indexed)
+            line_index: Shared LineIndex of source_text (optional)
         """
         if not self._use_predictive or not self._predictive_renderer:
             return
 
         try:
             # Import block splitter
+            from asciidoc_artisan.workers.document_prelude import assign_preludes
             from asciidoc_artisan.workers.incremental_renderer import (
                 DocumentBlockSplitter,
             )
 
-            # Split document into blocks
-            blocks = DocumentBlockSplitter.split(source_text)
+            # Split document into blocks (preludes make cache keys match the renderer)
+            blocks = DocumentBlockSplitter.split(source_text, line_index)
             if not blocks:
                 return
+            assign_preludes(blocks)
 
             # Find block containing cursor line
             current_block_index = 0
@@ -339,7 +466,7 @@ class PreviewWorker(QObject):
                 block = blocks[block_index]
 
                 # Skip if already cached
-                if self._incremental_renderer.cache.get(block.id) is not None:
+                if self._incremental_renderer.cache.get(block.cache_key()) is not None:
                     logger.debug(f"Block {block_index} already cached, skipping")
                     continue
 
@@ -347,7 +474,7 @@ class PreviewWorker(QObject):
                 rendered_html = self._incremental_renderer._render_block(block)
 
                 # Cache it for later use
-                self._incremental_renderer.cache.put(block.id, rendered_html)
+                self._incremental_renderer.cache.put(block.cache_key(), rendered_html)
 
                 # Record prediction was used
                 self._predictive_renderer.predictor.record_prediction_used(block_index)
@@ -0,0 +1,220 @@
+"""
+Process Block Renderer - Process-pool backend for parallel block rendering.
+
+MA principle: ~200 lines focused on cross-process rendering.
+
+AsciiDoc3API.execute is pure-Python CPU work and keeps its parser state in
+module globals, so threads serialize on the GIL. This backend renders blocks
+in worker processes instead:
+- Warm workers: each process builds one AsciiDoc3API at startup and reuses it
+- Compact payloads: (index, content) tuples in, (index, html) tuples out
+- Size-balanced batches: one round-trip per worker per render
+- Spawn start method: never forks a process that owns Qt threads
+
+Example:
+    backend = ProcessBlockRenderer(api_config, max_workers=4)
+    backend.warm_up()
+    results = backend.render_payload([(0, "== A"), (1, "== B")])
+    # {0: "<div ...>", 1: "<div ...>"}
+"""
+
+import html
+import io
+import logging
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Block payload protocol: (block_index, asciidoc_source) -> (block_index, html)
+BlockPayload = tuple[int, str]
+BlockResult = tuple[int, str]
+
+# Per-process AsciiDoc API (created once by _init_worker)
+_worker_api: Any = None
+
+
+def build_api_config(asciidoc_api: Any) -> dict[str, Any]:
+    """
+    Extract a picklable configuration from an AsciiDoc3API instance.
+
+    Args:
+        asciidoc_api: Template API (options and attributes are copied)
+
+    Returns:
+        Dictionary with module path, options and attributes
+    """
+    options = getattr(getattr(asciidoc_api, "options", None), "values", [])
+    attributes = getattr(asciidoc_api, "attributes", {})
+    return {
+        "module_file": getattr(asciidoc_api, "cmd", None),
+        "options": [tuple(opt) for opt in options if isinstance(opt, tuple | list)],
+        "attributes": dict(attributes) if isinstance(attributes, dict) else {},
+    }
+
+
+def _init_worker(api_config: dict[str, Any]) -> None:
+    """Create the per-process AsciiDoc API (runs once in each worker)."""
+    global _worker_api
+
+    try:
+        from asciidoc3 import asciidoc3
+        from asciidoc3.asciidoc3api import AsciiDoc3API
+
+        api = AsciiDoc3API(api_config.get("module_file") or asciidoc3.__file__)
+        for name, value in api_config.get("options", []):
+            api.options(name, value)
+        api.attributes.update(api_config.get("attributes", {}))
+        _worker_api = api
+    except Exception as exc:
+        logger.warning(f"Render worker failed to create AsciiDoc API: {exc}")
+        _worker_api = None
+
+
+def _warm_up() -> bool:
+    """Render a tiny document so the first real render skips lazy setup."""
+    if _worker_api is None:
+        return False
+    _render_batch([(0, "= Warm-up\n\nwarm")])
+    return True
+
+
+def _render_batch(payload: list[BlockPayload]) -> list[BlockResult]:
+    """Render a batch of blocks with the per-process API."""
+    results: list[BlockResult] = []
+    for index, content in payload:
+        try:
+            if _worker_api is None:
+                raise RuntimeError("AsciiDoc API unavailable in render worker")
+            outfile = io.StringIO()
+            _worker_api.execute(io.StringIO(content), outfile, backend="html5")
+            results.append((index, outfile.getvalue()))
+        except Exception as exc:
+            logger.warning(f"Block {index} render failed in worker: {exc}")
+            results.append((index, f"<pre>{html.escape(content)}</pre>"))
+    return results
+
+
+def balance_batches(payload: list[BlockPayload], batch_count: int) -> list[list[BlockPayload]]:
+    """
+    Split payload into batches of similar total size (largest block first).
+
+    Args:
+        payload: Blocks to distribute
+        batch_count: Number of batches (usually the worker count)
+
+    Returns:
+        Non-empty batches
+    """
+    batch_count = max(1, min(batch_count, len(payload)))
+    batches: list[list[BlockPayload]] = [[] for _ in range(batch_count)]
+    loads = [0] * batch_count
+
+    for item in sorted(payload, key=lambda p: len(p[1]), reverse=True):
+        target = loads.index(min(loads))
+        batches[target].append(item)
+        loads[target] += len(item[1])
+
+    return [batch for batch in batches if batch]
+
+
+class ProcessBlockRenderer:
+    """
+    Renders block payloads in a pool of warm worker processes.
+
+    The pool starts lazily and reports itself ready only after every worker
+    has finished its warm-up render, so callers can keep using threads while
+    processes spawn.
+    """
+
+    # Seconds to wait for one batch before giving up on it
+    BATCH_TIMEOUT = 30.0
+
+    def __init__(self, api_config: dict[str, Any], max_workers: int) -> None:
+        """
+        Initialize process backend (no processes are started yet).
+
+        Args:
+            api_config: Picklable API configuration from build_api_config()
+            max_workers: Number of worker processes
+        """
+        self._api_config = api_config
+        self._max_workers = max(1, max_workers)
+        self._executor: ProcessPoolExecutor | None = None
+        self._warm_futures: list[Future[bool]] = []
+        self._broken = False
+
+    def warm_up(self) -> None:
+        """Start worker processes and queue one warm-up render per worker."""
+        if self._executor is not None or self._broken:
+            return
+
+        try:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self._api_config,),
+            )
+            self._warm_futures = [self._executor.submit(_warm_up) for _ in range(self._max_workers)]
+            logger.info(f"ProcessBlockRenderer warming {self._max_workers} workers")
+        except Exception as exc:
+            logger.warning(f"Process pool unavailable, using threads only: {exc}")
+            self._broken = True
+            self._executor = None
+
+    def is_ready(self) -> bool:
+        """Check if all workers are up and warmed."""
+        if self._executor is None or self._broken:
+            return False
+        return all(f.done() and not f.exception() and f.result() for f in self._warm_futures)
+
+    def is_available(self) -> bool:
+        """Check if the backend can still be used (not broken)."""
+        return not self._broken
+
+    def render_payload(self, payload: list[BlockPayload]) -> dict[int, str]:
+        """
+        Render payload across worker processes.
+
+        Args:
+            payload: (index, content) tuples
+
+        Returns:
+            Mapping of block index to rendered HTML
+
+        Raises:
+            RuntimeError: If the pool is not running or a worker died
+        """
+        if self._executor is None:
+            raise RuntimeError("Process pool not started")
+
+        try:
+            futures = [
+                self._executor.submit(_render_batch, batch) for batch in balance_batches(payload, self._max_workers)
+            ]
+            results: dict[int, str] = {}
+            for future in futures:
+                results.update(future.result(timeout=self.BATCH_TIMEOUT))
+            return results
+        except Exception as exc:
+            # A dead worker breaks the whole pool - stop using it
+            logger.error(f"Process render failed, disabling process backend: {exc}")
+            self.shutdown()
+            self._broken = True
+            raise RuntimeError(str(exc)) from exc
+
+    def update_config(self, api_config: dict[str, Any]) -> None:
+        """Restart workers on next warm_up() if API configuration changed."""
+        if api_config != self._api_config:
+            self._api_config = api_config
+            self.shutdown()
+
+    def shutdown(self) -> None:
+        """Stop worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._warm_futures = []
+            logger.info("ProcessBlockRenderer shutdown complete")
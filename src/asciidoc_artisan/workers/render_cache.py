@@ -6,6 +6,7 @@ MA principle: Extracted from incremental_renderer.py for focused responsibility.
 
 Features:
 - Thread-safe LRU cache with automatic eviction
+- Optional persistent disk tier (disk_render_cache.py)
 - String interning for common tokens (reduces memory)
 - Cache statistics tracking
 
@@ -20,6 +21,7 @@ import logging
 import sys
 import threading
 from collections import OrderedDict
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -157,16 +159,21 @@ class BlockCache:
     Stores rendered HTML for document blocks with automatic eviction
     when cache size exceeds MAX_CACHE_SIZE. Uses threading.Lock to
     prevent race conditions during concurrent access from worker threads.
+
+    With a disk_cache, memory misses fall through to disk (hits are
+    promoted to memory) and every put is written through.
     """
 
-    def __init__(self, max_size: int = MAX_CACHE_SIZE):
+    def __init__(self, max_size: int = MAX_CACHE_SIZE, disk_cache: Any | None = None):
         """
         Initialize block cache with thread-safe locking.
 
         Args:
             max_size: Maximum number of blocks to cache
+            disk_cache: Optional DiskBlockCache used as persistent second tier
         """
         self.max_size = max_size
+        self.disk_cache = disk_cache
         self._cache: OrderedDict[str, str] = OrderedDict()
         self._lock = threading.Lock()
         self._hits = 0
@@ -189,8 +196,17 @@ class BlockCache:
                 self._hits += 1
                 return self._cache[block_id]
 
-            self._misses += 1
-            return None
+        # Disk I/O outside the lock
+        html = self.disk_cache.get(block_id) if self.disk_cache is not None else None
+
+        with self._lock:
+            if html is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._store(block_id, html)
+            return html
 
     def put(self, block_id: str, html: str) -> None:
         """
@@ -201,16 +217,23 @@ class BlockCache:
             html: Rendered HTML
         """
         with self._lock:
-            # Remove if already exists (will re-add at end)
-            if block_id in self._cache:
-                del self._cache[block_id]
+            self._store(block_id, html)
+
+        if self.disk_cache is not None:
+            self.disk_cache.put(block_id, html)
+
+    def _store(self, block_id: str, html: str) -> None:
+        """Insert into memory tier and evict (called with lock held)."""
+        # Remove if already exists (will re-add at end)
+        if block_id in self._cache:
+            del self._cache[block_id]
 
-            # Add to end (most recently used)
-            self._cache[block_id] = html
+        # Add to end (most recently used)
+        self._cache[block_id] = html
 
-            # Evict oldest if over size limit
-            while len(self._cache) > self.max_size:
-                self._cache.popitem(last=False)
+        # Evict oldest if over size limit
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
 
     def clear(self) -> None:
         """Clear all cached blocks and trigger garbage collection (thread-safe)."""
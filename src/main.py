@@ -7,6 +7,7 @@ Supports async/await via qasync for non-blocking file operations.
 
 import asyncio
 import logging
+import multiprocessing
 import os
 import platform
 import sys
@@ -289,4 +290,6 @@ def main() -> None:  # noqa: C901
 
 
 if __name__ == "__main__":
+    # Frozen (PyInstaller) builds: run spawned render workers instead of the GUI
+    multiprocessing.freeze_support()
     main()
@@ -116,6 +116,17 @@ The end.
 """
 
 
+@pytest.fixture(scope="session", autouse=True)
+def isolate_render_disk_cache(tmp_path_factory):
+    """Keep the persistent render cache out of the user's home directory."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "asciidoc_artisan.workers.disk_render_cache.DISK_CACHE_DIR",
+            tmp_path_factory.mktemp("render_cache"),
+        )
+        yield
+
+
 @pytest.fixture(autouse=True)
 def prevent_dialog_blocking(monkeypatch):
     """
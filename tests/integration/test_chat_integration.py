@@ -54,7 +54,8 @@ class TestChatIntegration:
         assert main_window.chat_manager is not None
 
     def test_ollama_worker_exists(self, main_window):
-        """Test that Ollama chat worker is created."""
+        """Test that Ollama chat worker is created on demand."""
+        main_window.worker_manager.start_worker("ollama_chat")
         assert hasattr(main_window, "ollama_chat_worker")
         assert hasattr(main_window, "ollama_chat_thread")
         assert main_window.ollama_chat_worker is not None
@@ -204,6 +205,8 @@ class TestChatWorkerIntegration:
 
         from asciidoc_artisan.core.models import ChatMessage
 
+        main_window.worker_manager.start_worker("ollama_chat")
+
         # Worker should emit signals that ChatManager receives
         # Signal signature changed: now expects ChatMessage object only
         with qtbot.waitSignal(main_window.ollama_chat_worker.chat_response_ready, timeout=100) as blocker:
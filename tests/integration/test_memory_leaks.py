@@ -173,13 +173,13 @@ def test_metrics_collector_ring_buffer():
     for i in range(100_000):
         collector.record_operation("test_op", float(i))
 
-    # Should have bounded memory (ring buffer of 1000 entries)
+    # Should have bounded memory (quantile sketch buckets)
     stats = collector.get_operation_stats("test_op")
     assert stats["count"] == 100_000  # Count is tracked
 
-    # But durations are limited to buffer size
+    # But duration storage is limited to the sketch buckets
     op_metrics = collector.operations["test_op"]
-    assert len(op_metrics.durations) <= 1000, "Ring buffer should limit duration storage"
+    assert op_metrics.sketch.bucket_count() <= op_metrics.sketch.max_buckets, "Sketch should limit duration storage"
 
 
 @pytest.mark.memory
@@ -484,7 +484,7 @@ def test_metrics_collector_bounded_operations():
 
     # Each operation should have bounded history
     for op_name, op_metrics in collector.operations.items():
-        assert len(op_metrics.durations) <= 1000
+        assert op_metrics.sketch.bucket_count() <= op_metrics.sketch.max_buckets
 
 
 @pytest.mark.memory
@@ -520,7 +520,7 @@ class TestPreviewUpdate:
 
     def test_update_preview_signal(self, editor, qtbot):
         """Test preview update can be requested."""
-        with patch.object(editor.preview_worker, "render_preview"):
+        with patch.object(editor.worker_manager.start_worker("preview"), "render_preview"):
             editor.update_preview()
 
             # Request should be emitted
@@ -578,25 +578,28 @@ class TestWorkerThreads:
                 pass  # Thread already deleted
 
     def test_git_worker_exists(self, editor):
-        """Test Git worker is created."""
-        assert editor.git_worker is not None
+        """Test Git worker is created on demand."""
+        assert editor.worker_manager.start_worker("git") is editor.git_worker
 
     def test_pandoc_worker_exists(self, editor):
-        """Test Pandoc worker is created."""
-        assert editor.pandoc_worker is not None
+        """Test Pandoc worker is created on demand."""
+        assert editor.worker_manager.start_worker("pandoc") is editor.pandoc_worker
 
     def test_preview_worker_exists(self, editor):
-        """Test Preview worker is created."""
-        assert editor.preview_worker is not None
+        """Test Preview worker is created on demand."""
+        assert editor.worker_manager.start_worker("preview") is editor.preview_worker
 
     def test_git_thread_running(self, editor):
-        """Test Git thread is running."""
+        """Test Git thread is running once started."""
+        editor.worker_manager.start_worker("git")
         assert editor.git_thread.isRunning()
 
     def test_pandoc_thread_running(self, editor):
-        """Test Pandoc thread is running."""
+        """Test Pandoc thread is running once started."""
+        editor.worker_manager.start_worker("pandoc")
         assert editor.pandoc_thread.isRunning()
 
     def test_preview_thread_running(self, editor):
-        """Test Preview thread is running."""
+        """Test Preview thread is running once started."""
+        editor.worker_manager.start_worker("preview")
         assert editor.preview_thread.isRunning()
@@ -4,6 +4,8 @@ Profile application startup performance.
 This script measures:
 - Import time for all modules
 - Application initialization time
+- Time to first keystroke (window shown, typed key in the editor) and
+  time until the preview engine finished warming up in its thread
 - Memory usage during startup
 - Top time-consuming operations
 
@@ -106,7 +108,7 @@ def profile_application_init():
     app.setOrganizationName("AsciiDoc Artisan")
 
     # Create main window (but don't show it)
-    AsciiDocEditor()
+    window = AsciiDocEditor()
 
     end_time = time.perf_counter()
 
@@ -135,7 +137,8 @@ def profile_application_init():
     print(f"\nDetailed profile saved to: {profile_file}")
     print(f"View with: python -m pstats {profile_file}")
 
-    # Cleanup
+    # Cleanup before its first preview request starts a preview thread
+    _close_window(app, window)
     app.quit()
 
     return {
@@ -145,6 +148,80 @@ def profile_application_init():
     }
 
 
+def profile_first_keystroke(engine_timeout_s: float = 30.0):
+    """Measure time until the shown window accepts typing, and until the preview engine is ready."""
+    print("\n" + "=" * 80)
+    print("PROFILING TIME TO FIRST KEYSTROKE")
+    print("=" * 80)
+
+    import os
+
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+    from PySide6.QtCore import Qt
+    from PySide6.QtTest import QTest
+    from PySide6.QtWidgets import QApplication
+
+    from asciidoc_artisan.ui import AsciiDocEditor
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    start_time = time.perf_counter()
+    window = AsciiDocEditor()
+    window.show()
+    app.processEvents()
+    shown_time = time.perf_counter()
+
+    # The first preview request started the preview thread, which imports and
+    # warms up the AsciiDoc engine, then emits ready
+    ready_times: list[float] = []
+    worker = window.worker_manager.preview_worker
+    if worker is not None:
+        worker.ready.connect(lambda: ready_times.append(time.perf_counter()), Qt.ConnectionType.DirectConnection)
+
+    # The editor widget is attached to the window by UISetupManager
+    editor = getattr(window, "editor")
+    QTest.keyClick(editor, Qt.Key.Key_A)
+    app.processEvents()
+    keystroke_time = time.perf_counter()
+    accepted = editor.toPlainText().endswith("a")
+
+    deadline = keystroke_time + engine_timeout_s
+    while worker is not None and not ready_times and time.perf_counter() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+    engine_ready_ms = (ready_times[0] - start_time) * 1000 if ready_times else None
+
+    # asciidoc3 redirects sys.stdout while it renders: stop the preview thread first
+    _close_window(app, window)
+
+    results = {
+        "first_paint_ms": (shown_time - start_time) * 1000,
+        "first_keystroke_ms": (keystroke_time - start_time) * 1000,
+        "keystroke_accepted": accepted,
+        "engine_ready_ms": engine_ready_ms,
+    }
+
+    print(f"\nWindow Shown: {results['first_paint_ms']:.2f} ms")
+    print(f"First Keystroke: {results['first_keystroke_ms']:.2f} ms (accepted: {accepted})")
+    if engine_ready_ms is None:
+        print("Preview Engine Ready: not ready (asciidoc3 missing or timeout)")
+    else:
+        print(f"Preview Engine Ready: {engine_ready_ms:.2f} ms (background)")
+
+    return results
+
+
+def _close_window(app, window):
+    """Run a main window's pending startup timers, stop its worker threads and delete it."""
+    from PySide6.QtCore import QEvent
+
+    app.processEvents()
+    window.worker_manager.shutdown()
+    window.deleteLater()
+    app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+
 def profile_component_creation():
     """Profile individual component creation times."""
     print("\n" + "=" * 80)
@@ -213,6 +290,7 @@ def main():
     # Run profiling tests
     import_results = profile_imports()
     init_results = profile_application_init()
+    keystroke_results = profile_first_keystroke()
     profile_component_creation()
 
     # Summary
@@ -231,6 +309,9 @@ def main():
     print(f"  Time: {init_results['init_time_ms']:.2f} ms")
     print(f"  Memory: {init_results['memory_mb']:.2f} MB")
 
+    print("\nTime to First Keystroke:")
+    print(f"  Time: {keystroke_results['first_keystroke_ms']:.2f} ms")
+
     print("\nTotal Startup:")
     print(f"  Time: {total_import_time + init_results['init_time_ms']:.2f} ms")
     print(f"  Memory: {init_results['total_memory_mb']:.2f} MB")
@@ -103,7 +103,7 @@ class TestTelemetryCollectorInitialization:
 
     def test_telemetry_file_path(self, collector_enabled, temp_data_dir):
         """Test telemetry file path is correct."""
-        expected_path = temp_data_dir / "telemetry.toon"
+        expected_path = temp_data_dir / "telemetry-000001.jsonl"
         assert collector_enabled.telemetry_file == expected_path
 
 
@@ -207,7 +207,7 @@ class TestTelemetryCollectorBuffering:
     def test_flush_creates_file(self, collector_enabled):
         """Test flush creates telemetry file."""
         collector_enabled.track_event("test_event")
-        collector_enabled.flush()
+        collector_enabled.flush(wait=True)
 
         assert collector_enabled.telemetry_file.exists()
 
@@ -221,9 +221,10 @@ class TestTelemetryCollectorBuffering:
         collector_enabled.track_event("event_2", {"index": 2})
         collector_enabled.flush()
 
-        # Load events from file
+        # Load events from file (one JSON event per line)
+        collector_enabled.wait_for_writes()
         with open(collector_enabled.telemetry_file, "r", encoding="utf-8") as f:
-            events = json.load(f)
+            events = [json.loads(line) for line in f]
 
         # Both events should be in file
         assert len(events) == 2
@@ -276,7 +277,8 @@ class TestTelemetryCollectorFileRotation:
             collector_enabled.track_event("large_event", {"data": "x" * 100, "index": i})
             collector_enabled.flush()
 
-        # File should exist but be rotated (smaller than if all events kept)
+        # Current segment should exist, old segments rotated out
+        collector_enabled.wait_for_writes()
         assert collector_enabled.telemetry_file.exists()
 
     def test_statistics_retrieval(self, collector_enabled):
@@ -300,7 +302,7 @@ class TestTelemetryCollectorClearData:
         """Test clearing all telemetry data."""
         # Add events and flush
         collector_enabled.track_event("test_event")
-        collector_enabled.flush()
+        collector_enabled.flush(wait=True)
         assert collector_enabled.telemetry_file.exists()
 
         # Clear all data
@@ -351,7 +353,7 @@ class TestTelemetryCollectorPrivacy:
     def test_local_storage_only(self, collector_enabled):
         """Test data is stored locally only."""
         collector_enabled.track_event("test_event")
-        collector_enabled.flush()
+        collector_enabled.flush(wait=True)
 
         # File should exist in local data dir
         assert collector_enabled.telemetry_file.exists()
@@ -240,6 +240,21 @@ class TestLargeFileLoading:
         assert any(0 < p < 100 for p in percentages)
 
 
+class TestMappedReading:
+    """Test memory-mapped, incrementally decoded reading."""
+
+    def test_chunk_boundaries_match_text_mode_read(self, handler, tmp_path, monkeypatch):
+        """Test multi-byte characters and CRLF pairs split across chunks."""
+        monkeypatch.setattr("asciidoc_artisan.core.large_file_handler.READ_CHUNK_SIZE", 3)
+        file_path = tmp_path / "mixed.adoc"
+        file_path.write_bytes("caf\u00e9 \U0001f600\r\nline\rlast\n".encode())
+
+        content = handler._read_mapped(file_path, "utf-8")
+
+        assert content == file_path.read_text(encoding="utf-8")
+        assert content == "caf\u00e9 \U0001f600\nline\nlast\n"
+
+
 class TestErrorHandling:
     """Test error handling during file loading."""
 
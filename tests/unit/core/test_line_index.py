@@ -0,0 +1,98 @@
+"""
+Tests for core.line_index module.
+
+Tests lazy line start offsets, offset/line conversion and versioned
+incremental updates.
+"""
+
+import pytest
+
+from asciidoc_artisan.core.line_index import LineIndex, merge_edits
+
+
+@pytest.mark.unit
+class TestLineIndex:
+    """Test line start offsets."""
+
+    def test_built_lazily(self):
+        index = LineIndex("a\nb")
+        assert not index.is_built
+        assert list(index.starts) == [0, 2]
+        assert index.is_built
+
+    def test_line_count_with_trailing_newline(self):
+        assert LineIndex("a\nb").line_count() == 2
+        assert LineIndex("a\nb\n").line_count() == 3
+        assert LineIndex("").line_count() == 1
+
+    def test_lines_and_spans(self):
+        text = "first\n\nthird line"
+        index = LineIndex(text)
+        assert [index.line(i) for i in range(index.line_count())] == text.split("\n")
+        assert index.line_span(2) == (7, 17)
+        assert index.line_start(1) == 6
+
+    def test_offset_to_line_col(self):
+        index = LineIndex("ab\ncd\n")
+        assert index.offset_to_line_col(0) == (0, 0)
+        assert index.offset_to_line_col(2) == (0, 2)
+        assert index.offset_to_line_col(3) == (1, 0)
+        assert index.offset_to_line_col(6) == (2, 0)
+        assert index.line_of(-1) == 0
+
+
+def _edit(text, position, removed, inserted):
+    return text[:position] + inserted + text[position + removed :]
+
+
+@pytest.mark.unit
+class TestEditedIndex:
+    """Test deriving the index of the next text version."""
+
+    def test_edit_updates_offsets(self):
+        index = LineIndex("a\nb\nc")
+        index.starts
+        text = _edit(index.text, 2, 1, "x\ny\n")
+
+        edited = index.edited(text, 2, 1, 4)
+
+        assert edited.version == 1
+        assert not edited.is_built
+        assert list(edited.starts) == list(LineIndex(text).starts)
+        assert list(index.starts) == [0, 2, 4]
+
+    def test_edits_merged_until_read(self):
+        index = LineIndex("one\ntwo\nthree")
+        index.starts
+        first = _edit(index.text, 4, 0, "new\n")
+        second = _edit(first, 0, 4, "")
+
+        edited = index.edited(first, 4, 0, 4).edited(second, 0, 4, 0)
+
+        assert edited.version == 2
+        assert list(edited.starts) == list(LineIndex(second).starts)
+
+    def test_unbuilt_index_rebuilds(self):
+        text = "a\nb"
+        edited = LineIndex("a").edited(text, 1, 0, 2)
+        assert list(edited.starts) == [0, 2]
+
+    def test_inconsistent_edit_rebuilds(self):
+        index = LineIndex("a\nb")
+        index.starts
+        edited = index.edited("a\nb\nc\n", 0, 3, 4)  # Lengths do not add up
+        assert list(edited.starts) == [0, 2, 4, 6]
+
+    def test_astral_text_rebuilds(self):
+        index = LineIndex("\U0001f600\na")
+        index.starts
+        # Qt positions count the emoji twice: 4 is the end of the text in UTF-16
+        edited = index.edited("\U0001f600\nab", 4, 0, 1)
+        assert list(edited.starts) == [0, 2]
+
+    def test_merge_edits(self):
+        assert merge_edits(None, 3, 1, 2) == (3, 1, 2)
+        # Insert 2 at 3, then delete those 2 again
+        assert merge_edits((3, 0, 2), 3, 2, 0) == (3, 0, 0)
+        # Edits far apart cover the span between them
+        assert merge_edits((0, 1, 1), 10, 0, 5) == (0, 10, 15)
@@ -1,6 +1,8 @@
 """Tests for metrics collection system."""
 
+import threading
 import time
+from unittest.mock import patch
 
 import pytest
 
@@ -8,6 +10,7 @@ from asciidoc_artisan.core.metrics import (
     CacheMetrics,
     MetricsCollector,
     OperationMetrics,
+    QuantileSketch,
     get_metrics_collector,
     measure_time,
 )
@@ -267,17 +270,15 @@ def test_metrics_collector_nonexistent_cache():
     assert stats is None
 
 
-def test_operation_metrics_max_buffer():
-    """Test that operation metrics buffer is limited."""
+def test_operation_metrics_memory_bounded():
+    """Test that operation metrics storage does not grow with recordings."""
     metrics = OperationMetrics(operation_name="test")
 
-    # Record more than buffer size (1000)
     for i in range(1500):
         metrics.record(float(i))
 
-    # Should have exactly 1000 durations (buffer size)
-    assert len(metrics.durations) == 1000
-    # But count should be 1500
+    # ~1% buckets: 1..1500 ms fit in a few hundred buckets
+    assert metrics.sketch.bucket_count() < 400
     assert metrics.count == 1500
 
 
@@ -291,11 +292,11 @@ def test_operation_metrics_get_average_empty():
 
 
 def test_operation_metrics_get_percentile_empty():
-    """Test get_percentile with no durations (line 69)."""
+    """Test get_percentile with no durations."""
     metrics = OperationMetrics(operation_name="test")
 
-    # With empty durations, should return 0.0
-    assert len(metrics.durations) == 0
+    # With an empty sketch, should return 0.0
+    assert metrics.sketch.count == 0
     assert metrics.get_percentile(50) == 0.0
     assert metrics.get_percentile(95) == 0.0
     assert metrics.get_percentile(99) == 0.0
@@ -311,3 +312,196 @@ def test_metrics_collector_record_cache_disabled():
 
     # No caches should be created
     assert len(collector.caches) == 0
+
+
+def test_quantile_sketch_relative_error():
+    """Test sketch quantiles stay within the configured relative error."""
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    values = [float(i) for i in range(1, 10_001)]
+    for value in values:
+        sketch.add(value)
+
+    for quantile in (0.01, 0.5, 0.95, 0.99):
+        expected = values[int(quantile * (len(values) - 1))]
+        assert sketch.quantile(quantile) == pytest.approx(expected, rel=0.011)
+
+
+def test_quantile_sketch_multiple_quantiles_keep_order():
+    """Test several quantiles are returned in the order requested."""
+    sketch = QuantileSketch()
+    for i in range(1, 101):
+        sketch.add(float(i))
+
+    p99, p50, zero = sketch.quantiles([0.99, 0.5, 0.0])
+
+    assert p99 > p50 > zero
+    assert zero == pytest.approx(1.0, rel=0.011)
+
+
+def test_quantile_sketch_zero_and_empty():
+    """Test zero durations and empty sketches."""
+    sketch = QuantileSketch()
+    assert sketch.quantiles([0.5, 0.99]) == [0.0, 0.0]
+
+    sketch.add(0.0, count=9)
+    sketch.add(100.0)
+    assert sketch.quantile(0.5) == 0.0
+    assert sketch.quantile(1.0) == pytest.approx(100.0, rel=0.011)
+
+
+def test_quantile_sketch_merge_matches_single_sketch():
+    """Test merging sketches equals recording everything in one sketch."""
+    combined, first, second = QuantileSketch(), QuantileSketch(), QuantileSketch()
+    for i in range(1, 1001):
+        combined.add(float(i))
+        (first if i % 2 else second).add(float(i))
+
+    first.merge(second)
+
+    assert first.count == combined.count
+    assert first.quantiles([0.5, 0.95, 0.99]) == combined.quantiles([0.5, 0.95, 0.99])
+
+
+def test_quantile_sketch_merge_rejects_different_accuracy():
+    """Test sketches with different buckets cannot be merged."""
+    with pytest.raises(ValueError):
+        QuantileSketch(relative_accuracy=0.01).merge(QuantileSketch(relative_accuracy=0.02))
+
+
+def test_quantile_sketch_max_buckets():
+    """Test bucket limit folds the lowest buckets."""
+    sketch = QuantileSketch(max_buckets=10)
+    for i in range(1, 1001):
+        sketch.add(float(i))
+
+    assert sketch.bucket_count() == 10
+    assert sketch.count == 1000
+    assert sketch.quantile(0.99) == pytest.approx(990.0, rel=0.011)
+
+
+def test_operation_metrics_merge():
+    """Test merging operation metrics from workers or time windows."""
+    worker = OperationMetrics(operation_name="render")
+    main = OperationMetrics(operation_name="render")
+    for i in range(1, 51):
+        main.record(float(i))
+        worker.record(float(i + 50))
+
+    main.merge(worker)
+
+    stats = main.get_stats()
+    assert stats["count"] == 100
+    assert stats["min_ms"] == 1.0
+    assert stats["max_ms"] == 100.0
+    assert stats["p99_ms"] == pytest.approx(99.0, rel=0.011)
+
+
+def test_metrics_collector_merge():
+    """Test merging collectors combines operations and caches."""
+    collector = MetricsCollector()
+    worker = MetricsCollector()
+    collector.record_operation("render", 10.0)
+    worker.record_operation("render", 30.0)
+    worker.record_operation("save", 5.0)
+    worker.record_cache_event("preview", hit=True)
+
+    collector.merge(worker)
+
+    assert collector.get_operation_stats("render")["count"] == 2
+    assert collector.get_operation_stats("save")["count"] == 1
+    assert collector.get_cache_stats("preview")["hits"] == 1
+
+
+def test_metrics_collector_aggregates_thread_buffers():
+    """Test records from several threads are merged when read."""
+    collector = MetricsCollector()
+
+    def worker():
+        for _ in range(1000):
+            collector.record_operation("block_render", 1.0)
+        collector.record_cache_event("block_cache", hit=False)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert collector.get_operation_stats("block_render")["count"] == 4000
+    assert collector.get_cache_stats("block_cache")["misses"] == 4
+    # Buffers of finished threads are dropped after draining
+    assert collector._buffers == []
+
+
+def test_metrics_collector_releases_thread_buffer():
+    """Test a released buffer is merged and unregistered while its thread lives on."""
+    collector = MetricsCollector()
+    released = threading.Event()
+    finish = threading.Event()
+
+    def worker():
+        collector.record_operation("block_render", 1.0)
+        collector.record_cache_event("block_cache", hit=True)
+        collector.release_thread_buffer()
+        released.set()
+        finish.wait(5)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    released.wait(5)
+
+    assert collector._buffers == []
+    assert collector.get_operation_stats("block_render")["count"] == 1
+    assert collector.get_cache_stats("block_cache")["hits"] == 1
+    finish.set()
+    thread.join()
+
+
+def test_metrics_collector_registers_again_after_release():
+    """Test recording after a release registers a fresh buffer."""
+    collector = MetricsCollector()
+    collector.record_operation("render", 5.0)
+    collector.release_thread_buffer()
+    collector.release_thread_buffer()  # Nothing registered: no-op
+
+    collector.record_operation("render", 7.0)
+
+    assert len(collector._buffers) == 1
+    assert collector.get_operation_stats("render")["count"] == 2
+
+
+def test_metrics_collector_buffers_until_read():
+    """Test recording only touches the thread buffer until aggregation."""
+    collector = MetricsCollector()
+    collector.record_operation("render", 5.0)
+
+    assert len(collector._operations) == 0
+    assert collector.operations["render"].count == 1
+
+
+def test_metrics_collector_full_buffer_aggregates():
+    """Test a full thread buffer is merged by the recording thread."""
+    collector = MetricsCollector()
+    for _ in range(512):
+        collector.record_operation("render", 1.0)
+
+    assert collector._operations["render"].count == 512
+
+
+def test_metrics_collector_reset_discards_buffered():
+    """Test reset drops records not yet aggregated."""
+    collector = MetricsCollector()
+    collector.record_operation("render", 5.0)
+    collector.reset()
+
+    assert collector.get_operation_stats("render") is None
+
+
+def test_measure_time_compiled_out():
+    """Test measure_time returns the function itself when instrumentation is off."""
+
+    def render():
+        return "html"
+
+    with patch("asciidoc_artisan.core.metrics.INSTRUMENTATION_ENABLED", False):
+        assert measure_time("render")(render) is render
@@ -0,0 +1,131 @@
+"""
+Tests for core.search_session module.
+
+Tests bisect navigation, incremental updates after edits and query
+refinement against full SearchEngine scans.
+"""
+
+import random
+
+import pytest
+
+from asciidoc_artisan.core.search_engine import SearchEngine
+from asciidoc_artisan.core.search_session import SearchSession
+
+
+def _spans(session):
+    return [(m.start, m.end) for m in session.iter_matches()]
+
+
+def _expected(text, search_text, **options):
+    return [(m.start, m.end) for m in SearchEngine(text).find_all(search_text, **options)]
+
+
+@pytest.mark.unit
+class TestNavigation:
+    """Test match lookup by offset."""
+
+    def test_matches_equal_find_all(self):
+        text = "Hello world, hello Python!\nhello again"
+        session = SearchSession(text, "hello", case_sensitive=False)
+        assert _spans(session) == _expected(text, "hello", case_sensitive=False)
+        assert session.match(2).line == 2
+
+    def test_find_next_and_wrap(self):
+        session = SearchSession("ab ab ab", "ab")
+        assert session.find_next(1) == 1
+        assert session.find_next(7) == 0
+        assert session.find_next(7, wrap_around=False) is None
+
+    def test_find_previous_and_wrap(self):
+        session = SearchSession("ab ab ab", "ab")
+        assert session.find_previous(5) == 1
+        assert session.find_previous(4) == 0
+        assert session.find_previous(1) == 2
+        assert session.find_previous(1, wrap_around=False) is None
+
+    def test_index_at_falls_back_to_last(self):
+        session = SearchSession("ab ab", "ab")
+        assert session.index_at(1) == 1
+        assert session.index_at(10) == 1
+        assert SearchSession("xyz", "ab").index_at(0) is None
+
+    def test_empty_search_raises(self):
+        with pytest.raises(ValueError, match="Search text cannot be empty"):
+            SearchSession("text", "")
+
+
+@pytest.mark.unit
+class TestIncrementalUpdates:
+    """Test edits and query refinement."""
+
+    @pytest.mark.parametrize(
+        ("search_text", "options"),
+        [("ab", {}), ("ab", {"case_sensitive": False}), ("ab", {"whole_word": True}), ("aba", {})],
+    )
+    def test_edits_match_full_scan(self, search_text, options):
+        rng = random.Random(7)
+        alphabet = "ab cAB\n"
+        for _ in range(100):
+            text = "".join(rng.choice(alphabet) for _ in range(120))
+            session = SearchSession(text, search_text, **options)
+            for _ in range(rng.randint(1, 3)):
+                position = rng.randint(0, len(text))
+                removed = rng.randint(0, min(4, len(text) - position))
+                inserted = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 4)))
+                text = text[:position] + inserted + text[position + removed :]
+                session.note_edit(position, removed, len(inserted))
+            session.sync(text)
+            assert _spans(session) == _expected(text, search_text, **options)
+
+    def test_edit_rescans_locally(self):
+        text = "word " * 1000
+        session = SearchSession(text, "word")
+        session.note_edit(10, 0, 4)
+        session.sync(text[:10] + "word" + text[10:])
+        assert session.get_stats() == {"matches": 1001, "full_scans": 1, "partial_scans": 1}
+
+    def test_self_overlapping_query_scans_fully(self):
+        session = SearchSession("aaaa", "aa")
+        session.note_edit(0, 0, 1)
+        session.sync("aaaaa")
+        assert session.get_stats()["full_scans"] == 2
+        assert _spans(session) == [(0, 2), (2, 4)]
+
+    def test_inconsistent_edit_scans_fully(self):
+        session = SearchSession("ab ab", "ab")
+        session.note_edit(0, 0, 5)
+        session.sync("ab ab ab")
+        assert _spans(session) == [(0, 2), (3, 5), (6, 8)]
+        assert session.get_stats()["full_scans"] == 2
+
+    def test_refine_filters_matches(self):
+        text = "abc abd abcabc ab"
+        session = SearchSession(text, "ab")
+        assert session.refine("abc")
+        assert _spans(session) == _expected(text, "abc")
+        assert session.get_stats()["full_scans"] == 1
+
+    def test_refine_rejects_unrelated_query(self):
+        session = SearchSession("abc", "ab")
+        assert not session.refine("xb")
+        assert not session.refine("a")
+        assert not SearchSession("abc", "a.", use_regex=True).refine("a.c")
+
+
+@pytest.mark.unit
+class TestReplacementHelpers:
+    """Test replacement text and editor positions."""
+
+    def test_literal_replacement_not_expanded(self):
+        session = SearchSession("a.b", ".")
+        assert session.replacement(0, r"\1") == r"\1"
+
+    def test_regex_replacement_expanded(self):
+        session = SearchSession("x=1", r"(\w)=(\d)", use_regex=True)
+        assert session.replacement(0, r"\2=\1") == "1=x"
+
+    def test_document_span_counts_utf16_units(self):
+        session = SearchSession("\U0001f600ab", "ab")
+        assert session.match(0).start == 1
+        assert session.document_span(0) == (2, 4)
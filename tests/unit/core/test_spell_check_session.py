@@ -0,0 +1,112 @@
+"""
+Tests for core.spell_check_session module.
+
+Tests paragraph splitting, paragraph-level caching and the batched
+dictionary lookups behind incremental spell checking.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from asciidoc_artisan.core.spell_check_session import (
+    SpellCheckCancelled,
+    SpellCheckSession,
+    iter_paragraphs,
+)
+from asciidoc_artisan.core.spell_checker import SpellChecker
+
+
+@pytest.fixture
+def checker() -> SpellChecker:
+    """Create English spell checker."""
+    return SpellChecker(language="en")
+
+
+@pytest.mark.unit
+class TestIterParagraphs:
+    """Test splitting text into prose paragraphs."""
+
+    def test_paragraph_offsets_and_lines(self):
+        text = "First line\nsecond line\n\nThird"
+        paragraphs = list(iter_paragraphs(text))
+        assert [(p.start, p.line) for p in paragraphs] == [(0, 0), (24, 3)]
+        assert paragraphs[0].text == "First line\nsecond line\n"
+        assert text[paragraphs[1].start :].startswith(paragraphs[1].text)
+
+    def test_skips_code_blocks_and_attribute_lines(self):
+        text = ":toc: left\n[source,python]\n----\nhelo = 1\n----\n```\ntset\n```\n// erro\nProse"
+        assert [p.text for p in iter_paragraphs(text)] == ["Prose"]
+
+
+@pytest.mark.unit
+class TestSpellCheckSession:
+    """Test incremental spell checking."""
+
+    def test_matches_check_text_positions(self, checker):
+        text = "Intro paragraph.\n\nThis has a tset word.\nAnd helo here."
+        errors = SpellCheckSession(checker).check(text)
+        expected = checker.check_text(text, with_suggestions=False)
+        assert [(e.word, e.start, e.end, e.line, e.column) for e in errors] == [
+            (e.word, e.start, e.end, e.line, e.column) for e in expected
+        ]
+        assert all(text[e.start : e.end] == e.word for e in errors)
+
+    def test_unchanged_paragraphs_are_reused(self, checker):
+        paragraphs = [f"Paragraph number {i} has helo." for i in range(20)]
+        session = SpellCheckSession(checker)
+        session.check("\n\n".join(paragraphs))
+
+        paragraphs[5] = "Paragraph number 5 has tset."
+        errors = session.check("\n\n".join(paragraphs))
+
+        stats = session.get_stats()
+        assert stats["last_checked"] == 1
+        assert stats["last_reused"] == 19
+        assert errors[5].word == "tset"
+        assert errors[5].line == 11
+
+    def test_one_dictionary_lookup_per_changed_paragraph(self, checker):
+        session = SpellCheckSession(checker)
+        with patch.object(checker, "_spell", wraps=checker._spell) as spell:
+            session.check("One two three helo.\n\nFour five six tset.")
+        assert spell.unknown.call_count == 2
+
+    def test_forget_word_drops_cached_errors(self, checker):
+        session = SpellCheckSession(checker)
+        text = "Some helo text."
+        assert [e.word for e in session.check(text)] == ["helo"]
+
+        checker.ignore_word("helo")
+        session.forget_word("helo")
+        assert session.check(text) == []
+        assert session.get_stats()["last_checked"] == 0
+
+    def test_cancelled_check_raises(self, checker):
+        with pytest.raises(SpellCheckCancelled):
+            SpellCheckSession(checker).check("Some text.", cancelled=lambda: True)
+
+    def test_reset_clears_cache(self, checker):
+        session = SpellCheckSession(checker)
+        session.check("Some text.")
+        session.reset()
+        assert session.get_stats()["cached_paragraphs"] == 0
+
+    def test_visible_paragraphs_reported_first(self, checker):
+        session = SpellCheckSession(checker)
+        text = "First helo.\n\nSecond tset.\n\nThird erro."
+        reported = []
+        errors = session.check(text, visible=(2, 2), on_visible=lambda *args: reported.append(args))
+
+        [(visible_errors, first, last)] = reported
+        assert [e.word for e in visible_errors] == ["tset"]
+        assert (first, last) == (2, 2)
+        assert [e.word for e in errors] == ["helo", "tset", "erro"]
+        assert session.get_stats()["last_checked"] == 3
+
+    def test_visible_pass_skipped_when_nothing_else_changed(self, checker):
+        session = SpellCheckSession(checker)
+        session.check("First helo.\n\nSecond text.")
+        reported = []
+        session.check("First helo.\n\nSecond tset.", visible=(2, 2), on_visible=lambda *args: reported.append(args))
+        assert reported == []
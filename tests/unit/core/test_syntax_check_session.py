@@ -0,0 +1,173 @@
+"""
+Tests for core.syntax_check_session module.
+
+Tests incremental re-checking: results must equal a full
+SyntaxChecker.validate() run while only dirty lines are re-checked.
+"""
+
+import random
+
+import pytest
+
+from asciidoc_artisan.core.models import ErrorSeverity, SyntaxErrorModel
+from asciidoc_artisan.core.syntax_check_session import SyntaxCheckSession
+from asciidoc_artisan.core.syntax_checker import (
+    RuleScope,
+    SyntaxChecker,
+    ValidationCancelled,
+    ValidationContext,
+)
+
+LINE_VOCABULARY = [
+    "= Title",
+    "== Section [[sec]]",
+    "==",
+    ":author: Jane",
+    ":version: 1.0",
+    ":bad attribute",
+    "[[intro]]",
+    "[#intro]",
+    "See <<intro>> and <<missing>>.",
+    "Broken <<intro",
+    "Uses {author} and {undefined}.",
+    "[source,python]",
+    "----",
+    "[example]",
+    "====",
+    "Plain text with trailing space   ",
+    "",
+    "include::nowhere.adoc[]",
+]
+
+
+def _dump(errors: list[SyntaxErrorModel]) -> list[dict]:
+    return [error.model_dump() for error in errors]
+
+
+@pytest.fixture
+def checker() -> SyntaxChecker:
+    """Create syntax checker with built-in rules."""
+    return SyntaxChecker()
+
+
+@pytest.mark.unit
+class TestRuleScopes:
+    """Test built-in rules declare scope and facts."""
+
+    def test_built_in_rules_declare_scope(self, checker):
+        for rule in checker.rules:
+            assert rule.scope in (RuleScope.LINE, RuleScope.DOCUMENT)
+
+    def test_lines_to_validate(self):
+        context = ValidationContext("a\nb\nc", changed_lines=[2, 0, 7])
+        assert list(context.lines_to_validate()) == [0, 2]
+        assert list(ValidationContext("a\nb").lines_to_validate()) == [0, 1]
+
+
+@pytest.mark.unit
+class TestIncrementalResults:
+    """Test incremental results equal full validation."""
+
+    def test_first_run_matches_full_validation(self, checker):
+        doc = "\n".join(LINE_VOCABULARY)
+        session = SyntaxCheckSession(checker)
+        assert _dump(session.validate(doc)) == _dump(checker.validate(doc))
+
+    def test_edit_within_line_rechecks_dirty_line_only(self, checker):
+        lines = ["= Title", ":author: Jane", ""] + [f"Paragraph {i} text." for i in range(200)]
+        session = SyntaxCheckSession(checker)
+        session.validate("\n".join(lines))
+
+        lines[100] = "Paragraph 100 text.  "
+        doc = "\n".join(lines)
+        errors = session.validate(doc)
+
+        assert _dump(errors) == _dump(checker.validate(doc))
+        assert [e.line for e in errors if e.code == "W029"] == [100]
+        stats = session.get_stats()
+        assert stats["last_dirty_lines"] == 1
+        assert stats["rules_reused"] > 0
+
+    def test_inserted_lines_shift_cached_errors(self, checker):
+        lines = ["= Title", "text  ", "<<missing>>"]
+        session = SyntaxCheckSession(checker)
+        session.validate("\n".join(lines))
+
+        lines[1:1] = ["new line", "another"]
+        doc = "\n".join(lines)
+        assert _dump(session.validate(doc)) == _dump(checker.validate(doc))
+
+    def test_new_anchor_rechecks_xrefs(self, checker):
+        lines = ["= Title", "See <<intro>>.", "", "Text"]
+        session = SyntaxCheckSession(checker)
+        assert any(e.code == "W001" for e in session.validate("\n".join(lines)))
+
+        lines[3] = "[[intro]]"
+        doc = "\n".join(lines)
+        errors = session.validate(doc)
+        assert not any(e.code == "W001" for e in errors)
+        assert _dump(errors) == _dump(checker.validate(doc))
+
+    def test_random_edits_match_full_validation(self, checker):
+        rng = random.Random(11)
+        lines = [rng.choice(LINE_VOCABULARY) for _ in range(40)]
+        session = SyntaxCheckSession(checker)
+
+        for _ in range(300):
+            action = rng.random()
+            position = rng.randint(0, len(lines))
+            if action < 0.4 and lines:
+                index = min(position, len(lines) - 1)
+                lines[index] = rng.choice(LINE_VOCABULARY)
+            elif action < 0.55 and lines:
+                index = min(position, len(lines) - 1)
+                lines[index] += rng.choice(["x", " ", "]]", ">>", "}"])
+            elif action < 0.8:
+                lines[position:position] = [rng.choice(LINE_VOCABULARY) for _ in range(rng.randint(1, 3))]
+            else:
+                del lines[position : position + rng.randint(1, 3)]
+
+            doc = "\n".join(lines)
+            assert _dump(session.validate(doc)) == _dump(checker.validate(doc))
+
+
+@pytest.mark.unit
+class TestSessionState:
+    """Test cancellation, rule changes and reset."""
+
+    def test_cancelled_run_keeps_previous_state(self, checker):
+        session = SyntaxCheckSession(checker)
+        session.validate("= Title\ntext")
+
+        with pytest.raises(ValidationCancelled):
+            session.validate("= Title\ntext  ", cancelled=lambda: True)
+
+        doc = "= Title\ntext  \nmore  "
+        assert _dump(session.validate(doc)) == _dump(checker.validate(doc))
+
+    def test_added_rule_runs_on_whole_document(self, checker):
+        session = SyntaxCheckSession(checker)
+        session.validate("= Title\na\nb")
+
+        class EveryLineRule:
+            scope = RuleScope.LINE
+            facts = ()
+
+            def validate(self, context):
+                return [
+                    SyntaxErrorModel(
+                        code="I099", severity=ErrorSeverity.INFO, message="line", line=i, column=0, length=0
+                    )
+                    for i in context.lines_to_validate()
+                ]
+
+        checker.add_rule(EveryLineRule())
+        errors = session.validate("= Title\na\nb")
+        assert [e.line for e in errors if e.code == "I099"] == [0, 1, 2]
+
+    def test_reset_forgets_previous_run(self, checker):
+        session = SyntaxCheckSession(checker)
+        session.validate("= Title\ntext")
+        session.reset()
+        session.validate("= Title\ntext")
+        assert session.get_stats()["last_dirty_lines"] == 2
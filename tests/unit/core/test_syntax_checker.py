@@ -9,6 +9,7 @@ import pytest
 from asciidoc_artisan.core.models import ErrorSeverity, SyntaxErrorModel
 from asciidoc_artisan.core.syntax_checker import (
     SyntaxChecker,
+    ValidationCancelled,
     ValidationContext,
     extract_anchors,
     extract_attributes,
@@ -405,6 +406,30 @@ class TestSyntaxChecker:
         assert "CustomRuleA" in names
         assert "CustomRuleB" in names
 
+    def test_validate_cancelled_between_rules(self):
+        """Test cancel check stops validation before the next rule."""
+        checker = SyntaxChecker()
+        checker.rules = []
+        calls = []
+
+        class RecordingRule:
+            def validate(self, context):
+                calls.append(context)
+                return []
+
+        checker.add_rule(RecordingRule())
+        checker.add_rule(RecordingRule())
+
+        with pytest.raises(ValidationCancelled):
+            checker.validate("= Doc", cancelled=lambda: len(calls) >= 1)
+
+        assert len(calls) == 1
+
+    def test_validate_not_cancelled(self):
+        """Test cancel check returning False keeps full validation."""
+        checker = SyntaxChecker()
+        assert checker.validate("= Doc", cancelled=lambda: False) == checker.validate("= Doc")
+
 
 @pytest.mark.fr_091
 @pytest.mark.fr_092
@@ -7,8 +7,9 @@ Tests privacy-first telemetry collection including:
 - Event tracking (track_event, track_error, track_performance, track_startup)
 - Event buffering and flushing
 - Privacy sanitization (PII removal)
-- File rotation and retention (30 days)
-- Statistics collection
+- Append-only segmented log, segment retention (30 days, 10MB)
+- Legacy single-file migration
+- Statistics collection (incremental summary)
 - Data clearing (opt-out)
 """
 
@@ -117,10 +118,10 @@ class TestTelemetryCollectorInitialization:
         assert data_dir.is_dir()
 
     def test_initialization_sets_telemetry_file_path(self, tmp_path):
-        """Test collector sets telemetry file path."""
+        """Test collector sets telemetry file path (first log segment)."""
         collector = TelemetryCollector(data_dir=tmp_path)
 
-        assert collector.telemetry_file == tmp_path / "telemetry.toon"
+        assert collector.telemetry_file == tmp_path / "telemetry-000001.jsonl"
 
     def test_initialization_sets_session_start_time(self, tmp_path):
         """Test collector sets session start time."""
@@ -294,20 +295,18 @@ class TestEventBufferFlush:
         assert not collector.telemetry_file.exists()
 
     def test_flush_writes_events_to_file(self, tmp_path):
-        """Test flush writes events to TOON file."""
+        """Test flush appends events as JSON lines."""
+        import json
+
         collector = TelemetryCollector(enabled=True, data_dir=tmp_path)
         collector.track_event("test_event", {"key": "value"})
 
-        collector.flush()
+        collector.flush(wait=True)
 
         assert collector.telemetry_file.exists()
-        with open(collector.telemetry_file) as f:
-            from asciidoc_artisan.core import toon_utils
-
-            data = toon_utils.load(f)
-        events = data["events"]
-        assert len(events) == 1
-        assert events[0]["event_type"] == "test_event"
+        lines = collector.telemetry_file.read_text().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["event_type"] == "test_event"
 
     def test_flush_clears_buffer(self, tmp_path):
         """Test flush clears event buffer."""
@@ -330,12 +329,8 @@ class TestEventBufferFlush:
         collector.track_event("event2")
         collector.flush()
 
-        with open(collector.telemetry_file) as f:
-            from asciidoc_artisan.core import toon_utils
-
-            data = toon_utils.load(f)
-        events = data["events"]
-        assert len(events) == 2
+        events = collector._load_events()
+        assert [event["event_type"] for event in events] == ["event1", "event2"]
 
     def test_flush_auto_triggers_at_buffer_size(self, tmp_path):
         """Test flush automatically triggers when buffer is full."""
@@ -348,6 +343,7 @@ class TestEventBufferFlush:
 
         # Buffer should be flushed automatically
         assert len(collector.event_buffer) == 0
+        collector.wait_for_writes()
         assert collector.telemetry_file.exists()
 
     def test_flush_with_empty_buffer(self, tmp_path):
@@ -444,68 +440,72 @@ class TestPrivacySanitization:
 @pytest.mark.fr_073
 @pytest.mark.unit
 class TestFileRotation:
-    """Test file rotation and retention."""
+    """Test log segments and retention."""
 
-    def test_rotate_events_keeps_recent_events(self, tmp_path):
-        """Test rotate_events keeps events within 30 days."""
+    def test_new_segment_past_segment_max_size(self, tmp_path):
+        """Test flushes start a new segment once the current one is full."""
         collector = TelemetryCollector(enabled=True, data_dir=tmp_path)
+        collector.segment_max_size = 200
 
-        # Create recent event (today)
-        recent_timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-        events = [
-            {
-                "event_type": "recent",
-                "timestamp": recent_timestamp,
-                "session_id": "test",
-                "data": {},
-            }
-        ]
-
-        rotated = collector._rotate_events(events)
+        for i in range(3):
+            collector.track_event(f"event{i}", {"value": i})
+            collector.flush()
+        collector.wait_for_writes()
 
-        assert len(rotated) == 1
+        assert collector.telemetry_file == tmp_path / "telemetry-000003.jsonl"
+        assert len(collector._load_events()) == 3
 
-    def test_rotate_events_removes_old_events(self, tmp_path):
-        """Test rotate_events removes events older than 30 days."""
+    def test_old_segments_dropped_after_retention(self, tmp_path):
+        """Test segments whose last event is older than 30 days are deleted whole."""
         collector = TelemetryCollector(enabled=True, data_dir=tmp_path)
+        collector.segment_max_size = 1
+        collector.track_event("old")
+        collector.flush(wait=True)
+        collector._segments[1].last_time = time.time() - 31 * 24 * 60 * 60
 
-        # Create old event (31 days ago)
-        old_date = datetime.now(timezone.utc) - timedelta(days=31)
-        old_timestamp = old_date.isoformat() + "Z"
-        events = [
-            {
-                "event_type": "old",
-                "timestamp": old_timestamp,
-                "session_id": "test",
-                "data": {},
-            }
-        ]
-
-        rotated = collector._rotate_events(events)
+        collector.track_event("recent")
+        collector.flush(wait=True)
 
-        assert len(rotated) == 0
+        assert not (tmp_path / "telemetry-000001.jsonl").exists()
+        assert [event["event_type"] for event in collector._load_events()] == ["recent"]
 
-    def test_rotate_events_skips_malformed_events(self, tmp_path):
-        """Test rotate_events skips events with invalid timestamps."""
+    def test_oldest_segments_dropped_over_max_size(self, tmp_path):
+        """Test oldest segments are deleted when the log exceeds max_file_size."""
         collector = TelemetryCollector(enabled=True, data_dir=tmp_path)
+        collector.segment_max_size = 1
+        collector.max_file_size = 300
 
-        events = [{"event_type": "malformed", "timestamp": "invalid", "session_id": "test"}]
-
-        rotated = collector._rotate_events(events)
+        for i in range(5):
+            collector.track_event(f"event{i}")
+            collector.flush()
+        collector.wait_for_writes()
 
-        assert len(rotated) == 0
+        assert collector._get_file_size() <= 300
+        events = [event["event_type"] for event in collector._load_events()]
+        assert events[-1] == "event4"
+        assert "event0" not in events
 
-    def test_rotate_events_skips_events_missing_timestamp(self, tmp_path):
-        """Test rotate_events handles events missing timestamp key (lines 322-324)."""
+    def test_summary_save_failure_does_not_duplicate_events(self, tmp_path):
+        """Test events are not re-buffered when only the summary update failed."""
         collector = TelemetryCollector(enabled=True, data_dir=tmp_path)
+        collector.track_event("event")
 
-        # Event missing 'timestamp' key triggers KeyError
-        events = [{"event_type": "no_timestamp", "session_id": "test", "data": {}}]
+        with patch.object(TelemetryCollector, "_save_summary", side_effect=OSError("disk full")):
+            collector.flush(wait=True)
+        collector.flush(wait=True)
 
-        rotated = collector._rotate_events(events)
+        assert collector.event_buffer == []
+        assert [event["event_type"] for event in collector._load_events()] == ["event"]
 
-        # Should skip the malformed event and return empty list
-        assert len(rotated) == 0
+    def test_current_segment_never_dropped(self, tmp_path):
+        """Test the segment being appended to is kept even above max_file_size."""
+        collector = TelemetryCollector(enabled=True, data_dir=tmp_path)
+        collector.max_file_size = 10
+        collector.track_event("event")
+
+        collector.flush(wait=True)
+
+        assert collector.telemetry_file.exists()
 
     def test_get_file_size_returns_zero_for_nonexistent_file(self, tmp_path):
         """Test get_file_size returns 0 for nonexistent file."""
@@ -519,11 +519,11 @@ class TestFileRotation:
         """Test get_file_size returns actual file size."""
         collector = TelemetryCollector(enabled=True, data_dir=tmp_path)
         collector.track_event("test_event", {"key": "value"})
-        collector.flush()
+        collector.flush(wait=True)
 
         size = collector._get_file_size()
 
-        assert size > 0
+        assert size == collector.telemetry_file.stat().st_size
 
 
 @pytest.mark.fr_073
@@ -581,7 +581,44 @@ class TestStatistics:
         stats = collector.get_statistics()
 
         assert stats["file_size"] > 0
-        assert "telemetry.toon" in stats["file_path"]
+        assert "telemetry-000001.jsonl" in stats["file_path"]
+        assert stats["segments"] == 1
+
+    def test_get_statistics_served_from_summary(self, tmp_path):
+        """Test a new collector reads statistics from the summary without reading the log."""
+        collector = TelemetryCollector(enabled=True, data_dir=tmp_path)
+        collector.track_event(EVENT_MENU_CLICK)
+        collector.track_event(EVENT_ERROR)
+        collector.flush(wait=True)
+
+        with patch.object(TelemetryCollector, "_read_segment", side_effect=AssertionError("log read")):
+            stats = TelemetryCollector(enabled=True, data_dir=tmp_path).get_statistics()
+
+        assert stats["total_events"] == 2
+        assert stats["event_counts"] == {EVENT_MENU_CLICK: 1, EVENT_ERROR: 1}
+
+    def test_get_statistics_rebuilds_missing_summary(self, tmp_path):
+        """Test the summary is rebuilt from the segments when it is missing."""
+        collector = TelemetryCollector(enabled=True, data_dir=tmp_path)
+        collector.track_event(EVENT_MENU_CLICK)
+        collector.flush(wait=True)
+        (tmp_path / "telemetry-summary.json").unlink()
+
+        stats = TelemetryCollector(enabled=True, data_dir=tmp_path).get_statistics()
+
+        assert stats["event_counts"] == {EVENT_MENU_CLICK: 1}
+
+    def test_get_statistics_rescans_segment_changed_since_summary(self, tmp_path):
+        """Test a segment whose size differs from the summary is rescanned."""
+        collector = TelemetryCollector(enabled=True, data_dir=tmp_path)
+        collector.track_event(EVENT_MENU_CLICK)
+        collector.flush(wait=True)
+        with open(collector.telemetry_file, "a", encoding="utf-8") as f:
+            f.write('{"event_type": "error", "timestamp": "2024-01-01T00:00:00Z", "session_id": "s", "data": {}}\n')
+
+        stats = TelemetryCollector(enabled=True, data_dir=tmp_path).get_statistics()
+
+        assert stats["event_counts"] == {EVENT_MENU_CLICK: 1, EVENT_ERROR: 1}
 
 
 @pytest.mark.fr_073
@@ -647,14 +684,9 @@ class TestDestructor:
         del collector
 
         # Events should be flushed to file
-        telemetry_file = tmp_path / "telemetry.toon"
+        telemetry_file = tmp_path / "telemetry-000001.jsonl"
         assert telemetry_file.exists()
-        with open(telemetry_file) as f:
-            from asciidoc_artisan.core import toon_utils
-
-            data = toon_utils.load(f)
-        events = data["events"]
-        assert len(events) == 1
+        assert len(telemetry_file.read_text().splitlines()) == 1
 
     def test_destructor_handles_flush_exception(self, tmp_path):
         """Test destructor handles exceptions during flush (lines 423-425)."""
@@ -725,22 +757,20 @@ class TestExceptionHandling:
         # Mock open to raise permission error
         with mock.patch("builtins.open", side_effect=PermissionError("Access denied")):
             # flush should not raise exception
-            collector.flush()
+            collector.flush(wait=True)
             # Buffer should still have events since flush failed
             assert len(collector.event_buffer) > 0
 
-    def test_load_events_handles_exception(self, tmp_path):
-        """Test _load_events handles exception gracefully (lines 290-292)."""
+    def test_load_events_skips_malformed_lines(self, tmp_path):
+        """Test _load_events skips lines that are not JSON (e.g. interrupted writes)."""
+        telemetry_file = tmp_path / "telemetry-000001.jsonl"
+        telemetry_file.write_text('invalid json {{{\n{"event_type": "ok", "timestamp": "", "session_id": "s"}\n')
 
         collector = TelemetryCollector(enabled=True, data_dir=tmp_path)
 
-        # Create corrupted JSON file
-        telemetry_file = tmp_path / "telemetry.toon"
-        telemetry_file.write_text("invalid json {{{")
-
-        # _load_events should return empty list on error
         events = collector._load_events()
-        assert events == []
+        assert [event["event_type"] for event in events] == ["ok"]
+        assert collector.get_statistics()["total_events"] == 1
 
     def test_clear_all_handles_exception(self, tmp_path):
         """Test clear_all_data handles exception gracefully (lines 416-417)."""
@@ -761,21 +791,17 @@ class TestExceptionHandling:
 
 @pytest.mark.fr_073
 @pytest.mark.unit
-class TestFileRotationWithSize:
-    """Test file rotation when size exceeds limit."""
+class TestLegacyMigration:
+    """Test migration of single-file telemetry into the log."""
 
-    def test_rotation_when_file_exceeds_max_size(self, tmp_path):
-        """Test file rotation when file size exceeds max (line 267)."""
-        from datetime import timedelta
+    def test_legacy_toon_file_migrated_within_retention(self, tmp_path):
+        """Test recent events of telemetry.toon are appended to the log and the file kept as backup."""
+        from asciidoc_artisan.core import toon_utils
 
-        collector = TelemetryCollector(enabled=True, data_dir=tmp_path)
-
-        # Create file with mix of old and recent events
         old_date = datetime.now(timezone.utc) - timedelta(days=31)
         recent_date = datetime.now(timezone.utc)
 
         events = []
-        # Add 25 old events (will be removed by rotation)
         for i in range(25):
             events.append(
                 {
@@ -785,8 +811,6 @@ class TestFileRotationWithSize:
                     "data": {"value": i * 100},
                 }
             )
-
-        # Add 25 recent events (will be kept by rotation)
         for i in range(25):
             events.append(
                 {
@@ -797,31 +821,59 @@ class TestFileRotationWithSize:
                 }
             )
 
-        # Write events to file in TOON format
-        telemetry_file = tmp_path / "telemetry.toon"
-        with open(telemetry_file, "w") as f:
-            from asciidoc_artisan.core import toon_utils
-
+        with open(tmp_path / "telemetry.toon", "w") as f:
             toon_utils.dump({"events": events}, f)
 
-        # Set very small max file size to trigger rotation on next flush
-        collector.max_file_size = 100
+        collector = TelemetryCollector(enabled=True, data_dir=tmp_path)
+
+        migrated = collector._load_events()
+        assert len(migrated) == 25
+        assert all(event["event_type"].startswith("recent_event") for event in migrated)
+        assert not (tmp_path / "telemetry.toon").exists()
+        assert (tmp_path / "telemetry.toon.bak").exists()
+
+    def test_legacy_json_file_migrated(self, tmp_path):
+        """Test legacy telemetry.json (list of events) is migrated."""
+        import json
+
+        timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        event = {"event_type": "legacy", "timestamp": timestamp, "session_id": "test", "data": {}}
+        (tmp_path / "telemetry.json").write_text(json.dumps([event]))
+
+        collector = TelemetryCollector(enabled=True, data_dir=tmp_path)
+
+        assert collector.get_statistics()["event_counts"] == {"legacy": 1}
+        assert (tmp_path / "telemetry.json.bak").exists()
 
-        # Add one more event and flush (should trigger rotation at line 266-267)
-        collector.track_event("trigger_event")
+
+@pytest.mark.fr_073
+@pytest.mark.unit
+class TestSetDataDir:
+    """Test moving telemetry storage."""
+
+    def test_set_data_dir_copies_segments(self, tmp_path):
+        """Test segments are copied and new events go to the new directory."""
+        collector = TelemetryCollector(enabled=True, data_dir=tmp_path / "old")
+        collector.track_event("before")
         collector.flush()
 
-        # Load rotated events
-        with open(telemetry_file) as f:
-            from asciidoc_artisan.core import toon_utils
+        collector.set_data_dir(tmp_path / "new")
+        collector.track_event("after")
+        collector.flush(wait=True)
+
+        assert collector.telemetry_file.parent == tmp_path / "new"
+        assert [event["event_type"] for event in collector._load_events()] == ["before", "after"]
 
-            data = toon_utils.load(f)
-        rotated_events = data["events"]
+    def test_set_data_dir_keeps_existing_segments(self, tmp_path):
+        """Test copied segments are numbered after the target's own segments."""
+        existing = TelemetryCollector(enabled=True, data_dir=tmp_path / "new")
+        existing.track_event("existing")
+        existing.flush(wait=True)
+        collector = TelemetryCollector(enabled=True, data_dir=tmp_path / "old")
+        collector.track_event("before")
+        collector.flush()
 
-        # Should only have recent events (old events removed by rotation)
-        # 25 recent events + 1 new event = 26 total
-        assert len(rotated_events) == 26
+        collector.set_data_dir(tmp_path / "new")
 
-        # Verify no old events remain
-        for event in rotated_events:
-            assert not event["event_type"].startswith("old_event")
+        assert [event["event_type"] for event in collector._load_events()] == ["existing", "before"]
+        assert collector.get_statistics()["event_counts"] == {"existing": 1, "before": 1}
@@ -0,0 +1,108 @@
+"""
+Tests for core.windowed_document module.
+
+Tests line access, piece table edits and streamed saves.
+"""
+
+import io
+
+import pytest
+
+from asciidoc_artisan.core.windowed_document import WindowedDocument
+
+
+@pytest.fixture
+def document(tmp_path):
+    file_path = tmp_path / "huge.adoc"
+    file_path.write_bytes(b"".join(f"line {i}\n".encode() for i in range(100)))
+    doc = WindowedDocument(file_path)
+    yield doc
+    doc.close()
+
+
+@pytest.mark.unit
+class TestLineAccess:
+    """Test reading line ranges."""
+
+    def test_line_count_includes_last_empty_line(self, document):
+        assert document.line_count() == 101
+
+    def test_lines_range(self, document):
+        assert document.lines(10, 13) == ["line 10", "line 11", "line 12"]
+        assert document.text(98, 200) == "line 98\nline 99\n"
+
+    def test_empty_file(self, tmp_path):
+        file_path = tmp_path / "empty.adoc"
+        file_path.write_bytes(b"")
+        doc = WindowedDocument(file_path)
+        assert doc.line_count() == 1
+        assert doc.lines(0, 1) == [""]
+        doc.close()
+
+    def test_crlf_lines(self, tmp_path):
+        file_path = tmp_path / "crlf.adoc"
+        file_path.write_bytes(b"a\r\nb\r\nc")
+        doc = WindowedDocument(file_path)
+        assert doc.newline == b"\r\n"
+        assert doc.lines(0, 3) == ["a", "b", "c"]
+        doc.close()
+
+
+@pytest.mark.unit
+class TestEdits:
+    """Test replacing line ranges."""
+
+    def test_replace_window(self, document):
+        document.replace_lines(10, 20, ["edited"])
+        assert document.line_count() == 92
+        assert document.lines(9, 12) == ["line 9", "edited", "line 20"]
+        assert document.modified
+
+    def test_insert_and_delete(self, document):
+        document.replace_lines(0, 0, ["new first"])
+        document.replace_lines(50, 60, [])
+        assert document.lines(0, 2) == ["new first", "line 0"]
+        assert document.lines(49, 51) == ["line 48", "line 59"]
+        assert document.line_count() == 92
+
+    def test_edits_on_edited_lines(self, document):
+        document.replace_lines(5, 10, ["a", "b", "c"])
+        document.replace_lines(6, 7, ["B1", "B2"])
+        assert document.lines(4, 10) == ["line 4", "a", "B1", "B2", "c", "line 10"]
+        assert document.get_stats()["edited_lines"] == 5
+
+
+@pytest.mark.unit
+class TestSave:
+    """Test streamed saves."""
+
+    def test_write_to_keeps_unedited_bytes(self, document, tmp_path):
+        original = (tmp_path / "huge.adoc").read_bytes()
+        stream = io.BytesIO()
+        document.write_to(stream)
+        assert stream.getvalue() == original
+
+    def test_save_edits_and_remaps(self, document, tmp_path):
+        file_path = tmp_path / "huge.adoc"
+        document.replace_lines(1, 99, ["middle"])
+        assert document.save(file_path)
+
+        assert file_path.read_bytes() == b"line 0\nmiddle\nline 99\n"
+        assert not document.modified
+        assert document.get_stats()["pieces"] == 1
+        assert document.lines(0, 4) == ["line 0", "middle", "line 99", ""]
+
+    def test_save_uses_file_line_ending(self, tmp_path):
+        file_path = tmp_path / "crlf.adoc"
+        file_path.write_bytes(b"a\r\nb\r\nc\r\n")
+        doc = WindowedDocument(file_path)
+        doc.replace_lines(1, 2, ["x", "y"])
+        assert doc.save(file_path)
+        assert file_path.read_bytes() == b"a\r\nx\r\ny\r\nc\r\n"
+        doc.close()
+
+    def test_save_failure_keeps_edits(self, document, tmp_path):
+        document.replace_lines(0, 1, ["kept"])
+        assert not document.save(tmp_path / "missing" / "out.adoc")
+        assert document.lines(0, 1) == ["kept"]
+        assert document.modified
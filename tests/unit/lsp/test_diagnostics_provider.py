@@ -6,12 +6,14 @@ Tests cover:
 - Conversion to LSP Diagnostic format
 - Severity mapping
 - Incremental validation
+- Edit-scoped validation with reused diagnostics
 """
 
 import pytest
 from lsprotocol import types as lsp
 
 from asciidoc_artisan.lsp.diagnostics_provider import AsciiDocDiagnosticsProvider
+from asciidoc_artisan.lsp.document_state import ChangedLines
 
 
 @pytest.fixture
@@ -114,6 +116,43 @@ Line 3
         # Should return list (may be empty for valid content)
         assert isinstance(diagnostics, list)
 
+    def test_edit_shifts_unchanged_diagnostics(self, provider: AsciiDocDiagnosticsProvider) -> None:
+        """Errors after the edited span are reused and moved by the line delta."""
+        uri = "file:///test.adoc"
+        provider.get_diagnostics("= Title\n\nText\n\n<<missing>>\n", uri)
+
+        text = "= Title\n\nText\nMore\nLines\n\n<<missing>>\n"
+        diagnostics = provider.get_diagnostics_for_edit(uri, text, ChangedLines(2, 3, 2, 5))
+
+        assert [(d.range.start.line, d.code) for d in diagnostics if d.code == "W001"] == [(6, "W001")]
+        assert diagnostics == provider.get_diagnostics(text)
+
+    def test_edit_revalidates_changed_lines(self, provider: AsciiDocDiagnosticsProvider) -> None:
+        """Errors inside the edited span are replaced by fresh results."""
+        uri = "file:///test.adoc"
+        provider.get_diagnostics("= Title\n\n<<missing>>\n", uri)
+
+        diagnostics = provider.get_diagnostics_for_edit(uri, "= Title\n\nFixed\n", ChangedLines(2, 3, 2, 3))
+
+        assert not [d for d in diagnostics if d.code == "W001"]
+
+    def test_edit_rechecks_document_rules_outside_span(self, provider: AsciiDocDiagnosticsProvider) -> None:
+        """Document-wide errors caused by an edit are reported on other lines."""
+        uri = "file:///test.adoc"
+        provider.get_diagnostics("= Title\n\n[[first]]\nText\n\n[[second]]\n", uri)
+
+        text = "= Title\n\n[[second]]\nText\n\n[[second]]\n"
+        diagnostics = provider.get_diagnostics_for_edit(uri, text, ChangedLines(2, 3, 2, 3))
+
+        assert (5, "W004") in [(d.range.start.line, d.code) for d in diagnostics]
+        assert diagnostics == provider.get_diagnostics(text)
+
+    def test_edit_without_previous_run_is_full(self, provider: AsciiDocDiagnosticsProvider) -> None:
+        """Without remembered errors the whole document is validated."""
+        text = "= Title\n\n<<missing>>\n"
+        diagnostics = provider.get_diagnostics_for_edit("file:///new.adoc", text, ChangedLines(0, 1, 0, 1))
+        assert diagnostics == provider.get_diagnostics(text)
+
 
 class TestErrorHandling:
     """Test error handling."""
@@ -336,3 +375,11 @@ class TestQuickFixes:
 
         # Cache should be a list (may be empty for valid content)
         assert isinstance(provider._errors_cache, list)
+
+    def test_get_last_errors_matches_diagnostics(self, provider: AsciiDocDiagnosticsProvider) -> None:
+        """Test get_last_errors returns the errors of the latest run."""
+        diagnostics = provider.get_diagnostics("= Title\n\n<<missing>>\n")
+
+        errors = provider.get_last_errors()
+        assert len(errors) == len(diagnostics) > 0
+        assert [error.line for error in errors] == [d.range.start.line for d in diagnostics]
@@ -0,0 +1,158 @@
+"""
+Tests for AsciiDoc LSP diagnostics scheduler.
+
+Tests cover:
+- Debouncing (coalescing rapid changes)
+- Cancellation of in-flight runs
+- Version check before publishing
+- Statistics
+"""
+
+import threading
+
+import pytest
+from lsprotocol import types as lsp
+
+from asciidoc_artisan.lsp.diagnostics_scheduler import DiagnosticsScheduler
+
+URI = "file:///test.adoc"
+
+
+class FakeServer:
+    """Validation/publish callbacks with a controllable document version."""
+
+    def __init__(self) -> None:
+        self.version = 1
+        self.validated: list[int] = []
+        self.published: list[tuple[str, int, list[lsp.Diagnostic]]] = []
+        self.published_event = threading.Event()
+        self.block: threading.Event | None = None
+        self.started = threading.Event()
+
+    def validate(self, uri, cancelled):
+        version = self.version
+        self.validated.append(version)
+        self.started.set()
+        if self.block is not None:
+            self.block.wait(2)
+        if cancelled():
+            return None
+        return version, []
+
+    def publish(self, uri, version, diagnostics):
+        self.published.append((uri, version, diagnostics))
+        self.published_event.set()
+
+    def current_version(self, uri):
+        return self.version
+
+
+@pytest.fixture
+def server() -> FakeServer:
+    """Create fake server callbacks."""
+    return FakeServer()
+
+
+def _scheduler(server: FakeServer, delay: float = 0.05) -> DiagnosticsScheduler:
+    return DiagnosticsScheduler(server.validate, server.publish, server.current_version, delay=delay)
+
+
+class TestDebounce:
+    """Test coalescing of rapid changes."""
+
+    def test_rapid_changes_coalesce_into_one_run(self, server: FakeServer) -> None:
+        scheduler = _scheduler(server)
+        for version in range(1, 6):
+            server.version = version
+            scheduler.schedule(URI, version)
+
+        assert server.published_event.wait(2)
+        scheduler.shutdown()
+
+        assert server.validated == [5]
+        assert server.published == [(URI, 5, [])]
+        stats = scheduler.get_stats()
+        assert stats["scheduled"] == 5
+        assert stats["coalesced"] == 4
+        assert stats["published"] == 1
+
+    def test_zero_delay_runs_immediately(self, server: FakeServer) -> None:
+        scheduler = _scheduler(server, delay=10)
+        scheduler.schedule(URI, 1, delay=0)
+
+        assert server.published_event.wait(2)
+        scheduler.shutdown()
+
+
+class TestCancellation:
+    """Test cancellation and version checks."""
+
+    def test_newer_change_cancels_running_validation(self, server: FakeServer) -> None:
+        server.block = threading.Event()
+        scheduler = _scheduler(server, delay=0)
+        scheduler.schedule(URI, 1)
+        assert server.started.wait(2)
+
+        server.version = 2
+        scheduler.schedule(URI, 2)
+        server.block.set()
+
+        assert server.published_event.wait(2)
+        scheduler.shutdown()
+
+        assert server.published == [(URI, 2, [])]
+        assert scheduler.get_stats()["cancelled"] == 1
+
+    def test_stale_result_not_published(self, server: FakeServer) -> None:
+        scheduler = _scheduler(server, delay=0)
+        done = threading.Event()
+
+        def validate(uri, cancelled):
+            server.version = 2  # Document changed while validating
+            done.set()
+            return 1, []
+
+        scheduler._validate = validate
+        scheduler.schedule(URI, 1)
+        assert done.wait(2)
+        scheduler.shutdown()
+        scheduler._executor.shutdown(wait=True)
+
+        assert server.published == []
+        assert scheduler.get_stats()["stale"] == 1
+
+    def test_cancel_drops_pending_run(self, server: FakeServer) -> None:
+        scheduler = _scheduler(server, delay=0.05)
+        scheduler.schedule(URI, 1)
+        scheduler.cancel(URI)
+
+        assert not server.published_event.wait(0.2)
+        assert scheduler.get_stats()["queue_depth"] == 0
+        scheduler.shutdown()
+
+
+class TestStats:
+    """Test statistics."""
+
+    def test_initial_stats(self, server: FakeServer) -> None:
+        scheduler = _scheduler(server)
+        stats = scheduler.get_stats()
+        scheduler.shutdown()
+
+        assert stats["queue_depth"] == 0
+        assert stats["avg_latency_ms"] == 0.0
+
+    def test_queue_depth_and_latency(self, server: FakeServer) -> None:
+        scheduler = _scheduler(server, delay=0.05)
+        scheduler.schedule(URI, 1)
+        scheduler.schedule("file:///other.adoc", 1)
+        assert scheduler.get_stats()["queue_depth"] == 2
+
+        while len(server.published) < 2:
+            assert server.published_event.wait(2)
+            server.published_event.clear()
+        scheduler.shutdown()
+
+        stats = scheduler.get_stats()
+        assert stats["queue_depth"] == 0
+        assert stats["max_latency_ms"] >= 50
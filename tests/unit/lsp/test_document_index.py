@@ -0,0 +1,127 @@
+"""
+Tests for AsciiDoc LSP document index.
+
+Tests cover:
+- Structure (headings, delimited blocks, comments)
+- Definitions and references (anchors, xrefs, attributes, includes)
+- Line kinds and inline spans
+- Lazy, cached parts
+"""
+
+import pytest
+
+from asciidoc_artisan.lsp.document_index import (
+    LINE_ATTRIBUTE,
+    LINE_BLOCK_ATTRIBUTE,
+    LINE_COMMENT,
+    LINE_HEADING,
+    LINE_TEXT,
+    Anchor,
+    AttributeEntry,
+    DelimitedBlock,
+    DocumentIndex,
+    Heading,
+    Include,
+    as_index,
+)
+
+TEXT = """= Title
+:toc: left
+
+[[intro]]
+== Introduction
+
+See <<details,the details>> and *bold*.
+
+[source]
+----
+code
+----
+
+// first comment
+// second comment
+include::chapter.adoc[]
+
+////
+== Not a heading
+////
+"""
+
+
+@pytest.fixture
+def index() -> DocumentIndex:
+    """Create index of the sample document."""
+    return DocumentIndex(TEXT, version=3)
+
+
+class TestStructure:
+    """Test structural parts."""
+
+    def test_headings(self, index: DocumentIndex) -> None:
+        assert index.headings == [
+            Heading(0, 1, "Title"),
+            Heading(4, 2, "Introduction"),
+            Heading(18, 2, "Not a heading"),
+        ]
+
+    def test_delimited_blocks(self, index: DocumentIndex) -> None:
+        assert index.delimited_blocks == [DelimitedBlock(9, 11, "-"), DelimitedBlock(17, 19, "/")]
+
+    def test_lines_split_at_lsp_line_breaks_only(self) -> None:
+        index = DocumentIndex("a\x0cb\u2028c\r\nd\re\n", version=1)
+        assert index.lines == ["a\x0cb\u2028c", "d", "e"]
+        assert DocumentIndex("", version=1).lines == []
+
+    def test_comment_lines(self, index: DocumentIndex) -> None:
+        assert index.comment_lines == [13, 14]
+
+
+class TestDefinitions:
+    """Test definitions and references."""
+
+    def test_anchors(self, index: DocumentIndex) -> None:
+        assert index.anchors == [Anchor("intro", 3, 0, 9)]
+        assert index.anchor_ids == ["intro"]
+
+    def test_xrefs(self, index: DocumentIndex) -> None:
+        assert [(xref.id, xref.line) for xref in index.xrefs] == [("details", 6)]
+
+    def test_attribute_entries(self, index: DocumentIndex) -> None:
+        assert index.attribute_entries == {1: AttributeEntry(":toc:", "left", 1)}
+
+    def test_includes(self, index: DocumentIndex) -> None:
+        assert index.includes == [Include("chapter.adoc", 15)]
+
+
+class TestLineKinds:
+    """Test line classification and inline spans."""
+
+    def test_line_kinds(self, index: DocumentIndex) -> None:
+        kinds = index.line_kinds
+        assert kinds[0] == LINE_HEADING
+        assert kinds[1] == LINE_ATTRIBUTE
+        assert kinds[8] == LINE_BLOCK_ATTRIBUTE
+        assert kinds[6] == LINE_TEXT
+        assert kinds[13] == LINE_COMMENT
+        assert kinds[17:20] == [LINE_COMMENT] * 3  # Heading inside comment block
+
+    def test_inline_spans_only_for_text_lines(self, index: DocumentIndex) -> None:
+        assert [span.kind for span in index.inline_spans[6]] == ["xref", "bold"]
+        assert [span.kind for span in index.inline_spans[3]] == ["anchor"]
+        assert index.inline_spans[8] == []
+
+
+class TestCaching:
+    """Test lazy parts and as_index."""
+
+    def test_parts_computed_once(self, index: DocumentIndex) -> None:
+        assert index.headings is index.headings
+        assert index.lines is index.lines
+
+    def test_parts_not_computed_until_accessed(self, index: DocumentIndex) -> None:
+        index.headings
+        assert "inline_spans" not in vars(index)
+
+    def test_as_index(self, index: DocumentIndex) -> None:
+        assert as_index(index) is index
+        assert as_index("== A").headings == [Heading(0, 2, "A")]
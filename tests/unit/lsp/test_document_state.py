@@ -5,11 +5,20 @@ Tests cover:
 - Document open/close/update operations
 - Thread safety
 - Version tracking
+- Ranged edits (incremental sync) and changed line tracking
 """
 
+import random
+
 import pytest
 
-from asciidoc_artisan.lsp.document_state import DocumentState
+from asciidoc_artisan.lsp.document_state import (
+    ChangedLines,
+    DocumentState,
+    LineBuffer,
+    split_lines,
+    utf16_to_index,
+)
 
 
 @pytest.fixture
@@ -156,3 +165,242 @@ class TestThreadSafety:
 
         # Should complete without errors
         assert len(errors) == 0
+
+
+class TestLineHelpers:
+    """Test line splitting and position conversion."""
+
+    def test_split_lines_keeps_endings(self) -> None:
+        assert split_lines("a\nb\r\nc\rd") == ["a\n", "b\r\n", "c\r", "d"]
+
+    def test_split_lines_trailing_break(self) -> None:
+        assert split_lines("a\n") == ["a\n", ""]
+        assert split_lines("") == [""]
+
+    def test_utf16_to_index_surrogate_pair(self) -> None:
+        line = "a\U0001f600b\n"
+        assert utf16_to_index(line, 1) == 1
+        assert utf16_to_index(line, 3) == 2
+
+    def test_utf16_to_index_clamps_to_line_end(self) -> None:
+        assert utf16_to_index("abc\n", 99) == 3
+        assert utf16_to_index("\u00e9t\u00e9\r\n", 99) == 3
+
+
+def _utf16_length(line: str) -> int:
+    return sum(2 if ord(char) > 0xFFFF else 1 for char in line.rstrip("\r\n"))
+
+
+def _offset(text: str, line: int, character: int) -> int:
+    lines = split_lines(text)
+    return sum(len(item) for item in lines[:line]) + utf16_to_index(lines[line], character)
+
+
+class TestLineBuffer:
+    """Test ranged edits on the line buffer."""
+
+    def test_insert_within_line(self) -> None:
+        buffer = LineBuffer("= Title\n\nText\n")
+        assert buffer.apply_edit(2, 0, 2, 0, "More ") == (2, 3, 1)
+        assert buffer.text == "= Title\n\nMore Text\n"
+
+    def test_insert_line_break(self) -> None:
+        buffer = LineBuffer("ab\ncd")
+        assert buffer.apply_edit(0, 1, 0, 1, "\n") == (0, 1, 2)
+        assert buffer.text == "a\nb\ncd"
+        assert buffer.line_count == 3
+
+    def test_delete_across_lines(self) -> None:
+        buffer = LineBuffer("one\ntwo\nthree\n")
+        assert buffer.apply_edit(0, 2, 2, 2, "") == (0, 3, 1)
+        assert buffer.text == "onree\n"
+
+    def test_edit_completing_crlf(self) -> None:
+        buffer = LineBuffer("a\rb")
+        first, _, _ = buffer.apply_edit(1, 0, 1, 0, "\n")
+        assert buffer.text == "a\r\nb"
+        assert first == 0
+        assert buffer.line_count == 2
+
+    def test_invalid_range(self) -> None:
+        buffer = LineBuffer("a\n")
+        with pytest.raises(ValueError):
+            buffer.apply_edit(0, 0, 5, 0, "x")
+        with pytest.raises(ValueError):
+            buffer.apply_edit(0, 1, 0, 0, "x")
+
+    def test_random_edits_match_string_splicing(self) -> None:
+        """Buffer stays equal to naive text splicing, lines outside the span untouched."""
+        rng = random.Random(7)
+        alphabet = ["a", "b", " ", "\n", "\r", "\r\n", "\u00e9", "\U0001f600"]
+
+        for _ in range(500):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 20)))
+            buffer = LineBuffer(text)
+            for _ in range(3):
+                lines = split_lines(text)
+                start_line = rng.randrange(len(lines))
+                end_line = rng.randrange(start_line, len(lines))
+                start_char = rng.randint(0, _utf16_length(lines[start_line]))
+                end_char = rng.randint(0, _utf16_length(lines[end_line]))
+                start, end = _offset(text, start_line, start_char), _offset(text, end_line, end_char)
+                if end < start:
+                    continue
+                new_text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 5)))
+
+                first, old_end, new_count = buffer.apply_edit(start_line, start_char, end_line, end_char, new_text)
+                text = text[:start] + new_text + text[end:]
+                new_lines = split_lines(text)
+
+                assert buffer.text == text
+                assert lines[:first] == new_lines[:first]
+                assert lines[old_end:] == new_lines[first + new_count :]
+
+
+class TestIncrementalSync:
+    """Test ranged edits and changed line tracking in DocumentState."""
+
+    def test_apply_edit_updates_text_and_version(self, state: DocumentState) -> None:
+        uri = "file:///test.adoc"
+        state.open_document(uri, "= Title\n\nText\n", 1)
+
+        assert state.apply_edit(uri, 2, 4, 2, 4, " here", 2) == (2, 3, 1)
+
+        assert state.get_document(uri) == "= Title\n\nText here\n"
+        assert state.get_version(uri) == 2
+        assert state.get_line(uri, 2) == "Text here"
+
+    def test_apply_edit_unknown_document(self, state: DocumentState) -> None:
+        assert not state.apply_edit("file:///missing.adoc", 0, 0, 0, 0, "x", 1)
+
+    def test_apply_edit_invalid_range(self, state: DocumentState) -> None:
+        uri = "file:///test.adoc"
+        state.open_document(uri, "a\n", 1)
+        assert not state.apply_edit(uri, 9, 0, 9, 0, "x", 2)
+        assert state.get_version(uri) == 1
+
+    def test_invalid_range_desyncs_until_full_update(self, state: DocumentState) -> None:
+        uri = "file:///test.adoc"
+        state.open_document(uri, "a\n", 1)
+        state.apply_edit(uri, 9, 0, 9, 0, "x", 2)
+
+        assert state.is_desynced(uri)
+        assert state.get_index(uri) is None
+        assert state.get_document(uri) is None
+        assert state.take_snapshot(uri) is None
+        assert not state.apply_edit(uri, 0, 0, 0, 0, "x", 3)
+
+        state.update_document(uri, "client text\n", 4)
+        assert not state.is_desynced(uri)
+        assert state.get_document(uri) == "client text\n"
+        assert state.apply_edit(uri, 0, 0, 0, 0, "x", 5)
+
+    def test_changed_lines_none_after_open(self, state: DocumentState) -> None:
+        uri = "file:///test.adoc"
+        state.open_document(uri, "a\nb\n", 1)
+        state.apply_edit(uri, 0, 0, 0, 0, "x", 2)
+
+        assert state.take_changed_lines(uri) is None
+
+    def test_changed_lines_after_edits(self, state: DocumentState) -> None:
+        uri = "file:///test.adoc"
+        state.open_document(uri, "a\nb\nc\nd\ne\n", 1)
+        state.take_changed_lines(uri)
+
+        state.apply_edit(uri, 1, 1, 1, 1, "\nnew", 2)  # line 1 -> 2 lines
+        state.apply_edit(uri, 4, 0, 4, 1, "D", 3)  # old line 3
+
+        assert state.take_changed_lines(uri) == ChangedLines(1, 4, 1, 5)
+        assert state.take_changed_lines(uri) is None
+
+    def test_changed_lines_reset_by_full_update(self, state: DocumentState) -> None:
+        uri = "file:///test.adoc"
+        state.open_document(uri, "a\n", 1)
+        state.take_changed_lines(uri)
+        state.apply_edit(uri, 0, 0, 0, 0, "x", 2)
+        state.update_document(uri, "b\n", 3)
+
+        assert state.take_changed_lines(uri) is None
+
+
+class TestSnapshots:
+    """Test atomic snapshots and restoring spans of cancelled consumers."""
+
+    def test_take_snapshot(self, state: DocumentState) -> None:
+        uri = "file:///test.adoc"
+        state.open_document(uri, "a\nb\n", 1)
+        state.take_changed_lines(uri)
+        state.apply_edit(uri, 1, 0, 1, 0, "x", 2)
+
+        index, version, changed = state.take_snapshot(uri)
+
+        assert (index.text, version, changed) == ("a\nxb\n", 2, ChangedLines(1, 2, 1, 2))
+        assert state.take_changed_lines(uri) is None
+        assert state.take_snapshot("file:///missing.adoc") is None
+
+    def test_restore_merges_newer_edits(self, state: DocumentState) -> None:
+        uri = "file:///test.adoc"
+        state.open_document(uri, "a\nb\nc\nd\n", 1)
+        state.take_changed_lines(uri)
+        state.apply_edit(uri, 0, 0, 0, 0, "x", 2)
+        _, _, changed = state.take_snapshot(uri)
+
+        state.apply_edit(uri, 2, 0, 2, 0, "y\n", 3)  # line 2 -> 2 lines
+        state.restore_changed_lines(uri, changed)
+
+        assert state.take_changed_lines(uri) == ChangedLines(0, 3, 0, 4)
+
+    def test_restore_full_change(self, state: DocumentState) -> None:
+        uri = "file:///test.adoc"
+        state.open_document(uri, "a\n", 1)
+        _, _, changed = state.take_snapshot(uri)
+        state.apply_edit(uri, 0, 0, 0, 0, "x", 2)
+
+        state.restore_changed_lines(uri, changed)
+
+        assert changed is None
+        assert state.take_changed_lines(uri) is None
+
+
+class TestSharedIndex:
+    """Test the per-version DocumentIndex cache."""
+
+    def test_index_shared_per_version(self, state: DocumentState) -> None:
+        uri = "file:///test.adoc"
+        state.open_document(uri, "= Title\n", 1)
+
+        index = state.get_index(uri)
+
+        assert index is state.get_index(uri)
+        assert index.version == 1
+        assert index.text == "= Title\n"
+
+    def test_edit_invalidates_index(self, state: DocumentState) -> None:
+        uri = "file:///test.adoc"
+        state.open_document(uri, "= Title\n", 1)
+        index = state.get_index(uri)
+
+        state.apply_edit(uri, 0, 7, 0, 7, "!", 2)
+
+        assert state.get_index(uri) is not index
+        assert state.get_index(uri).text == "= Title!\n"
+
+    def test_index_unknown_document(self, state: DocumentState) -> None:
+        assert state.get_index("file:///missing.adoc") is None
+
+
+class TestChangedLines:
+    """Test merging of edit spans."""
+
+    def test_line_delta(self) -> None:
+        assert ChangedLines(2, 3, 2, 5).line_delta == 2
+
+    def test_merge_disjoint_edit_after(self) -> None:
+        changed = ChangedLines(2, 3, 2, 4)
+        changed.merge(6, 7, 1)
+        assert changed == ChangedLines(2, 6, 2, 7)
+
+    def test_merge_edit_before(self) -> None:
+        changed = ChangedLines(5, 6, 5, 6)
+        changed.merge(1, 3, 0)
+        assert changed == ChangedLines(1, 6, 1, 4)
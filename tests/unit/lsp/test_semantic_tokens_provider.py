@@ -5,10 +5,15 @@ Tests cover:
 - Token type detection (headings, attributes, blocks, etc.)
 - Delta encoding of token positions
 - Token legend generation
+- Full results with ids, delta and range requests
 """
 
+import random
+
 import pytest
+from lsprotocol import types as lsp
 
+from asciidoc_artisan.lsp.document_state import DocumentState
 from asciidoc_artisan.lsp.semantic_tokens_provider import (
     TOKEN_MODIFIERS,
     TOKEN_TYPES,
@@ -230,3 +235,162 @@ class TestDeltaEncoding:
         tokens = provider.get_tokens("")
 
         assert len(tokens.data) == 0
+
+
+def _apply_edits(data: list[int], edits: list[lsp.SemanticTokensEdit]) -> list[int]:
+    """Apply delta edits the way a client does."""
+    result = list(data)
+    for edit in sorted(edits, key=lambda e: e.start, reverse=True):
+        result[edit.start : edit.start + edit.delete_count] = edit.data or []
+    return result
+
+
+LONG_TEXT = "".join(f"== Section {i}\n\nText with *bold* and {{attr}}.\n\n" for i in range(200))
+URI = "file:///test.adoc"
+
+
+class TestDeltaRequests:
+    """Test full/delta requests with result ids."""
+
+    def test_full_has_result_id(self, provider: AsciiDocSemanticTokensProvider) -> None:
+        tokens = provider.get_tokens_full(URI, LONG_TEXT)
+
+        assert tokens.result_id
+        assert tokens.data == provider.get_tokens(LONG_TEXT).data
+
+    def test_delta_edit_is_small(self, provider: AsciiDocSemanticTokensProvider) -> None:
+        full = provider.get_tokens_full(URI, LONG_TEXT)
+        edited = LONG_TEXT.replace("== Section 100\n", "== Section 100\n\n`code` here\n", 1)
+
+        delta = provider.get_tokens_delta(URI, edited, full.result_id)
+
+        assert isinstance(delta, lsp.SemanticTokensDelta)
+        assert delta.result_id != full.result_id
+        assert len(delta.edits) == 1
+        assert len(delta.edits[0].data) < 20
+        assert _apply_edits(full.data, delta.edits) == provider.get_tokens(edited).data
+
+    def test_delta_unchanged_has_no_edits(self, provider: AsciiDocSemanticTokensProvider) -> None:
+        full = provider.get_tokens_full(URI, LONG_TEXT)
+
+        delta = provider.get_tokens_delta(URI, LONG_TEXT, full.result_id)
+
+        assert isinstance(delta, lsp.SemanticTokensDelta)
+        assert delta.edits == []
+
+    def test_delta_with_unknown_result_returns_full(self, provider: AsciiDocSemanticTokensProvider) -> None:
+        provider.get_tokens_full(URI, LONG_TEXT)
+
+        tokens = provider.get_tokens_delta(URI, LONG_TEXT, "stale")
+
+        assert isinstance(tokens, lsp.SemanticTokens)
+        assert tokens.data == provider.get_tokens(LONG_TEXT).data
+
+    def test_forget_drops_result(self, provider: AsciiDocSemanticTokensProvider) -> None:
+        full = provider.get_tokens_full(URI, LONG_TEXT)
+        provider.forget(URI)
+
+        assert isinstance(provider.get_tokens_delta(URI, LONG_TEXT, full.result_id), lsp.SemanticTokens)
+
+
+class TestNotedEdits:
+    """Test delta requests after edits noted from didChange."""
+
+    @staticmethod
+    def edit_and_check(provider, state, previous, edit, version):
+        """Apply an edit, request a delta and check it against fresh tokens."""
+        span = state.apply_edit(URI, *edit, version)
+        provider.note_edit(URI, version, span)
+        index = state.get_index(URI)
+
+        delta = provider.get_tokens_delta(URI, index, previous.result_id)
+
+        assert isinstance(delta, lsp.SemanticTokensDelta)
+        data = _apply_edits(previous.data, delta.edits)
+        assert data == provider.get_tokens(index.text).data
+        return lsp.SemanticTokens(data=data, result_id=delta.result_id)
+
+    def test_only_edited_lines_are_tokenized(self, provider: AsciiDocSemanticTokensProvider, monkeypatch) -> None:
+        state = DocumentState()
+        state.open_document(URI, LONG_TEXT, 1)
+        full = provider.get_tokens_full(URI, state.get_index(URI))
+
+        calls = []
+        original = provider._tokenize_line
+        monkeypatch.setattr(
+            provider, "_tokenize_line", lambda index, line_num: calls.append(line_num) or original(index, line_num)
+        )
+        provider.note_edit(URI, 2, state.apply_edit(URI, 402, 0, 402, 0, "`code` and *more* ", 2))
+        delta = provider.get_tokens_delta(URI, state.get_index(URI), full.result_id)
+
+        assert calls == [402]
+        assert _apply_edits(full.data, delta.edits) == provider.get_tokens(state.get_document(URI)).data
+
+    def test_comment_delimiter_rescans_following_lines(self, provider: AsciiDocSemanticTokensProvider) -> None:
+        state = DocumentState()
+        state.open_document(URI, LONG_TEXT, 1)
+        result = provider.get_tokens_full(URI, state.get_index(URI))
+
+        result = self.edit_and_check(provider, state, result, (100, 0, 100, 0, "////\n"), 2)
+        result = self.edit_and_check(provider, state, result, (300, 0, 300, 0, "////\n"), 3)
+        self.edit_and_check(provider, state, result, (100, 0, 101, 0, ""), 4)
+
+    def test_random_edits_match_full_tokens(self, provider: AsciiDocSemanticTokensProvider) -> None:
+        rng = random.Random(7)
+        pieces = ["", "x", "*b*", "{a}", "\n", "== H\n", "////\n", ":n: v\n", "[[id]]", "<<id>>", "// c\n", "\r\n"]
+        state = DocumentState()
+        state.open_document(URI, LONG_TEXT[:2000], 1)
+        result = provider.get_tokens_full(URI, state.get_index(URI))
+
+        for version in range(2, 200):
+            lines = state.get_document(URI).split("\n")
+            start_line = rng.randrange(len(lines))
+            end_line = min(len(lines) - 1, start_line + rng.choice([0, 0, 1, 3]))
+            start_char = rng.randint(0, len(lines[start_line]))
+            end_char = rng.randint(0, len(lines[end_line])) if end_line > start_line else start_char
+            text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 3)))
+            if rng.random() < 0.3:
+                # Several edits before one request
+                span = state.apply_edit(URI, start_line, start_char, end_line, end_char, text, version)
+                provider.note_edit(URI, version, span)
+                continue
+            result = self.edit_and_check(
+                provider, state, result, (start_line, start_char, end_line, end_char, text), version
+            )
+
+    def test_full_replace_then_edit(self, provider: AsciiDocSemanticTokensProvider) -> None:
+        state = DocumentState()
+        state.open_document(URI, LONG_TEXT, 1)
+        result = provider.get_tokens_full(URI, state.get_index(URI))
+
+        state.update_document(URI, "= New\n\n*text*\n", 2)
+        provider.note_edit(URI, 2)
+        self.edit_and_check(provider, state, result, (0, 0, 0, 0, "x"), 3)
+
+    def test_full_after_noted_edit(self, provider: AsciiDocSemanticTokensProvider) -> None:
+        state = DocumentState()
+        state.open_document(URI, LONG_TEXT, 1)
+        provider.get_tokens_full(URI, state.get_index(URI))
+        provider.note_edit(URI, 2, state.apply_edit(URI, 5, 0, 5, 0, "{x} ", 2))
+
+        tokens = provider.get_tokens_full(URI, state.get_index(URI))
+
+        assert tokens.data == provider.get_tokens(state.get_document(URI)).data
+
+
+class TestRangeRequests:
+    """Test range (viewport) requests."""
+
+    def test_range_matches_full_tokens_of_lines(self, provider: AsciiDocSemanticTokensProvider) -> None:
+        text = "= Title\n\n{attr} and *bold*\n\n== Section\n"
+        range_ = lsp.Range(start=lsp.Position(line=2, character=0), end=lsp.Position(line=4, character=0))
+
+        tokens = provider.get_tokens_range(text, range_)
+
+        full = provider.get_tokens(text).data
+        # Full data minus the title token; first range token is relative to line 0
+        assert tokens.data == [2, *full[6:]]
+
+    def test_range_past_end(self, provider: AsciiDocSemanticTokensProvider) -> None:
+        range_ = lsp.Range(start=lsp.Position(line=5, character=0), end=lsp.Position(line=9, character=0))
+        assert provider.get_tokens_range("= Title\n", range_).data == []
@@ -246,3 +246,165 @@ class TestCodeActionProviderIntegration:
 
         # Verify cleared (no way to get fixes without context)
         assert provider is not None
+
+
+@pytest.mark.fr_108
+class TestDiagnosticsPublishThread:
+    """Tests that diagnostics are published from the server loop."""
+
+    @staticmethod
+    def make_server(version):
+        """Server with only the state used for publishing (skips handler registration)."""
+        server = object.__new__(AsciiDocLanguageServer)
+        server._loop = None
+        server.document_state = DocumentState()
+        server.document_state.open_document("file:///test.adoc", "= Test", version)
+        server.diagnostics_provider = AsciiDocDiagnosticsProvider()
+        server.code_action_provider = AsciiDocCodeActionProvider()
+        server.semantic_tokens_provider = AsciiDocSemanticTokensProvider()
+        return server
+
+    def test_publish_from_worker_runs_on_loop(self):
+        """Test a publish from a worker thread is posted to the server loop."""
+        import asyncio
+        import threading
+
+        server = self.make_server(1)
+        published_on = []
+        server.text_document_publish_diagnostics = lambda params: published_on.append(threading.get_ident())
+
+        async def publish_from_worker():
+            server._remember_loop()
+            worker = threading.Thread(target=server._publish_diagnostics, args=("file:///test.adoc", 1, []))
+            worker.start()
+            worker.join()
+            assert published_on == []  # Queued on the loop, not run on the worker
+            await asyncio.sleep(0)
+            return threading.get_ident()
+
+        loop_thread = asyncio.run(publish_from_worker())
+        assert published_on == [loop_thread]
+
+    def test_did_change_remembers_loop(self):
+        """Test a change handled on the loop captures it without a prior didOpen."""
+        import asyncio
+        from unittest.mock import Mock
+
+        server = self.make_server(1)
+        server.diagnostics_scheduler = Mock()
+        params = lsp.DidChangeTextDocumentParams(
+            text_document=lsp.VersionedTextDocumentIdentifier(uri="file:///test.adoc", version=2),
+            content_changes=[lsp.TextDocumentContentChangeWholeDocument(text="= Changed")],
+        )
+
+        async def change():
+            server._on_did_change(params)
+            return asyncio.get_running_loop()
+
+        loop = asyncio.run(change())
+        assert server._loop is loop
+        server.diagnostics_scheduler.schedule.assert_called_once_with("file:///test.adoc", 2)
+
+    def test_publish_dropped_when_document_changed(self):
+        """Test diagnostics queued for an older version are not published."""
+        server = self.make_server(2)
+        published = []
+        server.text_document_publish_diagnostics = published.append
+
+        server._publish_diagnostics("file:///test.adoc", 1, [])
+
+        assert published == []
+
+
+@pytest.mark.fr_108
+class TestDesync:
+    """Tests that a rejected edit pauses a document until its full text is resent."""
+
+    URI = "file:///test.adoc"
+
+    @classmethod
+    def make_server(cls):
+        """Server with only the state used for document sync (skips handler registration)."""
+        from unittest.mock import Mock
+
+        server = object.__new__(AsciiDocLanguageServer)
+        server._loop = None
+        server.document_state = DocumentState()
+        server.document_state.open_document(cls.URI, "= Test\n", 1)
+        server.diagnostics_provider = AsciiDocDiagnosticsProvider()
+        server.semantic_tokens_provider = AsciiDocSemanticTokensProvider()
+        server.diagnostics_scheduler = Mock()
+        server.published = []
+        server.text_document_publish_diagnostics = server.published.append
+        return server
+
+    @classmethod
+    def change(cls, server, version, line, uri=None):
+        server._on_did_change(
+            lsp.DidChangeTextDocumentParams(
+                text_document=lsp.VersionedTextDocumentIdentifier(uri=uri or cls.URI, version=version),
+                content_changes=[
+                    lsp.TextDocumentContentChangePartial(
+                        range=lsp.Range(
+                            start=lsp.Position(line=line, character=0), end=lsp.Position(line=line, character=0)
+                        ),
+                        text="x",
+                    )
+                ],
+            )
+        )
+
+    def test_out_of_bounds_edit_pauses_document(self):
+        server = self.make_server()
+        self.change(server, 2, 50)
+
+        assert server.document_state.is_desynced(self.URI)
+        assert [params.diagnostics for params in server.published] == [[]]
+        server.diagnostics_scheduler.schedule.assert_not_called()
+        tokens = lsp.SemanticTokensParams(text_document=lsp.TextDocumentIdentifier(uri=self.URI))
+        assert server._on_semantic_tokens(tokens) is None
+
+        # Later edits are dropped without clearing diagnostics again
+        self.change(server, 3, 0)
+        assert len(server.published) == 1
+        server.diagnostics_scheduler.schedule.assert_not_called()
+
+    def test_save_resyncs_from_text(self):
+        server = self.make_server()
+        self.change(server, 2, 50)
+
+        server._on_did_save(
+            lsp.DidSaveTextDocumentParams(text_document=lsp.TextDocumentIdentifier(uri=self.URI), text="= Client\n")
+        )
+
+        assert not server.document_state.is_desynced(self.URI)
+        assert server.document_state.get_document(self.URI) == "= Client\n"
+        server.diagnostics_scheduler.schedule.assert_called_once()
+
+    def test_save_resyncs_from_disk(self, tmp_path):
+        from pygls.uris import from_fs_path
+
+        saved = tmp_path / "doc.adoc"
+        saved.write_bytes(b"= Saved\r\n")
+        server = self.make_server()
+        uri = from_fs_path(str(saved))
+        server.document_state.open_document(uri, "= Old\n", 1)
+        self.change(server, 2, 50, uri)
+
+        server._on_did_save(lsp.DidSaveTextDocumentParams(text_document=lsp.TextDocumentIdentifier(uri=uri)))
+
+        assert server.document_state.get_document(uri) == "= Saved\r\n"
+
+    def test_full_change_resyncs(self):
+        server = self.make_server()
+        self.change(server, 2, 50)
+
+        server._on_did_change(
+            lsp.DidChangeTextDocumentParams(
+                text_document=lsp.VersionedTextDocumentIdentifier(uri=self.URI, version=3),
+                content_changes=[lsp.TextDocumentContentChangeWholeDocument(text="= Full\n")],
+            )
+        )
+
+        assert server.document_state.get_document(self.URI) == "= Full\n"
+        server.diagnostics_scheduler.schedule.assert_called_once_with(self.URI, 3)
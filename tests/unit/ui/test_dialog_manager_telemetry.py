@@ -225,17 +225,16 @@ class TestTelemetryFileOpening:
 class TestTelemetryDirectoryChange:
     """Test suite for telemetry directory change operations."""
 
-    @patch("shutil.copy2")
     @patch("PySide6.QtWidgets.QMessageBox.information")
-    def test_change_telemetry_directory_success(self, mock_info, mock_copy, mock_telemetry_window, tmp_path):
+    def test_change_telemetry_directory_success(self, mock_info, mock_telemetry_window, tmp_path):
         """Test successful telemetry directory change."""
         from asciidoc_artisan.ui.dialog_manager import DialogManager
 
         # Setup
         manager = DialogManager(mock_telemetry_window)
-        old_file = tmp_path / "old" / "telemetry.toon"
+        old_file = tmp_path / "old" / "telemetry-000001.jsonl"
         old_file.parent.mkdir()
-        old_file.write_text('{"test": "data"}')
+        old_file.write_text('{"event_type": "test"}\n')
 
         new_dir = tmp_path / "new"
 
@@ -253,7 +252,7 @@ class TestTelemetryDirectoryChange:
 
         # Verify
         assert new_dir.exists(), "New directory should be created"
-        mock_copy.assert_called_once()
+        mock_telemetry_window.telemetry_collector.set_data_dir.assert_called_once_with(new_dir, copy_data=True)
         mock_info.assert_called_once()
         mock_msg_box.done.assert_called_once()
 
@@ -290,7 +289,7 @@ class TestTelemetryDirectoryChange:
 
         # Setup
         manager = DialogManager(mock_telemetry_window)
-        old_file = tmp_path / "old" / "telemetry.toon"
+        old_file = tmp_path / "old" / "telemetry-000001.jsonl"
 
         mock_msg_box = Mock(spec=QMessageBox)
 
@@ -328,7 +327,5 @@ class TestTelemetryDirectoryChange:
             # Execute
             manager._telemetry_handler._change_telemetry_directory(None, tmp_path / "old", mock_msg_box)
 
-        # Verify telemetry_collector was updated
-        assert mock_telemetry_window.telemetry_collector.data_dir == new_dir
-        expected_file = new_dir / "telemetry.toon"
-        assert mock_telemetry_window.telemetry_collector.telemetry_file == expected_file
+        # Verify telemetry_collector was moved (nothing to copy)
+        mock_telemetry_window.telemetry_collector.set_data_dir.assert_called_once_with(new_dir, copy_data=False)
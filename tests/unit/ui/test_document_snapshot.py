@@ -0,0 +1,94 @@
+"""Tests for ui.document_snapshot module."""
+
+import pytest
+from PySide6.QtWidgets import QPlainTextEdit
+
+from asciidoc_artisan.ui.document_snapshot import DocumentSnapshot, get_document_snapshot
+
+
+@pytest.fixture
+def editor(qapp):
+    """Create an editor with some text."""
+    widget = QPlainTextEdit()
+    widget.setPlainText("= Title\n\nLine one.\nLine two.")
+    return widget
+
+
+@pytest.mark.unit
+class TestDocumentSnapshot:
+    """Test suite for DocumentSnapshot."""
+
+    def test_text_matches_editor(self, editor):
+        snapshot = DocumentSnapshot(editor.document())
+        assert snapshot.text() == editor.toPlainText()
+
+    def test_text_copied_once_per_generation(self, editor):
+        snapshot = DocumentSnapshot(editor.document())
+        first = snapshot.text()
+
+        assert snapshot.text() is first
+        assert snapshot.get_stats()["copies"] == 1
+
+    def test_edit_invalidates_text(self, editor):
+        snapshot = DocumentSnapshot(editor.document())
+        snapshot.text()
+        generation = snapshot.generation
+
+        editor.appendPlainText("Line three.")
+
+        assert snapshot.generation > generation
+        assert snapshot.text().endswith("Line three.")
+        assert snapshot.get_stats()["copies"] == 2
+
+    def test_length_and_line_count_without_copy(self, editor):
+        snapshot = DocumentSnapshot(editor.document())
+
+        assert snapshot.length() == len(editor.toPlainText())
+        assert snapshot.line_count() == 4
+        assert snapshot.get_stats()["copies"] == 0
+
+    def test_line_index_follows_edits(self, editor):
+        snapshot = DocumentSnapshot(editor.document())
+        index = snapshot.line_index()
+        assert index.line_count() == 4
+
+        cursor = editor.textCursor()
+        cursor.setPosition(0)
+        cursor.insertText("New line\n")
+
+        edited = snapshot.line_index()
+        assert edited.version == index.version + 1
+        assert edited.text is snapshot.text()
+        assert edited.line_count() == 5
+        assert edited.line(1) == "= Title"
+
+    def test_line_index_shared_until_edit(self, editor):
+        snapshot = DocumentSnapshot(editor.document())
+        assert snapshot.line_index() is snapshot.line_index()
+
+    def test_empty_document(self, qapp):
+        empty = QPlainTextEdit()
+        snapshot = DocumentSnapshot(empty.document())
+        assert snapshot.text() == ""
+        assert snapshot.length() == 0
+
+
+@pytest.mark.unit
+class TestGetDocumentSnapshot:
+    """Test suite for get_document_snapshot."""
+
+    def test_shared_per_editor(self, editor):
+        assert get_document_snapshot(editor) is get_document_snapshot(editor)
+
+    def test_separate_editors_get_separate_snapshots(self, editor, qapp):
+        other = QPlainTextEdit()
+        assert get_document_snapshot(editor) is not get_document_snapshot(other)
+
+    def test_consumers_share_one_copy(self, editor):
+        snapshot = get_document_snapshot(editor)
+        editor.setPlainText("new text")
+
+        texts = [get_document_snapshot(editor).text() for _ in range(5)]
+
+        assert all(text is texts[0] for text in texts)
+        assert snapshot.get_stats()["copies"] == 1
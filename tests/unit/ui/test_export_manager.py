@@ -175,6 +175,33 @@ class TestSaveFileAsFormat:
             mock_save.assert_called_once()
             assert result is True
 
+    @patch("asciidoc_artisan.ui.export_manager.QFileDialog.getSaveFileName")
+    def test_asciidoc_export_streams_windowed_document(self, mock_dialog, main_window, tmp_path):
+        from asciidoc_artisan.ui.export_manager import ExportManager
+
+        main_window.windowed_editor = Mock(active=True)
+        main_window.windowed_editor.save.return_value = True
+        manager = ExportManager(main_window)
+
+        export_file = tmp_path / "test.adoc"
+        mock_dialog.return_value = (str(export_file), "")
+
+        with patch("asciidoc_artisan.ui.export_manager.atomic_save_text") as mock_save:
+            assert manager.save_file_as_format("adoc") is True
+            mock_save.assert_not_called()
+        main_window.windowed_editor.save.assert_called_once_with(export_file)
+
+    @patch("asciidoc_artisan.ui.export_manager.QFileDialog.getSaveFileName")
+    def test_conversion_blocked_for_windowed_document(self, mock_dialog, main_window):
+        from asciidoc_artisan.ui.export_manager import ExportManager
+
+        main_window.windowed_editor = Mock(active=True)
+        manager = ExportManager(main_window)
+
+        assert manager.save_file_as_format("html") is False
+        mock_dialog.assert_not_called()
+        main_window.status_manager.show_message.assert_called_once()
+
     @patch("asciidoc_artisan.ui.export_manager.QFileDialog.getSaveFileName")
     def test_markdown_export_via_pandoc(self, mock_dialog, main_window, tmp_path):
         from asciidoc_artisan.ui.export_manager import ExportManager
@@ -526,6 +553,16 @@ class TestHelperInitialization:
         assert hasattr(manager, "html_converter")
         assert manager.html_converter is not None
 
+    def test_html_converter_built_on_first_use(self, main_window):
+        from asciidoc_artisan.ui.export_manager import ExportManager
+
+        manager = ExportManager(main_window)
+        assert not hasattr(manager, "_html_converter_instance")
+
+        converter = manager.html_converter
+        assert converter.asciidoc_api is main_window._asciidoc_api
+        assert manager.html_converter is converter
+
     def test_pdf_helper_initialized(self, main_window):
         from asciidoc_artisan.ui.export_manager import ExportManager
 
@@ -10,6 +10,7 @@ Tests file I/O operations including:
 - Path validation
 """
 
+import asyncio
 import time
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
@@ -18,6 +19,7 @@ import pytest
 from PySide6.QtWidgets import QMainWindow, QMessageBox, QPlainTextEdit
 
 from asciidoc_artisan.ui.file_handler import FileHandler
+from asciidoc_artisan.ui.windowed_editor import WINDOW_LINES, WindowedEditor
 
 
 @pytest.fixture
@@ -211,6 +213,40 @@ async def test_load_file_content_async(handler, tmp_path, mock_editor):
     assert handler.unsaved_changes is False
 
 
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_load_file_leaves_windowed_mode_async(handler, tmp_path, mock_editor, mock_window):
+    """Test opening a file ends windowed mode so saves write the new document."""
+    big_file = tmp_path / "huge.adoc"
+    big_file.write_text("".join(f"line {i}\n" for i in range(WINDOW_LINES * 3)), encoding="utf-8")
+    owner = Mock()
+    owner.editor = mock_editor
+    windowed = WindowedEditor(owner)
+    windowed.open(big_file)
+    mock_window.windowed_editor = windowed
+
+    small_file = tmp_path / "small.adoc"
+    small_content = "= Small\n\nShort document"
+    small_file.write_text(small_content, encoding="utf-8")
+    handler.async_manager.read_file = AsyncMock(return_value=small_content)
+    await handler._load_file_async(small_file)
+
+    assert not windowed.active
+
+    async def write_file(path, content, encoding="utf-8"):
+        path.write_text(content, encoding=encoding)
+        return True
+
+    handler.async_manager.write_file = write_file
+    small_file.unlink()
+    assert handler.save_file()
+    for _ in range(100):
+        if small_file.exists():
+            break
+        await asyncio.sleep(0.01)
+    assert small_file.read_bytes() == small_content.encode("utf-8")
+
+
 @pytest.mark.asyncio
 @pytest.mark.fr_072
 @pytest.mark.unit
@@ -60,6 +60,10 @@ def mock_editor(qapp):
     editor.large_file_handler = Mock()
     editor.large_file_handler.load_file_optimized = Mock(return_value=(True, "= Test\n\nContent", None))
 
+    # Windowed editing (files over WINDOWED_MODE_THRESHOLD) inactive
+    editor.windowed_editor = Mock()
+    editor.windowed_editor.active = False
+
     # Preview widget
     editor.preview = Mock()
     editor.preview.setHtml = Mock()
@@ -304,6 +308,24 @@ class TestSaveFile:
         # Should clear unsaved changes flag
         assert mock_editor._unsaved_changes is False
 
+    def test_save_file_emits_file_saved_only(self, mock_editor, tmp_path):
+        from asciidoc_artisan.ui.file_operations_manager import FileOperationsManager
+
+        manager = FileOperationsManager(mock_editor)
+
+        current_file = tmp_path / "test.adoc"
+        mock_editor._current_file_path = current_file
+
+        with patch(
+            "asciidoc_artisan.ui.file_save_handler.atomic_save_text",
+            return_value=True,
+        ):
+            manager.save_file()
+
+        # Git status is refreshed by the file_saved connection, not directly
+        mock_editor.file_handler.file_saved.emit.assert_called_once_with(current_file)
+        mock_editor.git_handler.notify_repository_changed.assert_not_called()
+
 
 @pytest.mark.fr_007
 @pytest.mark.fr_008
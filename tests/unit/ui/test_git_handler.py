@@ -1661,3 +1661,117 @@ class TestUIStateUpdateCalls:
         # Call operation to ensure _update_ui_state doesn't crash
         handler.pull_changes()
         assert handler.is_processing is True
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """Create a directory with the .git files that status refresh watches."""
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "index").write_bytes(b"index")
+    (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+    return tmp_path
+
+
+@pytest.mark.fr_030
+@pytest.mark.unit
+class TestEventDrivenStatusRefresh:
+    """Test suite for change detection, backoff and branch caching."""
+
+    def _handler(self, main_window, mock_managers, repo_path):
+        from asciidoc_artisan.ui.git_handler import GitHandler
+
+        settings_manager, status_manager = mock_managers
+        settings_manager.load_settings.return_value.git_repo_path = str(repo_path)
+        return GitHandler(main_window, settings_manager, status_manager)
+
+    def test_unchanged_repository_skips_refresh(self, main_window, mock_managers, git_repo):
+        handler = self._handler(main_window, mock_managers, git_repo)
+        handler._refresh_git_status()
+        handler._refresh_git_status()
+
+        main_window.request_git_status.emit.assert_called_once_with(str(git_repo))
+        assert handler.get_stats()["skipped_refreshes"] == 1
+
+    def test_index_change_triggers_refresh(self, main_window, mock_managers, git_repo):
+        handler = self._handler(main_window, mock_managers, git_repo)
+        handler._refresh_git_status()
+        (git_repo / ".git" / "index").write_bytes(b"index after staging")
+        handler._refresh_git_status()
+
+        assert main_window.request_git_status.emit.call_count == 2
+
+    def test_change_event_triggers_refresh(self, main_window, mock_managers, git_repo):
+        from asciidoc_artisan.ui.git_handler import STATUS_EVENT_DELAY_MS
+
+        handler = self._handler(main_window, mock_managers, git_repo)
+        handler.start_status_refresh()
+        handler.notify_repository_changed()
+        assert handler.status_timer.remainingTime() <= STATUS_EVENT_DELAY_MS
+
+        handler._refresh_git_status()
+        assert main_window.request_git_status.emit.call_count == 2
+        handler.stop_status_refresh()
+
+    def test_backoff_doubles_until_max_then_forces_refresh(self, main_window, mock_managers, git_repo):
+        from asciidoc_artisan.ui.git_handler import STATUS_REFRESH_MAX_MS, STATUS_REFRESH_MIN_MS
+
+        handler = self._handler(main_window, mock_managers, git_repo)
+        handler._refresh_git_status()
+        while handler.get_stats()["interval_ms"] < STATUS_REFRESH_MAX_MS:
+            handler._refresh_git_status()
+        assert main_window.request_git_status.emit.call_count == 1
+
+        # Worktree edits do not touch .git: the slowest poll still runs status
+        handler._refresh_git_status()
+        assert main_window.request_git_status.emit.call_count == 2
+
+        handler.notify_repository_changed()
+        assert handler.get_stats()["interval_ms"] == STATUS_REFRESH_MIN_MS
+
+    def test_status_results_adjust_interval(self, main_window, mock_managers, git_repo):
+        from asciidoc_artisan.core import GitStatus
+        from asciidoc_artisan.ui.git_handler import STATUS_REFRESH_MIN_MS
+
+        handler = self._handler(main_window, mock_managers, git_repo)
+        handler.handle_status_result(GitStatus(branch="main"))
+        handler.handle_status_result(GitStatus(branch="main"))
+        assert handler.get_stats()["interval_ms"] == STATUS_REFRESH_MIN_MS * 2
+
+        handler.handle_status_result(GitStatus(branch="main", modified_count=1))
+        assert handler.get_stats()["interval_ms"] == STATUS_REFRESH_MIN_MS
+
+    def test_branch_cached_from_status(self, main_window, mock_managers, git_repo):
+        from asciidoc_artisan.core import GitStatus
+
+        handler = self._handler(main_window, mock_managers, git_repo)
+        handler._refresh_git_status()
+        handler.handle_status_result(GitStatus(branch="feature"))
+
+        with patch("subprocess.run") as mock_run:
+            assert handler.get_current_branch() == "feature"
+            mock_run.assert_not_called()
+
+    def test_head_change_drops_cached_branch(self, main_window, mock_managers, git_repo):
+        from asciidoc_artisan.core import GitStatus
+
+        handler = self._handler(main_window, mock_managers, git_repo)
+        handler._refresh_git_status()
+        handler.handle_status_result(GitStatus(branch="main"))
+        (git_repo / ".git" / "HEAD").write_text("ref: refs/heads/feature-branch\n")
+        handler._refresh_git_status()
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = Mock(returncode=0, stdout="feature-branch\n")
+            assert handler.get_current_branch() == "feature-branch"
+            mock_run.assert_called_once()
+
+    def test_visible_status_dialog_requests_detailed_status(self, main_window, mock_managers, git_repo):
+        main_window.request_detailed_git_status = Mock()
+        main_window._git_status_dialog = Mock()
+        main_window._git_status_dialog.isVisible.return_value = True
+
+        handler = self._handler(main_window, mock_managers, git_repo)
+        handler._refresh_git_status()
+
+        main_window.request_detailed_git_status.emit.assert_called_once_with(str(git_repo))
+        main_window.request_git_status.emit.assert_not_called()
@@ -0,0 +1,171 @@
+"""
+Tests for ui.highlight_layers module.
+
+Tests layer merging, paint order and viewport-first building of
+editor extra selections.
+"""
+
+import pytest
+from PySide6.QtGui import QColor, QTextCharFormat
+from PySide6.QtWidgets import QPlainTextEdit
+
+from asciidoc_artisan.ui.highlight_layers import HighlightLayers, get_highlight_layers
+
+
+@pytest.fixture
+def editor(qtbot):
+    """Create a test editor widget."""
+    widget = QPlainTextEdit()
+    qtbot.addWidget(widget)
+    return widget
+
+
+def _format(color):
+    fmt = QTextCharFormat()
+    fmt.setBackground(QColor(color))
+    return fmt
+
+
+def _set_lines(layers, name, lines, color="yellow"):
+    """Highlight the first character of each given line."""
+    document = layers.editor.document()
+    fmt = _format(color)
+
+    def span_of(line):
+        position = document.findBlockByNumber(line).position()
+        return position, position + 1
+
+    layers.set_layer(
+        name,
+        list(lines),
+        line_of=lambda line: line,
+        span_of=span_of,
+        format_of=lambda _line: fmt,
+    )
+
+
+@pytest.mark.unit
+class TestHighlightLayers:
+    """Test merging and rebuilding of layers."""
+
+    def test_shared_per_editor(self, editor):
+        layers = get_highlight_layers(editor)
+        assert isinstance(layers, HighlightLayers)
+        assert get_highlight_layers(editor) is layers
+
+    def test_layers_merged_in_paint_order(self, editor):
+        editor.setPlainText("a\nb\nc")
+        layers = get_highlight_layers(editor)
+        _set_lines(layers, "search", [0], "yellow")
+        _set_lines(layers, "syntax", [1], "red")
+
+        assert layers.layer_names() == ["syntax", "search"]
+        assert [s.cursor.blockNumber() for s in editor.extraSelections()] == [1, 0]
+
+    def test_clear_layer_keeps_others(self, editor):
+        editor.setPlainText("a\nb\nc")
+        layers = get_highlight_layers(editor)
+        _set_lines(layers, "spell", [0, 2])
+        _set_lines(layers, "search", [1])
+
+        layers.clear_layer("search")
+        assert [s.cursor.blockNumber() for s in editor.extraSelections()] == [0, 2]
+
+    def test_unchanged_layer_not_rebuilt(self, editor):
+        editor.setPlainText("a\nb\nc")
+        layers = get_highlight_layers(editor)
+        calls = []
+        editor_doc = editor.document()
+        layers.set_layer(
+            "spell",
+            [0],
+            line_of=lambda line: line,
+            span_of=lambda line: calls.append(line) or (editor_doc.findBlockByNumber(line).position(), 1),
+            format_of=lambda _line: QTextCharFormat(),
+        )
+        _set_lines(layers, "search", [1])
+        _set_lines(layers, "search", [2])
+        assert calls == [0]
+        assert len(editor.extraSelections()) == 2
+
+    def test_spans_clamped_to_document(self, editor):
+        editor.setPlainText("abc")
+        layers = get_highlight_layers(editor)
+        layers.set_layer("search", [0], lambda _i: 0, lambda _i: (1, 100), lambda _i: QTextCharFormat())
+        assert editor.extraSelections()[0].cursor.selectedText() == "bc"
+
+
+@pytest.mark.unit
+class TestViewportFirst:
+    """Test that off-screen items are built later."""
+
+    @pytest.fixture
+    def shown(self, editor, qtbot):
+        editor.resize(400, 200)
+        editor.show()
+        qtbot.waitExposed(editor)
+        editor.setPlainText("\n".join(f"line {i}" for i in range(5000)))
+        return editor
+
+    def test_visible_window_built_first(self, shown):
+        layers = get_highlight_layers(shown)
+        _set_lines(layers, "spell", range(0, 5000, 5))
+
+        stats = layers.get_stats()
+        assert stats["items"] == 1000
+        assert 0 < stats["built"] < 100
+
+    def test_idle_fill_completes_layer(self, shown, qtbot):
+        layers = get_highlight_layers(shown)
+        _set_lines(layers, "spell", range(0, 5000, 5))
+
+        qtbot.waitUntil(lambda: layers.get_stats()["built"] == 1000)
+        assert len(shown.extraSelections()) == 1000
+
+    def test_scrolling_builds_new_window(self, shown):
+        layers = get_highlight_layers(shown)
+        _set_lines(layers, "spell", range(0, 5000, 5))
+
+        shown.verticalScrollBar().setValue(shown.verticalScrollBar().maximum())
+        assert 4995 in {s.cursor.blockNumber() for s in shown.extraSelections()}
+
+    def test_offset_layer_built_for_window_and_on_scroll(self, shown):
+        from asciidoc_artisan.core.search_session import SearchSession
+
+        session = SearchSession(shown.toPlainText(), "line")
+        layers = get_highlight_layers(shown)
+        layers.set_offset_layer(
+            "search", session.starts, session.line_index, session.document_span, lambda _i: QTextCharFormat()
+        )
+
+        stats = layers.get_stats()
+        assert stats["items"] == 5000
+        assert 0 < stats["built"] < 200
+        assert all(s.cursor.selectedText() == "line" for s in shown.extraSelections())
+
+        shown.verticalScrollBar().setValue(shown.verticalScrollBar().maximum())
+        assert 4999 in {s.cursor.blockNumber() for s in shown.extraSelections()}
+
+    def test_unbuilt_items_shift_with_edits(self, shown, qtbot):
+        layers = get_highlight_layers(shown)
+        document = shown.document()
+
+        def span_of(line):
+            position = document.findBlockByNumber(line).position()
+            return position, position + 4
+
+        spans = {line: span_of(line) for line in range(0, 5000, 5)}
+        layers.set_layer("spell", list(spans), lambda line: line, spans.get, lambda _line: QTextCharFormat())
+        assert layers.get_stats()["built"] < 1000
+
+        cursor = shown.textCursor()
+        cursor.setPosition(0)
+        cursor.insertText("new ")  # Before every unbuilt item
+        cursor.setPosition(document.findBlockByNumber(4000).position() + 2)
+        cursor.insertText("XY")  # Inside the span of line 4000
+
+        qtbot.waitUntil(lambda: layers.get_stats()["built"] == 1000)
+        selected = {s.cursor.blockNumber(): s.cursor.selectedText() for s in shown.extraSelections()}
+        assert selected[4995] == "line"
+        assert selected[5] == "line"
+        assert 4000 not in selected
@@ -384,6 +384,39 @@ def test_start_preview_updates(handler):
     # Just verify it doesn't crash
 
 
+def test_stopped_preview_ignores_edits_until_started(handler, editor):
+    """Test edits while stopped neither start the timer nor queue an edit range."""
+    handler.stop_preview_updates()
+    editor.setPlainText("Test")
+    assert not handler.preview_timer.isActive()
+    assert handler._pending_edit is None
+
+    handler.start_preview_updates()
+    editor.setPlainText("Test again")
+    assert handler.preview_timer.isActive()
+
+
+def test_restarted_preview_renders_full_text(handler, editor, mock_window):
+    """Test the first render after a restart sends no edit range."""
+    mock_window.request_preview_render_edit = Mock()
+    editor.setPlainText("Line 1\nLine 2")
+    handler.update_preview()
+    handler.stop_preview_updates()
+    editor.setPlainText("Other document")
+
+    handler.start_preview_updates()
+    editor.textCursor().insertText("x")
+    assert handler._pending_edit is None
+    mock_window.request_preview_render.reset_mock()
+    mock_window.request_preview_render_edit.reset_mock()
+    handler.update_preview()
+    mock_window.request_preview_render_edit.emit.assert_not_called()
+    mock_window.request_preview_render.emit.assert_called_once()
+
+    editor.textCursor().insertText("y")
+    assert handler._pending_edit is not None
+
+
 def test_css_has_responsive_design(handler):
     """Test CSS includes responsive design rules."""
     css = handler.get_preview_css()
@@ -641,16 +674,11 @@ def test_predictive_rendering_on_text_change(editor, preview, mock_window, qtbot
     """Test predictive rendering is triggered on text change.
 
     Tests lines 280-283:
-    - Preview worker request_prediction method call
+    - Prediction request emitted for the preview thread
     - Source text and cursor line passed correctly
     """
-    from unittest.mock import MagicMock
-
     FullConcretePreviewHandler(editor, preview, mock_window)
-
-    # Create mock preview worker with request_prediction
-    mock_worker = MagicMock()
-    mock_window.preview_worker = mock_worker
+    mock_window.request_preview_prediction = Mock()
 
     # Set initial text and cursor position
     editor.setPlainText("Line 1\nLine 2\nLine 3")
@@ -660,15 +688,15 @@ def test_predictive_rendering_on_text_change(editor, preview, mock_window, qtbot
     qtbot.wait(50)
 
     # Clear previous calls
-    mock_worker.request_prediction.reset_mock()
+    mock_window.request_preview_prediction.reset_mock()
 
     # Trigger text change
     editor.setPlainText("Line 1\nLine 2 modified\nLine 3")
     qtbot.wait(50)
 
-    # Verify request_prediction was called
-    assert mock_worker.request_prediction.called
-    call_args = mock_worker.request_prediction.call_args[0]
+    # Verify the prediction was requested (not run on the main thread)
+    assert mock_window.request_preview_prediction.emit.called
+    call_args = mock_window.request_preview_prediction.emit.call_args[0]
     assert "Line 2 modified" in call_args[0]  # Source text
     assert isinstance(call_args[1], int)  # Cursor line
 
@@ -847,3 +875,13 @@ def test_import_error_fallback():
         # If AdaptiveDebouncer import failed, flag would be False
         # This test documents the ImportError path exists
         assert hasattr(preview_handler_base, "ADAPTIVE_DEBOUNCER_AVAILABLE")
+
+
+def test_update_preview_passes_shared_line_index(handler, editor, mock_window):
+    """Test the render request carries the snapshot's line index of the text."""
+    editor.setPlainText("= Title\n\nBody")
+    handler.update_preview()
+
+    source_text, line_index = mock_window.request_preview_render.emit.call_args.args
+    assert line_index.text is source_text
+    assert line_index is handler._snapshot.line_index()
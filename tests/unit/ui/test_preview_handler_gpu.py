@@ -113,6 +113,76 @@ class TestHandlePreviewComplete:
             mock_signal.emit.assert_called_once_with(html)
 
 
+@pytest.mark.fr_015
+@pytest.mark.fr_016
+@pytest.mark.unit
+class TestHandlePreviewPatch:
+    """Test suite for per-block patch updates."""
+
+    def test_first_patch_reloads_page(self, mock_editor, mock_preview, mock_parent_window):
+        from asciidoc_artisan.ui.preview_handler_gpu import WebEngineHandler
+
+        handler = WebEngineHandler(mock_editor, mock_preview, mock_parent_window)
+        handler.handle_preview_patch('<div id="adoc-block-0">A</div>', [("adoc-block-0", "A")])
+
+        mock_preview.setHtml.assert_called_once()
+        mock_preview.page().runJavaScript.assert_not_called()
+
+    def test_patches_loaded_page_in_place(self, mock_editor, mock_preview, mock_parent_window):
+        from asciidoc_artisan.ui.preview_handler_gpu import WebEngineHandler
+
+        handler = WebEngineHandler(mock_editor, mock_preview, mock_parent_window)
+        handler.handle_preview_patch('<div id="adoc-block-0">A</div>', None)
+        handler.handle_preview_patch('<div id="adoc-block-0">B</div>', [("adoc-block-0", "<p>B</p>")])
+
+        assert mock_preview.setHtml.call_count == 1
+        js_code = mock_preview.page().runJavaScript.call_args[0][0]
+        assert '[["adoc-block-0", "<p>B</p>"]]' in js_code
+
+    def test_empty_patch_skips_update(self, mock_editor, mock_preview, mock_parent_window):
+        from asciidoc_artisan.ui.preview_handler_gpu import WebEngineHandler
+
+        handler = WebEngineHandler(mock_editor, mock_preview, mock_parent_window)
+        handler.handle_preview_patch("<div></div>", None)
+        handler.handle_preview_patch("<div></div>", [])
+
+        assert mock_preview.setHtml.call_count == 1
+        mock_preview.page().runJavaScript.assert_not_called()
+
+    def test_structure_change_reloads_page(self, mock_editor, mock_preview, mock_parent_window):
+        from asciidoc_artisan.ui.preview_handler_gpu import WebEngineHandler
+
+        handler = WebEngineHandler(mock_editor, mock_preview, mock_parent_window)
+        handler.handle_preview_patch("<div>A</div>", None)
+        handler.handle_preview_patch("<div>A</div><div>B</div>", None)
+
+        assert mock_preview.setHtml.call_count == 2
+
+    def test_error_page_is_not_patched(self, mock_editor, mock_preview, mock_parent_window):
+        from asciidoc_artisan.ui.preview_handler_gpu import WebEngineHandler
+
+        handler = WebEngineHandler(mock_editor, mock_preview, mock_parent_window)
+        handler.handle_preview_patch("<div>A</div>", None)
+        handler.handle_preview_error("boom")
+        handler.handle_preview_patch("<div>B</div>", [("adoc-block-0", "B")])
+
+        assert mock_preview.setHtml.call_count == 3
+        mock_preview.page().runJavaScript.assert_not_called()
+
+    def test_missing_anchor_reloads_page(self, mock_editor, mock_preview, mock_parent_window):
+        from asciidoc_artisan.ui.preview_handler_gpu import WebEngineHandler
+
+        handler = WebEngineHandler(mock_editor, mock_preview, mock_parent_window)
+        handler.handle_preview_patch("<div>A</div>", None)
+        handler.handle_preview_patch("<div>B</div>", [("adoc-block-0", "B")])
+
+        callback = mock_preview.page().runJavaScript.call_args[0][1]
+        callback(False)
+
+        assert mock_preview.setHtml.call_count == 2
+        assert "<div>B</div>" in mock_preview.setHtml.call_args[0][0]
+
+
 @pytest.mark.fr_015
 @pytest.mark.fr_016
 @pytest.mark.unit
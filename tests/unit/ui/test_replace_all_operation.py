@@ -0,0 +1,78 @@
+"""
+Tests for ui.replace_all_operation module.
+
+Tests chunked in-place replacement, the single undo step and
+cancellation.
+"""
+
+import pytest
+from PySide6.QtWidgets import QPlainTextEdit
+
+from asciidoc_artisan.core.search_session import SearchSession
+from asciidoc_artisan.ui.replace_all_operation import ReplaceAllOperation
+
+
+@pytest.fixture
+def editor(qtbot):
+    """Create a test editor widget."""
+    widget = QPlainTextEdit()
+    qtbot.addWidget(widget)
+    return widget
+
+
+def _operation(editor, text, search_text, replace_text, chunk_size=2, **options):
+    editor.setPlainText(text)
+    session = SearchSession(editor.toPlainText(), search_text, **options)
+    return ReplaceAllOperation(editor, session, replace_text, chunk_size=chunk_size)
+
+
+@pytest.mark.unit
+class TestReplaceAllOperation:
+    """Test chunked replace all."""
+
+    def test_replaces_in_chunks(self, editor, qtbot):
+        operation = _operation(editor, "a x a x a x a x a", "a", "bb")
+        progress = []
+        operation.progress.connect(lambda replaced, total: progress.append((replaced, total)))
+
+        with qtbot.waitSignal(operation.finished) as blocker:
+            operation.start()
+
+        assert blocker.args == [5]
+        assert progress == [(2, 5), (4, 5), (5, 5)]
+        assert editor.toPlainText() == "bb x bb x bb x bb x bb"
+        assert not editor.isReadOnly()
+
+    def test_single_undo_step(self, editor, qtbot):
+        operation = _operation(editor, "one two one two one", "one", "1")
+        with qtbot.waitSignal(operation.finished):
+            operation.start()
+
+        assert editor.toPlainText() == "1 two 1 two 1"
+        editor.undo()
+        assert editor.toPlainText() == "one two one two one"
+
+    def test_regex_backreferences(self, editor, qtbot):
+        operation = _operation(editor, "a1 b2", r"(\w)(\d)", r"\2\1", use_regex=True)
+        with qtbot.waitSignal(operation.finished):
+            operation.start()
+        assert editor.toPlainText() == "1a 2b"
+
+    def test_non_bmp_text_positions(self, editor, qtbot):
+        operation = _operation(editor, "\U0001f600 cat \U0001f600 cat", "cat", "dog")
+        with qtbot.waitSignal(operation.finished):
+            operation.start()
+        assert editor.toPlainText() == "\U0001f600 dog \U0001f600 dog"
+
+    def test_cancel_restores_document(self, editor, qtbot):
+        operation = _operation(editor, "a a a a a a", "a", "b", chunk_size=2)
+        operation.start()
+        assert operation.is_running
+        assert editor.isReadOnly()
+
+        with qtbot.waitSignal(operation.cancelled):
+            operation.cancel()
+
+        assert editor.toPlainText() == "a a a a a a"
+        assert not operation.is_running
+        assert not editor.isReadOnly()
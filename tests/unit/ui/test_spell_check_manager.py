@@ -1676,3 +1676,62 @@ class TestDefaultContextMenu:
 
             # Should call default menu
             mock_default.assert_called_once_with(event)
+
+
+@pytest.mark.fr_050
+@pytest.mark.unit
+class TestBackgroundSpellCheck:
+    """Test spell checking on the worker thread."""
+
+    def test_debounced_check_runs_off_gui_thread(self, main_window, qtbot):
+        """Test timer-triggered check applies worker results."""
+        from asciidoc_artisan.ui.spell_check_manager import SpellCheckManager
+
+        manager = SpellCheckManager(main_window)
+        main_window.editor.setPlainText("This is a tset.")
+        manager._start_background_check()
+
+        qtbot.waitUntil(lambda: [e.word for e in manager.errors] == ["tset"], timeout=2000)
+        manager.shutdown()
+
+    def test_toggle_on_checks_off_gui_thread(self, main_window, qtbot):
+        """Test enabling spell check queues a worker pass instead of checking inline."""
+        from asciidoc_artisan.ui.spell_check_manager import SpellCheckManager
+
+        main_window._settings.spell_check_enabled = False
+        manager = SpellCheckManager(main_window)
+        main_window.editor.setPlainText("This is a tset.")
+
+        with patch.object(manager, "_perform_spell_check") as mock_perform:
+            manager.toggle_spell_check()
+            mock_perform.assert_not_called()
+
+        qtbot.waitUntil(lambda: [e.word for e in manager.errors] == ["tset"], timeout=2000)
+        manager.shutdown()
+
+    def test_stale_result_dropped(self, main_window):
+        """Test results for older text are ignored."""
+        from asciidoc_artisan.core import SpellError
+        from asciidoc_artisan.ui.spell_check_manager import SpellCheckManager
+
+        manager = SpellCheckManager(main_window)
+        generation = manager._generation
+        main_window.editor.setPlainText("Changed")
+
+        manager._on_check_finished(generation, [SpellError("tset", 0, 4, [], 1, 0)])
+        assert manager.errors == []
+        manager.shutdown()
+
+    def test_suggestions_computed_on_demand(self, main_window):
+        """Test suggestions are filled in when first requested."""
+        from asciidoc_artisan.ui.spell_check_manager import SpellCheckManager
+
+        main_window.editor.setPlainText("Helo world")
+        manager = SpellCheckManager(main_window)
+        manager._perform_spell_check()
+
+        error = manager.errors[0]
+        assert error.suggestions == []
+        assert "hello" in manager.get_suggestions(error)
+        assert error.suggestions == manager.get_suggestions(error)
+        manager.shutdown()
@@ -31,7 +31,9 @@ def checker():
 @pytest.fixture
 def manager(editor, checker):
     """Create a SyntaxCheckerManager instance."""
-    return SyntaxCheckerManager(editor, checker)
+    manager = SyntaxCheckerManager(editor, checker)
+    yield manager
+    manager.shutdown()
 
 
 @pytest.mark.fr_091
@@ -642,3 +644,110 @@ class TestEdgeCases:
 
         # Errors list should be empty or have no critical issues
         assert isinstance(manager.errors, list)
+
+
+@pytest.mark.unit
+class TestBackgroundValidation:
+    """Test validation on the worker thread."""
+
+    def test_results_applied_from_worker(self, manager, editor, qtbot):
+        """Test worker results reach the GUI thread."""
+        editor.setPlainText("= Title\n\ntext  ")
+
+        with qtbot.waitSignal(manager.errors_changed, timeout=2000):
+            manager._validate_document()
+
+        assert any(e.code == "W029" for e in manager.errors)
+
+    def test_stale_results_dropped(self, manager, editor):
+        """Test results for older text are not applied after an edit."""
+        editor.setPlainText("text  ")
+        generation = manager._generation
+        editor.setPlainText("= Title")
+
+        manager._on_validation_finished(
+            generation,
+            [
+                SyntaxErrorModel(
+                    code="W029", severity=ErrorSeverity.WARNING, message="stale", line=0, column=4, length=2
+                )
+            ],
+        )
+        assert manager.errors == []
+
+    def test_edit_cancels_running_validation(self, manager, editor):
+        """Test a text change makes the running check's cancel flag true."""
+        editor.setPlainText("= Title")
+        generation = manager._generation
+        editor.insertPlainText("x")
+        assert generation != manager._generation
+
+    def test_validate_now_is_synchronous(self, manager, editor):
+        """Test validate_now applies errors before returning."""
+        editor.setPlainText("= Title\n\ntext  ")
+        manager.validate_now()
+        assert any(e.code == "W029" for e in manager.errors)
+
+    def test_shutdown_stops_worker(self, manager, editor):
+        """Test validation after shutdown is skipped without errors."""
+        manager.shutdown()
+        editor.setPlainText("text  ")
+        manager._validate_document()
+        assert manager.errors == []
+
+
+@pytest.mark.unit
+class TestViewportUnderlines:
+    """Test underline placement and viewport clipping."""
+
+    def _warnings(self, lines):
+        return [
+            SyntaxErrorModel(code="W029", message="w", severity=ErrorSeverity.WARNING, line=line, column=2, length=3)
+            for line in lines
+        ]
+
+    def test_underline_positions_use_block_index(self, manager, editor):
+        """Test selection covers the error columns of the right line."""
+        editor.setPlainText("first\nsecond line\nthird")
+        manager.errors = self._warnings([1])
+        manager._show_underlines()
+
+        selections = editor.extraSelections()
+        assert selections[0].cursor.selectedText() == "con"
+
+    def test_columns_clamped_to_line(self, manager, editor):
+        """Test errors past the line end stay on their line."""
+        editor.setPlainText("ab\ncd")
+        manager.errors = [
+            SyntaxErrorModel(code="E002", message="e", severity=ErrorSeverity.ERROR, line=0, column=1, length=10)
+        ]
+        manager._show_underlines()
+
+        selections = editor.extraSelections()
+        assert selections[0].cursor.selectedText() == "b"
+
+    def test_only_lines_near_viewport_underlined(self, manager, editor, qtbot):
+        """Test off-screen errors get selections only after scrolling."""
+        editor.resize(400, 200)
+        editor.show()
+        qtbot.waitExposed(editor)
+        editor.setPlainText("\n".join(f"line {i}" for i in range(5000)))
+        manager.errors = self._warnings(range(0, 5000, 10))
+        manager._show_underlines()
+
+        first_lines = {s.cursor.blockNumber() for s in editor.extraSelections()}
+        assert 0 in first_lines
+        assert len(first_lines) < 50
+
+        editor.verticalScrollBar().setValue(editor.verticalScrollBar().maximum())
+        last_lines = {s.cursor.blockNumber() for s in editor.extraSelections()}
+        assert 4990 in last_lines
+        assert 0 not in last_lines
+
+    def test_jump_to_error_uses_block_position(self, manager, editor):
+        """Test jumping places the cursor at the error column."""
+        editor.setPlainText("a\nbb\nccccc")
+        manager._jump_to_error(self._warnings([2])[0])
+
+        cursor = editor.textCursor()
+        assert (cursor.blockNumber(), cursor.positionInBlock()) == (2, 2)
@@ -0,0 +1,94 @@
+"""
+Tests for ui.windowed_editor module.
+
+Tests window loading, moving the window and saving through the
+windowed document.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from asciidoc_artisan.ui.line_number_area import LineNumberPlainTextEdit
+from asciidoc_artisan.ui.windowed_editor import WINDOW_LINES, WindowedEditor
+
+
+@pytest.fixture
+def main_window(qtbot):
+    """Create a main window stand-in with a line-numbered editor."""
+    window = Mock()
+    window.editor = LineNumberPlainTextEdit()
+    window._unsaved_changes = False
+    qtbot.addWidget(window.editor)
+    return window
+
+
+@pytest.fixture
+def big_file(tmp_path):
+    file_path = tmp_path / "huge.adoc"
+    file_path.write_text("".join(f"line {i}\n" for i in range(WINDOW_LINES * 3)), encoding="utf-8")
+    return file_path
+
+
+@pytest.mark.unit
+class TestWindowedEditor:
+    """Test windowed editing."""
+
+    def test_open_loads_first_window(self, main_window, big_file):
+        windowed = WindowedEditor(main_window)
+        windowed.open(big_file)
+
+        assert windowed.active
+        assert windowed.window == (0, WINDOW_LINES)
+        assert main_window.editor.blockCount() == WINDOW_LINES
+        assert main_window._current_file_path == big_file
+        windowed.close()
+
+    def test_go_to_line_moves_window(self, main_window, big_file):
+        windowed = WindowedEditor(main_window)
+        windowed.open(big_file)
+        windowed.go_to_line(WINDOW_LINES * 2)
+
+        first, last = windowed.window
+        assert first <= WINDOW_LINES * 2 < last
+        assert main_window.editor.line_number_offset == first
+        assert main_window.editor.textCursor().block().text() == f"line {WINDOW_LINES * 2}"
+        windowed.close()
+        assert main_window.editor.line_number_offset == 0
+
+    def test_edits_survive_window_moves_and_save(self, main_window, big_file):
+        windowed = WindowedEditor(main_window)
+        windowed.open(big_file)
+        main_window.editor.textCursor().insertText("edited ")
+        windowed.go_to_line(WINDOW_LINES * 2)
+
+        assert windowed.save(big_file)
+        lines = big_file.read_text(encoding="utf-8").split("\n")
+        assert lines[0] == "edited line 0"
+        assert len(lines) == WINDOW_LINES * 3 + 1
+        windowed.close()
+
+    def test_inactive_save_fails(self, main_window, tmp_path):
+        windowed = WindowedEditor(main_window)
+        assert not windowed.active
+        assert not windowed.save(tmp_path / "out.adoc")
+
+    def test_preview_stopped_while_open(self, main_window, big_file, monkeypatch):
+        monkeypatch.setattr("asciidoc_artisan.core.large_file_handler.PREVIEW_DISABLE_THRESHOLD", 0)
+        windowed = WindowedEditor(main_window)
+        windowed.open(big_file)
+
+        main_window.preview_handler.stop_preview_updates.assert_called_once()
+        main_window.preview_handler.clear_preview.assert_called_once()
+        main_window.preview_handler.start_preview_updates.assert_not_called()
+
+        windowed.close()
+        main_window.preview_handler.start_preview_updates.assert_called_once()
+
+    def test_preview_kept_below_threshold(self, main_window, big_file):
+        windowed = WindowedEditor(main_window)
+        windowed.open(big_file)
+        windowed.close()
+
+        main_window.preview_handler.stop_preview_updates.assert_not_called()
+        main_window.preview_handler.start_preview_updates.assert_not_called()
@@ -55,6 +55,19 @@ def mock_editor():
     return editor
 
 
+@pytest.fixture
+def lazy_startup_mocks():
+    """Patch the invoker and idle timers created when workers start."""
+    with (
+        patch("asciidoc_artisan.ui.worker_manager.WorkerInvoker") as mock_invoker_class,
+        patch("asciidoc_artisan.ui.worker_manager.QTimer") as mock_timer_class,
+    ):
+        yield mock_invoker_class, mock_timer_class
+
+
+ALL_WORKERS = ("git", "github", "pandoc", "preview", "ollama_chat", "claude")
+
+
 class TestWorkerManagerInitialization:
     """Test WorkerManager initialization."""
 
@@ -105,11 +118,11 @@ class TestSetupWorkersAndThreads:
     """Test worker and thread setup."""
 
     @patch("asciidoc_artisan.claude.ClaudeWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.OllamaChatWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.PreviewWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.PandocWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.GitHubCLIWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.GitWorker")
+    @patch("asciidoc_artisan.workers.OllamaChatWorker")
+    @patch("asciidoc_artisan.workers.PreviewWorker")
+    @patch("asciidoc_artisan.workers.PandocWorker")
+    @patch("asciidoc_artisan.workers.GitHubCLIWorker")
+    @patch("asciidoc_artisan.workers.GitWorker")
     @patch("asciidoc_artisan.ui.worker_manager.QThread")
     def test_setup_creates_all_workers(
         self,
@@ -121,8 +134,9 @@ class TestSetupWorkersAndThreads:
         mock_ollama_worker_class,
         mock_claude_worker_class,
         mock_editor,
+        lazy_startup_mocks,
     ):
-        """Test setup_workers_and_threads creates all workers."""
+        """Test start_worker creates all workers after setup."""
         # Mock thread instances
         mock_threads = [Mock(spec=QThread) for _ in range(6)]
         for thread in mock_threads:
@@ -184,6 +198,8 @@ class TestSetupWorkersAndThreads:
 
         manager = WorkerManager(mock_editor, use_worker_pool=False)
         manager.setup_workers_and_threads()
+        for name in ALL_WORKERS:
+            manager.start_worker(name)
 
         # Verify all workers created
         assert manager.git_worker is mock_git_worker
@@ -198,11 +214,11 @@ class TestSetupWorkersAndThreads:
             thread.start.assert_called_once()
 
     @patch("asciidoc_artisan.claude.ClaudeWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.OllamaChatWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.PreviewWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.PandocWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.GitHubCLIWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.GitWorker")
+    @patch("asciidoc_artisan.workers.OllamaChatWorker")
+    @patch("asciidoc_artisan.workers.PreviewWorker")
+    @patch("asciidoc_artisan.workers.PandocWorker")
+    @patch("asciidoc_artisan.workers.GitHubCLIWorker")
+    @patch("asciidoc_artisan.workers.GitWorker")
     @patch("asciidoc_artisan.ui.worker_manager.QThread")
     def test_setup_connects_git_signals(
         self,
@@ -214,6 +230,7 @@ class TestSetupWorkersAndThreads:
         mock_ollama_worker_class,
         mock_claude_worker_class,
         mock_editor,
+        lazy_startup_mocks,
     ):
         """Test setup connects Git worker signals."""
         # Setup mocks (simplified version)
@@ -263,12 +280,131 @@ class TestSetupWorkersAndThreads:
 
         manager = WorkerManager(mock_editor, use_worker_pool=False)
         manager.setup_workers_and_threads()
+        for name in ALL_WORKERS:
+            manager.start_worker(name)
 
         # Verify Git signals connected
         mock_editor.request_git_command.connect.assert_called_once()
         mock_git_worker.command_complete.connect.assert_called_once()
 
 
+class TestOnDemandStartup:
+    """Test workers start on first request and stop when idle."""
+
+    def test_setup_starts_no_workers(self, mock_editor):
+        """Test setup only routes requests."""
+        manager = WorkerManager(mock_editor, use_worker_pool=False)
+
+        with patch("asciidoc_artisan.ui.worker_manager.QThread") as mock_thread_class:
+            manager.setup_workers_and_threads()
+
+        mock_thread_class.assert_not_called()
+        assert manager.git_worker is None
+        assert manager.preview_worker is None
+        mock_editor.request_git_status.connect.assert_called_once()
+        assert manager.get_stats()["running_workers"] == []
+
+    @patch("asciidoc_artisan.workers.GitWorker")
+    @patch("asciidoc_artisan.ui.worker_manager.QThread")
+    def test_first_request_starts_worker_once(
+        self, mock_thread_class, mock_git_worker_class, mock_editor, lazy_startup_mocks
+    ):
+        """Test requests start the worker once and are queued to it."""
+        mock_invoker_class, mock_timer_class = lazy_startup_mocks
+        manager = WorkerManager(mock_editor, use_worker_pool=False)
+
+        manager._forward_request("git", "get_repository_status", "/repo")
+        manager._forward_request("git", "get_repository_status", "/repo")
+
+        mock_git_worker_class.assert_called_once()
+        mock_thread_class.return_value.start.assert_called_once()
+        assert mock_editor.git_worker is mock_git_worker_class.return_value
+        mock_invoker_class.return_value.call.emit.assert_called_with("get_repository_status", ("/repo",))
+        # Git keeps running: no idle timer
+        mock_timer_class.assert_not_called()
+        assert manager.get_stats()["worker_starts"] == 1
+
+    @patch("asciidoc_artisan.workers.PandocWorker")
+    @patch("asciidoc_artisan.ui.worker_manager.QThread")
+    def test_idle_worker_stops_and_restarts(
+        self, mock_thread_class, mock_pandoc_worker_class, mock_editor, lazy_startup_mocks
+    ):
+        """Test idle workers quit their thread and start again on demand."""
+        from asciidoc_artisan.ui.worker_manager import WORKER_IDLE_TIMEOUT_MS
+
+        mock_invoker_class, mock_timer_class = lazy_startup_mocks
+        manager = WorkerManager(mock_editor, use_worker_pool=False)
+
+        manager.start_worker("pandoc")
+        mock_timer_class.return_value.start.assert_called_with(WORKER_IDLE_TIMEOUT_MS)
+
+        manager.stop_idle_worker("pandoc")
+
+        mock_invoker_class.return_value.call.emit.assert_called_with("", ())
+        assert manager.pandoc_worker is None
+        assert mock_editor.pandoc_worker is None
+        assert manager.get_stats()["idle_stops"] == 1
+
+        manager.start_worker("pandoc")
+        assert mock_pandoc_worker_class.call_count == 2
+
+    def test_invoker_runs_calls_on_worker_thread(self, qtbot):
+        """Test queued calls run on the worker's thread."""
+        from PySide6.QtCore import QObject
+
+        from asciidoc_artisan.ui.worker_manager import WorkerInvoker
+
+        class RecordingWorker(QObject):
+            def __init__(self):
+                super().__init__()
+                self.calls = []
+
+            def record(self, value):
+                self.calls.append((value, QThread.currentThread()))
+
+        thread = QThread()
+        worker = RecordingWorker()
+        worker.moveToThread(thread)
+        invoker = WorkerInvoker(worker)
+        invoker.moveToThread(thread)
+        thread.start()
+
+        invoker.call.emit("record", ("a",))
+        invoker.call.emit("", ())
+
+        qtbot.waitUntil(lambda: thread.isFinished(), timeout=2000)
+        assert worker.calls == [("a", thread)]
+
+    def test_invoker_releases_metrics_buffer_on_stop(self, qtbot):
+        """Test stopping a worker thread releases its metrics buffer."""
+        from PySide6.QtCore import QObject
+
+        from asciidoc_artisan.core.metrics import MetricsCollector
+        from asciidoc_artisan.ui.worker_manager import WorkerInvoker
+
+        collector = MetricsCollector()
+        collector.enable()
+
+        class TimedWorker(QObject):
+            def render(self):
+                collector.record_operation("render", 2.0)
+
+        thread = QThread()
+        worker = TimedWorker()
+        worker.moveToThread(thread)
+        invoker = WorkerInvoker(worker)
+        invoker.moveToThread(thread)
+        thread.start()
+
+        with patch("asciidoc_artisan.ui.worker_manager.get_metrics_collector", return_value=collector):
+            invoker.call.emit("render", ())
+            invoker.call.emit("", ())
+            qtbot.waitUntil(lambda: thread.isFinished(), timeout=2000)
+
+        assert collector._buffers == []
+        assert collector.get_operation_stats("render")["count"] == 1
+
+
 class TestPoolOperations:
     """Test worker pool operations."""
 
@@ -564,11 +700,11 @@ class TestSignalConnectionVerification:
     """Test signal connection verification."""
 
     @patch("asciidoc_artisan.claude.ClaudeWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.OllamaChatWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.PreviewWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.PandocWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.GitHubCLIWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.GitWorker")
+    @patch("asciidoc_artisan.workers.OllamaChatWorker")
+    @patch("asciidoc_artisan.workers.PreviewWorker")
+    @patch("asciidoc_artisan.workers.PandocWorker")
+    @patch("asciidoc_artisan.workers.GitHubCLIWorker")
+    @patch("asciidoc_artisan.workers.GitWorker")
     @patch("asciidoc_artisan.ui.worker_manager.QThread")
     def test_github_signals_connected(
         self,
@@ -580,6 +716,7 @@ class TestSignalConnectionVerification:
         mock_ollama_worker_class,
         mock_claude_worker_class,
         mock_editor,
+        lazy_startup_mocks,
     ):
         """Test GitHub worker signals are connected."""
         # Setup thread mocks
@@ -611,17 +748,19 @@ class TestSignalConnectionVerification:
 
         manager = WorkerManager(mock_editor, use_worker_pool=False)
         manager.setup_workers_and_threads()
+        for name in ALL_WORKERS:
+            manager.start_worker(name)
 
         # Verify GitHub signals connected
         mock_editor.request_github_command.connect.assert_called_once()
         mock_github_worker.github_result_ready.connect.assert_called_once()
 
     @patch("asciidoc_artisan.claude.ClaudeWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.OllamaChatWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.PreviewWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.PandocWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.GitHubCLIWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.GitWorker")
+    @patch("asciidoc_artisan.workers.OllamaChatWorker")
+    @patch("asciidoc_artisan.workers.PreviewWorker")
+    @patch("asciidoc_artisan.workers.PandocWorker")
+    @patch("asciidoc_artisan.workers.GitHubCLIWorker")
+    @patch("asciidoc_artisan.workers.GitWorker")
     @patch("asciidoc_artisan.ui.worker_manager.QThread")
     def test_pandoc_signals_connected(
         self,
@@ -633,6 +772,7 @@ class TestSignalConnectionVerification:
         mock_ollama_worker_class,
         mock_claude_worker_class,
         mock_editor,
+        lazy_startup_mocks,
     ):
         """Test Pandoc worker signals are connected."""
         # Setup thread mocks
@@ -667,6 +807,8 @@ class TestSignalConnectionVerification:
 
         manager = WorkerManager(mock_editor, use_worker_pool=False)
         manager.setup_workers_and_threads()
+        for name in ALL_WORKERS:
+            manager.start_worker(name)
 
         # Verify Pandoc signals connected
         mock_editor.request_pandoc_conversion.connect.assert_called_once()
@@ -674,11 +816,11 @@ class TestSignalConnectionVerification:
         mock_pandoc_worker.conversion_error.connect.assert_called_once()
 
     @patch("asciidoc_artisan.claude.ClaudeWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.OllamaChatWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.PreviewWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.PandocWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.GitHubCLIWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.GitWorker")
+    @patch("asciidoc_artisan.workers.OllamaChatWorker")
+    @patch("asciidoc_artisan.workers.PreviewWorker")
+    @patch("asciidoc_artisan.workers.PandocWorker")
+    @patch("asciidoc_artisan.workers.GitHubCLIWorker")
+    @patch("asciidoc_artisan.workers.GitWorker")
     @patch("asciidoc_artisan.ui.worker_manager.QThread")
     def test_preview_signals_connected(
         self,
@@ -690,6 +832,7 @@ class TestSignalConnectionVerification:
         mock_ollama_worker_class,
         mock_claude_worker_class,
         mock_editor,
+        lazy_startup_mocks,
     ):
         """Test Preview worker signals are connected."""
         # Setup thread mocks
@@ -724,6 +867,8 @@ class TestSignalConnectionVerification:
 
         manager = WorkerManager(mock_editor, use_worker_pool=False)
         manager.setup_workers_and_threads()
+        for name in ALL_WORKERS:
+            manager.start_worker(name)
 
         # Verify Preview signals connected
         mock_editor.request_preview_render.connect.assert_called_once()
@@ -935,11 +1080,11 @@ class TestWorkerStateTransitions:
         assert manager.claude_worker is None
 
     @patch("asciidoc_artisan.claude.ClaudeWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.OllamaChatWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.PreviewWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.PandocWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.GitHubCLIWorker")
-    @patch("asciidoc_artisan.ui.worker_manager.GitWorker")
+    @patch("asciidoc_artisan.workers.OllamaChatWorker")
+    @patch("asciidoc_artisan.workers.PreviewWorker")
+    @patch("asciidoc_artisan.workers.PandocWorker")
+    @patch("asciidoc_artisan.workers.GitHubCLIWorker")
+    @patch("asciidoc_artisan.workers.GitWorker")
     @patch("asciidoc_artisan.ui.worker_manager.QThread")
     def test_worker_initialization_after_setup(
         self,
@@ -951,8 +1096,9 @@ class TestWorkerStateTransitions:
         mock_ollama_worker_class,
         mock_claude_worker_class,
         mock_editor,
+        lazy_startup_mocks,
     ):
-        """Test workers are initialized after setup."""
+        """Test workers are initialized once started."""
         # Setup thread mocks
         mock_threads = [Mock(spec=QThread) for _ in range(6)]
         for thread in mock_threads:
@@ -995,6 +1141,8 @@ class TestWorkerStateTransitions:
 
         manager = WorkerManager(mock_editor, use_worker_pool=False)
         manager.setup_workers_and_threads()
+        for name in ALL_WORKERS:
+            manager.start_worker(name)
 
         # All workers should be initialized
         assert manager.git_worker is mock_workers["git"]
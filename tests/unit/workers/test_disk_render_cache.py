@@ -0,0 +1,132 @@
+"""
+Tests for DiskBlockCache - Persistent render cache.
+
+Tests cover:
+- Round trip and persistence across instances
+- Fingerprint isolation
+- Size-bounded LRU eviction
+- Corrupt entry handling
+- BlockCache disk tier integration
+"""
+
+from pathlib import Path
+
+from asciidoc_artisan.workers.disk_render_cache import (
+    DiskBlockCache,
+    compute_render_fingerprint,
+)
+from asciidoc_artisan.workers.render_cache import BlockCache
+
+
+class MockOptions:
+    """Mock asciidoc3 Options object."""
+
+    def __init__(self) -> None:
+        self.values = [("--no-header-footer", None)]
+
+
+class MockAsciiDocAPI:
+    """Mock AsciiDoc API with options and attributes."""
+
+    def __init__(self, attributes: dict[str, str]) -> None:
+        self.options = MockOptions()
+        self.attributes = attributes
+
+
+class TestDiskBlockCache:
+    """Test disk cache storage."""
+
+    def test_put_and_get(self, tmp_path: Path) -> None:
+        cache = DiskBlockCache("fp", cache_dir=tmp_path)
+        cache.put("block1", "<p>Hello</p>")
+        assert cache.get("block1") == "<p>Hello</p>"
+        assert cache.get("missing") is None
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        DiskBlockCache("fp", cache_dir=tmp_path).put("block1", "<p>Saved</p>")
+        reopened = DiskBlockCache("fp", cache_dir=tmp_path)
+        assert reopened.get("block1") == "<p>Saved</p>"
+        assert reopened.get_stats()["hits"] == 1
+
+    def test_fingerprint_isolates_entries(self, tmp_path: Path) -> None:
+        DiskBlockCache("fp1", cache_dir=tmp_path).put("block1", "<p>v1</p>")
+        assert DiskBlockCache("fp2", cache_dir=tmp_path).get("block1") is None
+
+    def test_entries_are_compressed(self, tmp_path: Path) -> None:
+        cache = DiskBlockCache("fp", cache_dir=tmp_path)
+        html = "<p>repeated</p>" * 1000
+        cache.put("block1", html)
+        assert cache.get_stats()["bytes"] < len(html) // 10
+
+    def test_lru_eviction_by_size(self, tmp_path: Path) -> None:
+        cache = DiskBlockCache("fp", cache_dir=tmp_path, max_bytes=40)
+        cache.put("a", "<p>aaaa</p>")
+        cache.put("b", "<p>bbbb</p>")
+        cache.get("a")  # a becomes most recent
+        cache.put("c", "<p>cccc</p>")
+
+        assert cache.get_stats()["bytes"] <= 40
+        assert cache.get("a") == "<p>aaaa</p>"
+        assert cache.get("b") is None
+
+    def test_corrupt_entry_is_miss(self, tmp_path: Path) -> None:
+        cache = DiskBlockCache("fp", cache_dir=tmp_path)
+        cache.put("block1", "<p>ok</p>")
+        next(tmp_path.glob("*.html.z")).write_bytes(b"not zlib")
+
+        assert cache.get("block1") is None
+        assert list(tmp_path.glob("*.html.z")) == []
+
+    def test_clear_removes_files(self, tmp_path: Path) -> None:
+        cache = DiskBlockCache("fp", cache_dir=tmp_path)
+        cache.put("block1", "<p>x</p>")
+        cache.clear()
+        assert list(tmp_path.glob("*.html.z")) == []
+        assert cache.get_stats()["entries"] == 0
+
+    def test_default_dir_in_platform_cache_location(self, monkeypatch) -> None:
+        from PySide6.QtCore import QStandardPaths
+
+        monkeypatch.setattr("asciidoc_artisan.workers.disk_render_cache.DISK_CACHE_DIR", None)
+        location = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+        assert DiskBlockCache("fp").cache_dir == Path(location) / "render_cache"
+
+    def test_temp_file_not_written_under_lock(self, tmp_path: Path, monkeypatch) -> None:
+        cache = DiskBlockCache("fp", cache_dir=tmp_path)
+        locked_writes = []
+        write_bytes = Path.write_bytes
+
+        def checked_write(path: Path, data: bytes) -> int:
+            locked_writes.append(cache._lock.locked())
+            return write_bytes(path, data)
+
+        monkeypatch.setattr(Path, "write_bytes", checked_write)
+        cache.put("block1", "<p>x</p>")
+        assert locked_writes == [False]
+        assert cache.get("block1") == "<p>x</p>"
+        assert list(tmp_path.glob("*.tmp")) == []
+
+
+class TestRenderFingerprint:
+    """Test render fingerprint computation."""
+
+    def test_attributes_change_fingerprint(self) -> None:
+        fp1 = compute_render_fingerprint(MockAsciiDocAPI({"toc": "left"}))
+        fp2 = compute_render_fingerprint(MockAsciiDocAPI({"toc": "right"}))
+        assert fp1 != fp2
+
+    def test_fingerprint_is_stable(self) -> None:
+        api = MockAsciiDocAPI({"b": "2", "a": "1"})
+        assert compute_render_fingerprint(api) == compute_render_fingerprint(MockAsciiDocAPI({"a": "1", "b": "2"}))
+
+
+class TestBlockCacheDiskTier:
+    """Test BlockCache with a disk tier."""
+
+    def test_memory_miss_reads_disk(self, tmp_path: Path) -> None:
+        disk = DiskBlockCache("fp", cache_dir=tmp_path)
+        BlockCache(disk_cache=disk).put("block1", "<p>x</p>")
+
+        fresh = BlockCache(disk_cache=DiskBlockCache("fp", cache_dir=tmp_path))
+        assert fresh.get("block1") == "<p>x</p>"
+        assert fresh.get_stats()["size"] == 1  # Promoted to memory
@@ -0,0 +1,164 @@
+"""
+Tests for document prelude - per-block rendering context.
+
+Tests cover:
+- Attribute entry extraction
+- Prelude propagation and cache keys
+- Section numbering across blocks
+- Prelude-aware incremental rendering
+"""
+
+from unittest.mock import patch
+
+from asciidoc_artisan.workers.block_splitter import DocumentBlockSplitter, EditRange
+from asciidoc_artisan.workers.document_prelude import (
+    apply_section_number,
+    assign_preludes,
+    extract_attribute_lines,
+)
+from asciidoc_artisan.workers.incremental_renderer import IncrementalPreviewRenderer
+
+
+class MockAsciiDocAPI:
+    """Mock AsciiDoc API that echoes its input."""
+
+    def __init__(self, attributes=None):
+        self.attributes = attributes or {}
+
+    def execute(self, infile, outfile, backend="html5"):
+        """Mock execute method."""
+        outfile.write(f"<div>{infile.read()}</div>")
+
+
+SOURCE = """= Title
+:imagesdir: img
+:product: Artisan
+
+Intro.
+
+== First
+
+About {product}.
+
+== Second
+
+Second.
+"""
+
+
+class TestExtractAttributeLines:
+    """Test attribute entry detection."""
+
+    def test_extracts_set_and_unset_entries(self):
+        content = ":a: 1\ntext :b: 2\n:c!:\n:!d:\n::\n"
+        assert extract_attribute_lines(content) == [":a: 1", ":c!:", ":!d:"]
+
+    def test_no_entries(self):
+        assert extract_attribute_lines("== Heading\n\nPlain text.") == []
+
+
+class TestAssignPreludes:
+    """Test prelude propagation."""
+
+    def test_prelude_contains_earlier_entries_only(self):
+        blocks = DocumentBlockSplitter.split(SOURCE)
+        assign_preludes(blocks)
+
+        assert blocks[0].prelude == ""
+        assert blocks[0].cache_key() == blocks[0].id
+        assert blocks[1].prelude == ":imagesdir: img\n:product: Artisan\n\n"
+        assert blocks[1].render_source().startswith(":imagesdir: img")
+        assert blocks[1].prelude_hash == blocks[2].prelude_hash
+        assert blocks[1].cache_key() == f"{blocks[1].id}-{blocks[1].prelude_hash}"
+
+    def test_changed_prelude_changes_cache_key_and_resets_html(self):
+        blocks = DocumentBlockSplitter.split(SOURCE)
+        assign_preludes(blocks)
+        old_key = blocks[2].cache_key()
+        blocks[2].rendered_html = "<p>old</p>"
+
+        # Same body blocks, different header attribute
+        edited = DocumentBlockSplitter.split(SOURCE.replace("Artisan", "Editor"))
+        edited[2] = blocks[2]
+        assign_preludes(edited)
+
+        assert blocks[2].cache_key() != old_key
+        assert blocks[2].rendered_html is None
+
+    def test_unchanged_prelude_keeps_html(self):
+        blocks = DocumentBlockSplitter.split(SOURCE)
+        assign_preludes(blocks)
+        blocks[2].rendered_html = "<p>kept</p>"
+        assign_preludes(blocks)
+        assert blocks[2].rendered_html == "<p>kept</p>"
+
+    def test_section_numbers(self):
+        source = "= T\n:numbered:\n\n== A\n\n=== A1\n\n=== A2\n\n== B\n\n=== B1\n"
+        blocks = DocumentBlockSplitter.split(source)
+        assign_preludes(blocks)
+        assert [b.section_number for b in blocks] == ["", "1.", "1.1.", "1.2.", "2.", "2.1."]
+
+    def test_numbering_can_be_switched_off(self):
+        source = "== A\n\n== B\n:numbered!:\n\n== C\n"
+        blocks = DocumentBlockSplitter.split(source)
+        assign_preludes(blocks, numbered=True)
+        assert [b.section_number for b in blocks] == ["1.", "2.", ""]
+
+    def test_unnumbered_document(self):
+        blocks = DocumentBlockSplitter.split(SOURCE)
+        assign_preludes(blocks)
+        assert all(b.section_number == "" for b in blocks)
+
+
+class TestApplySectionNumber:
+    """Test heading number patching."""
+
+    def test_replaces_standalone_number(self):
+        blocks = DocumentBlockSplitter.split("== A\n\n=== A1\n\n=== A2\n")
+        assign_preludes(blocks, numbered=True)
+        html = '<h3 id="_a2">0.1. A2</h3>'
+        assert apply_section_number(blocks[2], html) == '<h3 id="_a2">1.2. A2</h3>'
+
+    def test_unnumbered_block_untouched(self):
+        blocks = DocumentBlockSplitter.split("== A\n")
+        assign_preludes(blocks)
+        assert apply_section_number(blocks[0], "<h2>A</h2>") == "<h2>A</h2>"
+
+
+class TestPreludeRendering:
+    """Test prelude-aware incremental rendering."""
+
+    def test_blocks_render_with_prelude(self):
+        renderer = IncrementalPreviewRenderer(MockAsciiDocAPI(), enable_parallel=False)
+        html = renderer.render(SOURCE)
+        assert "<div>:imagesdir: img\n:product: Artisan\n\n== First" in html
+
+    def test_attribute_edit_rerenders_following_blocks(self):
+        renderer = IncrementalPreviewRenderer(MockAsciiDocAPI(), enable_parallel=False)
+        renderer.render(SOURCE)
+
+        position = SOURCE.index("Artisan")
+        text = SOURCE[:position] + "Editor" + SOURCE[position + len("Artisan") :]
+        edit = EditRange(position, len("Artisan"), len("Editor"))
+        with patch.object(renderer, "_render_block", wraps=renderer._render_block) as render_block:
+            html = renderer.render(text, edit=edit)
+
+        assert render_block.call_count == 3
+        assert ":product: Artisan" not in html
+
+    def test_body_edit_keeps_prelude_cache(self):
+        renderer = IncrementalPreviewRenderer(MockAsciiDocAPI(), enable_parallel=False)
+        renderer.render(SOURCE)
+
+        position = SOURCE.index("Second.")
+        text = SOURCE[:position] + "The " + SOURCE[position:]
+        with patch.object(renderer, "_render_block", wraps=renderer._render_block) as render_block:
+            renderer.render(text, edit=EditRange(position, 0, 4))
+
+        assert render_block.call_count == 1
+
+    def test_numbered_api_attribute(self):
+        renderer = IncrementalPreviewRenderer(MockAsciiDocAPI({"numbered": ""}), enable_parallel=False)
+        with patch.object(renderer, "_render_block", side_effect=lambda b: f"<h>{'0.' * (b.level - 2)}1. x</h>"):
+            html = renderer.render("== A\n\n=== A1\n\n=== A2\n\n== B\n")
+        assert html.split("\n") == ["<h>1. x</h>", "<h>1.1. x</h>", "<h>1.2. x</h>", "<h>2. x</h>"]
@@ -378,6 +378,28 @@ class TestGitWorkerStatus:
         assert untracked_file["path"] == "file3.txt"
         # Untracked files don't have line count keys
 
+    @patch("asciidoc_artisan.workers.git_worker.subprocess.run")
+    def test_get_detailed_repository_status_also_emits_status(self, mock_run):
+        """Test detailed status refreshes the status bar from the same git status run."""
+        mock_run.return_value = MagicMock(
+            returncode=0,
+            stdout="# branch.oid abcd1234\n# branch.head main\n? file3.txt\n",
+            stderr="",
+        )
+
+        worker = GitWorker()
+        statuses = []
+        worker.status_ready.connect(statuses.append)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            worker.get_detailed_repository_status(str(tmpdir))
+
+        assert len(statuses) == 1
+        assert statuses[0].branch == "main"
+        assert statuses[0].untracked_count == 1
+        # Only untracked files: status alone, no numstat calls
+        assert mock_run.call_count == 1
+
     def test_parse_git_status_v2_detached_head(self):
         """Test parsing detached HEAD state."""
         worker = GitWorker()
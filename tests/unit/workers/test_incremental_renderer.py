@@ -15,6 +15,7 @@ from asciidoc_artisan.workers.incremental_renderer import (
     BlockCache,
     DocumentBlock,
     DocumentBlockSplitter,
+    EditRange,
     IncrementalPreviewRenderer,
     count_leading_equals,
 )
@@ -213,6 +214,21 @@ Final content"""
             assert block.id != ""
             assert len(block.id) == 12  # BLOCK_HASH_LENGTH is 12 (reduced from 16)
 
+    def test_split_with_shared_line_index(self):
+        """Test that a shared line index gives the same blocks."""
+        from asciidoc_artisan.core.line_index import LineIndex
+
+        source = "Preamble\n= Title\n\n== Section\nText\n==NotHeading\n=== Sub\n"
+
+        shared = DocumentBlockSplitter.split(source, LineIndex(source))
+        counted = DocumentBlockSplitter.split(source)
+
+        assert [(b.start_line, b.end_line, b.content, b.level) for b in shared] == [
+            (b.start_line, b.end_line, b.content, b.level) for b in counted
+        ]
+        assert [(b.start_line, b.end_line, b.level) for b in counted] == [(0, 0, 0), (1, 2, 1), (3, 5, 2), (6, 7, 3)]
+        assert counted[2].content == "== Section\nText\n==NotHeading"
+
 
 class MockAsciiDocAPI:
     """Mock AsciiDoc API for testing."""
@@ -1366,3 +1382,122 @@ Content 1."""
         # Should produce different HTML
         assert html1 != html2
         assert len(html2) < len(html1)
+
+
+def _apply_edit(text, position, removed, inserted):
+    """Apply an editor change and return (new_text, EditRange)."""
+    return text[:position] + inserted + text[position + removed :], EditRange(position, removed, len(inserted))
+
+
+class TestEditRangeSplitting:
+    """Test edit-range-aware incremental splitting."""
+
+    SOURCE = "= Title\n\nIntro.\n\n== One\n\nFirst.\n\n== Two\n\nSecond.\n\n== Three\n\nThird."
+
+    def _assert_matches_full_split(self, previous, text, edit):
+        result = DocumentBlockSplitter.split_edit(previous, text, edit)
+        assert result is not None
+        expected = DocumentBlockSplitter.split(text)
+        got = [(b.id, b.start_line, b.end_line, b.level) for b in result[0]]
+        assert got == [(b.id, b.start_line, b.end_line, b.level) for b in expected]
+        return result
+
+    def test_edit_inside_block_resplits_only_that_block(self):
+        """Typing inside one section re-hashes only that section."""
+        previous = DocumentBlockSplitter.split(self.SOURCE)
+        position = self.SOURCE.index("Second.")
+        text, edit = _apply_edit(self.SOURCE, position, 0, "Very ")
+
+        blocks, old_region, new_region = self._assert_matches_full_split(previous, text, edit)
+
+        assert [b.content for b in old_region] == ["== Two\n\nSecond.\n"]
+        assert len(new_region) == 1
+        assert blocks[-1] is previous[-1]
+
+    def test_new_line_shifts_following_blocks(self):
+        """Inserting lines shifts line numbers of later blocks in place."""
+        previous = DocumentBlockSplitter.split(self.SOURCE)
+        last_start = previous[-1].start_line
+        text, edit = _apply_edit(self.SOURCE, self.SOURCE.index("First."), 0, "More.\n\n")
+
+        blocks, _, _ = self._assert_matches_full_split(previous, text, edit)
+
+        assert blocks[-1].start_line == last_start + 2
+
+    def test_removing_heading_merges_blocks(self):
+        """Breaking a heading joins its content to the previous block."""
+        previous = DocumentBlockSplitter.split(self.SOURCE)
+        text, edit = _apply_edit(self.SOURCE, self.SOURCE.index("== Two"), 2, "")
+
+        blocks, _, _ = self._assert_matches_full_split(previous, text, edit)
+
+        assert len(blocks) == len(previous) - 1
+
+    def test_adding_heading_creates_block(self):
+        """Typing a new heading splits the block."""
+        previous = DocumentBlockSplitter.split(self.SOURCE)
+        position = self.SOURCE.index("First.") + len("First.")
+        text, edit = _apply_edit(self.SOURCE, position, 0, "\n\n== New")
+
+        blocks, _, _ = self._assert_matches_full_split(previous, text, edit)
+
+        assert len(blocks) == len(previous) + 1
+
+    def test_length_mismatch_returns_none(self):
+        """Edit ranges that do not match the previous text are rejected."""
+        previous = DocumentBlockSplitter.split(self.SOURCE)
+        assert DocumentBlockSplitter.split_edit(previous, self.SOURCE + "x", EditRange(0, 0, 0)) is None
+
+    def test_astral_character_before_edit_returns_none(self):
+        """Qt positions after an emoji do not match Python offsets: fall back to split()."""
+        source = self.SOURCE.replace("Intro.", "Intro \U0001f600.")
+        previous = DocumentBlockSplitter.split(source)
+        position = source.index("Second.")
+        text = source[:position] + "Very " + source[position:]
+        qt_position = len(source[:position].encode("utf-16-le")) // 2
+
+        assert DocumentBlockSplitter.split_edit(previous, text, EditRange(qt_position, 0, len("Very "))) is None
+
+    def test_astral_character_after_edit_still_splits(self):
+        """Emoji after the edit leave its offsets valid."""
+        source = self.SOURCE.replace("Third.", "Third \U0001f600.")
+        previous = DocumentBlockSplitter.split(source)
+        text, edit = _apply_edit(source, source.index("Second."), 0, "Very ")
+
+        self._assert_matches_full_split(previous, text, edit)
+
+    def test_merged_edits_match_full_split(self):
+        """Several edits merged into one range still split correctly."""
+        previous = DocumentBlockSplitter.split(self.SOURCE)
+        text, edit = _apply_edit(self.SOURCE, self.SOURCE.index("Third."), 0, "x")
+        position = text.index("Intro.")
+        text = text[:position] + "y" + text[position:]
+        edit.merge(position, 0, 1)
+
+        self._assert_matches_full_split(previous, text, edit)
+
+    def test_render_with_edit_renders_only_changed_block(self):
+        """Renderer re-renders only the edited block when given an edit range."""
+        api = MockAsciiDocAPI()
+        renderer = IncrementalPreviewRenderer(api, enable_parallel=False)
+        renderer.render(self.SOURCE)
+
+        text, edit = _apply_edit(self.SOURCE, self.SOURCE.index("Second."), 0, "Very ")
+        with patch.object(renderer, "_render_block", wraps=renderer._render_block) as render_block:
+            html = renderer.render(text, edit=edit)
+
+        assert render_block.call_count == 1
+        assert "Very Second." in html
+
+    def test_forget_layout_ignores_edit(self):
+        """A stale layout falls back to full split."""
+        api = MockAsciiDocAPI()
+        renderer = IncrementalPreviewRenderer(api, enable_parallel=False)
+        renderer.render(self.SOURCE)
+        renderer.forget_layout()
+
+        text, edit = _apply_edit(self.SOURCE, 0, 0, "x")
+        with patch.object(DocumentBlockSplitter, "split_edit") as split_edit:
+            renderer.render(text, edit=edit)
+
+        split_edit.assert_not_called()
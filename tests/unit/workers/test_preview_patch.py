@@ -0,0 +1,125 @@
+"""
+Tests for preview patches - per-block DOM updates.
+
+Tests cover:
+- Block anchoring
+- Patch diffing
+- Patch output of IncrementalPreviewRenderer
+- render_patch emission in PreviewWorker
+"""
+
+from unittest.mock import MagicMock
+
+from asciidoc_artisan.workers.block_splitter import EditRange
+from asciidoc_artisan.workers.incremental_renderer import IncrementalPreviewRenderer
+from asciidoc_artisan.workers.preview_patch import block_anchor_id, diff_block_html, wrap_blocks
+from asciidoc_artisan.workers.preview_worker import PreviewWorker
+
+
+class MockAsciiDocAPI:
+    """Mock AsciiDoc API that echoes its input."""
+
+    def execute(self, infile, outfile, backend="html5"):
+        """Mock execute method."""
+        outfile.write(f"<p>{infile.read().strip()}</p>")
+
+
+SOURCE = "== First\n\nOne.\n\n== Second\n\nTwo.\n\n== Third\n\nThree.\n"
+
+
+class TestPatchHelpers:
+    """Test anchoring and diffing."""
+
+    def test_wrap_blocks_adds_anchor_per_block(self):
+        html = wrap_blocks(["<p>a</p>", "<p>b</p>"])
+        assert html == (
+            '<div class="adoc-block" id="adoc-block-0"><p>a</p></div>\n'
+            '<div class="adoc-block" id="adoc-block-1"><p>b</p></div>'
+        )
+
+    def test_diff_returns_changed_blocks(self):
+        assert diff_block_html(["a", "b", "c"], ["a", "x", "c"]) == [(block_anchor_id(1), "x")]
+
+    def test_diff_unchanged_is_empty(self):
+        assert diff_block_html(["a", "b"], ["a", "b"]) == []
+
+    def test_diff_structure_change_requires_reload(self):
+        assert diff_block_html(["a", "b"], ["a", "b", "c"]) is None
+        assert diff_block_html(None, ["a"]) is None
+
+
+class TestRenderWithPatches:
+    """Test patch output of the incremental renderer."""
+
+    def test_first_render_requires_reload(self):
+        renderer = IncrementalPreviewRenderer(MockAsciiDocAPI(), enable_parallel=False)
+        html, patches = renderer.render_with_patches(SOURCE)
+        assert patches is None
+        assert 'id="adoc-block-2"' in html
+
+    def test_edit_patches_only_edited_block(self):
+        renderer = IncrementalPreviewRenderer(MockAsciiDocAPI(), enable_parallel=False)
+        renderer.render_with_patches(SOURCE)
+
+        position = SOURCE.index("Two.")
+        text = SOURCE[:position] + "Only " + SOURCE[position:]
+        html, patches = renderer.render_with_patches(text, EditRange(position, 0, 5))
+
+        assert patches == [("adoc-block-1", "<p>== Second\n\nOnly Two.</p>")]
+        assert "Only Two." in html
+
+    def test_new_heading_requires_reload(self):
+        renderer = IncrementalPreviewRenderer(MockAsciiDocAPI(), enable_parallel=False)
+        renderer.render_with_patches(SOURCE)
+        _, patches = renderer.render_with_patches(SOURCE + "\n== Fourth\n")
+        assert patches is None
+
+    def test_plain_render_resets_patch_baseline(self):
+        renderer = IncrementalPreviewRenderer(MockAsciiDocAPI(), enable_parallel=False)
+        renderer.render_with_patches(SOURCE)
+        renderer.render(SOURCE)
+        _, patches = renderer.render_with_patches(SOURCE)
+        assert patches is None
+
+    def test_forget_layout_resets_patch_baseline(self):
+        renderer = IncrementalPreviewRenderer(MockAsciiDocAPI(), enable_parallel=False)
+        renderer.render_with_patches(SOURCE)
+        renderer.forget_layout()
+        _, patches = renderer.render_with_patches(SOURCE)
+        assert patches is None
+
+
+class TestPreviewWorkerPatches:
+    """Test render_patch emission."""
+
+    def _create_worker(self):
+        worker = PreviewWorker()
+        worker._asciidoc_api = MockAsciiDocAPI()
+        worker._incremental_renderer = IncrementalPreviewRenderer(MockAsciiDocAPI(), enable_parallel=False)
+        return worker
+
+    def test_emits_render_patch_when_enabled(self):
+        worker = self._create_worker()
+        worker.set_patch_updates(True)
+        on_patch = MagicMock()
+        on_complete = MagicMock()
+        worker.render_patch.connect(on_patch)
+        worker.render_complete.connect(on_complete)
+
+        worker.render_preview(SOURCE * 10)
+
+        on_patch.assert_called_once()
+        assert on_patch.call_args[0][1] is None
+        on_complete.assert_not_called()
+
+    def test_emits_render_complete_when_disabled(self):
+        worker = self._create_worker()
+        on_patch = MagicMock()
+        on_complete = MagicMock()
+        worker.render_patch.connect(on_patch)
+        worker.render_complete.connect(on_complete)
+
+        worker.render_preview(SOURCE * 10)
+
+        on_complete.assert_called_once()
+        on_patch.assert_not_called()
@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from asciidoc_artisan.workers import PreviewWorker
+from asciidoc_artisan.workers.preview_worker import WARM_UP_SOURCE
 
 
 @pytest.mark.fr_015
@@ -35,6 +36,37 @@ class TestPreviewWorker:
         mock_api_class.assert_called_once_with("/path/to/asciidoc3.py")
         assert worker._asciidoc_api is not None
 
+    @patch("asciidoc_artisan.workers.preview_worker.asciidoc3")
+    @patch("asciidoc_artisan.workers.preview_worker.AsciiDoc3API")
+    def test_initialization_warms_up_and_signals_ready(self, mock_api_class, mock_asciidoc3):
+        """Test initialization renders the warm-up document once, then emits ready."""
+        mock_asciidoc3.__file__ = "/path/to/asciidoc3.py"
+        mock_api_instance = MagicMock()
+        mock_api_class.return_value = mock_api_instance
+
+        worker = PreviewWorker()
+        ready = []
+        worker.ready.connect(lambda: ready.append(mock_api_instance.execute.call_count))
+        worker.initialize_asciidoc()
+
+        mock_api_class.assert_called_once_with("/path/to/asciidoc3.py")
+        assert ready == [1]
+        warm_up_input = mock_api_instance.execute.call_args[0][0]
+        assert warm_up_input.getvalue() == WARM_UP_SOURCE
+
+    @patch("asciidoc_artisan.workers.preview_worker.ASCIIDOC3_AVAILABLE", True)
+    @patch("asciidoc_artisan.workers.preview_worker.AsciiDoc3API")
+    def test_warm_up_failure_keeps_api(self, mock_api_class):
+        """Test a failing warm-up render does not discard the initialized API."""
+        mock_api_instance = MagicMock()
+        mock_api_instance.execute.side_effect = RuntimeError("warm-up failed")
+        mock_api_class.return_value = mock_api_instance
+
+        worker = PreviewWorker()
+        worker.initialize_asciidoc("/path/to/asciidoc3.py")
+
+        assert worker._asciidoc_api is mock_api_instance
+
     @patch("asciidoc_artisan.workers.preview_worker.ASCIIDOC3_AVAILABLE", True)
     @patch("asciidoc_artisan.workers.preview_worker.AsciiDoc3API")
     def test_successful_preview_rendering(self, mock_api_class):
@@ -256,7 +288,7 @@ class TestIncrementalRendering:
         worker.render_preview(large_text)
 
         # Should use incremental renderer for large docs
-        mock_incremental_instance.render.assert_called_once_with(large_text)
+        mock_incremental_instance.render.assert_called_once_with(large_text, edit=None, line_index=None)
         assert result == "<div>Rendered HTML</div>"
 
     @patch("asciidoc_artisan.workers.preview_worker.ASCIIDOC3_AVAILABLE", True)
@@ -277,6 +277,7 @@ class TestSchedulePrerender:
         worker._incremental_renderer = mock_incremental
 
         mock_block = MagicMock(id="block1")
+        mock_block.cache_key.return_value = "block1"
 
         worker._schedule_prerender([mock_block])
 
@@ -307,6 +308,7 @@ class TestSchedulePrerender:
         worker._incremental_renderer = mock_incremental
 
         mock_block = MagicMock(id="block1", content="Test content")
+        mock_block.cache_key.return_value = "block1"
 
         worker._schedule_prerender([mock_block])
 
@@ -397,7 +399,7 @@ class TestImportFallbacks:
     """Test import error fallback behavior."""
 
     def test_asciidoc3_import_fallback(self):
-        """Test that ASCIIDOC3_AVAILABLE is False when import fails."""
+        """Test that ASCIIDOC3_AVAILABLE is False once loading fails."""
         # Reload module with mocked import failure
         import sys
         from importlib import reload
@@ -430,6 +432,10 @@ class TestImportFallbacks:
 
             reload(pw)
 
+            # Import is deferred to the preview thread
+            assert pw.ASCIIDOC3_AVAILABLE is None
+            assert pw._load_asciidoc3() is False
+
             # Verify fallback values are set
             assert pw.ASCIIDOC3_AVAILABLE is False
             assert pw.asciidoc3 is None
@@ -0,0 +1,164 @@
+"""
+Tests for ProcessBlockRenderer - Process-pool block rendering backend.
+
+Tests cover:
+- Payload batching and size balancing
+- API configuration extraction
+- Per-process batch rendering
+- Backend selection in ParallelBlockRenderer
+"""
+
+from typing import Any
+
+import pytest
+
+from asciidoc_artisan.workers import process_block_renderer
+from asciidoc_artisan.workers.block_splitter import DocumentBlock
+from asciidoc_artisan.workers.parallel_block_renderer import ParallelBlockRenderer
+from asciidoc_artisan.workers.process_block_renderer import (
+    ProcessBlockRenderer,
+    balance_batches,
+    build_api_config,
+)
+
+
+class MockOptions:
+    """Mock asciidoc3 Options object."""
+
+    def __init__(self) -> None:
+        self.values: list[tuple[str, str | None]] = [("--no-header-footer", None)]
+
+
+class MockAsciiDocAPI:
+    """Mock AsciiDoc API for testing."""
+
+    def __init__(self) -> None:
+        self.options = MockOptions()
+        self.attributes: dict[str, str] = {"toc": "left"}
+        self.cmd = "/fake/asciidoc3.py"
+
+    def execute(self, infile: Any, outfile: Any, backend: str = "html5") -> None:
+        """Mock execute that wraps content in div tags."""
+        outfile.write(f"<div>{infile.read()}</div>")
+
+
+def create_blocks(count: int, size: int) -> list[DocumentBlock]:
+    """Create test blocks with content of given size."""
+    return [
+        DocumentBlock(id=f"block_{i}", start_line=i, end_line=i, content=f"== S{i}\n" + "x" * size)
+        for i in range(count)
+    ]
+
+
+class TestBalanceBatches:
+    """Test payload batching."""
+
+    def test_batches_cover_all_items(self) -> None:
+        payload = [(i, "x" * (i + 1)) for i in range(10)]
+        batches = balance_batches(payload, 3)
+        assert len(batches) == 3
+        assert sorted(idx for batch in batches for idx, _ in batch) == list(range(10))
+
+    def test_batches_are_balanced(self) -> None:
+        payload = [(0, "x" * 100), (1, "x" * 50), (2, "x" * 50)]
+        batches = balance_batches(payload, 2)
+        loads = sorted(sum(len(c) for _, c in batch) for batch in batches)
+        assert loads == [100, 100]
+
+    def test_more_batches_than_items(self) -> None:
+        batches = balance_batches([(0, "a")], 4)
+        assert batches == [[(0, "a")]]
+
+
+class TestApiConfig:
+    """Test API configuration extraction."""
+
+    def test_build_api_config(self) -> None:
+        config = build_api_config(MockAsciiDocAPI())
+        assert config["module_file"] == "/fake/asciidoc3.py"
+        assert config["options"] == [("--no-header-footer", None)]
+        assert config["attributes"] == {"toc": "left"}
+
+    def test_build_api_config_minimal_api(self) -> None:
+        config = build_api_config(object())
+        assert config == {"module_file": None, "options": [], "attributes": {}}
+
+
+class TestRenderBatch:
+    """Test per-process batch rendering."""
+
+    def test_render_batch_uses_worker_api(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(process_block_renderer, "_worker_api", MockAsciiDocAPI())
+        results = process_block_renderer._render_batch([(3, "a"), (1, "b")])
+        assert results == [(3, "<div>a</div>"), (1, "<div>b</div>")]
+
+    def test_render_batch_without_api_escapes(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(process_block_renderer, "_worker_api", None)
+        results = process_block_renderer._render_batch([(0, "<b>")])
+        assert results == [(0, "<pre>&lt;b&gt;</pre>")]
+
+    def test_render_payload_requires_started_pool(self) -> None:
+        backend = ProcessBlockRenderer(build_api_config(MockAsciiDocAPI()), max_workers=2)
+        assert backend.is_ready() is False
+        with pytest.raises(RuntimeError):
+            backend.render_payload([(0, "a")])
+
+
+class TestBackendSelection:
+    """Test automatic backend choice in ParallelBlockRenderer."""
+
+    def test_small_batch_uses_threads(self) -> None:
+        renderer = ParallelBlockRenderer(MockAsciiDocAPI(), max_workers=4)
+        assert renderer._choose_backend(create_blocks(10, 10)) == ParallelBlockRenderer.BACKEND_THREAD
+        assert renderer._process_renderer is None
+
+    def test_large_batch_uses_threads_until_pool_warm(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(ProcessBlockRenderer, "warm_up", lambda self: None)
+        renderer = ParallelBlockRenderer(MockAsciiDocAPI(), max_workers=4)
+        blocks = create_blocks(8, 4000)
+        assert renderer._choose_backend(blocks) == ParallelBlockRenderer.BACKEND_THREAD
+        assert renderer._process_renderer is not None
+
+    def test_large_batch_uses_ready_pool(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(ProcessBlockRenderer, "warm_up", lambda self: None)
+        monkeypatch.setattr(ProcessBlockRenderer, "is_ready", lambda self: True)
+        monkeypatch.setattr(
+            ProcessBlockRenderer,
+            "render_payload",
+            lambda self, payload: {idx: f"<p>{idx}</p>" for idx, _ in payload},
+        )
+        renderer = ParallelBlockRenderer(MockAsciiDocAPI(), max_workers=4)
+        blocks = create_blocks(8, 4000)
+        results = renderer.render_blocks_parallel(blocks)
+
+        assert [rendered for _, rendered in results] == [f"<p>{i}</p>" for i in range(8)]
+        assert renderer.get_stats()["process_renders"] == 1
+
+    def test_config_change_restarts_pool(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(ProcessBlockRenderer, "warm_up", lambda self: None)
+        api = MockAsciiDocAPI()
+        renderer = ParallelBlockRenderer(api, max_workers=4)
+        blocks = create_blocks(8, 4000)
+        renderer._choose_backend(blocks)
+        process_renderer = renderer._process_renderer
+        assert process_renderer is not None
+        shutdowns = []
+        monkeypatch.setattr(ProcessBlockRenderer, "shutdown", lambda self: shutdowns.append(self))
+
+        renderer._choose_backend(blocks)
+        assert shutdowns == []
+
+        api.attributes["toc"] = "right"
+        renderer._choose_backend(blocks)
+        assert shutdowns == [process_renderer]
+        assert process_renderer._api_config["attributes"]["toc"] == "right"
+
+    def test_thread_backend_never_uses_processes(self) -> None:
+        renderer = ParallelBlockRenderer(MockAsciiDocAPI(), max_workers=4, backend="thread")
+        assert renderer._choose_backend(create_blocks(8, 4000)) == ParallelBlockRenderer.BACKEND_THREAD
+        assert renderer._process_renderer is None
+
+    def test_set_backend_rejects_unknown(self) -> None:
+        renderer = ParallelBlockRenderer(MockAsciiDocAPI(), max_workers=4)
+        with pytest.raises(ValueError):
+            renderer.set_backend("gpu")